@@ -209,10 +209,11 @@ if HAS_TYPER:
     def outdated_cmd(
         type_filter: Optional[str] = typer.Option(None, "--type", help="Filter by type"),
         show_all: bool = typer.Option(False, "--all", help="Check all tracked repos"),
+        json_output: bool = typer.Option(False, "--json", help="Machine-readable output"),
     ):
         """Show items with available upgrades."""
         from .commands.outdated import run_outdated
-        run_outdated(type_filter=type_filter, show_all=show_all)
+        run_outdated(type_filter=type_filter, show_all=show_all, json_out=json_output)
 
     @app.command("info")
     def info_cmd(
@@ -377,10 +378,18 @@ if HAS_TYPER:
             False, "-g", "--global",
             help="Run scheduled suites across all tracked projects",
         ),
+        no_cache: bool = typer.Option(
+            False, "--no-cache",
+            help="With -g, rerun suites that are unchanged since their last pass",
+        ),
+        resume: bool = typer.Option(
+            False, "--resume",
+            help="With -g, continue the last run if it was interrupted",
+        ),
     ):
         """Run test suites for the current project (or all with -g)."""
         from .commands.test_cmd import run_test_run
-        run_test_run(global_flag=global_flag)
+        run_test_run(global_flag=global_flag, no_cache=no_cache, resume=resume)
 
     @test_app.command("schedule")
     def test_schedule_cmd(
@@ -402,6 +411,22 @@ if HAS_TYPER:
             run_test_schedule(global_flag=global_flag, commands=do, list_only=list_only)
         )
 
+    @test_app.command("plan")
+    def test_plan_cmd(
+        lanes: Optional[int] = typer.Option(
+            None, "--lanes", help="Number of lanes (default: execution.max_parallel_lanes)"
+        ),
+        dry_run: bool = typer.Option(
+            False, "--dry-run", help="Preview lanes and predicted makespan without saving"
+        ),
+        enable: bool = typer.Option(
+            False, "--enable", help="Also turn on parallel_enabled after saving"
+        ),
+    ):
+        """Compute parallel lanes for scheduled runs from profile history."""
+        from .commands.test_cmd import run_test_plan
+        raise typer.Exit(run_test_plan(lanes=lanes, dry_run=dry_run, enable=enable))
+
     @test_app.command("status")
     def test_status_cmd(
         global_flag: bool = typer.Option(False, "-g", "--global", help="Global schedule status"),
@@ -430,6 +455,14 @@ if HAS_TYPER:
         from .commands.test_cmd import run_test_report
         run_test_report(global_flag=global_flag)
 
+    @test_app.command("watch")
+    def test_watch_cmd(
+        once: bool = typer.Option(False, "--once", help="Print the current progress and exit"),
+    ):
+        """Follow a scheduled run's progress live."""
+        from .commands.test_cmd import run_test_watch
+        raise typer.Exit(run_test_watch(once=once))
+
     @test_app.command("detect")
     def test_detect_cmd():
         """Re-detect test frameworks and update .aec.json."""
@@ -817,6 +850,7 @@ else:
         outdated_parser = subparsers.add_parser("outdated", help="Show items with available upgrades")
         outdated_parser.add_argument("--type", dest="type_filter", help="Filter by type")
         outdated_parser.add_argument("--all", dest="show_all", action="store_true", help="Check all repos")
+        outdated_parser.add_argument("--json", dest="json_output", action="store_true", help="Machine-readable output")
 
         # info
         info_parser = subparsers.add_parser("info", help="Show detailed item metadata")
@@ -889,6 +923,8 @@ else:
         test_sub = test_parser.add_subparsers(dest="test_command")
         test_run = test_sub.add_parser("run", help="Run test suites")
         test_run.add_argument("-g", "--global", dest="global_flag", action="store_true", help="Run all tracked projects")
+        test_run.add_argument("--no-cache", dest="no_cache", action="store_true", help="With -g, rerun suites unchanged since their last pass")
+        test_run.add_argument("--resume", action="store_true", help="With -g, continue the last run if it was interrupted")
         test_schedule = test_sub.add_parser(
             "schedule",
             help="Edit this repo's scheduled suites, or use -g for system-wide daily time",
@@ -912,12 +948,20 @@ else:
             dest="schedule_list",
             help="Print the current schedule and exit (no prompts)",
         )
+        test_plan = test_sub.add_parser(
+            "plan", help="Compute parallel lanes for scheduled runs from profile history"
+        )
+        test_plan.add_argument("--lanes", type=int, default=None, help="Number of lanes")
+        test_plan.add_argument("--dry-run", action="store_true", help="Preview without saving")
+        test_plan.add_argument("--enable", action="store_true", help="Also turn on parallel_enabled")
         test_status = test_sub.add_parser("status", help="Show test configuration or schedule status")
         test_status.add_argument("-g", "--global", dest="global_flag", action="store_true", help="Show global schedule status")
         test_sub.add_parser("enable", help="Enable scheduled test runs")
         test_sub.add_parser("disable", help="Disable scheduled test runs")
         test_report = test_sub.add_parser("report", help="View test reports")
         test_report.add_argument("-g", "--global", dest="global_flag", action="store_true", help="Show global report")
+        test_watch = test_sub.add_parser("watch", help="Follow a scheduled run's progress live")
+        test_watch.add_argument("--once", action="store_true", help="Print the current progress and exit")
         test_sub.add_parser("detect", help="Re-detect test frameworks for current project")
 
         # discover-repos (renamed from discover)
@@ -1085,7 +1129,9 @@ else:
 
         elif args.command == "outdated":
             from .commands.outdated import run_outdated
-            run_outdated(type_filter=args.type_filter, show_all=args.show_all)
+            run_outdated(
+                type_filter=args.type_filter, show_all=args.show_all, json_out=args.json_output
+            )
 
         elif args.command == "info":
             from .commands.info import run_info
@@ -1180,10 +1226,10 @@ else:
             from .commands.test_cmd import (
                 run_test_run, run_test_schedule, run_test_status,
                 run_test_enable, run_test_disable, run_test_report,
-                run_test_detect,
+                run_test_detect, run_test_plan, run_test_watch,
             )
             if args.test_command == "run":
-                run_test_run(global_flag=args.global_flag)
+                run_test_run(global_flag=args.global_flag, no_cache=args.no_cache, resume=args.resume)
             elif args.test_command == "schedule":
                 sys.exit(
                     run_test_schedule(
@@ -1192,6 +1238,12 @@ else:
                         list_only=args.schedule_list,
                     )
                 )
+            elif args.test_command == "plan":
+                sys.exit(
+                    run_test_plan(
+                        lanes=args.lanes, dry_run=args.dry_run, enable=args.enable,
+                    )
+                )
             elif args.test_command == "status":
                 run_test_status(global_flag=args.global_flag)
             elif args.test_command == "enable":
@@ -1200,6 +1252,8 @@ else:
                 run_test_disable()
             elif args.test_command == "report":
                 run_test_report(global_flag=args.global_flag)
+            elif args.test_command == "watch":
+                sys.exit(run_test_watch(once=args.once))
             elif args.test_command == "detect":
                 run_test_detect()
             else:
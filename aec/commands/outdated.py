@@ -5,12 +5,11 @@ from typing import Optional
 
 from ..lib.console import Console
 from ..lib.config import get_repo_root
-from ..lib.manifest_v2 import load_manifest, get_installed
-from ..lib.sources import discover_available, get_source_dirs
+from ..lib.manifest_v2 import load_manifest
+from ..lib.outdated_matrix import ITEM_TYPES, discover_catalog, outdated_matrix, to_json
+from ..lib.sources import get_source_dirs
 from ..lib.scope import find_tracked_repo, get_all_tracked_repos
-from ..lib.skills_manifest import version_is_newer
 
-ITEM_TYPES = ("skills", "rules", "agents", "plugins")
 TYPE_SINGULAR = {"skills": "skill", "rules": "rule", "agents": "agent", "plugins": "plugin"}
 
 
@@ -18,7 +17,11 @@ def _manifest_path() -> Path:
     return Path.home() / ".agents-environment-config" / "installed-manifest.json"
 
 
-def run_outdated(type_filter: Optional[str] = None, show_all: bool = False) -> None:
+def run_outdated(
+    type_filter: Optional[str] = None,
+    show_all: bool = False,
+    json_out: bool = False,
+) -> None:
     """Check for items with available upgrades across scopes."""
     repo = get_repo_root()
     if repo is None:
@@ -34,60 +37,42 @@ def run_outdated(type_filter: Optional[str] = None, show_all: bool = False) -> N
         if plural in ITEM_TYPES:
             types_to_check = (plural,)
 
-    any_outdated = False
-
-    Console.print("Global:")
-    if _print_outdated(manifest, "global", source_dirs, types_to_check):
-        any_outdated = True
-    else:
-        Console.print("  (up to date)")
-
     local_repo = find_tracked_repo()
+    # (heading, scope key, counts towards "everything is up to date")
+    scopes = [("Global:", "global", True)]
     if local_repo:
-        repo_key = str(local_repo.resolve())
-        Console.print(f"\nLocal ({local_repo}):")
-        if _print_outdated(manifest, repo_key, source_dirs, types_to_check):
-            any_outdated = True
-        else:
-            Console.print("  (up to date)")
-
+        scopes.append((f"\nLocal ({local_repo}):", str(local_repo.resolve()), True))
     if show_all:
         for repo_path in get_all_tracked_repos():
             if repo_path == local_repo:
                 continue
-            repo_key = str(repo_path.resolve())
-            Console.print(f"\n{repo_path}:")
-            if not _print_outdated(manifest, repo_key, source_dirs, types_to_check):
-                Console.print("  (up to date)")
+            scopes.append((f"\n{repo_path}:", str(repo_path.resolve()), False))
+
+    catalog = discover_catalog(source_dirs, types_to_check)
+    matrix = outdated_matrix(manifest, catalog, [key for _heading, key, _counts in scopes])
+
+    if json_out:
+        print(to_json(matrix))
+        return
+
+    any_outdated = False
+    for heading, key, counts in scopes:
+        Console.print(heading)
+        if _print_outdated(matrix[key]):
+            any_outdated = any_outdated or counts
+        else:
+            Console.print("  (up to date)")
 
     if not any_outdated:
         Console.print("\nEverything is up to date.")
 
 
-def _print_outdated(
-    manifest: dict,
-    scope: str,
-    source_dirs: dict,
-    types: tuple,
-) -> bool:
-    """Print outdated items for a single scope. Returns True if any found."""
-    found = False
-    for item_type in types:
-        source_dir = source_dirs.get(item_type)
-        if not source_dir or not source_dir.exists():
-            continue
-        available = discover_available(source_dir, item_type)
-        installed = get_installed(manifest, scope, item_type)
-        singular = TYPE_SINGULAR[item_type]
-        for name, info in sorted(installed.items()):
-            if name in available:
-                avail_v = available[name].get("version", "0.0.0")
-                inst_v = info.get("version", "0.0.0")
-                if version_is_newer(avail_v, inst_v):
-                    Console.print(f"  {singular:<8} {name:<32} {inst_v} → {avail_v}")
-                    found = True
-            elif item_type == "plugins":
-                # Plugins absent from the catalog have no version to compare.
-                Console.print(f"  {singular:<8} {name:<32} version unknown")
-                found = True
-    return found
+def _print_outdated(rows: list) -> bool:
+    """Print the outdated rows of a single scope. Returns True if any."""
+    for row in rows:
+        singular = TYPE_SINGULAR[row["type"]]
+        if row["available"] is None:
+            Console.print(f"  {singular:<8} {row['name']:<32} version unknown")
+        else:
+            Console.print(f"  {singular:<8} {row['name']:<32} {row['installed']} → {row['available']}")
+    return bool(rows)
@@ -20,6 +20,8 @@ def _print_results(result: dict) -> None:
 
         if status == "passed":
             Console.success(f"{suite_name:<25} {dur_str}   passed")
+        elif status == "cached-pass":
+            Console.success(f"{suite_name:<25}          cached-pass")
         elif status == "skipped":
             reason = suite_result.get("reason", "")
             Console.info(f"{suite_name:<25}          skipped ({reason})")
@@ -34,14 +36,31 @@ def _print_results(result: dict) -> None:
             Console.warning(obs.get("message", str(obs)))
 
 
-def run_test_run(global_flag: bool = False) -> None:
-    """Run test suites for one or all tracked projects."""
+def run_test_run(
+    global_flag: bool = False, no_cache: bool = False, resume: bool = False
+) -> None:
+    """Run test suites for one or all tracked projects.
+
+    ``no_cache`` reruns suites the skip-unchanged cache would report as
+    ``cached-pass``; it only matters with ``global_flag`` (local runs always
+    run every suite). ``resume`` continues an interrupted ``-g`` run from
+    its journal.
+    """
     from ..lib.runner import run_single_project, run_all_projects, write_reports
     from datetime import datetime, timezone
 
+    if resume and not global_flag:
+        Console.error("--resume only applies to scheduled runs; use it with -g")
+        return
+
     if global_flag:
         Console.info("Running tests for all tracked projects...")
-        results = run_all_projects(global_mode=True)
+        results = run_all_projects(global_mode=True, use_cache=not no_cache, resume=resume)
+        if resume:
+            if results.get("resumed"):
+                Console.info("Resumed the interrupted run")
+            else:
+                Console.info("No interrupted run to resume; started a new run")
         Console.print()
         for project_path, result in results.get("projects", {}).items():
             _print_results(result)
@@ -62,11 +81,20 @@ def run_test_run(global_flag: bool = False) -> None:
                 "Use --global to run all projects, or run from a tracked repo."
             )
             return
-        Console.info(f"Running tests for {repo.name}...")
-        result = run_single_project(repo, run_all=True)
+        from ..lib.config import AEC_SCHEDULER_CONFIG, AEC_TESTS_DIR
+        from ..lib.reports import create_report_dir
+        from ..lib.scheduler_config import get_sample_interval, load_scheduler_config
 
-        # Write reports for local runs too
+        # Write reports for local runs too; suite output streams into them
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        report_dir = create_report_dir(AEC_TESTS_DIR, timestamp.replace(":", "-"))
+
+        Console.info(f"Running tests for {repo.name}...")
+        result = run_single_project(
+            repo, run_all=True, report_dir=report_dir,
+            sample_interval=get_sample_interval(load_scheduler_config(AEC_SCHEDULER_CONFIG)),
+        )
+
         project_name = result.get("project", repo.name)
         summary_path = write_reports(
             {str(repo): result}, timestamp, seed=0,
@@ -85,6 +113,90 @@ def run_test_run(global_flag: bool = False) -> None:
         Console.info(f"Report: {summary_path}")
 
 
+def _format_seconds(seconds: float) -> str:
+    """Render a duration as ``1h02m``, ``4m05s`` or ``12.3s``."""
+    if seconds >= 3600:
+        return f"{int(seconds // 3600)}h{int(seconds % 3600 // 60):02d}m"
+    if seconds >= 60:
+        return f"{int(seconds // 60)}m{int(seconds % 60):02d}s"
+    return f"{seconds:.1f}s"
+
+
+def run_test_plan(
+    lanes: "int | None" = None,
+    dry_run: bool = False,
+    enable: bool = False,
+) -> int:
+    """Compute parallel lanes from profile history and store the plan.
+
+    With ``dry_run`` the plan is only previewed: lanes, predicted makespan,
+    and the serial time it replaces. Returns an exit code.
+    """
+    from contextlib import closing
+
+    from ..lib.config import AEC_HISTORY_DB, AEC_PROFILES_DIR, AEC_SCHEDULER_CONFIG
+    from ..lib.history_store import connect
+    from ..lib.lane_planner import compute_plan
+    from ..lib.runner import find_scheduled_projects
+    from ..lib.scheduler_config import (
+        get_max_parallel_lanes,
+        load_scheduler_config,
+        save_scheduler_config,
+        update_parallelization_plan,
+    )
+
+    config = load_scheduler_config(AEC_SCHEDULER_CONFIG)
+    min_runs = config.get("execution", {}).get("min_profile_runs_for_parallel", 3)
+    lane_count = lanes if lanes and lanes > 0 else get_max_parallel_lanes(config)
+
+    names = [name for _repo, name in find_scheduled_projects()]
+    if not names:
+        Console.info("No tracked projects have scheduled suites.")
+        return 0
+
+    with closing(connect(AEC_HISTORY_DB, legacy_profiles_dir=AEC_PROFILES_DIR)) as conn:
+        plan = compute_plan(conn, names, lane_count, min_runs)
+
+    Console.subheader("Parallelization plan" + (" (dry run)" if dry_run else ""))
+    for number, (lane, seconds) in enumerate(
+        zip(plan["lanes"], plan["lane_seconds"]), start=1
+    ):
+        Console.print(f"  Lane {number}  ~{_format_seconds(seconds):>7}  {', '.join(lane)}")
+
+    if plan["insufficient"]:
+        waiting = ", ".join(
+            f"{name} ({runs}/{min_runs})" for name, runs in plan["insufficient"].items()
+        )
+        Console.info(f"Not enough profiled runs yet, will share a trailing lane: {waiting}")
+
+    if not plan["lanes"]:
+        Console.warning(
+            f"No project has {min_runs} profiled runs yet — nothing to plan."
+        )
+        return 1
+
+    makespan = plan["makespan_seconds"]
+    serial = plan["serial_seconds"]
+    speedup = f", {serial / makespan:.1f}x faster" if makespan > 0 else ""
+    Console.print()
+    Console.print(
+        f"  Predicted makespan: {_format_seconds(makespan)} "
+        f"(serial: {_format_seconds(serial)}{speedup})"
+    )
+
+    if dry_run:
+        return 0
+
+    config = update_parallelization_plan(config, plan["lanes"], plan["based_on_runs"])
+    if enable:
+        config["execution"]["parallel_enabled"] = True
+    save_scheduler_config(config, AEC_SCHEDULER_CONFIG)
+    Console.success(f"Saved {len(plan['lanes'])} lanes to {AEC_SCHEDULER_CONFIG.name}")
+    if not config["execution"].get("parallel_enabled"):
+        Console.info("Parallel runs are off; rerun with --enable to turn them on.")
+    return 0
+
+
 def run_test_schedule(
     global_flag: bool = False,
     commands: "list[str] | None" = None,
@@ -325,8 +437,10 @@ def run_test_disable() -> None:
 
 
 def run_test_report(global_flag: bool = False) -> None:
-    """View test reports."""
+    """View test reports, decompressing older ones as needed."""
     from ..lib.config import AEC_HOME
+    from ..lib.report_index import load_index, read_report_text
+    from ..lib.reports import suite_output_path
 
     tests_dir = AEC_HOME / "tests"
     if not tests_dir.is_dir():
@@ -334,10 +448,8 @@ def run_test_report(global_flag: bool = False) -> None:
         return
 
     # Find latest report directory (sorted by name, newest last)
-    report_dirs = sorted(
-        [d for d in tests_dir.iterdir() if d.is_dir()],
-        key=lambda d: d.name,
-    )
+    report_dirs = [tests_dir / name for name in sorted(load_index(tests_dir))]
+    report_dirs = [d for d in report_dirs if d.is_dir()]
     if not report_dirs:
         Console.info("No test reports found. Run 'aec test run' first.")
         return
@@ -345,10 +457,10 @@ def run_test_report(global_flag: bool = False) -> None:
     latest = report_dirs[-1]
 
     if global_flag:
-        summary = latest / "summary.txt"
-        if summary.exists():
+        summary = read_report_text(latest / "summary.txt")
+        if summary is not None:
             Console.subheader(f"Report: {latest.name}")
-            Console.print(summary.read_text(encoding="utf-8"))
+            Console.print(summary)
         else:
             Console.info(f"No summary found in {latest.name}")
             # List available files
@@ -363,9 +475,107 @@ def run_test_report(global_flag: bool = False) -> None:
             return
 
         # Look for this project's output
-        project_file = latest / f"{repo.name}.txt"
-        if project_file.exists():
+        output = read_report_text(suite_output_path(latest, repo.name))
+        if output is None:
+            output = read_report_text(latest / f"{repo.name}.txt")
+        if output is not None:
             Console.subheader(f"Report: {repo.name} ({latest.name})")
-            Console.print(project_file.read_text(encoding="utf-8"))
+            Console.print(output)
         else:
             Console.info(f"No report for {repo.name} in {latest.name}")
+
+
+def _watch_lines(progress, expected: dict, now: float) -> list:
+    """Render a ``RunProgress`` as the ``aec test watch`` table."""
+    run = progress.run
+    if run is None:
+        return ["Waiting for the run to start..."]
+    projects = progress.projects
+    finished = sum(1 for p in projects.values() if p["status"] not in ("queued", "running"))
+    failed = sum(1 for p in projects.values() if p["status"] == "failed")
+    lanes = run.get("lanes") or 1
+    header = (
+        f"Run {run.get('timestamp')}  (seed {run.get('seed')}, "
+        f"{lanes} lane{'s' if lanes != 1 else ''})  "
+        f"{finished}/{len(projects)} projects, {failed} failed"
+    )
+    if progress.finished is not None:
+        header += f"  done in {_format_seconds(progress.finished.get('duration_seconds') or 0.0)}"
+    else:
+        eta, unknown = progress.eta_seconds(expected, now)
+        header += f"  ETA ~{_format_seconds(eta)}"
+        if unknown:
+            header += f" (+{unknown} without history)"
+    lines = [header, ""]
+    width = max([len(name) for name in projects] + [7])
+    lines.append(f"  {'PROJECT':<{width}}  LANE  SUITES  STATUS")
+    for name, entry in projects.items():
+        lane = str(entry["lane"]) if entry["lane"] is not None else "-"
+        suites = f"{entry['done']}/{len(entry['suites'])}" if entry["suites"] else "-"
+        status = entry["status"]
+        if entry["current"] is not None:
+            status = f"running {entry['current']}"
+            if entry["started_at"] is not None:
+                status += f" ({_format_seconds(max(now - entry['started_at'], 0.0))})"
+        if entry["failed"] and entry["status"] == "running":
+            status += f", {entry['failed']} failed"
+        lines.append(f"  {name:<{width}}  {lane:<4}  {suites:<6}  {status}")
+    if progress.observations:
+        lines.append("")
+        lines.append(f"  {progress.observations} observation(s) so far")
+    if progress.finished is not None and progress.finished.get("summary_path"):
+        lines.append("")
+        lines.append(f"  Report: {progress.finished['summary_path']}")
+    return lines
+
+
+def run_test_watch(once: bool = False, interval: float = 1.0) -> int:
+    """Follow the scheduled run's event stream with a live progress table.
+
+    The ETA comes from each project's median duration in the run history,
+    spread over the run's lanes. With ``once`` (or when stdout is not a
+    terminal) the table is printed once, when the run finishes or
+    immediately with ``once``. Returns an exit code.
+    """
+    import time
+    from contextlib import closing
+
+    from ..lib.config import AEC_HISTORY_DB, AEC_PROFILES_DIR, AEC_TESTS_DIR
+    from ..lib.history_store import connect
+    from ..lib.ordering import project_history_stats
+    from ..lib.run_events import EVENTS_NAME, RunProgress, read_events
+
+    path = AEC_TESTS_DIR / EVENTS_NAME
+    if not path.is_file():
+        Console.info("No scheduled run found. Start one with 'aec test run -g'.")
+        return 1
+
+    live = not once and sys.stdout.isatty()
+    progress = RunProgress()
+    offset = 0
+    expected: dict = {}
+    current_run = None
+    try:
+        while True:
+            events, offset = read_events(path, offset)
+            for event in events:
+                progress.apply(event)
+            if progress.run is not None and progress.run is not current_run:
+                current_run = progress.run
+                with closing(connect(AEC_HISTORY_DB, legacy_profiles_dir=AEC_PROFILES_DIR)) as conn:
+                    stats = project_history_stats(conn, progress.projects)
+                expected = {
+                    name: s["expected_seconds"]
+                    for name, s in stats.items() if s["expected_seconds"]
+                }
+            done = progress.finished is not None
+            if live or once or done:
+                if live:
+                    Console.print("\033[H\033[J", end="")
+                for line in _watch_lines(progress, expected, time.time()):
+                    Console.print(line)
+            if once or done:
+                return 0
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        return 0
@@ -22,14 +22,17 @@ from ..lib.manifest_v2 import (
     record_install,
     is_stale,
 )
+from ..lib.outdated_matrix import discover_catalog, outdated_matrix, upgradable_count
 from ..lib.sources import discover_available, get_source_dirs
 from ..lib.scope import find_tracked_repo, get_all_tracked_repos
 from ..lib.skills_manifest import (
     version_is_newer,
     hash_skill_directory,
     plan_skill_directory_replace,
+    diff_skill_trees,
 )
 from ..lib.skill_dependencies import resolve_install_graph
+from ..lib.hash_cache import skill_tree, skill_trees
 from ..lib.dep_approval_prompt import prompt_dep_upgrade_conflict, prompt_dep_install
 
 
@@ -353,7 +356,7 @@ def _upgrade_scope(
                     existing_path, src_path, info, assume_yes=yes
                 )
                 if plan == "sync_manifest":
-                    sh = hash_skill_directory(src_path)
+                    sh = skill_tree(src_path).content_hash
                     record_install(
                         manifest, scope, item_type, name, avail_v, sh,
                         installed_as=info.get("installedAs", "explicit"),
@@ -370,7 +373,7 @@ def _upgrade_scope(
                 do_prompt = plan == "prompt"
             elif existing_path.exists() and not yes:
                 current_hash = (
-                    hash_skill_directory(existing_path) if existing_path.is_dir() else ""
+                    skill_tree(existing_path).content_hash if existing_path.is_dir() else ""
                 )
                 recorded_hash = info.get("contentHash", "")
                 if (
@@ -381,6 +384,8 @@ def _upgrade_scope(
                     do_prompt = True
 
             if do_prompt:
+                if existing_path.is_dir() and src_path.is_dir():
+                    _print_tree_diff(existing_path, src_path)
                 resp = prompt(
                     item_prompt_id(UPGRADE_OVERWRITE_LOCAL_PREFIX, name),
                     f"  {name} differs from install baseline and source; "
@@ -446,26 +451,32 @@ def _upgrade_scope(
     return upgraded
 
 
+# Files listed per kind of change before the overwrite prompt.
+DIFF_FILES_SHOWN = 10
+
+
+def _print_tree_diff(installed: Path, source: Path) -> None:
+    """List the files in which an installed skill differs from the new source."""
+    installed_tree, source_tree = skill_trees([installed, source])
+    diff = diff_skill_trees(installed_tree.files, source_tree.files)
+    labels = (("modified", "modified"), ("removed", "only installed"), ("added", "only in source"))
+    for kind, label in labels:
+        paths = diff[kind]
+        for rel in paths[:DIFF_FILES_SHOWN]:
+            Console.print(f"    {label:<14} {rel}")
+        if len(paths) > DIFF_FILES_SHOWN:
+            Console.print(f"    {label:<14} … {len(paths) - DIFF_FILES_SHOWN} more")
+
+
 def _find_outdated_repos(
     manifest: dict, repos: list[Path], source_dirs: dict
 ) -> list[tuple[Path, int]]:
     """Find repos with outdated items. Returns list of (repo_path, count)."""
+    catalog = discover_catalog(source_dirs)
+    matrix = outdated_matrix(manifest, catalog, [str(r.resolve()) for r in repos])
     results = []
     for repo_path in repos:
-        repo_key = str(repo_path.resolve())
-        count = 0
-        for item_type, source_dir in source_dirs.items():
-            if not source_dir or not source_dir.exists():
-                continue
-            available = discover_available(source_dir, item_type)
-            installed = get_installed(manifest, repo_key, item_type)
-            for name, info in installed.items():
-                if name in available:
-                    if version_is_newer(
-                        available[name].get("version", "0.0.0"),
-                        info.get("version", "0.0.0"),
-                    ):
-                        count += 1
+        count = upgradable_count(matrix[str(repo_path.resolve())])
         if count > 0:
             results.append((repo_path, count))
     return results
@@ -0,0 +1,164 @@
+"""Wall-clock budget for scheduled test runs.
+
+With ``schedule.max_duration_minutes`` set in ``scheduler-config.json``,
+``run_all_projects`` picks the suites that fit the budget before anything
+runs. Each scheduled suite is an item for a 0/1 knapsack:
+
+* its cost is the median duration from the run history
+  (``DEFAULT_SUITE_SECONDS`` without history)
+* its value is ``2 ** priority`` (``test.suites.<name>.priority`` in
+  ``.aec.json``, default 0) × ``1 + days since it last passed``, capped at
+  ``MAX_STALENESS_DAYS``. Suites that have never passed count as stale as
+  the cap. Suites deferred by the previous run are worth ``DEFERRED_BOOST``
+  times more.
+
+Every lane is its own knapsack with the whole budget, since lanes run side
+by side. A sequential run is one lane. Suites that do not fit are deferred.
+They are listed in summary.txt and recorded in ``last_run.deferred``, and
+their projects run first the next night.
+"""
+
+import math
+import sqlite3
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+# Expected duration of a suite without recorded history.
+DEFAULT_SUITE_SECONDS = 300.0
+
+# Staleness stops adding value after this many days.
+MAX_STALENESS_DAYS = 30.0
+
+# Value multiplier for suites the previous run deferred.
+DEFERRED_BOOST = 4.0
+
+# Upper bound on knapsack capacity units; durations are rounded to fit.
+MAX_CAPACITY_UNITS = 2000
+
+
+class BudgetItem(NamedTuple):
+    """One scheduled suite competing for the budget."""
+
+    project: str
+    suite: str
+    seconds: float
+    value: float
+    staleness_days: Optional[float]
+    carried_over: bool
+
+
+def suite_value(priority: float, staleness_days: Optional[float], carried_over: bool) -> float:
+    """Return a suite's knapsack value (see the module docstring)."""
+    staleness = MAX_STALENESS_DAYS if staleness_days is None else min(
+        max(staleness_days, 0.0), MAX_STALENESS_DAYS
+    )
+    value = (2.0 ** priority) * (1.0 + staleness)
+    return value * DEFERRED_BOOST if carried_over else value
+
+
+def last_verified(conn: sqlite3.Connection, projects: Iterable[str]) -> Dict[Tuple[str, str], float]:
+    """Return when each suite last passed, ``{(project, suite): unix time}``.
+
+    Covers executed passes from the run history and cached passes from the
+    skip-unchanged cache, whichever is newer.
+    """
+    names = list(dict.fromkeys(projects))
+    if not names:
+        return {}
+    marks = ",".join("?" * len(names))
+    verified: Dict[Tuple[str, str], float] = {}
+    for project, suite, at in conn.execute(
+        "SELECT r.project, s.suite, MAX(r.created_at) FROM runs r "
+        "JOIN suites s ON s.run_id = r.id "
+        f"WHERE s.status = 'passed' AND r.project IN ({marks}) "
+        "GROUP BY r.project, s.suite",
+        names,
+    ):
+        verified[(project, suite)] = at
+    for project, suite, at in conn.execute(
+        f"SELECT project, suite, verified_at FROM suite_cache WHERE project IN ({marks})",
+        names,
+    ):
+        verified[(project, suite)] = max(verified.get((project, suite), 0.0), at)
+    return verified
+
+
+def budget_items(
+    conn: sqlite3.Connection,
+    scheduled: Dict[str, Dict[str, dict]],
+    carried_over: Set[Tuple[str, str]],
+    now: Optional[float] = None,
+) -> Dict[Tuple[str, str], BudgetItem]:
+    """Build the knapsack items for every scheduled suite.
+
+    Args:
+        conn: History database.
+        scheduled: ``{project: {suite: suite config}}`` of the run.
+        carried_over: Suites the previous run deferred.
+        now: Current Unix time (defaults to ``time.time()``).
+    """
+    from aec.lib.history_store import suite_duration_percentiles
+
+    now = time.time() if now is None else now
+    durations: Dict[Tuple[str, str], float] = {}
+    for project in scheduled:
+        durations.update(suite_duration_percentiles(conn, 50.0, project=project))
+    verified = last_verified(conn, scheduled)
+
+    items: Dict[Tuple[str, str], BudgetItem] = {}
+    for project, suites in scheduled.items():
+        for suite, suite_config in suites.items():
+            key = (project, suite)
+            try:
+                priority = float((suite_config or {}).get("priority", 0))
+            except (TypeError, ValueError):
+                priority = 0.0
+            staleness = (now - verified[key]) / 86400 if key in verified else None
+            items[key] = BudgetItem(
+                project,
+                suite,
+                durations.get(key, DEFAULT_SUITE_SECONDS),
+                suite_value(priority, staleness, key in carried_over),
+                None if staleness is None else round(staleness, 2),
+                key in carried_over,
+            )
+    return items
+
+
+def select_within_budget(
+    items: Sequence[BudgetItem], capacity_seconds: float
+) -> Tuple[List[BudgetItem], List[BudgetItem]]:
+    """Pick the most valuable items whose durations fit ``capacity_seconds``.
+
+    A 0/1 knapsack over durations rounded up to a resolution that keeps
+    the table within ``MAX_CAPACITY_UNITS`` columns.
+
+    Returns:
+        ``(selected, deferred)``, each in the input order.
+    """
+    if sum(item.seconds for item in items) <= capacity_seconds:
+        return list(items), []
+    resolution = max(1.0, capacity_seconds / MAX_CAPACITY_UNITS)
+    capacity = int(capacity_seconds // resolution)
+    weights = [max(1, math.ceil(item.seconds / resolution)) for item in items]
+
+    best = [0.0] * (capacity + 1)
+    taken: List[bytearray] = []
+    for item, weight in zip(items, weights):
+        took = bytearray(capacity + 1)
+        for c in range(capacity, weight - 1, -1):
+            candidate = best[c - weight] + item.value
+            if candidate > best[c]:
+                best[c] = candidate
+                took[c] = 1
+        taken.append(took)
+
+    chosen = set()
+    c = capacity
+    for index in range(len(items) - 1, -1, -1):
+        if taken[index][c]:
+            chosen.add(index)
+            c -= weights[index]
+    selected = [item for i, item in enumerate(items) if i in chosen]
+    deferred = [item for i, item in enumerate(items) if i not in chosen]
+    return selected, deferred
@@ -1,32 +1,42 @@
 """Generate and load catalog-hashes.json with pre-computed SHA-256 hashes."""
 
-import hashlib
 import json
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Optional
 
 from aec.lib.config import VERSION
-from aec.lib.skills_manifest import hash_skill_directory
+from aec.lib.file_hashing import file_digest, parallel_map
+from aec.lib.hash_cache import HashCache
+from aec.lib.skills_manifest import hash_skill_directory, hash_skill_tree
 from aec.lib.sources import discover_available, get_source_dirs
 
 
 def hash_single_file(path: Path) -> str:
     """Compute SHA-256 of a single file, return 'sha256:<hexdigest>'."""
-    hasher = hashlib.sha256()
-    hasher.update(path.read_bytes())
-    return f"sha256:{hasher.hexdigest()}"
+    return file_digest(path)
 
 
-def generate_catalog_hashes(source_dirs: dict = None) -> dict:
+def generate_catalog_hashes(
+    source_dirs: dict = None,
+    cache: Optional[HashCache] = None,
+    workers: Optional[int] = None,
+) -> dict:
     """Walk each source dir and build a catalog-hashes dict.
 
     For agents: hash each .md file individually using hash_single_file.
     For skills: hash each skill directory using hash_skill_directory.
     For rules: hash each .md file individually using hash_single_file.
 
+    Items are hashed on a thread pool (see ``file_hashing.parallel_map``).
+
     Args:
         source_dirs: Optional dict of item_type -> Path. If None, uses
             get_source_dirs() to discover them from the AEC repo.
+        cache: Optional HashCache; files unchanged since it last hashed
+            them are not read again.
+        workers: Hashing threads (default ``file_hashing.default_workers()``;
+            1 hashes serially).
 
     Returns:
         Dict matching the catalog-hashes.json schema.
@@ -42,6 +52,8 @@ def generate_catalog_hashes(source_dirs: dict = None) -> dict:
         "rules": {},
     }
 
+    # (item_type, name, version, path) of every item to hash
+    jobs = []
     for item_type in ("agents", "skills", "rules"):
         src = source_dirs.get(item_type)
         if src is None:
@@ -54,21 +66,29 @@ def generate_catalog_hashes(source_dirs: dict = None) -> dict:
             full_path = src / rel_path
 
             if item_type == "skills":
-                if full_path.is_dir():
-                    content_hash = hash_skill_directory(full_path)
-                else:
+                if not full_path.is_dir():
                     continue
-            else:
+            elif not full_path.is_file():
                 # agents and rules — hash individual .md files
-                if full_path.is_file():
-                    content_hash = hash_single_file(full_path)
-                else:
-                    continue
-
-            catalog[item_type][name] = {
-                "version": meta.get("version", "0.0.0"),
-                "contentHash": content_hash,
-            }
+                continue
+            jobs.append((item_type, name, meta.get("version", "0.0.0"), full_path))
+
+    def content_hash(job: tuple) -> str:
+        item_type, _name, _version, full_path = job
+        if item_type == "skills":
+            if cache is not None:
+                return cache.hash_directory(full_path, hash_skill_tree)
+            return hash_skill_directory(full_path)
+        if cache is not None:
+            return cache.hash_file(full_path, hash_single_file)
+        return hash_single_file(full_path)
+
+    digests = parallel_map(content_hash, jobs, workers)
+    for (item_type, name, version, _path), digest in zip(jobs, digests):
+        catalog[item_type][name] = {
+            "version": version,
+            "contentHash": digest,
+        }
 
     return catalog
 
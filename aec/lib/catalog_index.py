@@ -0,0 +1,202 @@
+"""Persistent index of the install catalog read by ``sources.discover_available``.
+
+Discovering a catalog means walking a source tree and parsing the
+frontmatter or JSON of every item in it. Almost every command does this,
+often several times. So the results are kept in ``catalog-index.json``
+under ``AEC_HOME``, one entry per item type and source directory. Each
+entry holds:
+
+* ``dirs`` — mtime of every directory in the source tree; adding,
+  removing or renaming a file changes its directory's mtime
+* ``files`` — mtime, size and parsed value of every file the discovery
+  read
+* ``items`` — the discovered catalog (name, version, description, path,
+  ...), and ``dependencies`` of the items that declare them
+
+When no recorded directory or file has changed, ``discover_indexed`` returns
+the stored items after one ``stat`` per entry, without listing or reading
+anything. Otherwise the discovery runs again, and only files whose mtime
+or size changed are parsed again.
+
+A file modified within ``RACY_SECONDS`` of the index being built could
+change again without its mtime moving. Such files are always read again,
+the same way git handles racily clean index entries. The index is a cache:
+if it is missing, corrupt, or cannot be written, discovery simply runs
+uncached.
+"""
+
+import copy
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bumped when the index changes incompatibly; older indexes are discarded.
+INDEX_VERSION = 1
+
+# Entries modified this close to the build are not trusted.
+RACY_SECONDS = 2.0
+
+# Catalogs kept; the least recently built are dropped first.
+MAX_CATALOGS = 32
+
+Parser = Callable[[Path], Any]
+Reader = Callable[[Path, Parser], Any]
+
+
+def read_direct(path: Path, parse: Parser) -> Any:
+    """Catalog reader without an index: parse the file every time."""
+    return parse(path)
+
+
+def _index_path() -> Path:
+    from . import config
+
+    return config.AEC_CATALOG_INDEX
+
+
+def _load(index_path: Path) -> Dict[str, dict]:
+    try:
+        data = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+        return {}
+    catalogs = data.get("catalogs")
+    return catalogs if isinstance(catalogs, dict) else {}
+
+
+def _save(index_path: Path, catalogs: Dict[str, dict]) -> None:
+    from .atomic_write import atomic_write_text
+
+    live = {
+        key: entry
+        for key, entry in catalogs.items()
+        if Path(entry.get("source_dir", "")).is_dir()
+    }
+    newest = sorted(live, key=lambda key: live[key].get("built_at_ns", 0), reverse=True)
+    kept = {key: live[key] for key in newest[:MAX_CATALOGS]}
+    try:
+        atomic_write_text(
+            index_path,
+            json.dumps({"version": INDEX_VERSION, "catalogs": kept}, separators=(",", ":")),
+        )
+    except OSError as exc:
+        logger.debug("Could not write catalog index %s: %s", index_path, exc)
+
+
+def _trusted(mtime_ns: int, built_at_ns: int) -> bool:
+    return mtime_ns < built_at_ns - int(RACY_SECONDS * 1e9)
+
+
+def _unchanged(source_dir: Path, entry: dict) -> bool:
+    """True when every directory and file the entry recorded is untouched."""
+    built_at_ns = entry.get("built_at_ns", 0)
+    try:
+        for rel, mtime_ns in entry["dirs"].items():
+            if not _trusted(mtime_ns, built_at_ns):
+                return False
+            if os.stat(source_dir / rel).st_mtime_ns != mtime_ns:
+                return False
+        for rel, (mtime_ns, size, _value, failed) in entry["files"].items():
+            if failed or not _trusted(mtime_ns, built_at_ns):
+                return False
+            st = os.stat(source_dir / rel)
+            if st.st_mtime_ns != mtime_ns or st.st_size != size:
+                return False
+    except (OSError, KeyError, TypeError, ValueError):
+        return False
+    return True
+
+
+class _IndexedReader:
+    """Reader that reuses parsed values of files unchanged since the last build."""
+
+    def __init__(self, source_dir: Path, previous: Optional[dict]):
+        self.source_dir = source_dir
+        self.previous_files = (previous or {}).get("files") or {}
+        self.previous_built_at_ns = (previous or {}).get("built_at_ns", 0)
+        self.files: Dict[str, list] = {}
+
+    def __call__(self, path: Path, parse: Parser) -> Any:
+        rel = path.relative_to(self.source_dir).as_posix()
+        st = os.stat(path)
+        cached = self.previous_files.get(rel)
+        if (
+            isinstance(cached, list)
+            and len(cached) == 4
+            and not cached[3]
+            and cached[0] == st.st_mtime_ns
+            and cached[1] == st.st_size
+            and _trusted(cached[0], self.previous_built_at_ns)
+        ):
+            self.files[rel] = cached
+            return copy.deepcopy(cached[2])
+        try:
+            value = parse(path)
+        except Exception:
+            self.files[rel] = [st.st_mtime_ns, st.st_size, None, True]
+            raise
+        # Store a detached JSON copy; callers may mutate what they get back
+        stored = json.loads(json.dumps(value, default=str))
+        self.files[rel] = [st.st_mtime_ns, st.st_size, stored, False]
+        return value
+
+
+def _dependencies(files: Dict[str, list]) -> Dict[str, list]:
+    """Collect ``dependencies`` declared by parsed items (SKILL.md frontmatter)."""
+    found = {}
+    for _mtime, _size, value, _failed in files.values():
+        if isinstance(value, dict) and value.get("dependencies") and "name" in value:
+            found[value["name"]] = value["dependencies"]
+    return found
+
+
+def discover_indexed(
+    source_dir: Path,
+    item_type: str,
+    discover: Callable[[Path, Reader], dict],
+    index_path: Optional[Path] = None,
+) -> dict:
+    """Return ``discover(source_dir, reader)``, answered from the index when possible.
+
+    Args:
+        source_dir: Root of the catalog source.
+        item_type: Catalog type, part of the index key.
+        discover: Discovery function. Every file it parses must be read
+            through the reader it is given.
+        index_path: Index file (defaults to ``config.AEC_CATALOG_INDEX``).
+    """
+    index_path = index_path or _index_path()
+    source_dir = Path(os.path.abspath(source_dir))
+    key = f"{item_type}:{source_dir}"
+    catalogs = _load(index_path)
+    previous = catalogs.get(key)
+    if isinstance(previous, dict) and _unchanged(source_dir, previous):
+        return previous["items"]
+
+    built_at_ns = time.time_ns()
+    dirs = {}
+    for root, _subdirs, _files in os.walk(source_dir):
+        try:
+            rel = Path(root).relative_to(source_dir).as_posix()
+            dirs[rel] = os.stat(root).st_mtime_ns
+        except OSError:
+            continue
+    reader = _IndexedReader(source_dir, previous if isinstance(previous, dict) else None)
+    items = discover(source_dir, reader)
+
+    catalogs[key] = {
+        "source_dir": str(source_dir),
+        "built_at_ns": built_at_ns,
+        "dirs": dirs,
+        "files": reader.files,
+        "items": json.loads(json.dumps(items, default=str)),
+        "dependencies": _dependencies(reader.files),
+    }
+    _save(index_path, catalogs)
+    return items
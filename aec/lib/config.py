@@ -55,10 +55,13 @@ INSTALLED_RULES = AEC_HOME / "installed-rules.json"
 INSTALLED_SKILLS = AEC_HOME / "installed-skills.json"
 AEC_PORTS_REGISTRY = AEC_HOME / "ports-registry.json"
 TRACKED_REPOS_PATH = AEC_HOME / "tracked-repos.json"
+AEC_CATALOG_INDEX = AEC_HOME / "catalog-index.json"
+AEC_HASH_CACHE = AEC_HOME / "hash-cache.json"
 
 # Phase 2: Test runner paths (pathlib / Path.home(); correct on Windows and Unix)
 AEC_TESTS_DIR = AEC_HOME / "tests"
 AEC_PROFILES_DIR = AEC_HOME / "profiles"
+AEC_HISTORY_DB = AEC_HOME / "history.db"
 AEC_SCHEDULER_CONFIG = AEC_HOME / "scheduler-config.json"
 AEC_RUNNER_SCRIPT = AEC_HOME / "runner.py"
 
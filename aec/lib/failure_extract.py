@@ -0,0 +1,346 @@
+"""Failing tests and their first error lines, pulled from a suite's output.
+
+When a suite fails, ``execute_suite`` reads the output it streamed to disk
+once more, line by line, through the extractor of the suite's framework
+(one per entry of ``TEST_FRAMEWORK_HOOKS``). The extractor keeps the
+names of up to ``MAX_FAILURES`` failing tests and the first error line of
+each, so summary.txt can say what failed without opening the log.
+
+Lines are read ``MAX_LINE_BYTES`` at a time and only the kept names and
+errors are held, so memory stays bounded however long the output is.
+
+The framework comes from the suite's ``framework`` key, a ``fw:<key>``
+suite name, or the command. When none of those tell, every extractor reads
+the same pass and the one that found the most failures wins.
+"""
+
+import re
+from abc import ABC, abstractmethod
+from typing import BinaryIO, Dict, List, Optional, Type
+
+# Failing tests kept per suite; the rest are only counted.
+MAX_FAILURES = 20
+
+# Error lines held while waiting for their test to be reported.
+MAX_PENDING_ERRORS = 200
+
+# Longest line read at once; longer lines are cut.
+MAX_LINE_BYTES = 4096
+
+# Characters of an error line kept.
+ERROR_CHARS = 300
+
+_ANSI = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]")
+
+
+class FailureExtractor(ABC):
+    """Line-by-line parser of one framework's output."""
+
+    framework = ""
+
+    def __init__(self, limit: int = MAX_FAILURES):
+        self.limit = limit
+        self.tests: List[str] = []
+        self.omitted = 0
+        self._errors: Dict[str, str] = {}
+        self._awaiting: Optional[str] = None
+
+    def feed(self, line: str) -> None:
+        """Take one output line (without its newline)."""
+        if self._awaiting is not None:
+            text = line.strip()
+            if text and not self._skip_error(text):
+                self._error(self._awaiting, text)
+                self._awaiting = None
+                return
+        self.parse(line)
+
+    @abstractmethod
+    def parse(self, line: str) -> None:
+        """Look for a failing test or an error in one output line."""
+
+    def _skip_error(self, text: str) -> bool:
+        """True for lines that sit between a test header and its error."""
+        return False
+
+    def _fail(self, test: str) -> None:
+        if test in self.tests:
+            return
+        if len(self.tests) < self.limit:
+            self.tests.append(test)
+        else:
+            self.omitted += 1
+
+    def _error(self, key: str, text: str) -> None:
+        if key not in self._errors and len(self._errors) < MAX_PENDING_ERRORS:
+            self._errors[key] = text[:ERROR_CHARS]
+
+    def _expect_error(self, key: str) -> None:
+        """Take the next non-blank line as ``key``'s error."""
+        self._awaiting = key
+
+    def error_key(self, test: str) -> str:
+        """Key under which a reported test's error was stored."""
+        return test
+
+    def result(self) -> List[dict]:
+        return [
+            {"test": test, "error": self._errors.get(self.error_key(test))}
+            for test in self.tests
+        ]
+
+
+class PytestExtractor(FailureExtractor):
+    """``FAILED``/``ERROR`` summary lines; errors from ``E`` lines under ``____ name ____``."""
+
+    framework = "pytest"
+    _summary = re.compile(r"^(?:FAILED|ERROR) (\S+)(?: - (.*))?$")
+    _header = re.compile(r"^_{3,} (?:ERROR at \w+ of )?(\S.*?) _{3,}$")
+    _e_line = re.compile(r"^E\s+(\S.*)$")
+
+    def __init__(self, limit: int = MAX_FAILURES):
+        super().__init__(limit)
+        self._current: Optional[str] = None
+        self._headers: List[str] = []
+
+    def parse(self, line: str) -> None:
+        match = self._summary.match(line)
+        if match:
+            test, message = match.groups()
+            self._fail(test)
+            if message:
+                self._error(f"summary:{test}", message)
+            return
+        match = self._header.match(line)
+        if match:
+            self._current = match.group(1)
+            if len(self._headers) < MAX_PENDING_ERRORS:
+                self._headers.append(self._current)
+            return
+        match = self._e_line.match(line)
+        if match and self._current is not None:
+            self._error(self._current, match.group(1))
+
+    def error_key(self, test: str) -> str:
+        # ``path::Class::test`` is shown as ``Class.test`` in section headers
+        return test.split("::", 1)[-1].replace("::", ".")
+
+    def result(self) -> List[dict]:
+        if not self.tests:
+            # Run without the short summary (-rN): fall back to section headers
+            for header in self._headers:
+                self._fail(header)
+        return [
+            {
+                "test": test,
+                "error": self._errors.get(self.error_key(test))
+                or self._errors.get(f"summary:{test}"),
+            }
+            for test in self.tests
+        ]
+
+
+class JestExtractor(FailureExtractor):
+    """``● Suite › test`` blocks, error on the next line."""
+
+    framework = "jest"
+    _header = re.compile(r"^\s*● (.+)$")
+
+    def parse(self, line: str) -> None:
+        match = self._header.match(line)
+        # "● Console" opens a block of captured console output, not a failure
+        if match and match.group(1) != "Console":
+            self._fail(match.group(1))
+            self._expect_error(match.group(1))
+
+
+class VitestExtractor(FailureExtractor):
+    """`` FAIL  file > suite > test`` headers, error on the next line."""
+
+    framework = "vitest"
+    _header = re.compile(r"^\s*FAIL\s+(\S.*? > .+?)\s*$")
+
+    def parse(self, line: str) -> None:
+        match = self._header.match(line)
+        if match:
+            self._fail(match.group(1))
+            self._expect_error(match.group(1))
+
+    def _skip_error(self, text: str) -> bool:
+        return set(text) <= set("⎯-─ ")
+
+
+class PlaywrightExtractor(FailureExtractor):
+    """``1) [project] › file:line › test`` headers, error on the next line."""
+
+    framework = "playwright"
+    _header = re.compile(r"^\s*\d+\) (\[.+?\] › .+?)\s*─*$")
+
+    def parse(self, line: str) -> None:
+        match = self._header.match(line)
+        if match:
+            self._fail(match.group(1))
+            self._expect_error(match.group(1))
+
+
+class CargoTestExtractor(FailureExtractor):
+    """``test x ... FAILED`` lines; errors from the ``---- x stdout ----`` panics."""
+
+    framework = "cargo_test"
+    _failed = re.compile(r"^test (\S+) \.\.\. FAILED$")
+    _stdout = re.compile(r"^---- (\S+) stdout ----$")
+    _panic = re.compile(r"^thread '.*' panicked at (.*)$")
+
+    def __init__(self, limit: int = MAX_FAILURES):
+        super().__init__(limit)
+        self._current: Optional[str] = None
+
+    def parse(self, line: str) -> None:
+        match = self._failed.match(line)
+        if match:
+            self._fail(match.group(1))
+            return
+        match = self._stdout.match(line)
+        if match:
+            self._current = match.group(1)
+            return
+        match = self._panic.match(line)
+        if match and self._current is not None:
+            if line.endswith(":"):
+                # Rust >= 1.73 puts the message on the line after the location
+                self._expect_error(self._current)
+            else:
+                self._error(self._current, match.group(1))
+            self._current = None
+
+
+class GoTestExtractor(FailureExtractor):
+    """``--- FAIL: TestName`` lines, error on the next indented line."""
+
+    framework = "go_test"
+    _failed = re.compile(r"^\s*--- FAIL: (\S+)")
+
+    def parse(self, line: str) -> None:
+        match = self._failed.match(line)
+        if match:
+            self._fail(match.group(1))
+            self._expect_error(match.group(1))
+
+    def _skip_error(self, text: str) -> bool:
+        return text.startswith("--- FAIL:")
+
+
+class RspecExtractor(FailureExtractor):
+    """Numbered entries under ``Failures:``, error after ``Failure/Error:``."""
+
+    framework = "rspec"
+    _header = re.compile(r"^\s*\d+\) (.+)$")
+
+    def __init__(self, limit: int = MAX_FAILURES):
+        super().__init__(limit)
+        self._in_failures = False
+
+    def parse(self, line: str) -> None:
+        if line.startswith("Failures:"):
+            self._in_failures = True
+            return
+        if line.startswith(("Finished in ", "Failed examples:")):
+            self._in_failures = False
+            return
+        match = self._header.match(line) if self._in_failures else None
+        if match:
+            self._fail(match.group(1))
+            self._expect_error(match.group(1))
+
+    def _skip_error(self, text: str) -> bool:
+        return text.startswith("Failure/Error:")
+
+
+EXTRACTORS: Dict[str, Type[FailureExtractor]] = {
+    cls.framework: cls
+    for cls in (
+        JestExtractor,
+        VitestExtractor,
+        PytestExtractor,
+        PlaywrightExtractor,
+        CargoTestExtractor,
+        GoTestExtractor,
+        RspecExtractor,
+    )
+}
+
+# Command fragments naming a framework, checked in order.
+_COMMAND_HINTS = (
+    ("playwright", "playwright"),
+    ("vitest", "vitest"),
+    ("jest", "jest"),
+    ("pytest", "pytest"),
+    ("cargo test", "cargo_test"),
+    ("cargo nextest", "cargo_test"),
+    ("go test", "go_test"),
+    ("rspec", "rspec"),
+)
+
+
+def suite_framework(suite_name: str, suite_config: dict) -> Optional[str]:
+    """Return the ``TEST_FRAMEWORK_HOOKS`` key of a suite, or None when unknown."""
+    framework = suite_config.get("framework")
+    if framework in EXTRACTORS:
+        return framework
+    if suite_name.startswith("fw:") and suite_name[3:] in EXTRACTORS:
+        return suite_name[3:]
+    command = suite_config.get("command") or ""
+    for hint, key in _COMMAND_HINTS:
+        if hint in command:
+            return key
+    return None
+
+
+def _lines(fh: BinaryIO, start: int):
+    """Yield decoded lines after ``start``, cutting lines longer than ``MAX_LINE_BYTES``."""
+    fh.seek(start)
+    continued = False
+    while True:
+        chunk = fh.readline(MAX_LINE_BYTES)
+        if not chunk:
+            return
+        complete = chunk.endswith(b"\n")
+        if not continued:
+            yield _ANSI.sub("", chunk.decode("utf-8", errors="replace").rstrip("\r\n"))
+        continued = not complete
+
+
+def extract_failures(
+    fh: BinaryIO,
+    start: int = 0,
+    framework: Optional[str] = None,
+    limit: int = MAX_FAILURES,
+) -> Optional[dict]:
+    """Read a suite's output once and return its failing tests.
+
+    Args:
+        fh: Binary file holding the output.
+        start: Offset where the suite's output begins.
+        framework: ``TEST_FRAMEWORK_HOOKS`` key; None tries every extractor.
+        limit: Failing tests kept.
+
+    Returns:
+        ``{"framework", "failures": [{"test", "error"}], "omitted"}``, or
+        None when no failing test was recognised.
+    """
+    if framework in EXTRACTORS:
+        extractors = [EXTRACTORS[framework](limit)]
+    else:
+        extractors = [cls(limit) for cls in EXTRACTORS.values()]
+    for line in _lines(fh, start):
+        for extractor in extractors:
+            extractor.feed(line)
+    results = [(extractor, extractor.result()) for extractor in extractors]
+    extractor, failures = max(results, key=lambda pair: len(pair[1]))
+    if not failures:
+        return None
+    return {
+        "framework": extractor.framework,
+        "failures": failures,
+        "omitted": extractor.omitted,
+    }
@@ -0,0 +1,86 @@
+"""Streaming SHA-256 of files, fanned out over a thread pool.
+
+Every content hash AEC records (``contentHash`` of agents, rules and skill
+directories, ``catalog-hashes.json``, discovery matches) is a SHA-256 of
+file bytes. The helpers here stream files through the hash in
+``CHUNK_BYTES`` pieces rather than reading them whole. They use
+``hashlib.file_digest`` where it exists (Python 3.11+) and a ``readinto``
+loop over one reused buffer otherwise. Either way a large asset never sits
+in memory at once, and the digests are byte-identical to hashing
+``path.read_bytes()``.
+
+``hashlib`` releases the GIL while it hashes more than a couple of
+kilobytes, and so does reading a file. ``parallel_map`` therefore runs
+per-item hashing (one catalog item or one local file per task) on a
+thread pool. It stays serial for a handful of items, where starting
+threads costs more than it saves.
+"""
+
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterable, List, Optional, TypeVar
+
+# Bytes read at once while streaming a file into a hash.
+CHUNK_BYTES = 1 << 20
+
+# Upper bound on hashing threads.
+MAX_WORKERS = 8
+
+# Fewer items than this are hashed on the calling thread.
+PARALLEL_MIN_ITEMS = 8
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def update_from_file(hasher, fh: BinaryIO, *more) -> None:
+    """Feed the rest of an open binary file into ``hasher`` and ``more``, chunk by chunk."""
+    hashers = (hasher, *more)
+    buf = bytearray(CHUNK_BYTES)
+    view = memoryview(buf)
+    while True:
+        size = fh.readinto(buf)
+        if not size:
+            return
+        for h in hashers:
+            h.update(view[:size])
+
+
+def sha256_file(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's contents, streamed."""
+    with open(path, "rb") as fh:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(fh, "sha256").hexdigest()
+        hasher = hashlib.sha256()
+        update_from_file(hasher, fh)
+        return hasher.hexdigest()
+
+
+def file_digest(path: Path) -> str:
+    """Return ``sha256:<hexdigest>`` of a file, as recorded in ``contentHash``."""
+    return f"sha256:{sha256_file(path)}"
+
+
+def default_workers() -> int:
+    """Threads used by ``parallel_map`` unless told otherwise."""
+    # Reads overlap with hashing, so use a few more threads than cores
+    return min(MAX_WORKERS, (os.cpu_count() or 1) + 4)
+
+
+def parallel_map(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    workers: Optional[int] = None,
+) -> List[R]:
+    """Return ``[fn(item) for item in items]``, computed on a thread pool.
+
+    Order is preserved, and the first exception raised by ``fn`` propagates.
+    """
+    items = list(items)
+    workers = default_workers() if workers is None else workers
+    if workers <= 1 or len(items) < PARALLEL_MIN_ITEMS:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(workers, len(items))) as pool:
+        return list(pool.map(fn, items))
@@ -0,0 +1,79 @@
+"""Flaky-suite detection for scheduled test runs.
+
+A suite's flakiness score comes from its recent history in the run history
+database. Each stored run is one outcome:
+
+* ``pass`` or ``fail`` from the first attempt
+* ``flaky`` when the first attempt failed and a rerun passed
+
+The score is the number of flaky runs plus the number of pass/fail flips
+between consecutive runs, divided by the number of runs (0-1). A
+suite that always passes or always fails scores 0. One that alternates
+scores close to 1. Cached passes and skipped runs are ignored.
+
+Failed suites scoring at least ``execution.rerun_flakiness_threshold`` are
+rerun (up to ``execution.max_reruns`` times) once every first attempt of
+the run has finished.
+"""
+
+import sqlite3
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Runs of history each score is computed from.
+FLAKINESS_HISTORY_RUNS = 20
+
+# Suites listed in the summary's flakiness section.
+TOP_FLAKY_SUITES = 10
+
+
+def run_outcome(profile: dict) -> Optional[str]:
+    """Return ``pass``, ``fail`` or ``flaky`` for one stored suite profile."""
+    status = profile.get("status")
+    if status == "passed":
+        return "pass"
+    if status != "failed":
+        return None
+    reruns = profile.get("reruns") or []
+    if any(r.get("status") == "passed" for r in reruns if isinstance(r, dict)):
+        return "flaky"
+    return "fail"
+
+
+def flakiness_score(outcomes: List[str]) -> float:
+    """Score a suite's outcomes, listed in run order (either direction)."""
+    if len(outcomes) < 2 and "flaky" not in outcomes:
+        return 0.0
+    events = outcomes.count("flaky")
+    for previous, current in zip(outcomes, outcomes[1:]):
+        if {previous, current} == {"pass", "fail"}:
+            events += 1
+    return round(events / len(outcomes), 3)
+
+
+def suite_flakiness(
+    conn: sqlite3.Connection,
+    project_names: Iterable[str],
+    history_limit: int = FLAKINESS_HISTORY_RUNS,
+) -> Dict[Tuple[str, str], dict]:
+    """Score every suite of the given projects from stored history.
+
+    Returns:
+        ``{(project, suite): {"score", "runs"}}`` for suites with at least
+        one pass or fail on record.
+    """
+    from aec.lib.history_store import load_project_profiles
+
+    scores: Dict[Tuple[str, str], dict] = {}
+    for project in dict.fromkeys(project_names):
+        outcomes: Dict[str, List[str]] = {}
+        for run in load_project_profiles(conn, project, limit=history_limit):
+            for suite, profile in run.items():
+                outcome = run_outcome(profile) if isinstance(profile, dict) else None
+                if outcome is not None:
+                    outcomes.setdefault(suite, []).append(outcome)
+        for suite, suite_outcomes in outcomes.items():
+            scores[(project, suite)] = {
+                "score": flakiness_score(suite_outcomes),
+                "runs": len(suite_outcomes),
+            }
+    return scores
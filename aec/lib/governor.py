@@ -0,0 +1,219 @@
+"""Load-adaptive admission control for suites of a parallel test run.
+
+Parallel lanes bound how many projects may run at once, but a fixed bound
+is wrong on a laptop that someone is also using. When
+``execution.adaptive_concurrency`` is on (the default), every suite of a
+parallel run asks the run's :class:`ConcurrencyGovernor` for a slot before
+it starts. A suite is admitted when:
+
+* fewer than ``execution.max_parallel_lanes`` suites are running,
+* the 1-minute load average per CPU (``os.getloadavg()``) is below
+  ``execution.max_load_per_cpu``, and
+* its predicted peak memory fits: ``MemAvailable`` from ``/proc/meminfo``,
+  minus ``execution.memory_reserve_mb``, minus the predicted peaks of the
+  suites already running.
+
+A suite's prediction is the highest peak memory it has recorded in the run
+history, or ``DEFAULT_SUITE_MEMORY_MB`` without history. Signals the
+platform does not provide (load average on Windows, ``/proc/meminfo``
+outside Linux) are not checked. When nothing is running, the next suite is
+always admitted, so a run can never stall.
+
+Each admission is logged with what it waited for, and the governor keeps
+time-weighted utilization; both go into the run report.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Predicted peak for suites that have never recorded their memory.
+DEFAULT_SUITE_MEMORY_MB = 256.0
+
+# Seconds between re-checks while a suite waits for load or memory.
+POLL_INTERVAL_SECONDS = 1.0
+
+# Runs of history the memory predictions are taken from.
+MEMORY_HISTORY_RUNS = 10
+
+MEMINFO_PATH = Path("/proc/meminfo")
+
+
+def available_memory_mb(meminfo_path: Path = MEMINFO_PATH) -> Optional[float]:
+    """Return ``MemAvailable`` in MB, or None where ``/proc/meminfo`` is missing."""
+    try:
+        with open(meminfo_path, encoding="ascii") as fh:
+            for line in fh:
+                if line.startswith("MemAvailable:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def load_per_cpu() -> Optional[float]:
+    """Return the 1-minute load average per CPU, or None where it is unavailable."""
+    try:
+        load = os.getloadavg()[0]
+    except (AttributeError, OSError):
+        return None
+    return round(load / (os.cpu_count() or 1), 3)
+
+
+def profile_peak_memory_mb(profile: dict) -> Optional[float]:
+    """Return the peak memory a stored suite profile recorded, if any."""
+    from aec.lib.reports import suite_resource_usage
+
+    peaks = []
+    usage = suite_resource_usage(profile)
+    if "memory_mb" in usage:
+        peaks.append(float(usage["memory_mb"]))
+    resources = profile.get("resources") or {}
+    if isinstance(resources.get("peak_rss_mb"), (int, float)):
+        peaks.append(float(resources["peak_rss_mb"]))
+    return max(peaks) if peaks else None
+
+
+def suite_memory_history(
+    conn: sqlite3.Connection,
+    project_names: Iterable[str],
+    history_limit: int = MEMORY_HISTORY_RUNS,
+) -> Dict[Tuple[str, str], float]:
+    """Return each suite's highest recorded peak memory, ``{(project, suite): MB}``."""
+    from aec.lib.history_store import load_project_profiles
+
+    peaks: Dict[Tuple[str, str], float] = {}
+    for project in dict.fromkeys(project_names):
+        for run in load_project_profiles(conn, project, limit=history_limit):
+            for suite, profile in run.items():
+                peak = profile_peak_memory_mb(profile) if isinstance(profile, dict) else None
+                if peak is not None:
+                    key = (project, suite)
+                    peaks[key] = max(peaks.get(key, 0.0), peak)
+    return peaks
+
+
+class ConcurrencyGovernor:
+    """Admit suites of a parallel run while load and memory allow; thread-safe."""
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        predicted_memory_mb: Dict[Tuple[str, str], float],
+        max_load_per_cpu: float = 1.0,
+        memory_reserve_mb: float = 1024.0,
+        load: Callable[[], Optional[float]] = load_per_cpu,
+        memory: Callable[[], Optional[float]] = available_memory_mb,
+        poll_interval: float = POLL_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.predicted_memory_mb = predicted_memory_mb
+        self.max_load_per_cpu = max_load_per_cpu
+        self.memory_reserve_mb = memory_reserve_mb
+        self._load = load
+        self._memory = memory
+        self._poll_interval = poll_interval
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._running: Dict[int, float] = {}
+        self._next_token = 0
+        self._decisions: List[dict] = []
+        self._started = clock()
+        self._changed = self._started
+        self._busy_seconds = 0.0
+        self._peak = 0
+
+    def predicted(self, project: str, suite: str) -> float:
+        return self.predicted_memory_mb.get((project, suite), DEFAULT_SUITE_MEMORY_MB)
+
+    def _blockers(self, predicted_mb: float) -> Tuple[List[str], Optional[float], Optional[float]]:
+        """Return why a suite cannot start now, with the readings used."""
+        load = self._load()
+        available = self._memory()
+        if not self._running:
+            return [], load, available
+        blockers = []
+        if len(self._running) >= self.max_concurrency:
+            blockers.append("slots")
+        if load is not None and load >= self.max_load_per_cpu:
+            blockers.append("load")
+        if available is not None:
+            headroom = available - self.memory_reserve_mb - sum(self._running.values())
+            if predicted_mb > headroom:
+                blockers.append("memory")
+        return blockers, load, available
+
+    def _account(self) -> None:
+        now = self._clock()
+        self._busy_seconds += len(self._running) * (now - self._changed)
+        self._changed = now
+
+    def acquire(self, project: str, suite: str) -> int:
+        """Block until the suite may start; returns a token for :meth:`release`."""
+        predicted_mb = self.predicted(project, suite)
+        waited_for: List[str] = []
+        start = self._clock()
+        with self._cond:
+            while True:
+                blockers, load, available = self._blockers(predicted_mb)
+                if not blockers:
+                    break
+                waited_for.extend(b for b in blockers if b not in waited_for)
+                self._cond.wait(self._poll_interval)
+            self._account()
+            token = self._next_token
+            self._next_token += 1
+            self._running[token] = predicted_mb
+            self._peak = max(self._peak, len(self._running))
+            self._decisions.append({
+                "project": project,
+                "suite": suite,
+                "waited_seconds": round(self._clock() - start, 3),
+                "waited_for": waited_for,
+                "running": len(self._running) - 1,
+                "load_per_cpu": load,
+                "available_mb": available,
+                "predicted_mb": predicted_mb,
+            })
+            return token
+
+    def release(self, token: int) -> None:
+        with self._cond:
+            self._account()
+            self._running.pop(token, None)
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, project: str, suite: str) -> Iterator[None]:
+        """Hold a slot for the duration of one suite."""
+        token = self.acquire(project, suite)
+        try:
+            yield
+        finally:
+            self.release(token)
+
+    def report(self) -> dict:
+        """Return the settings, utilization and every admission decision."""
+        with self._cond:
+            self._account()
+            elapsed = self._changed - self._started
+            mean = self._busy_seconds / elapsed if elapsed > 0 else 0.0
+            decisions = [dict(d) for d in self._decisions]
+        deferred = [d for d in decisions if d["waited_for"]]
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_load_per_cpu": self.max_load_per_cpu,
+            "memory_reserve_mb": self.memory_reserve_mb,
+            "peak_concurrency": self._peak,
+            "mean_concurrency": round(mean, 2),
+            "utilization": round(mean / self.max_concurrency, 3),
+            "admitted": len(decisions),
+            "deferred": len(deferred),
+            "wait_seconds": round(sum(d["waited_seconds"] for d in deferred), 3),
+            "decisions": decisions,
+        }
@@ -0,0 +1,222 @@
+"""Content hashes of catalog files and skill trees, reused while files are unchanged.
+
+``HashCache`` remembers each file's SHA-256 under its
+``(path, size, mtime_ns, inode)``, so a file whose stat still matches is
+not read again. ``generate_catalog_hashes`` (the pre-commit hook) keeps
+one in ``CACHE_NAME`` next to ``catalog-hashes.json``. Installed skill
+trees use the shared one in ``AEC_HASH_CACHE`` (``skill_trees``).
+
+A skill directory is hashed as a ``SkillTree``: one digest per file plus
+the root ``contentHash`` recorded in manifests. The root is the single
+stream hash of ``hash_skill_directory``, kept for compatibility, so it
+cannot be derived from the file digests. It is stored with them instead,
+and reused while the directory holds the same files with the same
+digests. Checking an unchanged tree therefore costs one listing and one
+``stat`` per file, and only changed files are read to find out which ones
+differ. When some content really changed, or files were added or removed,
+``hash_skill_tree`` reads the tree once for the root and the file digests
+together.
+
+As in ``catalog_index``, a file modified within ``RACY_SECONDS`` of being
+hashed could change again without its mtime moving, so it is always read
+again. Lookups may run on several threads at once (``generate_catalog_hashes``
+hashes items in parallel). The cache is only an optimisation: if it is
+missing or corrupt, everything is hashed, and if it cannot be written, it
+is skipped.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from .skills_manifest import SkillTree, skill_tree_files
+
+logger = logging.getLogger(__name__)
+
+CACHE_NAME = "catalog-hashes.cache.json"
+
+# Bumped when the cache changes incompatibly; older caches are discarded.
+CACHE_VERSION = 2
+
+# Files modified this close to being hashed are not trusted.
+RACY_SECONDS = 2.0
+
+Hasher = Callable[[Path], str]
+TreeHasher = Callable[[Path], SkillTree]
+
+
+def _signature(st: os.stat_result) -> List[int]:
+    return [st.st_size, st.st_mtime_ns, st.st_ino]
+
+
+def _trusted(mtime_ns: int, hashed_at_ns: int) -> bool:
+    return mtime_ns < hashed_at_ns - int(RACY_SECONDS * 1e9)
+
+
+class HashCache:
+    """Digests of files and skill directories, keyed by path and checked by stat."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self.files: Dict[str, list] = {}
+        self.dirs: Dict[str, dict] = {}
+        self.hits = 0
+        self.misses = 0
+        self._used: set = set()
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Path) -> "HashCache":
+        """Read the cache at ``path``; a missing or invalid cache starts empty."""
+        cache = cls(path)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cache
+        if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+            if isinstance(data.get("files"), dict):
+                cache.files = data["files"]
+            if isinstance(data.get("dirs"), dict):
+                cache.dirs = data["dirs"]
+        return cache
+
+    def save(self) -> None:
+        """Write the cache back if anything was hashed since it was loaded."""
+        if self.path is None or not self._dirty:
+            return
+        from .atomic_write import atomic_write_text
+
+        try:
+            atomic_write_text(
+                self.path,
+                json.dumps(
+                    {"version": CACHE_VERSION, "files": self.files, "dirs": self.dirs},
+                    separators=(",", ":"),
+                ),
+            )
+        except OSError as exc:
+            logger.debug("Could not write hash cache %s: %s", self.path, exc)
+            return
+        self._dirty = False
+
+    def _cached_file(self, key: str, signature: List[int]) -> Optional[str]:
+        """The digest stored for ``key`` if its stat still matches and can be trusted."""
+        cached = self.files.get(key)
+        if (
+            isinstance(cached, list)
+            and len(cached) == 5
+            and cached[:3] == signature
+            and _trusted(signature[1], cached[3])
+        ):
+            return cached[4]
+        return None
+
+    def hash_file(self, path: Path, hasher: Optional[Hasher] = None) -> str:
+        """Return ``hasher(path)`` (default ``hash_single_file``), reading the file only if it changed."""
+        if hasher is None:
+            from .catalog_hashes import hash_single_file as hasher
+        key = os.path.abspath(path)
+        self._used.add(key)
+        signature = _signature(os.stat(path))
+        digest = self._cached_file(key, signature)
+        if digest is not None:
+            with self._lock:
+                self.hits += 1
+            return digest
+        hashed_at_ns = time.time_ns()
+        digest = hasher(path)
+        with self._lock:
+            self.files[key] = signature + [hashed_at_ns, digest]
+            self.misses += 1
+            self._dirty = True
+        return digest
+
+    def hash_tree(self, path: Path, hasher: Optional[TreeHasher] = None) -> SkillTree:
+        """Return the ``SkillTree`` of a skill directory, reading only files that changed.
+
+        While the directory holds the same files, only those whose stat
+        changed are read, to see whether their content did. Otherwise
+        ``hasher`` (default ``hash_skill_tree``) reads the tree once for
+        the root and every file digest, and the file digests are cached too.
+        """
+        if hasher is None:
+            from .skills_manifest import hash_skill_tree as hasher
+        key = os.path.abspath(path)
+        self._used.add(key)
+        filepaths = {
+            filepath.relative_to(path).as_posix(): filepath
+            for filepath in skill_tree_files(path)
+        }
+        cached = self.dirs.get(key)
+        if (
+            isinstance(cached, dict)
+            and cached.get("digest")
+            and isinstance(cached.get("files"), dict)
+            and cached["files"].keys() == filepaths.keys()
+        ):
+            files = {rel: self.hash_file(filepath) for rel, filepath in filepaths.items()}
+            if files == cached["files"]:
+                with self._lock:
+                    self.hits += 1
+                return SkillTree(cached["digest"], files)
+
+        signatures = {}
+        for rel, filepath in filepaths.items():
+            file_key = os.path.abspath(filepath)
+            self._used.add(file_key)
+            signatures[rel] = (file_key, _signature(os.stat(filepath)))
+        hashed_at_ns = time.time_ns()
+        tree = hasher(path)
+        with self._lock:
+            for rel, digest in tree.files.items():
+                if rel in signatures:
+                    file_key, signature = signatures[rel]
+                    self.files[file_key] = signature + [hashed_at_ns, digest]
+            self.dirs[key] = {"files": tree.files, "digest": tree.content_hash}
+            self.misses += 1
+            self._dirty = True
+        return tree
+
+    def hash_directory(self, path: Path, hasher: Optional[TreeHasher] = None) -> str:
+        """Return the ``contentHash`` of a skill directory (see ``hash_tree``)."""
+        return self.hash_tree(path, hasher).content_hash
+
+    def forget_unused(self) -> None:
+        """Drop entries of paths not hashed since the cache was loaded (removed items)."""
+        for store in (self.files, self.dirs):
+            for key in [key for key in store if key not in self._used]:
+                del store[key]
+                self._dirty = True
+
+    def forget_missing(self) -> None:
+        """Drop entries of paths that no longer exist."""
+        for store in (self.files, self.dirs):
+            for key in [key for key in store if not os.path.exists(key)]:
+                del store[key]
+                self._dirty = True
+
+
+def _shared_cache_path() -> Path:
+    from . import config
+
+    return config.AEC_HASH_CACHE
+
+
+def skill_trees(paths: Iterable[Path]) -> List[SkillTree]:
+    """``SkillTree`` of each skill directory, through the shared cache in ``AEC_HASH_CACHE``."""
+    cache = HashCache.load(_shared_cache_path())
+    trees = [cache.hash_tree(Path(path)) for path in paths]
+    if cache.misses:
+        cache.forget_missing()
+    cache.save()
+    return trees
+
+
+def skill_tree(path: Path) -> SkillTree:
+    """``SkillTree`` of one skill directory, through the shared cache."""
+    return skill_trees([path])[0]
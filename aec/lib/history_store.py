@@ -0,0 +1,309 @@
+"""SQLite store for test-run history and per-suite profiles.
+
+Replaces the ``profiles/<project>/<timestamp>.json`` tree, where every query
+globbed and parsed every file. One row per run plus one row per suite keeps
+the common questions indexed:
+
+* the last N runs of a project, or of one of its suites
+* duration percentiles per suite
+* retention pruning with a single ``DELETE`` (suites cascade)
+
+It also holds the skip-unchanged cache (``suite_cache``, see
+``result_cache``): the last passing cache key of each suite.
+
+The first time a database is opened with ``legacy_profiles_dir``, the
+existing JSON tree is imported once. The JSON files are left in place and
+age out under the usual profile retention.
+"""
+
+import json
+import math
+import sqlite3
+import time
+from itertools import groupby
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id         INTEGER PRIMARY KEY,
+    project    TEXT NOT NULL,
+    timestamp  TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    UNIQUE (project, timestamp)
+);
+CREATE INDEX IF NOT EXISTS runs_created_at ON runs (created_at);
+CREATE TABLE IF NOT EXISTS suites (
+    run_id           INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    suite            TEXT NOT NULL,
+    status           TEXT,
+    duration_seconds REAL,
+    profile          TEXT NOT NULL,
+    PRIMARY KEY (run_id, suite)
+);
+CREATE INDEX IF NOT EXISTS suites_suite ON suites (suite);
+CREATE TABLE IF NOT EXISTS suite_cache (
+    project     TEXT NOT NULL,
+    suite       TEXT NOT NULL,
+    cache_key   TEXT NOT NULL,
+    report_dir  TEXT NOT NULL,
+    verified_at REAL NOT NULL,
+    PRIMARY KEY (project, suite)
+);
+"""
+
+
+def connect(db_path: Path, legacy_profiles_dir: Optional[Path] = None) -> sqlite3.Connection:
+    """Open (creating if needed) the history database.
+
+    Args:
+        db_path: SQLite file, e.g. ``AEC_HISTORY_DB``.
+        legacy_profiles_dir: JSON profile tree to import, once, into a
+            database that has not imported it yet.
+
+    Returns:
+        An open connection; close it with ``contextlib.closing``.
+    """
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path), timeout=30)
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA journal_mode = WAL")
+    with conn:
+        conn.executescript(_SCHEMA)
+        conn.execute(
+            "INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)",
+            (str(SCHEMA_VERSION),),
+        )
+    if legacy_profiles_dir is not None:
+        imported = conn.execute(
+            "SELECT value FROM meta WHERE key = 'json_imported'"
+        ).fetchone()
+        if imported is None:
+            import_json_profiles(conn, legacy_profiles_dir)
+    return conn
+
+
+def record_run(
+    conn: sqlite3.Connection,
+    project: str,
+    timestamp: str,
+    profiles: dict,
+    created_at: Optional[float] = None,
+) -> int:
+    """Store one run's profiles (``{suite: profile}``), replacing any earlier copy.
+
+    Returns:
+        The run's row id.
+    """
+    with conn:
+        conn.execute(
+            "DELETE FROM runs WHERE project = ? AND timestamp = ?", (project, timestamp)
+        )
+        cursor = conn.execute(
+            "INSERT INTO runs (project, timestamp, created_at) VALUES (?, ?, ?)",
+            (project, timestamp, time.time() if created_at is None else created_at),
+        )
+        run_id = cursor.lastrowid
+        conn.executemany(
+            "INSERT INTO suites (run_id, suite, status, duration_seconds, profile) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [
+                (
+                    run_id,
+                    suite,
+                    profile.get("status") if isinstance(profile, dict) else None,
+                    _as_float(profile.get("duration_seconds"))
+                    if isinstance(profile, dict) else None,
+                    json.dumps(profile),
+                )
+                for suite, profile in profiles.items()
+            ],
+        )
+    return run_id
+
+
+def _as_float(value) -> Optional[float]:
+    return float(value) if isinstance(value, (int, float)) else None
+
+
+def load_project_profiles(
+    conn: sqlite3.Connection, project: str, limit: int = 10
+) -> List[dict]:
+    """Return a project's last ``limit`` runs as ``{suite: profile}``, newest first.
+
+    Same shape as a run's ``profiles/<project>/<timestamp>.json`` file.
+    """
+    rows = conn.execute(
+        "SELECT r.id, s.suite, s.profile FROM "
+        "(SELECT id, timestamp FROM runs WHERE project = ? "
+        " ORDER BY timestamp DESC LIMIT ?) AS r "
+        "JOIN suites s ON s.run_id = r.id "
+        "ORDER BY r.timestamp DESC, s.rowid",
+        (project, limit),
+    ).fetchall()
+    runs: List[dict] = []
+    for _run_id, group in groupby(rows, key=lambda row: row[0]):
+        runs.append({suite: json.loads(profile) for _id, suite, profile in group})
+    return runs
+
+
+def suite_history(
+    conn: sqlite3.Connection, project: str, suite: str, limit: int = 10
+) -> List[dict]:
+    """Return the last ``limit`` runs of one suite, newest first.
+
+    Each entry has ``timestamp``, ``status``, ``duration_seconds`` and
+    ``profile``.
+    """
+    rows = conn.execute(
+        "SELECT r.timestamp, s.status, s.duration_seconds, s.profile "
+        "FROM runs r JOIN suites s ON s.run_id = r.id "
+        "WHERE r.project = ? AND s.suite = ? "
+        "ORDER BY r.timestamp DESC LIMIT ?",
+        (project, suite, limit),
+    ).fetchall()
+    return [
+        {
+            "timestamp": timestamp,
+            "status": status,
+            "duration_seconds": duration,
+            "profile": json.loads(profile),
+        }
+        for timestamp, status, duration, profile in rows
+    ]
+
+
+def suite_duration_percentiles(
+    conn: sqlite3.Connection,
+    percentile: float = 95.0,
+    project: Optional[str] = None,
+) -> Dict[Tuple[str, str], float]:
+    """Return the nearest-rank duration percentile of every suite.
+
+    Args:
+        percentile: 0-100, e.g. 95 for p95.
+        project: Limit to one project; all projects when None.
+
+    Returns:
+        ``{(project, suite): seconds}`` for suites with recorded durations.
+    """
+    query = (
+        "SELECT r.project, s.suite, s.duration_seconds "
+        "FROM runs r JOIN suites s ON s.run_id = r.id "
+        "WHERE s.duration_seconds IS NOT NULL"
+    )
+    params: tuple = ()
+    if project is not None:
+        query += " AND r.project = ?"
+        params = (project,)
+    query += " ORDER BY r.project, s.suite, s.duration_seconds"
+
+    result: Dict[Tuple[str, str], float] = {}
+    for key, group in groupby(conn.execute(query, params), key=lambda row: row[:2]):
+        durations = [row[2] for row in group]
+        rank = max(1, math.ceil(percentile / 100 * len(durations)))
+        result[key] = durations[rank - 1]
+    return result
+
+
+def prune_history(conn: sqlite3.Connection, max_days: int) -> int:
+    """Delete runs (and their suites) recorded more than ``max_days`` ago.
+
+    Returns:
+        Number of runs deleted.
+    """
+    cutoff = time.time() - max_days * 86400
+    with conn:
+        cursor = conn.execute("DELETE FROM runs WHERE created_at < ?", (cutoff,))
+    return cursor.rowcount
+
+
+def get_cached_pass(
+    conn: sqlite3.Connection,
+    project: str,
+    suite: str,
+    cache_key: str,
+    min_verified_at: float,
+) -> Optional[dict]:
+    """Return a suite's cached pass if it matches ``cache_key`` and is fresh.
+
+    Returns:
+        Dict with ``report_dir`` and ``verified_at``, or None.
+    """
+    row = conn.execute(
+        "SELECT report_dir, verified_at FROM suite_cache "
+        "WHERE project = ? AND suite = ? AND cache_key = ? AND verified_at >= ?",
+        (project, suite, cache_key, min_verified_at),
+    ).fetchone()
+    if row is None:
+        return None
+    return {"report_dir": row[0], "verified_at": row[1]}
+
+
+def set_cached_pass(
+    conn: sqlite3.Connection,
+    project: str,
+    suite: str,
+    cache_key: str,
+    report_dir: str,
+    verified_at: Optional[float] = None,
+) -> None:
+    """Record that a suite passed under ``cache_key`` (one entry per suite)."""
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO suite_cache "
+            "(project, suite, cache_key, report_dir, verified_at) VALUES (?, ?, ?, ?, ?)",
+            (project, suite, cache_key, report_dir,
+             time.time() if verified_at is None else verified_at),
+        )
+
+
+def clear_cached_pass(conn: sqlite3.Connection, project: str, suite: str) -> None:
+    """Forget a suite's cached pass."""
+    with conn:
+        conn.execute(
+            "DELETE FROM suite_cache WHERE project = ? AND suite = ?", (project, suite)
+        )
+
+
+def import_json_profiles(conn: sqlite3.Connection, profiles_dir: Path) -> int:
+    """Import a ``profiles/<project>/<timestamp>.json`` tree into the store.
+
+    Runs already in the store are kept as they are. Each run's ``created_at``
+    is the file's mtime, matching how the JSON tree was pruned. Unreadable
+    files are skipped. Marks the database as imported either way.
+
+    Returns:
+        Number of runs imported.
+    """
+    imported = 0
+    if profiles_dir.is_dir():
+        for project_dir in sorted(p for p in profiles_dir.iterdir() if p.is_dir()):
+            for profile_file in sorted(project_dir.glob("*.json")):
+                exists = conn.execute(
+                    "SELECT 1 FROM runs WHERE project = ? AND timestamp = ?",
+                    (project_dir.name, profile_file.stem),
+                ).fetchone()
+                if exists:
+                    continue
+                try:
+                    profiles = json.loads(profile_file.read_text())
+                    mtime = profile_file.stat().st_mtime
+                except (json.JSONDecodeError, OSError):
+                    continue
+                if not isinstance(profiles, dict):
+                    continue
+                record_run(conn, project_dir.name, profile_file.stem, profiles, mtime)
+                imported += 1
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('json_imported', ?)",
+            (str(imported),),
+        )
+    return imported
@@ -0,0 +1,164 @@
+"""JUnit XML ingestion for test-suite results.
+
+A suite that writes JUnit XML declares it in ``.aec.json``::
+
+    "unit": {"command": "pytest --junitxml=reports/junit.xml", "junit": "reports/junit.xml"}
+
+``junit`` is a path or glob, relative to the project directory unless it
+is absolute. After the suite runs, every matching file written during the
+run is parsed with ``iterparse``. Each ``<testcase>`` is dropped from the
+tree as soon as it has been counted, so memory stays flat however large
+the report is. The result keeps counts, the failed tests and the slowest
+tests, which is enough to know what failed without keeping the raw log
+around.
+"""
+
+import heapq
+import logging
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Failed tests kept per suite (the counts are always complete).
+MAX_FAILED_TESTS = 50
+
+# Slowest tests kept per suite.
+SLOWEST_TESTS = 10
+
+# Characters of a failure message kept.
+MESSAGE_CHARS = 300
+
+
+def _local(tag: str) -> str:
+    """Strip an XML namespace from a tag."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _test_id(case: ET.Element) -> str:
+    classname = case.get("classname") or ""
+    name = case.get("name") or "?"
+    return f"{classname}::{name}" if classname else name
+
+
+def empty_summary() -> dict:
+    return {
+        "files": 0,
+        "tests": 0,
+        "passed": 0,
+        "failures": 0,
+        "errors": 0,
+        "skipped": 0,
+        "time_seconds": 0.0,
+        "failed": [],
+        "slowest": [],
+    }
+
+
+def summarize_junit(paths: Iterable[Path], slowest: int = SLOWEST_TESTS) -> Optional[dict]:
+    """Stream-parse JUnit XML files into one summary.
+
+    Args:
+        paths: JUnit XML files of one suite run.
+        slowest: Number of slowest tests to keep.
+
+    Returns:
+        ``files``, ``tests``, ``passed``, ``failures``, ``errors``,
+        ``skipped``, ``time_seconds``, ``failed`` (``test``, ``kind``,
+        ``message``; at most ``MAX_FAILED_TESTS``) and ``slowest`` (``test``,
+        ``seconds``), or None when no file could be parsed. A file cut
+        short (e.g. by a timeout) still counts the tests it holds and sets
+        ``truncated``.
+    """
+    summary = empty_summary()
+    heap: List[tuple] = []
+    for path in paths:
+        stack: List[ET.Element] = []
+        counted = summary["tests"]
+        try:
+            for event, elem in ET.iterparse(str(path), events=("start", "end")):
+                if event == "start":
+                    stack.append(elem)
+                    continue
+                stack.pop()
+                if _local(elem.tag) != "testcase":
+                    continue
+                _count_case(summary, heap, elem, slowest)
+                # Drop the counted case so the tree never grows
+                elem.clear()
+                if stack and len(stack[-1]) and stack[-1][-1] is elem:
+                    del stack[-1][-1]
+        except (ET.ParseError, OSError) as exc:
+            logger.warning("Could not read JUnit XML %s: %s", path, exc)
+            if summary["tests"] == counted:
+                continue
+            summary["truncated"] = True
+        summary["files"] += 1
+    if not summary["files"]:
+        return None
+    summary["time_seconds"] = round(summary["time_seconds"], 3)
+    summary["slowest"] = [
+        {"test": test, "seconds": seconds}
+        for seconds, _order, test in sorted(heap, reverse=True)
+    ]
+    return summary
+
+
+def _count_case(summary: dict, heap: List[tuple], case: ET.Element, slowest: int) -> None:
+    """Add one ``<testcase>`` to the running summary."""
+    summary["tests"] += 1
+    try:
+        seconds = float(case.get("time") or 0.0)
+    except ValueError:
+        seconds = 0.0
+    summary["time_seconds"] += seconds
+
+    outcome = None
+    for child in case:
+        kind = _local(child.tag)
+        if kind in ("failure", "error", "skipped"):
+            outcome = (kind, child)
+            break
+    if outcome is None:
+        summary["passed"] += 1
+    else:
+        kind, child = outcome
+        summary["skipped" if kind == "skipped" else f"{kind}s"] += 1
+        if kind != "skipped" and len(summary["failed"]) < MAX_FAILED_TESTS:
+            message = child.get("message")
+            if not message:
+                text = (child.text or "").strip()
+                message = text.splitlines()[0] if text else ""
+            summary["failed"].append({
+                "test": _test_id(case),
+                "kind": kind,
+                "message": message[:MESSAGE_CHARS],
+            })
+
+    if slowest > 0:
+        entry = (round(seconds, 3), -summary["tests"], _test_id(case))
+        if len(heap) < slowest:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+
+
+def junit_reports(project_dir: Path, pattern: str, since: float) -> List[Path]:
+    """Return the files matching ``pattern`` that were written at or after ``since``.
+
+    Older files are left-overs from earlier runs and are ignored. An
+    absolute ``pattern`` is matched from its own root, not ``project_dir``.
+    """
+    if Path(pattern).is_absolute():
+        # Path.glob() only accepts relative patterns
+        anchor = Path(Path(pattern).anchor)
+        project_dir, pattern = anchor, str(Path(pattern).relative_to(anchor))
+    matches = []
+    for path in sorted(project_dir.glob(pattern)):
+        try:
+            if path.is_file() and path.stat().st_mtime >= since:
+                matches.append(path)
+        except OSError:
+            continue
+    return matches
@@ -0,0 +1,142 @@
+"""Per-lane isolation for parallel scheduled test runs.
+
+Suites in different lanes run at the same time, so anything they share by
+name can collide: dev-server ports from ``ports-registry.json``, Docker
+Compose projects (named after the directory by default) and temp files.
+Each lane therefore gets an isolation context, exported to its suite and
+cleanup commands:
+
+* ``AEC_LANE`` — 1-based lane number
+* ``AEC_PORT_OFFSET`` — add this to every registered port. Lane 1 keeps
+  offset 0, so a sequential run and the first lane bind the usual ports.
+  Later lanes are shifted by a multiple of the span of registered ports,
+  which keeps a shifted port from landing on another registered port.
+* ``COMPOSE_PROJECT_NAME`` — unique per run and lane
+* ``TMPDIR`` — a private directory, removed when the lane finishes
+
+Suites opt into port shifting by reading ``AEC_PORT_OFFSET``.
+"""
+
+import logging
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+# Offsets are whole multiples of this, so shifted ports stay easy to read.
+PORT_OFFSET_GRANULARITY = 100
+
+_MAX_PORT = 65535
+
+
+class LaneContext(NamedTuple):
+    """Isolation settings for one lane."""
+    lane: int
+    port_offset: int
+    compose_project: str
+    tmpdir: Path
+
+    def env(self) -> Dict[str, str]:
+        """Environment variables exported to the lane's commands."""
+        return {
+            "AEC_LANE": str(self.lane),
+            "AEC_PORT_OFFSET": str(self.port_offset),
+            "COMPOSE_PROJECT_NAME": self.compose_project,
+            "TMPDIR": str(self.tmpdir),
+        }
+
+
+def registered_ports(port_registry: dict) -> List[int]:
+    """Return the sorted port numbers in a loaded port registry."""
+    ports = set()
+    for key, entry in port_registry.get("ports", {}).items():
+        if isinstance(entry, dict) and "port" in entry:
+            ports.add(entry["port"])
+        else:
+            # key might be the port number itself
+            try:
+                ports.add(int(key))
+            except (ValueError, TypeError):
+                pass
+    return sorted(p for p in ports if isinstance(p, int))
+
+
+def port_offset_step(port_registry: dict) -> int:
+    """Return the offset between consecutive lanes.
+
+    The span of registered ports, rounded up to a multiple of
+    :data:`PORT_OFFSET_GRANULARITY`, so no shifted port lands on another
+    registered port.
+    """
+    ports = registered_ports(port_registry)
+    span = ports[-1] - ports[0] + 1 if ports else 1
+    return -(-span // PORT_OFFSET_GRANULARITY) * PORT_OFFSET_GRANULARITY
+
+
+def lane_port_offset(lane: int, port_registry: dict) -> int:
+    """Return ``AEC_PORT_OFFSET`` for a 1-based lane.
+
+    Falls back to 0 (with a warning) when the shifted ports would pass 65535.
+    """
+    offset = (lane - 1) * port_offset_step(port_registry)
+    ports = registered_ports(port_registry)
+    if ports and ports[-1] + offset > _MAX_PORT:
+        logger.warning(
+            "Lane %d: port offset %d exceeds %d; lane runs unshifted",
+            lane, offset, _MAX_PORT,
+        )
+        return 0
+    return offset
+
+
+def lane_port_offsets(lanes: int, port_registry: dict) -> List[int]:
+    """Return ``AEC_PORT_OFFSET`` of each of ``lanes`` lanes, in lane order."""
+    return [lane_port_offset(lane, port_registry) for lane in range(1, lanes + 1)]
+
+
+def unshift_ports(ports: List[int], port_registry: dict, port_offset: int) -> List[int]:
+    """Map ports a lane bound back to the registered ports they were shifted from.
+
+    Ports that are not a registered port plus ``port_offset`` are kept as
+    they are.
+    """
+    registered = set(registered_ports(port_registry))
+    return sorted({
+        port - port_offset if port_offset and port - port_offset in registered else port
+        for port in ports
+    })
+
+
+def create_lane_context(
+    lane: int,
+    run_id: str,
+    port_registry: dict,
+    tmp_root: Optional[Path] = None,
+) -> LaneContext:
+    """Create a lane's context, including its private temp directory.
+
+    Args:
+        lane: 1-based lane number.
+        run_id: Identifies the run (e.g. its timestamp); part of the
+            Compose project name.
+        port_registry: Loaded ``ports-registry.json``.
+        tmp_root: Parent of the lane's temp directory (system default when
+            None).
+    """
+    token = "".join(c for c in run_id.lower() if c.isalnum())
+    tmpdir = Path(tempfile.mkdtemp(
+        prefix=f"aec-lane{lane}-", dir=str(tmp_root) if tmp_root else None,
+    ))
+    return LaneContext(
+        lane=lane,
+        port_offset=lane_port_offset(lane, port_registry),
+        compose_project=f"aec{token}-lane{lane}",
+        tmpdir=tmpdir,
+    )
+
+
+def release_lane_context(context: LaneContext) -> None:
+    """Remove the lane's temp directory."""
+    shutil.rmtree(context.tmpdir, ignore_errors=True)
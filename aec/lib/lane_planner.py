@@ -0,0 +1,158 @@
+"""Compute parallel lanes for scheduled test runs from profile history.
+
+Reads per-project run profiles (``{suite: diff}`` per run) from the run
+history store, derives each project's expected
+duration and the ports/containers it touches, keeps projects that collide
+on those resources in the same lane, and bin-packs the rest into N lanes
+balanced by expected duration (longest-processing-time first).
+"""
+
+import sqlite3
+import statistics
+from typing import Dict, Iterable, List
+
+
+def summarize_project_history(profiles: List[dict]) -> dict:
+    """Reduce a project's profile runs into planning stats.
+
+    Args:
+        profiles: Profile dicts (``{suite_name: diff}``), any order.
+
+    Returns:
+        Dict with ``runs``, ``expected_seconds`` (median total suite
+        duration per run, 0.0 when no run recorded durations), ``ports``
+        and ``docker`` (sets of observed resources).
+    """
+    totals: List[float] = []
+    ports: set = set()
+    docker: set = set()
+    for run in profiles:
+        run_total = 0.0
+        has_duration = False
+        for diff in run.values():
+            if not isinstance(diff, dict):
+                continue
+            duration = diff.get("duration_seconds")
+            if isinstance(duration, (int, float)):
+                run_total += float(duration)
+                has_duration = True
+            ports.update(p for p in diff.get("ports_new", []) if isinstance(p, int))
+            docker.update(diff.get("docker_started", []))
+        if has_duration:
+            totals.append(run_total)
+    return {
+        "runs": len(profiles),
+        "expected_seconds": round(statistics.median(totals), 3) if totals else 0.0,
+        "ports": ports,
+        "docker": docker,
+    }
+
+
+def group_conflicting(stats: Dict[str, dict]) -> List[List[str]]:
+    """Group projects that share an observed port or Docker container.
+
+    Conflicts are transitive: if A shares a port with B and B a container
+    with C, all three end up in one group.
+
+    Returns:
+        Groups of project names, each sorted, in first-seen order.
+    """
+    parent = {name: name for name in stats}
+
+    def find(name: str) -> str:
+        while parent[name] != name:
+            parent[name] = parent[parent[name]]
+            name = parent[name]
+        return name
+
+    owner: Dict[tuple, str] = {}
+    for name in sorted(stats):
+        resources = [("port", p) for p in stats[name]["ports"]]
+        resources += [("docker", c) for c in stats[name]["docker"]]
+        for resource in resources:
+            if resource in owner:
+                parent[find(name)] = find(owner[resource])
+            else:
+                owner[resource] = name
+
+    groups: Dict[str, List[str]] = {}
+    for name in sorted(stats):
+        groups.setdefault(find(name), []).append(name)
+    return list(groups.values())
+
+
+def plan_lanes(stats: Dict[str, dict], lane_count: int) -> dict:
+    """Bin-pack conflict groups into ``lane_count`` balanced lanes.
+
+    Groups are placed longest-first onto the currently lightest lane. Inside
+    a lane, longer projects run first.
+
+    Returns:
+        Dict with ``lanes`` (list of project-name lists), ``lane_seconds``,
+        ``makespan_seconds`` and ``serial_seconds``.
+    """
+    groups = group_conflicting(stats)
+
+    def group_seconds(group: List[str]) -> float:
+        return sum(stats[name]["expected_seconds"] for name in group)
+
+    groups.sort(key=lambda g: (-group_seconds(g), g[0]))
+    lane_count = max(1, min(lane_count, len(groups) or 1))
+    lanes: List[List[str]] = [[] for _ in range(lane_count)]
+    loads = [0.0] * lane_count
+    for group in groups:
+        idx = loads.index(min(loads))
+        lanes[idx].extend(
+            sorted(group, key=lambda n: (-stats[n]["expected_seconds"], n))
+        )
+        loads[idx] += group_seconds(group)
+
+    kept = [(lane, load) for lane, load in zip(lanes, loads) if lane]
+    return {
+        "lanes": [lane for lane, _ in kept],
+        "lane_seconds": [round(load, 3) for _, load in kept],
+        "makespan_seconds": round(max((load for _, load in kept), default=0.0), 3),
+        "serial_seconds": round(sum(loads), 3),
+    }
+
+
+def compute_plan(
+    conn: sqlite3.Connection,
+    project_names: Iterable[str],
+    lane_count: int,
+    min_runs: int,
+    history_limit: int = 10,
+) -> dict:
+    """Build a lane plan for the given projects from the run history store.
+
+    Projects with fewer than ``min_runs`` profiled runs are left out of the
+    plan (the runner puts unplanned projects in a trailing lane of their
+    own) and reported under ``insufficient``.
+
+    Returns:
+        The :func:`plan_lanes` dict plus ``insufficient`` (name → runs found)
+        and ``based_on_runs`` (fewest runs among planned projects, 0 when
+        nothing could be planned).
+    """
+    from aec.lib.history_store import load_project_profiles
+
+    stats: Dict[str, dict] = {}
+    insufficient: Dict[str, int] = {}
+    for name in dict.fromkeys(project_names):
+        summary = summarize_project_history(
+            load_project_profiles(conn, name, limit=history_limit)
+        )
+        if summary["runs"] < min_runs:
+            insufficient[name] = summary["runs"]
+        else:
+            stats[name] = summary
+
+    plan = plan_lanes(stats, lane_count) if stats else {
+        "lanes": [],
+        "lane_seconds": [],
+        "makespan_seconds": 0.0,
+        "serial_seconds": 0.0,
+    }
+    plan["insufficient"] = insufficient
+    plan["based_on_runs"] = min((s["runs"] for s in stats.values()), default=0)
+    return plan
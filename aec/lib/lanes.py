@@ -0,0 +1,112 @@
+"""Parallel lane execution for scheduled test runs.
+
+A lane is an ordered list of projects that must never run at the same time
+as each other (shared ports, shared Docker resources). Lanes run
+concurrently on a bounded thread pool; projects inside a lane run one after
+another, in plan order, so their suites keep their declared order too.
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def assign_lanes(
+    items: Sequence[T],
+    plan_lanes: List[List[str]],
+    names: Callable[[T], Iterable[str]],
+) -> List[List[T]]:
+    """Distribute items into the lanes of a parallelization plan.
+
+    An item joins the first plan lane that lists any of its names (repo
+    directory name or ``.aec.json`` project name). Items the plan does not
+    mention are collected into one trailing lane so they cannot collide with
+    each other. Empty lanes are dropped.
+
+    Args:
+        items: Items to distribute (e.g. tracked repos), in fallback order.
+        plan_lanes: ``parallelization_plan["lanes"]`` from scheduler config.
+        names: Returns the names an item may be listed under in the plan.
+
+    Returns:
+        List of lanes, each an ordered list of items.
+    """
+    lane_of: Dict[str, int] = {}
+    position: Dict[str, int] = {}
+    for lane_idx, lane in enumerate(plan_lanes):
+        for pos, name in enumerate(lane):
+            lane_of.setdefault(name, lane_idx)
+            position.setdefault(name, pos)
+
+    lanes: List[List[Any]] = [[] for _ in plan_lanes]
+    unplanned: List[T] = []
+    for item in items:
+        match = next((n for n in names(item) if n in lane_of), None)
+        if match is None:
+            unplanned.append(item)
+        else:
+            lanes[lane_of[match]].append((position[match], item))
+
+    result = [[item for _pos, item in sorted(lane, key=lambda p: p[0])] for lane in lanes]
+    if unplanned:
+        result.append(unplanned)
+    return [lane for lane in result if lane]
+
+
+def _run_lane(
+    lane_number: int,
+    items: List[T],
+    run_item: Callable[[T], dict],
+) -> dict:
+    """Run every item of one lane in order and time the lane."""
+    start = time.monotonic()
+    results = []
+    for item in items:
+        try:
+            result = run_item(item)
+        except Exception as exc:  # keep the other lanes running
+            logger.exception("Lane %d: run failed for %r", lane_number, item)
+            result = {
+                "status": "failed",
+                "reason": f"runner error: {exc}",
+                "suites": {},
+            }
+        results.append((item, result))
+    return {
+        "lane": lane_number,
+        "duration_seconds": round(time.monotonic() - start, 3),
+        "results": results,
+    }
+
+
+def run_lanes(
+    lanes: List[List[T]],
+    run_item: Callable[[T], dict],
+    max_workers: int,
+) -> List[dict]:
+    """Run lanes concurrently, with at most ``max_workers`` lanes at a time.
+
+    Args:
+        lanes: Lanes from :func:`assign_lanes`.
+        run_item: Runs one item and returns its result dict.
+        max_workers: Upper bound on lanes executing at once.
+
+    Returns:
+        One dict per lane, in lane order, with ``lane`` (1-based),
+        ``duration_seconds`` (lane wall-clock) and ``results`` — a list of
+        ``(item, result)`` pairs in execution order.
+    """
+    if not lanes:
+        return []
+    workers = max(1, min(max_workers, len(lanes)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="aec-lane") as pool:
+        futures = [
+            pool.submit(_run_lane, number, lane, run_item)
+            for number, lane in enumerate(lanes, start=1)
+        ]
+        return [f.result() for f in futures]
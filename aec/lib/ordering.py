@@ -0,0 +1,141 @@
+"""Execution-order strategies for scheduled test runs.
+
+``execution.order_strategy`` in ``scheduler-config.json`` selects one of:
+
+* ``random`` — seeded shuffle (the default). Exposes cross-project order
+  dependence.
+* ``longest-first`` — longest expected duration first, so the tail of the
+  run (and of each lane) is made of short projects.
+* ``fail-first`` — highest recent failure rate first, shortest first among
+  equals, so likely failures are reported early.
+* ``seeded-weighted`` — a seeded random permutation biased towards slow
+  and failure-prone projects. It keeps some of the shuffle's power to find
+  order dependence.
+
+Every strategy is deterministic for a given seed and history, and the seed
+is recorded in the summary so a run can be reproduced. Projects without
+history go first under the history-based strategies: their cost and risk
+are unknown.
+"""
+
+import random
+import sqlite3
+from typing import Callable, Dict, Iterable, List, Sequence, TypeVar
+
+T = TypeVar("T")
+
+STRATEGIES = ("random", "longest-first", "fail-first", "seeded-weighted")
+DEFAULT_STRATEGY = "random"
+
+# Weight of each older run when computing the recent failure rate.
+_FAILURE_DECAY = 0.7
+
+
+def project_history_stats(
+    conn: sqlite3.Connection, project_names: Iterable[str], history_limit: int = 10
+) -> Dict[str, dict]:
+    """Summarize each project's recent runs for ordering.
+
+    Returns:
+        ``{name: {"runs", "expected_seconds", "fail_rate"}}`` for projects
+        with at least one stored run. ``fail_rate`` is 0-1, weighted toward
+        recent runs.
+    """
+    from aec.lib.history_store import load_project_profiles
+    from aec.lib.lane_planner import summarize_project_history
+
+    stats: Dict[str, dict] = {}
+    for name in dict.fromkeys(project_names):
+        runs = load_project_profiles(conn, name, limit=history_limit)
+        if not runs:
+            continue
+        weight, failed, total = 1.0, 0.0, 0.0
+        for run in runs:  # newest first
+            statuses = [p.get("status") for p in run.values() if isinstance(p, dict)]
+            failed += weight * ("failed" in statuses)
+            total += weight
+            weight *= _FAILURE_DECAY
+        stats[name] = {
+            "runs": len(runs),
+            "expected_seconds": summarize_project_history(runs)["expected_seconds"],
+            "fail_rate": round(failed / total, 3),
+        }
+    return stats
+
+
+def order_items(
+    items: Sequence[T],
+    strategy: str,
+    seed: int,
+    stats: Dict[str, dict],
+    name_of: Callable[[T], str],
+) -> List[T]:
+    """Return ``items`` in the order ``strategy`` runs them.
+
+    Args:
+        items: Projects (or anything ``name_of`` maps to a project name).
+        strategy: One of :data:`STRATEGIES`; unknown names act as ``random``.
+        seed: Seed for the shuffle that every strategy starts from (it
+            breaks ties between equal histories).
+        stats: :func:`project_history_stats` output.
+        name_of: Maps an item to its project name.
+    """
+    rng = random.Random(seed)
+    ordered = list(items)
+    rng.shuffle(ordered)
+    if strategy not in STRATEGIES or strategy == "random":
+        return ordered
+
+    def known(item: T) -> bool:
+        return name_of(item) in stats
+
+    def seconds(item: T) -> float:
+        return stats.get(name_of(item), {}).get("expected_seconds", 0.0)
+
+    def fail_rate(item: T) -> float:
+        return stats.get(name_of(item), {}).get("fail_rate", 0.0)
+
+    if strategy == "longest-first":
+        return sorted(ordered, key=lambda i: (known(i), -seconds(i)))
+    if strategy == "fail-first":
+        return sorted(ordered, key=lambda i: (known(i), -fail_rate(i), seconds(i)))
+
+    # seeded-weighted: weighted random permutation (Efraimidis-Spirakis keys).
+    longest = max((seconds(i) for i in ordered), default=0.0) or 1.0
+
+    def weight(item: T) -> float:
+        if not known(item):
+            return 3.0
+        return 1.0 + 4.0 * fail_rate(item) + seconds(item) / longest
+
+    keys = {id(item): rng.random() ** (1.0 / weight(item)) for item in ordered}
+    return sorted(ordered, key=lambda i: -keys[id(i)])
+
+
+def order_lanes(
+    lanes: List[List[T]],
+    strategy: str,
+    seed: int,
+    stats: Dict[str, dict],
+    name_of: Callable[[T], str],
+) -> List[List[T]]:
+    """Apply ``strategy`` inside each lane and to the order lanes start in.
+
+    ``random`` keeps the plan's order, as the planner already sorted each
+    lane. The other strategies reorder projects within a lane and start the
+    heaviest lanes first, which matters when there are more lanes than
+    workers.
+    """
+    if strategy not in STRATEGIES or strategy == "random":
+        return lanes
+    reordered = [order_items(lane, strategy, seed, stats, name_of) for lane in lanes]
+
+    def lane_seconds(lane: List[T]) -> float:
+        return sum(stats.get(name_of(i), {}).get("expected_seconds", 0.0) for i in lane)
+
+    def lane_fail_rate(lane: List[T]) -> float:
+        return max((stats.get(name_of(i), {}).get("fail_rate", 0.0) for i in lane), default=0.0)
+
+    if strategy == "fail-first":
+        return sorted(reordered, key=lambda lane: (-lane_fail_rate(lane), lane_seconds(lane)))
+    return sorted(reordered, key=lambda lane: -lane_seconds(lane))
@@ -0,0 +1,108 @@
+"""Outdated items of every scope in the manifest, computed in one pass.
+
+``aec outdated --all`` and the "other tracked repos have upgrades" prompt
+of ``aec upgrade`` both need, for many scopes, the installed items whose
+catalog version is newer. Each item type's catalog is discovered once
+(``discover_catalog``), and ``outdated_matrix`` then walks the global scope
+and ``manifest["repos"]`` a single time, comparing every installed item
+against that catalog. Versions are parsed once per distinct string.
+
+The result maps scope (``"global"`` or a resolved repo path) to its
+outdated rows::
+
+    {"type": "skills", "name": "x", "installed": "1.0.0", "available": "2.0.0"}
+
+``available`` is None for plugins missing from the catalog, whose version
+cannot be compared. ``to_json`` renders the matrix for ``--json`` output.
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+ITEM_TYPES = ("skills", "rules", "agents", "plugins")
+
+Catalog = Dict[str, dict]
+Matrix = Dict[str, List[dict]]
+
+
+@lru_cache(maxsize=4096)
+def _version(version: str) -> tuple:
+    from .skills_manifest import parse_version
+
+    return parse_version(version)
+
+
+def discover_catalog(source_dirs: dict, types: Optional[Iterable[str]] = None) -> Catalog:
+    """Discover each item type's catalog once: ``{item_type: {name: item}}``.
+
+    Args:
+        source_dirs: ``{item_type: source dir}``, as from ``get_source_dirs``.
+        types: Item types to discover (default: every type in ``source_dirs``).
+            Types whose source directory is unset or missing are left out,
+            and so are never reported.
+    """
+    from .sources import discover_available
+
+    catalog: Catalog = {}
+    for item_type in source_dirs if types is None else types:
+        source_dir = source_dirs.get(item_type)
+        if not source_dir or not Path(source_dir).exists():
+            continue
+        catalog[item_type] = discover_available(Path(source_dir), item_type)
+    return catalog
+
+
+def scope_outdated(scope_dict: dict, catalog: Catalog) -> List[dict]:
+    """Outdated rows of one scope of the manifest, sorted by type then name."""
+    rows = []
+    for item_type, available in catalog.items():
+        for name, info in sorted((scope_dict.get(item_type) or {}).items()):
+            inst_v = info.get("version", "0.0.0")
+            if name in available:
+                avail_v = available[name].get("version", "0.0.0")
+                if _version(avail_v) > _version(inst_v):
+                    rows.append(
+                        {"type": item_type, "name": name, "installed": inst_v, "available": avail_v}
+                    )
+            elif item_type == "plugins":
+                # Plugins absent from the catalog have no version to compare.
+                rows.append({"type": item_type, "name": name, "installed": inst_v, "available": None})
+    return rows
+
+
+def outdated_matrix(
+    manifest: dict,
+    catalog: Catalog,
+    scopes: Optional[Iterable[str]] = None,
+) -> Matrix:
+    """Return ``{scope: [outdated rows]}`` for the global scope and every tracked repo.
+
+    Args:
+        manifest: v2 manifest.
+        catalog: Result of ``discover_catalog``.
+        scopes: Limit to these scopes (``"global"`` or resolved repo paths);
+            scopes absent from the manifest get no rows.
+    """
+    all_scopes = {"global": manifest.get("global") or {}}
+    all_scopes.update(manifest.get("repos") or {})
+    wanted = all_scopes if scopes is None else scopes
+    return {scope: scope_outdated(all_scopes.get(scope) or {}, catalog) for scope in wanted}
+
+
+def upgradable_count(rows: List[dict]) -> int:
+    """Rows that can be upgraded (the catalog knows a newer version)."""
+    return sum(1 for row in rows if row["available"] is not None)
+
+
+def to_json(matrix: Matrix) -> str:
+    """Render a matrix as JSON, with per-scope counts."""
+    payload = {
+        "scopes": {
+            scope: {"outdated": rows, "upgradable": upgradable_count(rows)}
+            for scope, rows in matrix.items()
+        },
+        "total_upgradable": sum(upgradable_count(rows) for rows in matrix.values()),
+    }
+    return json.dumps(payload, indent=2)
@@ -2,7 +2,10 @@
 
 import shutil
 import subprocess
-from typing import Any, Dict, List, Tuple
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 # Registry of known prerequisites and how to check them.
 # Each entry has:
@@ -112,3 +115,89 @@ def check_prerequisites(names: List[str]) -> List[Tuple[str, bool, str]]:
         available, detail = check_prerequisite(name)
         results.append((name, available, detail))
     return results
+
+
+class _Probe:
+    """One probe of one prerequisite; waiters block on ``done``."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.started = time.monotonic()
+        self.result: Tuple[bool, str] = (False, "not checked")
+
+
+class PrerequisiteOracle:
+    """Run-scoped, thread-safe memo of prerequisite checks.
+
+    Each prerequisite is probed once per run (or again once its result is
+    older than ``ttl_seconds``), no matter how many projects, suites or
+    concurrent lanes ask for it. :meth:`prefetch` probes a whole set at once
+    on a small thread pool, so slow checks such as ``docker info`` overlap
+    instead of adding up.
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = None, max_workers: int = 8):
+        self.ttl_seconds = ttl_seconds
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._probes: Dict[str, _Probe] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    def _result(self, name: str) -> Tuple[bool, str]:
+        with self._lock:
+            probe = self._probes.get(name)
+            stale = (
+                probe is not None
+                and probe.done.is_set()
+                and self.ttl_seconds is not None
+                and time.monotonic() - probe.started > self.ttl_seconds
+            )
+            owner = probe is None or stale
+            if owner:
+                probe = _Probe()
+                self._probes[name] = probe
+            stats = self._stats.setdefault(
+                name, {"name": name, "checks": 0, "probes": 0, "seconds": 0.0}
+            )
+            stats["checks"] += 1
+
+        if not owner:
+            probe.done.wait()
+            return probe.result
+
+        try:
+            probe.result = check_prerequisite(name)
+        except Exception as exc:  # a broken check must not hang the waiters
+            probe.result = (False, f"check failed: {exc}")
+        finally:
+            elapsed = time.monotonic() - probe.started
+            with self._lock:
+                stats["probes"] += 1
+                stats["seconds"] = round(stats["seconds"] + elapsed, 3)
+                stats["available"], stats["detail"] = probe.result
+            probe.done.set()
+        return probe.result
+
+    def prefetch(self, names: Iterable[str]) -> None:
+        """Probe every distinct name concurrently, ahead of the first check."""
+        unique = list(dict.fromkeys(names))
+        if not unique:
+            return
+        workers = max(1, min(self.max_workers, len(unique)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="aec-prereq") as pool:
+            list(pool.map(self._result, unique))
+        # Warm-up probes are not requests from a project or suite.
+        with self._lock:
+            for name in unique:
+                self._stats[name]["checks"] -= 1
+
+    def check(self, names: List[str]) -> List[Tuple[str, bool, str]]:
+        """Same contract as :func:`check_prerequisites`, answered from the memo."""
+        return [(name, *self._result(name)) for name in names]
+
+    def timings(self) -> List[Dict[str, Any]]:
+        """Per-prerequisite ``checks``, ``probes``, total probe ``seconds`` and
+        the latest ``available``/``detail``, slowest first."""
+        with self._lock:
+            entries = [dict(s) for s in self._stats.values()]
+        return sorted(entries, key=lambda s: (-s["seconds"], s["name"]))
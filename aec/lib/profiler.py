@@ -4,7 +4,6 @@ Takes system state snapshots before/after test suite execution.
 Read-only — never kills processes or modifies system state.
 """
 
-import json
 import os
 import re
 import subprocess
@@ -13,6 +12,13 @@ from pathlib import Path
 
 from aec.lib.config import IS_LINUX, IS_MACOS, IS_WINDOWS
 
+# Process classification shared by the subprocess and /proc backends.
+_NODE_RE = re.compile(r"\bnode\b|\bnpm\b")
+_TEST_RUNNER_RE = re.compile(r"\bjest\b|\bvitest\b|\bpytest\b|\bplaywright\b")
+_TEST_DETAIL_PATTERN = "jest|vitest|pytest|playwright"
+
+PROC_ROOT = Path("/proc")
+
 
 def _run_cmd(args: list[str], timeout: int = 10) -> str:
     """Run a subprocess and return stdout, or empty string on any failure."""
@@ -113,11 +119,11 @@ def snapshot_processes() -> dict:
             result["stuck_io"] += 1
 
         # Check full command for node/npm
-        if re.search(r"\bnode\b|\bnpm\b", command_lower):
+        if _NODE_RE.search(command_lower):
             result["node_processes"] += 1
 
         # Check for test runners
-        if re.search(r"\bjest\b|\bvitest\b|\bpytest\b|\bplaywright\b", command_lower):
+        if _TEST_RUNNER_RE.search(command_lower):
             result["test_processes"] += 1
 
     return result
@@ -152,7 +158,7 @@ def snapshot_process_details() -> list[dict]:
         return details
 
     # macOS / Linux
-    pgrep_output = _run_cmd(["pgrep", "-f", "jest|vitest|pytest|playwright", "-l"])
+    pgrep_output = _run_cmd(["pgrep", "-f", _TEST_DETAIL_PATTERN, "-l"])
     if not pgrep_output:
         return details
 
@@ -211,12 +217,222 @@ def snapshot_memory() -> float:
         return 0.0
 
 
-def take_snapshot() -> dict:
-    """Take a complete system state snapshot."""
+# --- Linux /proc backend -------------------------------------------------
+#
+# Reads the kernel's own tables in-process instead of forking lsof, ps,
+# pgrep and one ``ps -p`` per matching process. Produces exactly the
+# shapes the subprocess functions above return.
+
+_TCP_LISTEN = "0A"
+# Long argv (bundlers, browsers) would bloat every stored profile.
+_MAX_COMMAND_CHARS = 200
+
+
+def procfs_available(proc_root: Path = PROC_ROOT) -> bool:
+    """Return True when the /proc backend can be used."""
+    return IS_LINUX and (proc_root / "net" / "tcp").is_file()
+
+
+def snapshot_ports_procfs(proc_root: Path = PROC_ROOT) -> list[int]:
+    """Listening TCP ports from /proc/net/tcp and /proc/net/tcp6."""
+    ports: set[int] = set()
+    for table in ("tcp", "tcp6"):
+        try:
+            lines = (proc_root / "net" / table).read_text().splitlines()[1:]
+        except OSError:
+            continue
+        for line in lines:
+            parts = line.split()
+            if len(parts) < 4 or parts[3] != _TCP_LISTEN:
+                continue
+            try:
+                ports.add(int(parts[1].rsplit(":", 1)[1], 16))
+            except (IndexError, ValueError):
+                continue
+    return sorted(ports)
+
+
+def listening_ports_of(pids: list[int], proc_root: Path = PROC_ROOT) -> "list[int] | None":
+    """Listening TCP ports held open by ``pids``, or None without /proc.
+
+    Matches the socket inodes in each process's ``fd`` directory against
+    the LISTEN rows of /proc/net/tcp and tcp6.
+    """
+    if not procfs_available(proc_root):
+        return None
+    port_of_inode: dict[str, int] = {}
+    for table in ("tcp", "tcp6"):
+        try:
+            lines = (proc_root / "net" / table).read_text().splitlines()[1:]
+        except OSError:
+            continue
+        for line in lines:
+            parts = line.split()
+            if len(parts) < 10 or parts[3] != _TCP_LISTEN:
+                continue
+            try:
+                port_of_inode[parts[9]] = int(parts[1].rsplit(":", 1)[1], 16)
+            except (IndexError, ValueError):
+                continue
+    ports: set[int] = set()
+    for pid in pids:
+        try:
+            fds = list(os.scandir(proc_root / str(pid) / "fd"))
+        except OSError:
+            continue
+        for fd in fds:
+            try:
+                target = os.readlink(fd.path)
+            except OSError:
+                continue
+            if target.startswith("socket:[") and target[8:-1] in port_of_inode:
+                ports.add(port_of_inode[target[8:-1]])
+    return sorted(ports)
+
+
+def _format_etime(seconds: float) -> str:
+    """Format elapsed seconds the way ``ps -o etime=`` does: [[dd-]hh:]mm:ss."""
+    total = max(0, int(seconds))
+    days, rem = divmod(total, 86400)
+    hours, rem = divmod(rem, 3600)
+    minutes, secs = divmod(rem, 60)
+    if days:
+        return f"{days}-{hours:02d}:{minutes:02d}:{secs:02d}"
+    if hours:
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+    return f"{minutes:02d}:{secs:02d}"
+
+
+def read_proc_stat(pid_dir: Path) -> "tuple[str, list[str]] | None":
+    """Parse /proc/<pid>/stat into (comm, fields after comm).
+
+    ``fields[0]`` is the state (stat field 3), so stat field N is
+    ``fields[N - 3]``. Returns None if the process is gone or unreadable.
+    """
+    try:
+        stat = (pid_dir / "stat").read_text()
+    except OSError:
+        return None
+    # comm may contain spaces and parentheses; it ends at the last ')'
+    close = stat.rfind(")")
+    if close == -1:
+        return None
+    fields = stat[close + 2:].split()
+    if len(fields) < 20:
+        return None
+    return stat[stat.find("(") + 1:close], fields
+
+
+def _read_proc_entry(pid_dir: Path) -> "tuple[str, str, int] | None":
+    """Return (state, command, starttime_ticks) for one /proc/<pid>, or None.
+
+    The command is the NUL-separated cmdline joined by spaces, or
+    ``[comm]`` for kernel threads and zombies, matching ``ps aux``.
+    """
+    parsed = read_proc_stat(pid_dir)
+    if parsed is None:
+        return None
+    comm, fields = parsed
+    try:
+        raw = (pid_dir / "cmdline").read_bytes()
+    except OSError:
+        raw = b""
+    command = raw.replace(b"\0", b" ").decode("utf-8", errors="replace").strip()
+    try:
+        start_ticks = int(fields[19])
+    except ValueError:
+        start_ticks = 0
+    return fields[0], command or f"[{comm}]", start_ticks
+
+
+def snapshot_processes_procfs(proc_root: Path = PROC_ROOT) -> tuple[dict, list[dict]]:
+    """Process counts and test-process details from a single /proc walk.
+
+    Returns:
+        (counts, details) shaped like :func:`snapshot_processes` and
+        :func:`snapshot_process_details`.
+    """
+    counts = {
+        "zombies": 0,
+        "stuck_io": 0,
+        "node_processes": 0,
+        "test_processes": 0,
+    }
+    details: list[dict] = []
+
+    try:
+        clock_ticks = os.sysconf("SC_CLK_TCK")
+    except (AttributeError, ValueError, OSError):
+        clock_ticks = 100
+    try:
+        uptime = float((proc_root / "uptime").read_text().split()[0])
+    except (OSError, ValueError, IndexError):
+        uptime = None
+
+    detail_re = re.compile(_TEST_DETAIL_PATTERN)
+    own_pid = os.getpid()
+    try:
+        entries = list(os.scandir(proc_root))
+    except OSError:
+        return counts, details
+
+    for entry in entries:
+        if not entry.name.isdigit():
+            continue
+        parsed = _read_proc_entry(Path(entry.path))
+        if parsed is None:
+            continue
+        state, command, start_ticks = parsed
+        command_lower = command.lower()
+
+        if state == "Z":
+            counts["zombies"] += 1
+        if state == "D":
+            counts["stuck_io"] += 1
+        if _NODE_RE.search(command_lower):
+            counts["node_processes"] += 1
+        if _TEST_RUNNER_RE.search(command_lower):
+            counts["test_processes"] += 1
+
+        pid = int(entry.name)
+        if pid != own_pid and detail_re.search(command):
+            if uptime is not None:
+                elapsed = _format_etime(uptime - start_ticks / clock_ticks)
+            else:
+                elapsed = "unknown"
+            details.append({
+                "pid": pid,
+                "command": command[:_MAX_COMMAND_CHARS],
+                "elapsed": elapsed,
+            })
+
+    details.sort(key=lambda d: d["pid"])
+    return counts, details
+
+
+def take_snapshot(backend: "str | None" = None) -> dict:
+    """Take a complete system state snapshot.
+
+    Args:
+        backend: ``"procfs"`` to read Linux /proc in-process,
+            ``"subprocess"`` to shell out to lsof/ps/pgrep, or None to use
+            /proc when available and fall back to subprocesses otherwise.
+    """
+    if backend is None:
+        backend = "procfs" if procfs_available() else "subprocess"
+
+    if backend == "procfs":
+        ports = snapshot_ports_procfs()
+        processes, process_details = snapshot_processes_procfs()
+    else:
+        ports = snapshot_ports()
+        processes = snapshot_processes()
+        process_details = snapshot_process_details()
+
     return {
-        "ports": snapshot_ports(),
-        "processes": snapshot_processes(),
-        "process_details": snapshot_process_details(),
+        "ports": ports,
+        "processes": processes,
+        "process_details": process_details,
         "docker_containers": snapshot_docker(),
         "memory_mb": snapshot_memory(),
         "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
@@ -252,31 +468,40 @@ def diff_snapshots(before: dict, after: dict) -> dict:
     }
 
 
-def save_profile(
-    profiles_dir: Path, project_name: str, timestamp: str, profile_data: dict
-) -> Path:
-    """Save profile JSON to profiles/{project}/{timestamp}.json."""
-    project_dir = profiles_dir / project_name
-    project_dir.mkdir(parents=True, exist_ok=True)
-    file_path = project_dir / f"{timestamp}.json"
-    file_path.write_text(json.dumps(profile_data, indent=2))
-    return file_path
-
-
-def load_profiles(
-    profiles_dir: Path, project_name: str, limit: int = 10
-) -> list[dict]:
-    """Load recent profiles for a project, sorted by timestamp descending."""
-    project_dir = profiles_dir / project_name
-    if not project_dir.is_dir():
-        return []
+def scope_diff_to_session(
+    diff: dict,
+    survivors: list[dict],
+    compose_project: "str | None" = None,
+    proc_root: Path = PROC_ROOT,
+) -> dict:
+    """Restrict a machine-wide snapshot diff to what one suite left behind.
+
+    While other lanes run, a diff also holds the ports, processes and
+    containers they started. The scoped diff keeps only the new ports held
+    by the processes still in the suite's session (``survivors``, see
+    ``suite_limits.session_members``), the containers of the suite's
+    Compose project, and those processes as the leak. ``ports_gone`` and
+    ``memory_delta_mb`` cannot be attributed, so they are dropped.
+    """
+    owned = listening_ports_of([m["pid"] for m in survivors], proc_root) if survivors else []
+    owned_ports = set(owned or [])
+
+    def ours(name: str) -> bool:
+        # Compose v2 names containers project-service-n, v1 project_service_n
+        return compose_project is not None and name.startswith(
+            (f"{compose_project}-", f"{compose_project}_")
+        )
 
-    files = sorted(project_dir.glob("*.json"), reverse=True)
-    results: list[dict] = []
-    for f in files[:limit]:
-        try:
-            data = json.loads(f.read_text())
-            results.append(data)
-        except (json.JSONDecodeError, OSError):
-            continue
-    return results
+    scoped = {
+        key: value for key, value in diff.items()
+        if key not in ("ports_gone", "memory_delta_mb")
+    }
+    scoped.update(
+        ports_new=[port for port in diff.get("ports_new", []) if port in owned_ports],
+        docker_started=[name for name in diff.get("docker_started", []) if ours(name)],
+        docker_remaining=[name for name in diff.get("docker_remaining", []) if ours(name)],
+        processes_leaked=len(survivors),
+        leaked_details=list(survivors),
+        scope="session",
+    )
+    return scoped
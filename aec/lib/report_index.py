@@ -0,0 +1,223 @@
+"""Index and compression of the report directories under ``AEC_TESTS_DIR``.
+
+Every report directory is listed in ``reports-index.json`` next to them,
+with the codec its files were compressed with (``null`` while they are
+plain). ``create_report_dir`` adds entries and pruning removes them, so
+counting and retention read one small file instead of listing the
+directory. A missing or unreadable index is rebuilt from one listing of
+the reports directory.
+
+Reports older than ``retention.compress_after_days`` are compressed in
+place: each file is streamed through ``lzma`` (``.xz``, the default) or
+``gzip`` (``.gz``) and the original removed once the compressed copy is
+complete. ``read_report_text`` finds either form, so ``aec test report``
+reads old reports transparently.
+"""
+
+import gzip
+import json
+import logging
+import lzma
+import os
+import shutil
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = "reports-index.json"
+
+# Bumped when the index changes incompatibly; older indexes are rebuilt.
+INDEX_VERSION = 1
+
+DEFAULT_CODEC = "xz"
+
+# Codec name -> (file suffix, opener).
+CODECS: Dict[str, tuple] = {
+    "xz": (".xz", lzma.open),
+    "gzip": (".gz", gzip.open),
+}
+
+# Bytes copied per read while compressing.
+COPY_CHUNK_BYTES = 1 << 20
+
+
+def report_time(name: str) -> Optional[datetime]:
+    """Parse a report directory name (ISO timestamp) into a UTC datetime.
+
+    The runner names directories with ``-`` in place of ``:`` in the time
+    (``2026-04-01T02-00-00Z``); plain ISO names are accepted too.
+    """
+    date, sep, clock = name.partition("T")
+    if sep and ":" not in clock:
+        clock = clock.replace("-", ":", 2)
+    try:
+        parsed = datetime.fromisoformat(f"{date}{sep}{clock}".replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _compressed_codec(report_dir: Path) -> Optional[str]:
+    """Return the codec of an already compressed report directory, if any."""
+    try:
+        names = [p.name for p in report_dir.iterdir() if p.is_file()]
+    except OSError:
+        return None
+    for codec, (suffix, _opener) in CODECS.items():
+        if names and all(name.endswith(suffix) for name in names):
+            return codec
+    return None
+
+
+def rebuild_index(base_dir: Path) -> Dict[str, dict]:
+    """List ``base_dir`` once and write a fresh index of its report directories."""
+    reports: Dict[str, dict] = {}
+    if base_dir.is_dir():
+        for entry in sorted(base_dir.iterdir()):
+            if entry.is_dir():
+                reports[entry.name] = {"compressed": _compressed_codec(entry)}
+    save_index(base_dir, reports)
+    return reports
+
+
+def load_index(base_dir: Path) -> Dict[str, dict]:
+    """Return ``{report name: entry}``, rebuilding the index when it is missing or invalid."""
+    if not base_dir.is_dir():
+        return {}
+    try:
+        data = json.loads((base_dir / INDEX_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return rebuild_index(base_dir)
+    if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+        return rebuild_index(base_dir)
+    reports = data.get("reports")
+    if not isinstance(reports, dict):
+        return rebuild_index(base_dir)
+    return reports
+
+
+def save_index(base_dir: Path, reports: Dict[str, dict]) -> None:
+    from aec.lib.atomic_write import atomic_write_json
+
+    atomic_write_json(
+        base_dir / INDEX_NAME,
+        {"version": INDEX_VERSION, "reports": dict(sorted(reports.items()))},
+    )
+
+
+def add_report(base_dir: Path, name: str) -> None:
+    """Record a new (or reused) report directory in the index."""
+    reports = load_index(base_dir)
+    if name not in reports:
+        reports[name] = {"compressed": None}
+        save_index(base_dir, reports)
+
+
+def remove_reports(base_dir: Path, names: Iterable[str]) -> None:
+    """Drop report directories from the index."""
+    reports = load_index(base_dir)
+    names = [name for name in names if name in reports]
+    if names:
+        for name in names:
+            del reports[name]
+        save_index(base_dir, reports)
+
+
+def compress_file(path: Path, codec: str = DEFAULT_CODEC) -> Path:
+    """Compress one file in place and return the compressed path.
+
+    The compressed copy is written under a temporary name and renamed into
+    place before the original is removed, so an interrupted compression
+    leaves the original intact.
+    """
+    suffix, opener = CODECS[codec]
+    target = path.with_name(path.name + suffix)
+    partial = path.with_name(path.name + suffix + ".partial")
+    try:
+        with open(path, "rb") as src, opener(partial, "wb") as dst:
+            shutil.copyfileobj(src, dst, COPY_CHUNK_BYTES)
+        shutil.copystat(path, partial)
+        os.replace(partial, target)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+    path.unlink()
+    return target
+
+
+def compress_report_dir(report_dir: Path, codec: str = DEFAULT_CODEC) -> int:
+    """Compress every plain file of a report directory; returns the bytes saved."""
+    suffixes = tuple(suffix for suffix, _opener in CODECS.values())
+    saved = 0
+    for path in sorted(report_dir.iterdir()):
+        if not path.is_file() or path.name.endswith(suffixes) or path.name.endswith(".partial"):
+            continue
+        before = path.stat().st_size
+        saved += before - compress_file(path, codec).stat().st_size
+    return saved
+
+
+def compress_old_reports(
+    base_dir: Path,
+    after_days: float,
+    codec: str = DEFAULT_CODEC,
+    now: Optional[datetime] = None,
+) -> int:
+    """Compress report directories older than ``after_days``.
+
+    Returns:
+        Count of directories compressed.
+    """
+    if codec not in CODECS:
+        raise ValueError(f"Unknown report compression {codec!r}; expected one of {sorted(CODECS)}")
+    reports = load_index(base_dir)
+    now = now or datetime.now(timezone.utc)
+    compressed = 0
+    for name, entry in reports.items():
+        when = report_time(name)
+        if entry.get("compressed") or when is None:
+            continue
+        if (now - when).total_seconds() / 86400 <= after_days:
+            continue
+        report_dir = base_dir / name
+        if not report_dir.is_dir():
+            continue
+        try:
+            compress_report_dir(report_dir, codec)
+        except OSError as exc:
+            logger.warning("Could not compress report %s: %s", name, exc)
+            continue
+        entry["compressed"] = codec
+        compressed += 1
+    if compressed:
+        save_index(base_dir, reports)
+    return compressed
+
+
+def find_report_file(path: Path) -> Optional[Path]:
+    """Return ``path`` or its compressed form, whichever exists."""
+    if path.exists():
+        return path
+    for suffix, _opener in CODECS.values():
+        candidate = path.with_name(path.name + suffix)
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def _opener_for(path: Path) -> Callable:
+    for suffix, opener in CODECS.values():
+        if path.name.endswith(suffix):
+            return opener
+    return open
+
+
+def read_report_text(path: Path) -> Optional[str]:
+    """Read a report file, decompressing it if it was compressed; None if missing."""
+    found = find_report_file(path)
+    if found is None:
+        return None
+    with _opener_for(found)(found, "rt", encoding="utf-8", errors="replace") as fh:
+        return fh.read()
@@ -5,7 +5,7 @@ import subprocess
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 
 def create_report_dir(base_dir: Path, timestamp: str) -> Path:
@@ -18,11 +18,19 @@ def create_report_dir(base_dir: Path, timestamp: str) -> Path:
     Returns:
         Path to the created directory.
     """
+    from aec.lib.report_index import add_report
+
     report_dir = base_dir / timestamp
     report_dir.mkdir(parents=True, exist_ok=True)
+    add_report(base_dir, timestamp)
     return report_dir
 
 
+def suite_output_path(report_dir: Path, project_name: str) -> Path:
+    """Return the per-project raw output file inside a report directory."""
+    return report_dir / f"{project_name}_test_output.txt"
+
+
 def write_suite_output(report_dir: Path, project_name: str, output: str) -> Path:
     """Write raw test output to a file in the report directory.
 
@@ -34,11 +42,86 @@ def write_suite_output(report_dir: Path, project_name: str, output: str) -> Path
     Returns:
         Path to the written file.
     """
-    file_path = report_dir / f"{project_name}_test_output.txt"
+    file_path = suite_output_path(report_dir, project_name)
     file_path.write_text(output)
     return file_path
 
 
+# Number of suites listed per metric in the summary's resource section.
+TOP_RESOURCE_SUITES = 5
+
+# Longest waits listed in the summary's concurrency governor section.
+TOP_DEFERRED_SUITES = 5
+
+# Failed tests listed per suite, from its JUnit XML or its output.
+TOP_FAILED_TESTS = 5
+
+# Bumped when summary.json changes incompatibly.
+SUMMARY_JSON_VERSION = 1
+
+
+def suite_resource_usage(result: Dict) -> Dict[str, float]:
+    """Return a suite's ``cpu_seconds`` and ``memory_mb`` from its accounting.
+
+    Prefers the suite's own cgroup counters, which also cover processes the
+    suite orphaned, and falls back to ``wait4`` rusage. Metrics that were not
+    measured are absent.
+    """
+    usage: Dict[str, float] = {}
+    cgroup = result.get("cgroup") or {}
+    rusage = result.get("rusage") or {}
+    if "cpu_seconds" in cgroup:
+        usage["cpu_seconds"] = cgroup["cpu_seconds"]
+    elif rusage:
+        usage["cpu_seconds"] = round(
+            rusage.get("user_cpu_seconds", 0.0) + rusage.get("system_cpu_seconds", 0.0), 3
+        )
+    if "peak_memory_mb" in cgroup:
+        usage["memory_mb"] = cgroup["peak_memory_mb"]
+    elif "max_rss_mb" in rusage:
+        usage["memory_mb"] = rusage["max_rss_mb"]
+    return usage
+
+
+def write_summary_json(
+    report_dir: Path,
+    results: List[Dict],
+    port_observations: List[Dict],
+    process_observations: List[Dict],
+    execution_order: List[str],
+    seed: int,
+    **sections,
+) -> Path:
+    """Write summary.json, the machine-readable twin of summary.txt.
+
+    Holds the same flat suite results ``generate_summary`` renders, status
+    totals, both observation lists and every optional section passed as a
+    keyword (``lanes``, ``prerequisites``, ``flakiness``, ``governor``,
+    ``deferred``, ``progress``, ...), as given.
+
+    Returns:
+        Path to the written summary.json.
+    """
+    from aec.lib.atomic_write import atomic_write_json
+
+    totals: Dict[str, int] = {}
+    for r in results:
+        totals[r.get("status", "unknown")] = totals.get(r.get("status", "unknown"), 0) + 1
+    document = {
+        "version": SUMMARY_JSON_VERSION,
+        "report": report_dir.name,
+        "execution_order": execution_order,
+        "seed": seed,
+        **sections,
+        "totals": totals,
+        "results": results,
+        "observations": {"ports": port_observations, "processes": process_observations},
+    }
+    path = report_dir / "summary.json"
+    atomic_write_json(path, document)
+    return path
+
+
 def generate_summary(
     report_dir: Path,
     results: List[Dict],
@@ -48,6 +131,13 @@ def generate_summary(
     seed: int,
     retention_mode: str,
     report_count: int,
+    lanes: Optional[List[Dict]] = None,
+    prerequisites: Optional[List[Dict]] = None,
+    order_strategy: str = "random",
+    flakiness: Optional[List[Dict]] = None,
+    progress: Optional[str] = None,
+    governor: Optional[Dict] = None,
+    deferred: Optional[List[Dict]] = None,
 ) -> Path:
     """Write a summary.txt in the report directory.
 
@@ -60,6 +150,21 @@ def generate_summary(
         seed: Random seed used for ordering.
         retention_mode: "manual" or "auto".
         report_count: Number of report days that exist.
+        lanes: Per-lane timings from a parallel run (``lane``, ``projects``,
+            ``duration_seconds``, ``port_offset``). Omitted for sequential
+            runs.
+        prerequisites: Probe timings from ``PrerequisiteOracle.timings()``.
+        order_strategy: Ordering strategy; shown next to the seed unless
+            it is the default ``random``.
+        flakiness: Suites of this run with a non-zero flakiness score
+            (``project``, ``suite``, ``score``, ``runs``).
+        progress: Set while the run is still going (e.g. "3 of 10 projects
+            finished"); shown in the header.
+        governor: ``ConcurrencyGovernor.report()`` of a parallel run:
+            utilization and the suites that had to wait for a slot.
+        deferred: Suites left out by ``schedule.max_duration_minutes``
+            (``project``, ``suite``, ``expected_seconds``,
+            ``staleness_days``).
 
     Returns:
         Path to the written summary.txt.
@@ -76,7 +181,10 @@ def generate_summary(
 
     lines.append(f"AEC Test Report — {display_time}")
     order_str = ", ".join(execution_order)
-    lines.append(f"Execution order: {order_str} (seed: {seed})")
+    strategy_str = f", strategy: {order_strategy}" if order_strategy != "random" else ""
+    lines.append(f"Execution order: {order_str} (seed: {seed}{strategy_str})")
+    if progress:
+        lines.append(f"In progress: {progress}")
 
     if retention_mode == "manual":
         lines.append(
@@ -99,7 +207,8 @@ def generate_summary(
 
     for proj in projects_seen:
         lines.append("")
-        lines.append(proj)
+        lane = results_by_project[proj][0].get("lane")
+        lines.append(f"{proj}  [lane {lane}]" if lane is not None else proj)
         for r in results_by_project[proj]:
             suite = r["suite"]
             status = r["status"]
@@ -110,6 +219,10 @@ def generate_summary(
                 symbol = "✓"
                 duration_str = f"{duration:.1f}s" if duration is not None else ""
                 lines.append(f"  {symbol} {suite:<14}{duration_str}   passed")
+            elif status == "cached-pass":
+                lines.append(f"  ↺ {suite:<14}cached-pass (unchanged since last pass)")
+                if r.get("cached_from"):
+                    lines.append(f"    → see {r['cached_from']}")
             elif status == "skipped":
                 symbol = "⊘"
                 reason_str = f" ({skip_reason})" if skip_reason else ""
@@ -118,15 +231,153 @@ def generate_summary(
                 symbol = "✗"
                 duration_str = f"{duration:.1f}s" if duration is not None else ""
                 exit_code = r.get("exit_code", 1)
+                reason = "timed out" if r.get("timed_out") else f"exit code {exit_code}"
                 lines.append(
                     f"  {symbol} {suite:<14}{duration_str}   "
-                    f"FAILED (exit code {exit_code})"
+                    f"FAILED ({reason})"
                 )
                 lines.append(f"    → see {proj}_test_output.txt")
+            junit = r.get("junit")
+            if junit:
+                lines.append(
+                    f"    junit: {junit.get('tests', 0)} tests, {junit.get('passed', 0)} passed, "
+                    f"{junit.get('failures', 0) + junit.get('errors', 0)} failed, "
+                    f"{junit.get('skipped', 0)} skipped"
+                )
+                for test in (junit.get("failed") or [])[:TOP_FAILED_TESTS]:
+                    message = f" — {test['message']}" if test.get("message") else ""
+                    lines.append(f"      ✗ {test.get('test')}{message}")
+            extracted = r.get("failures")
+            if extracted and not (junit and junit.get("failed")):
+                failures = extracted.get("failures") or []
+                for test in failures[:TOP_FAILED_TESTS]:
+                    error = f" — {test['error']}" if test.get("error") else ""
+                    lines.append(f"    ✗ {test.get('test')}{error}")
+                more = len(failures) - TOP_FAILED_TESTS + extracted.get("omitted", 0)
+                if more > 0:
+                    lines.append(f"    … {more} more failing")
+            for rerun in r.get("reruns") or []:
+                rerun_duration = rerun.get("duration_seconds")
+                rerun_duration_str = (
+                    f"{rerun_duration:.1f}s" if rerun_duration is not None else ""
+                )
+                outcome = (
+                    "passed (flaky)" if rerun.get("status") == "passed"
+                    else f"failed (exit code {rerun.get('exit_code')})"
+                )
+                label = f"rerun {rerun.get('attempt')}"
+                lines.append(f"    ↻ {label:<12}{rerun_duration_str}   {outcome}")
+            survivors = r.get("survivors") or []
+            if survivors:
+                pids_str = ", ".join(str(s.get("pid")) for s in survivors)
+                lines.append(
+                    f"    ! {len(survivors)} process{'es' if len(survivors) != 1 else ''} "
+                    f"survived the suite (PIDs: {pids_str})"
+                )
+
+    if deferred:
+        lines.append("")
+        lines.append(f"Deferred by the time budget ({len(deferred)}, run first next time):")
+        for entry in deferred:
+            staleness = entry.get("staleness_days")
+            verified = (
+                f"last passed {staleness:.1f} days ago" if staleness is not None
+                else "never passed"
+            )
+            lines.append(
+                f"  {entry.get('project')}/{entry.get('suite')}  "
+                f"~{entry.get('expected_seconds') or 0.0:.0f}s expected, {verified}"
+            )
 
     lines.append("")
     lines.append("──────────────────────────────────────────")
 
+    if lanes:
+        lines.append("")
+        lines.append("Lanes:")
+        for entry in lanes:
+            projects_str = ", ".join(entry.get("projects", []))
+            offset = entry.get("port_offset")
+            offset_str = f"  ports +{offset}" if offset else ""
+            lines.append(
+                f"  Lane {entry.get('lane')}  "
+                f"{entry.get('duration_seconds', 0.0):.1f}s{offset_str}  {projects_str}"
+            )
+
+    if governor:
+        lines.append("")
+        lines.append("Concurrency governor:")
+        lines.append(
+            f"  Up to {governor.get('max_concurrency')} suites at once; "
+            f"peak {governor.get('peak_concurrency', 0)}, "
+            f"mean {governor.get('mean_concurrency', 0.0):.2f} "
+            f"({governor.get('utilization', 0.0):.0%} utilization)"
+        )
+        decisions = governor.get("decisions", [])
+        waited = [d for d in decisions if d.get("waited_for")]
+        reasons: Dict[str, int] = {}
+        for decision in waited:
+            for reason in decision["waited_for"]:
+                reasons[reason] = reasons.get(reason, 0) + 1
+        reasons_str = ", ".join(f"{reason}: {count}" for reason, count in sorted(reasons.items()))
+        waited_str = (
+            f", {len(waited)} deferred for {governor.get('wait_seconds', 0.0):.1f}s"
+            f" ({reasons_str})" if waited else ", none deferred"
+        )
+        lines.append(f"  {len(decisions)} suites admitted{waited_str}")
+        longest = sorted(waited, key=lambda d: -d.get("waited_seconds", 0.0))
+        for decision in longest[:TOP_DEFERRED_SUITES]:
+            readings = [f"{decision.get('predicted_mb', 0.0):.0f} MB predicted"]
+            if decision.get("available_mb") is not None:
+                readings.append(f"{decision['available_mb']:.0f} MB available")
+            if decision.get("load_per_cpu") is not None:
+                readings.append(f"load {decision['load_per_cpu']:.2f}/CPU")
+            lines.append(
+                f"  waited {decision.get('waited_seconds', 0.0):6.1f}s  "
+                f"{decision.get('project')}/{decision.get('suite')}  "
+                f"({', '.join(decision['waited_for'])}; {', '.join(readings)})"
+            )
+
+    if prerequisites:
+        lines.append("")
+        lines.append("Prerequisites:")
+        for entry in prerequisites:
+            symbol = "✓" if entry.get("available") else "✗"
+            probes = entry.get("probes", 0)
+            lines.append(
+                f"  {symbol} {entry.get('name', '?'):<12}"
+                f"{entry.get('seconds', 0.0):6.2f}s  "
+                f"{probes} probe{'s' if probes != 1 else ''}, "
+                f"{entry.get('checks', 0)} checks  {entry.get('detail', '')}"
+            )
+
+    if flakiness:
+        from aec.lib.flakiness import FLAKINESS_HISTORY_RUNS, TOP_FLAKY_SUITES
+
+        ranked = sorted(flakiness, key=lambda e: -e.get("score", 0.0))[:TOP_FLAKY_SUITES]
+        lines.append("")
+        lines.append(f"Flakiness (last {FLAKINESS_HISTORY_RUNS} runs):")
+        for entry in ranked:
+            lines.append(
+                f"  {entry.get('score', 0.0):.2f}  {entry.get('project')}/{entry.get('suite')}"
+                f"  ({entry.get('runs', 0)} runs)"
+            )
+
+    usage = [(r, suite_resource_usage(r)) for r in results]
+    for metric, title, fmt in (
+        ("cpu_seconds", "Top CPU (user+system):", "{:.1f}s"),
+        ("memory_mb", "Top memory (peak):", "{:.0f} MB"),
+    ):
+        ranked = sorted(
+            ((u[metric], r) for r, u in usage if metric in u),
+            key=lambda pair: -pair[0],
+        )[:TOP_RESOURCE_SUITES]
+        if ranked:
+            lines.append("")
+            lines.append(title)
+            for value, r in ranked:
+                lines.append(f"  {fmt.format(value):>9}  {r['project']}/{r['suite']}")
+
     if port_observations:
         lines.append("")
         lines.append("Port observations:")
@@ -162,21 +413,24 @@ def generate_summary(
 def count_report_days(base_dir: Path) -> int:
     """Count the number of date-stamped directories in the tests/ dir.
 
+    Reads the report index rather than listing the directory.
+
     Args:
         base_dir: Directory containing report subdirectories.
 
     Returns:
         Number of directories found. 0 if base_dir doesn't exist.
     """
-    if not base_dir.exists():
-        return 0
-    return sum(1 for p in base_dir.iterdir() if p.is_dir())
+    from aec.lib.report_index import load_index
+
+    return len(load_index(base_dir))
 
 
 def prune_old_reports(base_dir: Path, max_days: int) -> int:
     """Delete report directories older than max_days.
 
-    Compares directory name (ISO timestamp) against current time.
+    Compares directory name (ISO timestamp) against current time. The
+    candidates come from the report index, which is updated to match.
 
     Args:
         base_dir: Directory containing report subdirectories.
@@ -185,26 +439,28 @@ def prune_old_reports(base_dir: Path, max_days: int) -> int:
     Returns:
         Count of directories deleted.
     """
+    from aec.lib.report_index import load_index, remove_reports, report_time
+
     if not base_dir.exists():
         return 0
 
     now = datetime.now(timezone.utc)
+    removed = []
     deleted = 0
 
-    for entry in list(base_dir.iterdir()):
-        if not entry.is_dir():
+    for name in load_index(base_dir):
+        dir_time = report_time(name)
+        if dir_time is None:
             continue
-        try:
-            dir_time = datetime.fromisoformat(
-                entry.name.replace("Z", "+00:00")
-            )
-            age_days = (now - dir_time).total_seconds() / 86400
-            if age_days > max_days:
+        age_days = (now - dir_time).total_seconds() / 86400
+        if age_days > max_days:
+            entry = base_dir / name
+            if entry.is_dir():
                 shutil.rmtree(entry)
                 deleted += 1
-        except (ValueError, AttributeError):
-            continue
+            removed.append(name)
 
+    remove_reports(base_dir, removed)
     return deleted
 
 
@@ -0,0 +1,196 @@
+"""Background resource sampling of a running test suite's process tree.
+
+``profiler.snapshot_memory`` reports ``RUSAGE_CHILDREN.ru_maxrss``, which is
+cumulative over every child the runner has ever reaped. That makes it
+useless per suite. This sampler instead polls the suite's own process tree
+from a daemon thread while it runs. It records peak RSS, CPU seconds,
+thread count and open file descriptors as a compact time series for the
+profile.
+
+Linux only (reads /proc). Elsewhere the sampler is a silent no-op and the
+profile simply has no ``resources`` entry.
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from aec.lib.profiler import PROC_ROOT, procfs_available, read_proc_stat
+
+DEFAULT_SAMPLE_INTERVAL = 1.0
+
+# Series longer than this are thinned by dropping every other row and
+# doubling the recording stride, so hour-long suites stay small on disk.
+MAX_SERIES_POINTS = 120
+
+SERIES_COLUMNS = ["t", "rss_mb", "cpu_s", "threads", "fds"]
+
+
+def _clock_ticks() -> int:
+    try:
+        return os.sysconf("SC_CLK_TCK")
+    except (AttributeError, ValueError, OSError):
+        return 100
+
+
+def _page_size() -> int:
+    try:
+        return os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return 4096
+
+
+def sample_process_tree(root_pid: int, proc_root: Path = PROC_ROOT) -> Optional[dict]:
+    """Measure a process and all of its live descendants once.
+
+    Returns:
+        Dict with ``rss_bytes``, ``cpu_seconds`` (user+system, including
+        reaped children of live processes), ``threads``, ``fds`` and
+        ``processes``; None when the root process is gone.
+    """
+    stats: Dict[int, List[str]] = {}
+    children: Dict[int, List[int]] = {}
+    try:
+        entries = list(os.scandir(proc_root))
+    except OSError:
+        return None
+    for entry in entries:
+        if not entry.name.isdigit():
+            continue
+        parsed = read_proc_stat(Path(entry.path))
+        if parsed is None:
+            continue
+        pid = int(entry.name)
+        fields = parsed[1]
+        stats[pid] = fields
+        try:
+            children.setdefault(int(fields[1]), []).append(pid)
+        except ValueError:
+            continue
+
+    if root_pid not in stats:
+        return None
+
+    ticks = _clock_ticks()
+    page = _page_size()
+    totals = {"rss_bytes": 0, "cpu_seconds": 0.0, "threads": 0, "fds": 0, "processes": 0}
+    stack = [root_pid]
+    seen = set()
+    while stack:
+        pid = stack.pop()
+        if pid in seen or pid not in stats:
+            continue
+        seen.add(pid)
+        stack.extend(children.get(pid, []))
+        fields = stats[pid]
+        try:
+            # stat fields 14-17: utime stime cutime cstime; 20: num_threads; 24: rss
+            cpu_ticks = sum(int(f) for f in fields[11:15])
+            totals["threads"] += int(fields[17])
+            totals["rss_bytes"] += int(fields[21]) * page
+        except (ValueError, IndexError):
+            continue
+        totals["cpu_seconds"] += cpu_ticks / ticks
+        totals["processes"] += 1
+        try:
+            totals["fds"] += len(os.listdir(proc_root / str(pid) / "fd"))
+        except OSError:
+            pass
+    return totals
+
+
+class ResourceSampler:
+    """Poll one process tree on a background thread until stopped.
+
+    Usage::
+
+        sampler = ResourceSampler(interval=1.0)
+        sampler.start(proc.pid)
+        ...
+        sampler.stop()
+        profile["resources"] = sampler.summary()
+    """
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_SAMPLE_INTERVAL,
+        proc_root: Path = PROC_ROOT,
+        max_points: int = MAX_SERIES_POINTS,
+    ):
+        self.interval = interval
+        self.proc_root = proc_root
+        self.max_points = max_points
+        self.rows: List[list] = []
+        self.samples = 0
+        self.peak_rss_bytes = 0
+        self.peak_threads = 0
+        self.peak_fds = 0
+        self.cpu_seconds = 0.0
+        self._stride = 1
+        self._started_at = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def enabled(self) -> bool:
+        """True when sampling is configured and /proc is available."""
+        return self.interval > 0 and procfs_available(self.proc_root)
+
+    def start(self, pid: int) -> None:
+        """Begin sampling ``pid`` and its descendants (no-op when disabled)."""
+        if not self.enabled or self._thread is not None:
+            return
+        self._started_at = time.monotonic()
+        self._thread = threading.Thread(
+            target=self._run, args=(pid,), name="aec-sampler", daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampling thread to exit."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self, pid: int) -> None:
+        while True:
+            self.record(sample_process_tree(pid, self.proc_root))
+            if self._stop.wait(self.interval):
+                return
+
+    def record(self, sample: Optional[dict]) -> None:
+        """Fold one tree sample into the peaks and the time series."""
+        if sample is None:
+            return
+        self.peak_rss_bytes = max(self.peak_rss_bytes, sample["rss_bytes"])
+        self.peak_threads = max(self.peak_threads, sample["threads"])
+        self.peak_fds = max(self.peak_fds, sample["fds"])
+        self.cpu_seconds = max(self.cpu_seconds, sample["cpu_seconds"])
+        if self.samples % self._stride == 0:
+            self.rows.append([
+                round(time.monotonic() - self._started_at, 1),
+                round(sample["rss_bytes"] / (1024 * 1024), 1),
+                round(sample["cpu_seconds"], 2),
+                sample["threads"],
+                sample["fds"],
+            ])
+            if len(self.rows) > self.max_points:
+                self.rows = self.rows[::2]
+                self._stride *= 2
+        self.samples += 1
+
+    def summary(self) -> Optional[dict]:
+        """Return the profile entry, or None when nothing was sampled."""
+        if not self.samples:
+            return None
+        return {
+            "interval_seconds": self.interval,
+            "samples": self.samples,
+            "peak_rss_mb": round(self.peak_rss_bytes / (1024 * 1024), 1),
+            "cpu_seconds": round(self.cpu_seconds, 2),
+            "peak_threads": self.peak_threads,
+            "peak_open_fds": self.peak_fds,
+            "series": {"columns": SERIES_COLUMNS, "rows": self.rows},
+        }
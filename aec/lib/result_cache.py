@@ -0,0 +1,145 @@
+"""Skip-unchanged cache for scheduled test runs.
+
+A suite that passed is not rerun while nothing it could depend on has
+changed. The cache key covers:
+
+* the repo's git ``HEAD``
+* a hash of the working tree's changes against it (tracked diffs plus
+  untracked, non-ignored files)
+* the suite command
+* the hashes of the dependency lockfiles in the project root, plus any
+  paths the suite lists in ``cache_inputs``
+
+A hit is reported as ``cached-pass`` and points at the report of the run
+that actually passed. Entries expire after a TTL, so every suite is still
+re-verified periodically. Projects that are not git repositories are never
+cached.
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Iterable, Optional
+
+from aec.lib.file_hashing import sha256_file
+
+CACHED_PASS = "cached-pass"
+
+# Lockfiles hashed into every suite's key when present in the project root.
+LOCKFILES = (
+    "package-lock.json",
+    "npm-shrinkwrap.json",
+    "yarn.lock",
+    "pnpm-lock.yaml",
+    "bun.lockb",
+    "uv.lock",
+    "poetry.lock",
+    "Pipfile.lock",
+    "Cargo.lock",
+    "go.sum",
+    "Gemfile.lock",
+    "composer.lock",
+)
+
+
+def _git(project_dir: Path, *args: str) -> Optional[bytes]:
+    try:
+        result = subprocess.run(
+            ["git", *args], cwd=str(project_dir), capture_output=True, timeout=60,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+def repo_fingerprint(project_dir: Path) -> Optional[dict]:
+    """Return ``{"head", "dirty"}`` for a git checkout, or None if it is not one.
+
+    ``dirty`` is empty for a clean tree, otherwise a SHA-256 over the binary
+    diff against ``HEAD`` and the paths and contents of untracked files.
+    """
+    head = _git(project_dir, "rev-parse", "HEAD")
+    if head is None:
+        return None
+    diff = _git(project_dir, "diff", "HEAD", "--binary", "--no-ext-diff") or b""
+    untracked = _git(project_dir, "ls-files", "--others", "--exclude-standard", "-z") or b""
+    paths = sorted(p for p in untracked.split(b"\0") if p)
+    if not diff and not paths:
+        return {"head": head.decode().strip(), "dirty": ""}
+
+    hasher = hashlib.sha256(diff)
+    for rel in paths:
+        hasher.update(rel + b"\0")
+        try:
+            hasher.update(sha256_file(project_dir / os.fsdecode(rel)).encode())
+        except OSError:
+            hasher.update(b"<unreadable>")
+    return {"head": head.decode().strip(), "dirty": hasher.hexdigest()}
+
+
+def input_hashes(project_dir: Path, extra: Iterable[str] = ()) -> dict:
+    """Hash the project's lockfiles and extra input paths that exist."""
+    hashes = {}
+    for rel in (*LOCKFILES, *extra):
+        path = project_dir / rel
+        if path.is_file():
+            try:
+                hashes[rel] = sha256_file(path)
+            except OSError:
+                hashes[rel] = "<unreadable>"
+    return hashes
+
+
+def suite_cache_key(project_dir: Path, fingerprint: dict, suite_config: dict) -> str:
+    """Return the cache key for one suite of a fingerprinted project."""
+    payload = {
+        "head": fingerprint["head"],
+        "dirty": fingerprint["dirty"],
+        "command": suite_config.get("command", ""),
+        "inputs": input_hashes(project_dir, suite_config.get("cache_inputs", [])),
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return "sha256:" + hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """Passing-result cache backed by the run history database.
+
+    Each call opens its own short-lived connection, so one instance can be
+    shared by concurrently running lanes.
+    """
+
+    def __init__(self, db_path: Path, ttl_seconds: float):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+
+    def lookup(self, project: str, suite: str, key: str) -> Optional[dict]:
+        """Return the cached pass (``report_dir``, ``verified_at``) for ``key``."""
+        from aec.lib.history_store import connect, get_cached_pass
+
+        with closing(connect(self.db_path)) as conn:
+            return get_cached_pass(
+                conn, project, suite, key, min_verified_at=time.time() - self.ttl_seconds,
+            )
+
+    def record_pass(
+        self, project: str, suite: str, key: str, report_dir: Optional[Path]
+    ) -> None:
+        """Remember that ``suite`` passed with ``key`` in ``report_dir``."""
+        from aec.lib.history_store import connect, set_cached_pass
+
+        with closing(connect(self.db_path)) as conn:
+            set_cached_pass(
+                conn, project, suite, key, str(report_dir) if report_dir else "",
+            )
+
+    def forget(self, project: str, suite: str) -> None:
+        """Drop any cached pass for ``suite`` (after it failed)."""
+        from aec.lib.history_store import clear_cached_pass, connect
+
+        with closing(connect(self.db_path)) as conn:
+            clear_cached_pass(conn, project, suite)
@@ -0,0 +1,167 @@
+"""Live event stream of a scheduled test run.
+
+``run_all_projects`` writes one JSON object per line to
+``AEC_TESTS_DIR/events.jsonl``, truncating it when a run starts. Each event
+has ``event`` and ``ts`` (Unix time) fields:
+
+* ``run_started`` — timestamp, seed, ordering strategy, report directory,
+  projects in execution order, number of lanes
+* ``project_started`` / ``project_finished`` — a project's scheduled suites,
+  then its overall status
+* ``suite_started`` / ``suite_finished`` — one suite attempt (reruns carry
+  ``attempt``); finished events add status and duration
+* ``observation`` — a port or process observation, as in the summary
+* ``run_finished`` — ``status`` (``complete``, or ``error`` when the run
+  raised), and for a complete run the totals and the summary path
+
+Writing an event is one ``json.dumps`` and one line-buffered write, with no
+fsync. ``run_journal`` is the durable record; this stream is for watching a
+run (``aec test watch``) and for tools that consume results as they arrive.
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+EVENTS_NAME = "events.jsonl"
+
+
+class EventStream:
+    """Append-only writer for one run's events; safe to share between lanes."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = open(path, "w", encoding="utf-8", buffering=1)
+        self._lock = threading.Lock()
+
+    def emit(self, event: str, **fields) -> None:
+        """Write one event; errors are ignored so a full disk never fails a run."""
+        line = json.dumps(
+            {"event": event, "ts": round(time.time(), 3), **fields},
+            separators=(",", ":"),
+            default=str,
+        )
+        with self._lock:
+            try:
+                self._fh.write(line + "\n")
+            except (OSError, ValueError):
+                pass
+
+    def close(self) -> None:
+        with self._lock:
+            self._fh.close()
+
+
+def read_events(path: Path, offset: int = 0) -> Tuple[List[dict], int]:
+    """Read complete events written after ``offset``.
+
+    Returns:
+        The events and the offset to resume from. A partly written last
+        line is left for the next call. The offset goes back to 0 when the
+        file was truncated by a new run.
+    """
+    try:
+        size = path.stat().st_size
+    except OSError:
+        return [], 0
+    if size < offset:
+        offset = 0
+    with open(path, "rb") as fh:
+        fh.seek(offset)
+        data = fh.read()
+    end = data.rfind(b"\n") + 1
+    events = []
+    for line in data[:end].splitlines():
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(event, dict):
+            events.append(event)
+    return events, offset + end
+
+
+class RunProgress:
+    """Fold a run's events into per-project progress for ``aec test watch``."""
+
+    def __init__(self):
+        self.run: Optional[dict] = None
+        self.finished: Optional[dict] = None
+        self.projects: Dict[str, dict] = {}
+        self.observations = 0
+
+    def _project(self, name: str) -> dict:
+        return self.projects.setdefault(name, {
+            "status": "queued",
+            "lane": None,
+            "suites": [],
+            "done": 0,
+            "failed": 0,
+            "elapsed": 0.0,
+            "current": None,
+            "started_at": None,
+        })
+
+    def apply(self, event: dict) -> None:
+        kind = event.get("event")
+        if kind == "run_started":
+            self.__init__()
+            self.run = event
+            for name in event.get("projects", []):
+                self._project(name)
+            return
+        project = event.get("project")
+        if kind == "project_started":
+            entry = self._project(project)
+            entry.update(status="running", lane=event.get("lane"))
+            entry["suites"] = list(event.get("suites", []))
+        elif kind == "suite_started":
+            entry = self._project(project)
+            entry["status"] = "running"
+            entry["current"] = event.get("suite")
+            entry["started_at"] = event.get("ts")
+        elif kind == "suite_finished":
+            entry = self._project(project)
+            if not event.get("attempt"):
+                entry["done"] += 1
+            if event.get("status") == "failed":
+                entry["failed"] += 1
+            entry["elapsed"] += event.get("duration_seconds") or 0.0
+            entry["current"] = None
+            entry["started_at"] = None
+        elif kind == "project_finished":
+            entry = self._project(project)
+            entry["status"] = event.get("status", "finished")
+            entry["current"] = None
+        elif kind == "observation":
+            self.observations += 1
+        elif kind == "run_finished":
+            self.finished = event
+
+    def eta_seconds(self, expected: Dict[str, float], now: float) -> Tuple[float, int]:
+        """Estimate the time left from historical project durations.
+
+        Args:
+            expected: Expected seconds per project name (from history).
+            now: Current Unix time.
+
+        Returns:
+            ``(seconds, unknown)`` where ``unknown`` counts unfinished
+            projects without history, which the estimate leaves out.
+        """
+        remaining, unknown = 0.0, 0
+        for name, entry in self.projects.items():
+            if entry["status"] not in ("queued", "running"):
+                continue
+            if name not in expected:
+                unknown += 1
+                continue
+            spent = entry["elapsed"]
+            if entry["started_at"] is not None:
+                spent += max(now - entry["started_at"], 0.0)
+            remaining += max(expected[name] - spent, 0.0)
+        lanes = max(int((self.run or {}).get("lanes") or 1), 1)
+        return remaining / lanes, unknown
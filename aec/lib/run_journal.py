@@ -0,0 +1,273 @@
+"""Append-only journal of a scheduled test run, for resuming interrupted runs.
+
+``run_all_projects`` writes ``journal.jsonl`` into the run's report
+directory. The first line holds the run's timestamp, seed, ordering
+strategy, project order, lanes and any suites deferred by the wall-clock
+budget. After that, one line is appended when each suite finishes (its
+result, profile diff and observations) and one when each project
+finishes. A final ``complete`` line closes the run.
+
+Each line is flushed and fsynced as it is written. A laptop that sleeps
+through the night, or a cron job that gets killed, loses at most the suite
+that was running. A torn last line is ignored when loading.
+``aec test run -g --resume`` replays the newest journal: finished projects
+and suites are kept, and the rest run in the original order.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+JOURNAL_NAME = "journal.jsonl"
+JOURNAL_VERSION = 1
+
+
+def _without_output(result: dict) -> dict:
+    """Drop the in-memory output tail when the full log is already on disk."""
+    if result.get("output_path"):
+        return {k: v for k, v in result.items() if k != "output"}
+    return result
+
+
+def _as_result(entry: dict) -> dict:
+    """Shape a journaled project like ``run_single_project``'s result."""
+    result = {
+        k: v for k, v in entry.items() if k not in ("finished", "suite_observations")
+    }
+    result["observations"] = [
+        obs for suite_obs in entry["suite_observations"].values() for obs in suite_obs
+    ]
+    return result
+
+
+class RunJournal:
+    """One run's journal; safe to share between lanes."""
+
+    def __init__(self, path: Path, header: dict):
+        self.path = path
+        self.header = header
+        self.complete = False
+        self._projects: Dict[str, dict] = {}
+        self._lock = threading.RLock()
+
+    @classmethod
+    def create(
+        cls,
+        path: Path,
+        timestamp: str,
+        seed: int,
+        order_strategy: str,
+        order: List[str],
+        lanes: Optional[List[List[str]]] = None,
+        deferred: Optional[List[dict]] = None,
+    ) -> "RunJournal":
+        """Start a new journal.
+
+        Args:
+            path: Journal file, normally ``<report_dir>/journal.jsonl``.
+            timestamp: The run's timestamp.
+            seed: Ordering seed.
+            order_strategy: ``execution.order_strategy`` of the run.
+            order: Project paths in execution order.
+            lanes: Project paths per lane for a parallel run.
+            deferred: Suites left out by the wall-clock budget
+                (``path``, ``project``, ``suite``, ...).
+        """
+        header = {
+            "type": "run",
+            "version": JOURNAL_VERSION,
+            "timestamp": timestamp,
+            "seed": seed,
+            "order_strategy": order_strategy,
+            "order": order,
+            "lanes": lanes,
+            "deferred": deferred or [],
+        }
+        journal = cls(path, header)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+        journal._append(header)
+        return journal
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["RunJournal"]:
+        """Replay a journal file; None if it is missing or has no header."""
+        try:
+            lines = path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return None
+        journal: Optional[RunJournal] = None
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # torn write from an interrupted run
+            if not isinstance(record, dict):
+                continue
+            kind = record.get("type")
+            if journal is None:
+                if kind != "run":
+                    return None
+                journal = cls(path, record)
+            elif kind == "suite":
+                journal._apply_suite(record)
+            elif kind == "project":
+                journal._apply_project(record)
+            elif kind == "complete":
+                journal.complete = True
+        return journal
+
+    @property
+    def timestamp(self) -> str:
+        return self.header["timestamp"]
+
+    @property
+    def seed(self) -> int:
+        return self.header["seed"]
+
+    @property
+    def order_strategy(self) -> str:
+        return self.header.get("order_strategy", "random")
+
+    @property
+    def order(self) -> List[str]:
+        return list(self.header.get("order") or [])
+
+    @property
+    def lanes(self) -> Optional[List[List[str]]]:
+        lanes = self.header.get("lanes")
+        return [list(lane) for lane in lanes] if lanes else None
+
+    @property
+    def lock(self) -> threading.RLock:
+        """The journal's lock; hold it to write files derived from the journal."""
+        return self._lock
+
+    @property
+    def deferred(self) -> List[dict]:
+        return [dict(entry) for entry in self.header.get("deferred") or []]
+
+    def _append(self, record: dict) -> None:
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with open(self.path, "a", encoding="utf-8") as fh:
+            fh.write(line)
+            fh.flush()
+            os.fsync(fh.fileno())
+
+    def _entry(self, project_path: str, project_name: str) -> dict:
+        return self._projects.setdefault(project_path, {
+            "project": project_name,
+            "status": "running",
+            "finished": False,
+            "suites": {},
+            "profiles": {},
+            "suite_observations": {},
+        })
+
+    def _apply_suite(self, record: dict) -> None:
+        entry = self._entry(record["path"], record.get("project", ""))
+        entry["suites"][record["suite"]] = record.get("result") or {}
+        if record.get("profile") is not None:
+            entry["profiles"][record["suite"]] = record["profile"]
+        entry["suite_observations"][record["suite"]] = record.get("observations") or []
+
+    def _apply_project(self, record: dict) -> None:
+        entry = self._entry(record["path"], record.get("project", ""))
+        entry.update(record.get("result") or {})
+        entry["finished"] = True
+
+    def record_suite(
+        self,
+        project_path: str,
+        project_name: str,
+        suite: str,
+        result: dict,
+        profile: Optional[dict] = None,
+        observations: Optional[list] = None,
+    ) -> None:
+        """Journal one finished suite."""
+        record = {
+            "type": "suite",
+            "path": project_path,
+            "project": project_name,
+            "suite": suite,
+            "result": _without_output(result),
+            "profile": profile,
+            "observations": observations or [],
+        }
+        with self._lock:
+            self._append(record)
+            self._apply_suite(record)
+
+    def finish_project(self, project_path: str, result: dict) -> None:
+        """Journal a finished project (its suites are already journaled)."""
+        summary = {
+            k: v for k, v in result.items()
+            if k not in ("suites", "profiles", "observations")
+        }
+        record = {
+            "type": "project",
+            "path": project_path,
+            "project": result.get("project", Path(project_path).name),
+            "result": summary,
+        }
+        with self._lock:
+            self._append(record)
+            self._apply_project(record)
+
+    def mark_complete(self) -> None:
+        """Close the journal; a complete run is never resumed."""
+        with self._lock:
+            self._append({"type": "complete"})
+            self.complete = True
+
+    def project_result(self, project_path: str) -> Optional[dict]:
+        """Return a finished project's result, or None."""
+        with self._lock:
+            entry = self._projects.get(project_path)
+            if entry is None or not entry["finished"]:
+                return None
+            return _as_result(entry)
+
+    def completed_suites(self, project_path: str) -> Dict[str, dict]:
+        """Return ``{suite: {"result", "profile", "observations"}}`` journaled for a project."""
+        with self._lock:
+            entry = self._projects.get(project_path)
+            if entry is None:
+                return {}
+            return {
+                suite: {
+                    "result": result,
+                    "profile": entry["profiles"].get(suite),
+                    "observations": entry["suite_observations"].get(suite, []),
+                }
+                for suite, result in entry["suites"].items()
+            }
+
+    def results(self) -> Dict[str, dict]:
+        """Return every journaled project (finished or not), by project path."""
+        with self._lock:
+            return {path: _as_result(entry) for path, entry in self._projects.items()}
+
+    def finished_count(self) -> int:
+        with self._lock:
+            return sum(1 for entry in self._projects.values() if entry["finished"])
+
+
+def find_resumable(tests_dir: Path) -> Optional[RunJournal]:
+    """Return the newest run's journal if that run did not complete."""
+    if not tests_dir.is_dir():
+        return None
+    candidates = sorted(
+        (p for p in tests_dir.iterdir() if (p / JOURNAL_NAME).is_file()),
+        key=lambda p: p.name,
+        reverse=True,
+    )
+    if not candidates:
+        return None
+    journal = RunJournal.load(candidates[0] / JOURNAL_NAME)
+    if journal is None or journal.complete:
+        return None
+    return journal
@@ -1,30 +1,115 @@
 """AEC test runner — executes test suites, profiles, and generates reports."""
 
 import logging
+import os
 import random
 import subprocess
+import tempfile
 import time
+from contextlib import nullcontext
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Tuple
+from typing import BinaryIO, Callable, Dict, List, Optional, Set, Tuple
+
+from aec.lib.governor import ConcurrencyGovernor
+from aec.lib.lane_isolation import LaneContext
+from aec.lib.prerequisites import PrerequisiteOracle
+from aec.lib.result_cache import ResultCache
+from aec.lib.run_events import EVENTS_NAME, EventStream
+from aec.lib.run_journal import JOURNAL_NAME, RunJournal, find_resumable
 
 logger = logging.getLogger(__name__)
 
 
-def execute_suite(project_dir: Path, suite_name: str, suite_config: dict) -> dict:
+# Bytes of each suite's output kept in memory for summaries and the terminal.
+# The full log only ever lives on disk.
+OUTPUT_TAIL_BYTES = 64 * 1024
+
+# JUnit files modified this long before a suite started still count as its
+# own (coarse filesystem timestamps).
+JUNIT_MTIME_SLACK_SECONDS = 2.0
+
+
+def _read_tail(fh: BinaryIO, start: int) -> str:
+    """Read at most the last ``OUTPUT_TAIL_BYTES`` written to ``fh`` after ``start``.
+
+    A tail that had to be cut starts at the next full line.
+    """
+    fh.flush()
+    end = fh.seek(0, os.SEEK_END)
+    begin = max(start, end - OUTPUT_TAIL_BYTES)
+    fh.seek(begin)
+    data = fh.read(end - begin)
+    if begin > start:
+        newline = data.find(b"\n")
+        if newline != -1:
+            data = data[newline + 1:]
+    return data.decode("utf-8", errors="replace")
+
+
+def _settled_session_members(
+    session_id: int, list_members: Callable[[int], List[dict]], settle_seconds: float = 1.0
+) -> List[dict]:
+    """List a killed suite's session after giving SIGKILLed processes time to exit."""
+    deadline = time.monotonic() + settle_seconds
+    members = list_members(session_id)
+    while members and time.monotonic() < deadline:
+        time.sleep(0.05)
+        members = list_members(session_id)
+    return members
+
+
+def execute_suite(
+    project_dir: Path,
+    suite_name: str,
+    suite_config: dict,
+    output_path: Optional[Path] = None,
+    on_spawn: Optional[Callable[[int], None]] = None,
+    env: Optional[dict] = None,
+) -> dict:
     """Execute a single test suite.
 
-    Runs the suite's command via subprocess, captures output, exit code,
-    and duration.
+    Runs the suite's command via subprocess with stdout and stderr streamed
+    straight into a file, so a long, noisy suite never sits in memory. Only
+    the last ``OUTPUT_TAIL_BYTES`` are read back for the result.
+
+    The suite runs in its own session under the ``timeout_seconds``,
+    ``max_memory_mb`` and ``nice`` limits from its config (see
+    ``suite_limits``). On timeout its whole process group is killed.
 
     Args:
         project_dir: Working directory for the command.
         suite_name: Name of the suite (for logging).
         suite_config: Dict with at least a "command" key.
+        output_path: File to append this suite's output to, under an
+            ``=== suite ===`` header. When None the output goes to a
+            temporary file that is removed once the tail has been read.
+        on_spawn: Called with the suite's PID right after it starts (used to
+            attach the resource sampler).
+        env: Variables added to the runner's environment for the suite
+            (e.g. a lane's isolation context).
 
     Returns:
-        Dict with status, exit_code, duration_seconds, and output.
+        Dict with status, exit_code, duration_seconds, output (bounded
+        tail) and, when ``output_path`` was given, output_path. Where the
+        platform supports it, also ``rusage`` (from ``wait4`` on the suite)
+        and ``cgroup`` (the suite's own cgroup v2 counters). ``limits``
+        lists the limits that were set (with ``cgroup_memory_max`` telling
+        whether ``max_memory_mb`` also capped the suite's cgroup), ``timed_out`` is True after a
+        timeout, and ``survivors`` lists processes left in the suite's
+        session once it ended. A failed suite whose output names its
+        failing tests gets ``failures`` (see ``failure_extract``).
     """
+    from aec.lib.failure_extract import extract_failures, suite_framework
+    from aec.lib.suite_accounting import SuiteCgroup, wait_with_rusage
+    from aec.lib.suite_limits import (
+        kill_process_group,
+        popen_options,
+        session_members,
+        suite_args,
+        suite_limits,
+    )
+
     command = suite_config.get("command", "")
     if not command:
         return {
@@ -34,42 +119,106 @@ def execute_suite(project_dir: Path, suite_name: str, suite_config: dict) -> dic
             "output": "No command specified for suite",
         }
 
-    start = time.monotonic()
-    try:
-        result = subprocess.run(
-            command,
-            shell=True,
+    if output_path is not None:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        fh = open(output_path, "a+b")
+        fh.write(f"=== {suite_name} ===\n".encode("utf-8"))
+        fh.flush()
+    else:
+        fh = tempfile.TemporaryFile()
+    start_offset = fh.tell()
+
+    limits = suite_limits(suite_config)
+    args = suite_args(command, limits)
+
+    with fh:
+        cgroup = SuiteCgroup.create()
+        start = time.monotonic()
+        proc = subprocess.Popen(
+            args,
+            shell=isinstance(args, str),
             cwd=str(project_dir),
-            capture_output=True,
-            text=True,
-            timeout=3600,
+            stdout=fh,
+            stderr=subprocess.STDOUT,
+            env={**os.environ, **env} if env else None,
+            **popen_options(),
         )
-        duration = time.monotonic() - start
-        output = result.stdout
-        if result.stderr:
-            output += "\n" + result.stderr if output else result.stderr
-        return {
-            "status": "passed" if result.returncode == 0 else "failed",
-            "exit_code": result.returncode,
-            "duration_seconds": round(duration, 3),
-            "output": output,
-        }
-    except subprocess.TimeoutExpired:
-        duration = time.monotonic() - start
-        return {
-            "status": "failed",
-            "exit_code": -1,
-            "duration_seconds": round(duration, 3),
-            "output": f"Suite '{suite_name}' timed out after 3600 seconds",
+        if cgroup is not None and not cgroup.attach(proc.pid):
+            cgroup = None
+        memory_capped = False
+        if cgroup is not None and limits.max_memory_mb is not None:
+            memory_capped = cgroup.set_memory_max(limits.max_memory_mb)
+        if on_spawn is not None:
+            on_spawn(proc.pid)
+        rusage = None
+        try:
+            returncode, rusage = wait_with_rusage(proc, timeout=limits.timeout_seconds)
+            duration = time.monotonic() - start
+            suite_result = {
+                "status": "passed" if returncode == 0 else "failed",
+                "exit_code": returncode,
+                "duration_seconds": round(duration, 3),
+                "output": _read_tail(fh, start_offset),
+            }
+            survivors = session_members(proc.pid)
+        except subprocess.TimeoutExpired:
+            kill_process_group(proc)
+            if cgroup is not None:
+                cgroup.kill()
+            _returncode, rusage = wait_with_rusage(proc, timeout=60)
+            duration = time.monotonic() - start
+            survivors = _settled_session_members(proc.pid, session_members)
+            message = (
+                f"Suite '{suite_name}' timed out after {limits.timeout_seconds:g} seconds"
+            )
+            tail = _read_tail(fh, start_offset)
+            fh.write(f"\n{message}\n".encode("utf-8"))
+            suite_result = {
+                "status": "failed",
+                "exit_code": -1,
+                "duration_seconds": round(duration, 3),
+                "output": f"{tail}\n{message}" if tail else message,
+                "timed_out": True,
+            }
+        set_limits = {
+            key: value for key, value in limits._asdict().items() if value is not None
         }
-
-
-def run_cleanup(project_dir: Path, cleanup_command: str) -> bool:
+        if limits.max_memory_mb is not None:
+            # Whether the cgroup's memory.max took, on top of ulimit -d
+            set_limits["cgroup_memory_max"] = memory_capped
+        suite_result["limits"] = set_limits
+        if survivors:
+            suite_result["survivors"] = survivors
+        if suite_result["status"] == "failed":
+            failures = extract_failures(
+                fh, start_offset, suite_framework(suite_name, suite_config)
+            )
+            if failures is not None:
+                suite_result["failures"] = failures
+        if rusage is not None:
+            suite_result["rusage"] = rusage
+        if cgroup is not None:
+            cgroup_stats = cgroup.read()
+            cgroup.remove()
+            if cgroup_stats is not None:
+                suite_result["cgroup"] = cgroup_stats
+        if output_path is not None:
+            fh.seek(0, os.SEEK_END)
+            fh.write(b"\n")
+            suite_result["output_path"] = str(output_path)
+    return suite_result
+
+
+def run_cleanup(
+    project_dir: Path, cleanup_command: str, env: Optional[dict] = None
+) -> bool:
     """Run a cleanup command after a test suite.
 
     Args:
         project_dir: Working directory for the command.
         cleanup_command: Shell command to execute.
+        env: Variables added to the runner's environment, matching the
+            suite's (so e.g. ``docker compose down`` finds the lane's project).
 
     Returns:
         True if the command exited with code 0, False otherwise.
@@ -82,17 +231,21 @@ def run_cleanup(project_dir: Path, cleanup_command: str) -> bool:
             capture_output=True,
             text=True,
             timeout=300,
+            env={**os.environ, **env} if env else None,
         )
         return result.returncode == 0
     except (subprocess.TimeoutExpired, OSError):
         return False
 
 
-def check_project_prerequisites(aec_data: dict) -> Tuple[bool, List[str]]:
+def check_project_prerequisites(
+    aec_data: dict, oracle: Optional[PrerequisiteOracle] = None
+) -> Tuple[bool, List[str]]:
     """Check project-level prerequisites from aec_data.
 
     Args:
         aec_data: Loaded .aec.json data.
+        oracle: Run-scoped memo to answer from; checks directly when None.
 
     Returns:
         (all_passed, list_of_failure_reasons).
@@ -102,16 +255,19 @@ def check_project_prerequisites(aec_data: dict) -> Tuple[bool, List[str]]:
     prereqs = aec_data.get("test", {}).get("prerequisites", [])
     if not prereqs:
         return True, []
-    results = check_prerequisites(prereqs)
+    results = oracle.check(prereqs) if oracle is not None else check_prerequisites(prereqs)
     failures = [f"{name}: {detail}" for name, available, detail in results if not available]
     return len(failures) == 0, failures
 
 
-def check_suite_prerequisites(suite_config: dict) -> Tuple[bool, List[str]]:
+def check_suite_prerequisites(
+    suite_config: dict, oracle: Optional[PrerequisiteOracle] = None
+) -> Tuple[bool, List[str]]:
     """Check suite-level prerequisites.
 
     Args:
         suite_config: Suite configuration dict.
+        oracle: Run-scoped memo to answer from; checks directly when None.
 
     Returns:
         (all_passed, list_of_failure_reasons).
@@ -121,7 +277,7 @@ def check_suite_prerequisites(suite_config: dict) -> Tuple[bool, List[str]]:
     prereqs = suite_config.get("prerequisites", [])
     if not prereqs:
         return True, []
-    results = check_prerequisites(prereqs)
+    results = oracle.check(prereqs) if oracle is not None else check_prerequisites(prereqs)
     failures = [f"{name}: {detail}" for name, available, detail in results if not available]
     return len(failures) == 0, failures
 
@@ -131,6 +287,8 @@ def analyze_port_observations(
     profile_diff: dict,
     port_registry: dict,
     port_mgmt_enabled: bool,
+    port_offset: int = 0,
+    lanes: int = 1,
 ) -> list:
     """Compare observed ports against the port registry.
 
@@ -139,28 +297,26 @@ def analyze_port_observations(
         profile_diff: Diff from profiler.diff_snapshots().
         port_registry: Loaded port registry dict.
         port_mgmt_enabled: Whether port management is enabled.
+        port_offset: The lane's ``AEC_PORT_OFFSET``; a registered port
+            shifted by it counts as registered.
+        lanes: Lanes of the run; a registered port shifted by any of their
+            offsets counts as registered too.
 
     Returns:
         List of observation dicts with type, port, and message.
     """
+    from aec.lib.lane_isolation import lane_port_offsets, registered_ports
+
     if not port_mgmt_enabled:
         return []
 
     observations = []
-    registered_ports = set()
-    for _key, entry in port_registry.get("ports", {}).items():
-        if isinstance(entry, dict) and "port" in entry:
-            registered_ports.add(entry["port"])
-        else:
-            # key might be the port number itself
-            try:
-                registered_ports.add(int(_key))
-            except (ValueError, TypeError):
-                pass
+    registered = set(registered_ports(port_registry))
+    offsets = {port_offset, *lane_port_offsets(lanes, port_registry)}
 
-    for port_info in profile_diff.get("new_ports", []):
+    for port_info in profile_diff.get("ports_new", []):
         port = port_info if isinstance(port_info, int) else port_info.get("port", 0)
-        if port and port not in registered_ports:
+        if port and not any(port - offset in registered for offset in offsets):
             observations.append({
                 "type": "unregistered_port",
                 "port": port,
@@ -198,12 +354,49 @@ def analyze_process_observations(
     return observations
 
 
-def run_single_project(project_dir: Path, run_all: bool = False) -> dict:
+def run_single_project(
+    project_dir: Path,
+    run_all: bool = False,
+    report_dir: Optional[Path] = None,
+    sample_interval: float = 1.0,
+    cache: Optional[ResultCache] = None,
+    oracle: Optional[PrerequisiteOracle] = None,
+    isolation: Optional[LaneContext] = None,
+    completed_suites: Optional[dict] = None,
+    on_suite: Optional[Callable[[str, dict, Optional[dict], list], None]] = None,
+    events: Optional[EventStream] = None,
+    governor: Optional[ConcurrencyGovernor] = None,
+    deferred_suites: Optional[Set[str]] = None,
+    lanes: int = 1,
+) -> dict:
     """Run test suites for a single project.
 
     Args:
         project_dir: Path to the project directory.
         run_all: If True, run ALL suites. If False, run only scheduled suites.
+        report_dir: Report directory of the current run. When given, suite
+            output streams into the project's ``*_test_output.txt`` there
+            while the suites run.
+        sample_interval: Seconds between resource samples of each suite's
+            process tree; 0 disables sampling.
+        cache: Skip-unchanged cache. Suites whose key matches a recent pass
+            are reported as ``cached-pass`` instead of being run.
+        oracle: Run-scoped prerequisite memo shared by all projects.
+        isolation: The lane's isolation context; its variables are exported
+            to every suite and cleanup command. With other lanes running,
+            each suite's snapshot diff is scoped to its own session and
+            Compose project (``scope_diff_to_session``).
+        completed_suites: Suites already finished by an interrupted run
+            (``RunJournal.completed_suites``); their results are reused
+            instead of running them again.
+        on_suite: Called as ``(suite, result, profile, observations)`` once
+            each suite is finished, skipped or cached (used for the run
+            journal).
+        events: The run's live event stream.
+        governor: Admission control of a parallel run; each suite waits
+            for a slot before it starts.
+        deferred_suites: Suites the run's wall-clock budget left out.
+        lanes: Lanes running at the same time (for port observations).
 
     Returns:
         Results dict with per-suite results and profiles.
@@ -211,7 +404,12 @@ def run_single_project(project_dir: Path, run_all: bool = False) -> dict:
     from aec.lib.aec_json import load_aec_json
     from aec.lib.config import AEC_PORTS_REGISTRY
     from aec.lib.ports import load_registry
-    from aec.lib.profiler import diff_snapshots, take_snapshot
+    from aec.lib.profiler import diff_snapshots, scope_diff_to_session, take_snapshot
+    from aec.lib.junit import junit_reports, summarize_junit
+    from aec.lib.lane_isolation import unshift_ports
+    from aec.lib.reports import suite_output_path
+    from aec.lib.resource_sampler import ResourceSampler
+    from aec.lib.result_cache import CACHED_PASS, repo_fingerprint, suite_cache_key
 
     aec_data = load_aec_json(project_dir)
     if aec_data is None:
@@ -225,7 +423,7 @@ def run_single_project(project_dir: Path, run_all: bool = False) -> dict:
     project_name = aec_data.get("project", {}).get("name", project_dir.name)
 
     # Check project-level prerequisites
-    prereqs_ok, failures = check_project_prerequisites(aec_data)
+    prereqs_ok, failures = check_project_prerequisites(aec_data, oracle)
     if not prereqs_ok:
         return {
             "project": project_name,
@@ -244,6 +442,10 @@ def run_single_project(project_dir: Path, run_all: bool = False) -> dict:
         suites_to_run = {
             name: cfg for name, cfg in all_suites.items() if name in scheduled
         }
+    if deferred_suites:
+        suites_to_run = {
+            name: cfg for name, cfg in suites_to_run.items() if name not in deferred_suites
+        }
 
     if not suites_to_run:
         return {
@@ -260,45 +462,148 @@ def run_single_project(project_dir: Path, run_all: bool = False) -> dict:
     suite_results = {}
     profiles = {}
     observations = []
+    output_path = (
+        suite_output_path(report_dir, project_name) if report_dir is not None else None
+    )
+    env = isolation.env() if isolation is not None else None
+    port_offset = isolation.port_offset if isolation is not None else 0
+    lane = isolation.lane if isolation is not None else None
+    # Fingerprint before any suite runs: suites may leave files behind.
+    fingerprint = repo_fingerprint(project_dir) if cache is not None else None
+
+    completed_suites = completed_suites or {}
+    if events is not None:
+        events.emit(
+            "project_started", project=project_name, suites=list(suites_to_run), lane=lane,
+        )
+
+    def suite_finished_event(suite_name: str, suite_observations) -> None:
+        result = suite_results[suite_name]
+        events.emit(
+            "suite_finished", project=project_name, suite=suite_name, lane=lane,
+            status=result.get("status"),
+            duration_seconds=result.get("duration_seconds"),
+            exit_code=result.get("exit_code"),
+        )
+        for obs in suite_observations:
+            events.emit("observation", project=project_name, suite=suite_name, **obs)
+
+    def suite_done(suite_name: str, suite_observations: list = ()) -> None:
+        if events is not None:
+            suite_finished_event(suite_name, suite_observations)
+        if on_suite is not None:
+            on_suite(
+                suite_name, suite_results[suite_name], profiles.get(suite_name),
+                list(suite_observations),
+            )
 
     for suite_name, suite_config in suites_to_run.items():
+        # Reuse suites an interrupted run already finished
+        if suite_name in completed_suites:
+            done = completed_suites[suite_name]
+            suite_results[suite_name] = done["result"]
+            if done.get("profile") is not None:
+                profiles[suite_name] = done["profile"]
+            observations.extend(done.get("observations") or [])
+            if events is not None:
+                suite_finished_event(suite_name, ())
+            continue
+
         # Check suite-level prerequisites
-        suite_ok, suite_failures = check_suite_prerequisites(suite_config)
+        suite_ok, suite_failures = check_suite_prerequisites(suite_config, oracle)
         if not suite_ok:
             suite_results[suite_name] = {
                 "status": "skipped",
                 "reason": f"prerequisites failed: {', '.join(suite_failures)}",
             }
+            suite_done(suite_name)
             continue
 
-        # Take pre-snapshot
-        before = take_snapshot()
-
-        # Execute the suite
-        result = execute_suite(project_dir, suite_name, suite_config)
+        cache_key = None
+        if fingerprint is not None:
+            cache_key = suite_cache_key(project_dir, fingerprint, suite_config)
+            hit = cache.lookup(project_name, suite_name, cache_key)
+            if hit is not None:
+                suite_results[suite_name] = {
+                    "status": CACHED_PASS,
+                    "cached_from": hit["report_dir"],
+                    "verified_at": hit["verified_at"],
+                }
+                suite_done(suite_name)
+                continue
+
+        # Wait until load and memory leave room for the suite
+        slot = governor.slot(project_name, suite_name) if governor is not None else nullcontext()
+        with slot:
+            # Take pre-snapshot
+            before = take_snapshot()
+            if events is not None:
+                events.emit("suite_started", project=project_name, suite=suite_name, lane=lane)
+
+            # Execute the suite, sampling its process tree while it runs
+            sampler = ResourceSampler(interval=sample_interval)
+            started_at = time.time()
+            try:
+                result = execute_suite(
+                    project_dir, suite_name, suite_config, output_path,
+                    on_spawn=sampler.start, env=env,
+                )
+            finally:
+                sampler.stop()
+        junit_pattern = suite_config.get("junit")
+        if junit_pattern:
+            junit = summarize_junit(
+                junit_reports(project_dir, junit_pattern, started_at - JUNIT_MTIME_SLACK_SECONDS)
+            )
+            if junit is not None:
+                result["junit"] = junit
         suite_results[suite_name] = result
+        if cache_key is not None:
+            if result.get("status") == "passed":
+                cache.record_pass(project_name, suite_name, cache_key, report_dir)
+            else:
+                cache.forget(project_name, suite_name)
 
         # Take post-snapshot and diff
         after = take_snapshot()
         diff = diff_snapshots(before, after)
-        profiles[suite_name] = diff
+        if isolation is not None:
+            # Other lanes share the machine: keep only what this suite left
+            diff = scope_diff_to_session(
+                diff, result.get("survivors", []), isolation.compose_project,
+            )
+        if port_offset:
+            # Profiles hold registered ports as lane 1 binds them
+            diff["ports_new"] = unshift_ports(diff.get("ports_new", []), port_registry, port_offset)
+        profiles[suite_name] = dict(
+            diff,
+            duration_seconds=result.get("duration_seconds"),
+            status=result.get("status"),
+        )
+        resources = sampler.summary()
+        if resources is not None:
+            profiles[suite_name]["resources"] = resources
+        for key in ("rusage", "cgroup", "limits", "timed_out", "survivors"):
+            if key in result:
+                profiles[suite_name][key] = result[key]
 
         # Run cleanup if specified
         cleanup_cmd = suite_config.get("cleanup")
         if cleanup_cmd:
-            run_cleanup(project_dir, cleanup_cmd)
+            run_cleanup(project_dir, cleanup_cmd, env=env)
 
         # Analyze observations
         port_obs = analyze_port_observations(
-            project_name, diff, port_registry, port_mgmt_enabled
+            project_name, diff, port_registry, port_mgmt_enabled, port_offset, lanes
         )
         proc_obs = analyze_process_observations(project_name, suite_name, diff)
         observations.extend(port_obs)
         observations.extend(proc_obs)
+        suite_done(suite_name, port_obs + proc_obs)
 
     # Determine overall status
     statuses = [r.get("status") for r in suite_results.values()]
-    if all(s == "passed" for s in statuses):
+    if all(s in ("passed", CACHED_PASS) for s in statuses):
         overall = "passed"
     elif all(s == "skipped" for s in statuses):
         overall = "skipped"
@@ -314,19 +619,150 @@ def run_single_project(project_dir: Path, run_all: bool = False) -> dict:
     }
 
 
+def rerun_failed_suites(
+    project_results: dict,
+    policy: dict,
+    flakiness: dict,
+    report_dir: Optional[Path] = None,
+    events: Optional[EventStream] = None,
+    contexts: Optional[Dict[str, LaneContext]] = None,
+    sample_interval: float = 1.0,
+    governor: Optional[ConcurrencyGovernor] = None,
+    on_suite: Optional[Callable[[str, str, dict, Optional[dict]], None]] = None,
+) -> int:
+    """Rerun failed suites with a history of flakiness, after all first attempts.
+
+    A failed suite is rerun when its flakiness score is at least
+    ``policy["flakiness_threshold"]``, up to ``policy["max_reruns"]`` times
+    or until it passes. The first attempt's result is kept as it is; the
+    attempts go into its ``reruns`` list (and the suite's profile), and the
+    output is appended to the project's log under ``=== suite (rerun N) ===``.
+    Reruns run in the project's lane context, wait for the governor and are
+    sampled like first attempts; suites that already have ``reruns`` (from
+    an interrupted run) are not rerun again.
+
+    Args:
+        project_results: ``run_all_projects`` results by project path,
+            updated in place.
+        policy: ``get_rerun_policy()`` output.
+        flakiness: ``suite_flakiness()`` scores from before this run.
+        report_dir: Report directory of the run.
+        events: The run's live event stream.
+        contexts: Lane isolation context of each project path, as given to
+            its first run; still held by the caller.
+        sample_interval: Seconds between resource samples; 0 disables sampling.
+        governor: Admission control of a parallel run.
+        on_suite: Called as ``(project_path, suite, result, profile)`` once a
+            suite's reruns are finished (used for the run journal).
+
+    Returns:
+        Number of reruns executed.
+    """
+    from aec.lib.aec_json import load_aec_json
+    from aec.lib.reports import suite_output_path
+    from aec.lib.resource_sampler import ResourceSampler
+
+    contexts = contexts or {}
+    executed = 0
+    for project_path, result in project_results.items():
+        suites = result.get("suites", {})
+        failed = [
+            name for name, r in suites.items()
+            if r.get("status") == "failed" and "reruns" not in r
+        ]
+        if not failed:
+            continue
+        project_dir = Path(project_path)
+        project_name = result.get("project", project_dir.name)
+        suite_configs = (load_aec_json(project_dir) or {}).get("test", {}).get("suites", {})
+        output_path = (
+            suite_output_path(report_dir, project_name) if report_dir is not None else None
+        )
+        isolation = contexts.get(project_path)
+        env = isolation.env() if isolation is not None else None
+        lane = isolation.lane if isolation is not None else None
+        for suite_name in failed:
+            score = flakiness.get((project_name, suite_name), {}).get("score", 0.0)
+            suite_config = suite_configs.get(suite_name)
+            if suite_config is None or score < policy["flakiness_threshold"]:
+                continue
+            reruns = []
+            attempt_profiles = []
+            for attempt in range(1, policy["max_reruns"] + 1):
+                slot = (
+                    governor.slot(project_name, suite_name) if governor is not None
+                    else nullcontext()
+                )
+                with slot:
+                    if events is not None:
+                        events.emit(
+                            "suite_started", project=project_name, suite=suite_name,
+                            lane=lane, attempt=attempt,
+                        )
+                    sampler = ResourceSampler(interval=sample_interval)
+                    try:
+                        rerun = execute_suite(
+                            project_dir, f"{suite_name} (rerun {attempt})", suite_config,
+                            output_path, on_spawn=sampler.start, env=env,
+                        )
+                    finally:
+                        sampler.stop()
+                executed += 1
+                if events is not None:
+                    events.emit(
+                        "suite_finished", project=project_name, suite=suite_name,
+                        lane=lane, attempt=attempt, status=rerun.get("status"),
+                        duration_seconds=rerun.get("duration_seconds"),
+                        exit_code=rerun.get("exit_code"),
+                    )
+                summary = {
+                    "attempt": attempt,
+                    "status": rerun.get("status"),
+                    "exit_code": rerun.get("exit_code"),
+                    "duration_seconds": rerun.get("duration_seconds"),
+                }
+                reruns.append(summary)
+                attempt_profile = dict(summary)
+                resources = sampler.summary()
+                if resources is not None:
+                    attempt_profile["resources"] = resources
+                for key in ("rusage", "cgroup", "limits", "timed_out", "survivors"):
+                    if key in rerun:
+                        attempt_profile[key] = rerun[key]
+                attempt_profiles.append(attempt_profile)
+                cleanup_cmd = suite_config.get("cleanup")
+                if cleanup_cmd:
+                    run_cleanup(project_dir, cleanup_cmd, env=env)
+                if rerun.get("status") == "passed":
+                    break
+            suites[suite_name]["reruns"] = reruns
+            suites[suite_name]["flakiness"] = score
+            profile = result.get("profiles", {}).get(suite_name)
+            if profile is not None:
+                profile["reruns"] = attempt_profiles
+            if on_suite is not None:
+                on_suite(project_path, suite_name, suites[suite_name], profile)
+    return executed
+
+
 def apply_retention(config: dict) -> None:
     """Apply retention policy based on scheduler config.
 
-    If retention mode is "auto", prunes old reports and profiles.
+    If retention mode is "auto", prunes old reports, run history and any
+    legacy profile JSON files, and compresses the reports that are kept
+    once they are older than ``retention.compress_after_days``.
 
     Args:
         config: Scheduler config dict.
     """
-    from aec.lib.config import AEC_HOME
+    from contextlib import closing
+
+    from aec.lib.history_store import connect, prune_history
+    from aec.lib.report_index import compress_old_reports
     from aec.lib.reports import prune_old_profiles, prune_old_reports
-    from aec.lib.scheduler_config import get_retention_config
+    from aec.lib.scheduler_config import get_compression_settings, get_retention_config
 
-    from aec.lib.config import AEC_PROFILES_DIR, AEC_TESTS_DIR
+    from aec.lib.config import AEC_HISTORY_DB, AEC_PROFILES_DIR, AEC_TESTS_DIR
 
     retention = get_retention_config(config)
     if retention.get("report_mode") != "auto":
@@ -336,7 +772,80 @@ def apply_retention(config: dict) -> None:
     profile_days = retention.get("profile_days", 90)
 
     prune_old_reports(AEC_TESTS_DIR, report_days)
+    compression = get_compression_settings(config)
+    if compression is not None:
+        compress_old_reports(AEC_TESTS_DIR, *compression)
     prune_old_profiles(AEC_PROFILES_DIR, profile_days)
+    if AEC_HISTORY_DB.exists():
+        with closing(connect(AEC_HISTORY_DB)) as conn:
+            prune_history(conn, profile_days)
+
+
+def _flatten_results(project_results: dict) -> Tuple[List[dict], List[dict], List[dict]]:
+    """Return ``(suite results, port observations, process observations)`` for a summary."""
+    flat_results = []
+    port_observations = []
+    process_observations = []
+    for project_path, result in project_results.items():
+        project_name = result.get("project", Path(project_path).name)
+        for suite_name, suite_result in result.get("suites", {}).items():
+            flat_results.append({
+                "project": project_name,
+                "suite": suite_name,
+                "status": suite_result.get("status", "unknown"),
+                "duration_seconds": suite_result.get("duration_seconds"),
+                "exit_code": suite_result.get("exit_code"),
+                "skip_reason": suite_result.get("reason"),
+                "cached_from": suite_result.get("cached_from"),
+                "lane": result.get("lane"),
+                "rusage": suite_result.get("rusage"),
+                "cgroup": suite_result.get("cgroup"),
+                "timed_out": suite_result.get("timed_out", False),
+                "survivors": suite_result.get("survivors", []),
+                "reruns": suite_result.get("reruns", []),
+                "junit": suite_result.get("junit"),
+                "failures": suite_result.get("failures"),
+            })
+        for obs in result.get("observations", []):
+            if obs.get("type") == "port":
+                port_observations.append(obs)
+            else:
+                process_observations.append(obs)
+    return flat_results, port_observations, process_observations
+
+
+def write_partial_summary(report_dir: Path, journal: RunJournal) -> Path:
+    """Write summary.txt and summary.json for a run that is still in progress.
+
+    Lists every suite the journal has recorded so far; ``write_reports``
+    replaces both when the run finishes. Lanes call this concurrently, so
+    it runs under the journal's lock.
+    """
+    from aec.lib.reports import generate_summary, write_summary_json
+
+    with journal.lock:
+        results = journal.results()
+        flat_results, port_obs, proc_obs = _flatten_results(results)
+        order = journal.order
+        progress = f"{journal.finished_count()} of {len(order)} projects finished"
+        write_summary_json(
+            report_dir, flat_results, port_obs, proc_obs, [Path(p).name for p in order],
+            journal.seed, order_strategy=journal.order_strategy, progress=progress,
+            deferred=journal.deferred,
+        )
+        return generate_summary(
+            report_dir,
+            flat_results,
+            port_obs,
+            proc_obs,
+            [Path(p).name for p in order],
+            journal.seed,
+            "auto",
+            0,
+            order_strategy=journal.order_strategy,
+            progress=progress,
+            deferred=journal.deferred,
+        )
 
 
 def write_reports(
@@ -344,26 +853,42 @@ def write_reports(
     timestamp: str,
     seed: int,
     execution_order: list,
+    lane_timings: Optional[List[dict]] = None,
+    prerequisite_timings: Optional[List[dict]] = None,
+    order_strategy: str = "random",
+    governor: Optional[dict] = None,
+    deferred: Optional[List[dict]] = None,
 ) -> Path:
-    """Write test reports and profiles to disk.
+    """Write test reports (summary.txt and summary.json) and profiles to disk.
 
     Args:
         project_results: Dict mapping project paths to result dicts.
         timestamp: ISO timestamp for this run.
         seed: Random seed used for ordering.
         execution_order: List of project names in execution order.
+        lane_timings: Per-lane wall-clock entries from a parallel run
+            (``lane``, ``projects``, ``duration_seconds``, ``port_offset``);
+            None when the run was sequential.
+        prerequisite_timings: ``PrerequisiteOracle.timings()`` of the run.
+        order_strategy: ``execution.order_strategy`` used for this run.
+        governor: ``ConcurrencyGovernor.report()`` of a parallel run.
+        deferred: Suites left out by the wall-clock budget.
 
     Returns:
         Path to the summary.txt file.
     """
-    from aec.lib.config import AEC_HOME, AEC_PROFILES_DIR, AEC_TESTS_DIR
+    from contextlib import closing
+
+    from aec.lib.config import AEC_HISTORY_DB, AEC_PROFILES_DIR, AEC_TESTS_DIR
+    from aec.lib.flakiness import suite_flakiness
+    from aec.lib.history_store import connect, record_run
     from aec.lib.preferences import get_setting
-    from aec.lib.profiler import save_profile
     from aec.lib.reports import (
         count_report_days,
         create_report_dir,
         generate_summary,
         write_suite_output,
+        write_summary_json,
     )
 
     safe_ts = timestamp.replace(":", "-")
@@ -371,10 +896,14 @@ def write_reports(
     # Create report directory
     report_dir = create_report_dir(AEC_TESTS_DIR, safe_ts)
 
-    # Write per-project output files
+    # Write per-project output files. Suites run with a report_dir already
+    # streamed their full output there; only results produced without one
+    # (output tail held in the result) are written here.
     for project_path, result in project_results.items():
         project_name = result.get("project", Path(project_path).name)
-        # Combine all suite outputs into one file per project
+        suites = result.get("suites", {}).values()
+        if any(s.get("output_path") for s in suites):
+            continue
         combined_output = []
         for suite_name, suite_result in result.get("suites", {}).items():
             output = suite_result.get("output", "")
@@ -383,30 +912,48 @@ def write_reports(
         if combined_output:
             write_suite_output(report_dir, project_name, "\n".join(combined_output))
 
-    # Build flat results list for generate_summary
-    flat_results = []
-    all_observations_port = []
-    all_observations_proc = []
-    for project_path, result in project_results.items():
-        project_name = result.get("project", Path(project_path).name)
-        for suite_name, suite_result in result.get("suites", {}).items():
-            flat_results.append({
-                "project": project_name,
-                "suite": suite_name,
-                "status": suite_result.get("status", "unknown"),
-                "duration_seconds": suite_result.get("duration_seconds"),
-                "exit_code": suite_result.get("exit_code"),
-                "skip_reason": suite_result.get("reason"),
-            })
-        for obs in result.get("observations", []):
-            if obs.get("type") == "port":
-                all_observations_port.append(obs)
-            else:
-                all_observations_proc.append(obs)
+    flat_results, all_observations_port, all_observations_proc = _flatten_results(
+        project_results
+    )
+
+    # Record profiles per-project in the run history, then score flakiness
+    # including this run
+    project_names = []
+    with closing(connect(AEC_HISTORY_DB, legacy_profiles_dir=AEC_PROFILES_DIR)) as conn:
+        for project_path, result in project_results.items():
+            project_name = result.get("project", Path(project_path).name)
+            project_names.append(project_name)
+            profiles = result.get("profiles", {})
+            if profiles:
+                record_run(conn, project_name, safe_ts, profiles)
+        scores = suite_flakiness(conn, project_names)
+    flakiness = [
+        {"project": r["project"], "suite": r["suite"], **scores[(r["project"], r["suite"])]}
+        for r in flat_results
+        if scores.get((r["project"], r["suite"]), {}).get("score", 0.0) > 0
+    ]
 
     retention_mode = get_setting("report_retention_mode") or "auto"
     report_count = count_report_days(AEC_TESTS_DIR)
 
+    sections = dict(
+        lanes=lane_timings,
+        prerequisites=prerequisite_timings,
+        order_strategy=order_strategy,
+        flakiness=flakiness,
+        governor=governor,
+        deferred=deferred,
+    )
+    write_summary_json(
+        report_dir,
+        flat_results,
+        all_observations_port,
+        all_observations_proc,
+        execution_order,
+        seed,
+        timestamp=timestamp,
+        **sections,
+    )
     summary_path = generate_summary(
         report_dir,
         flat_results,
@@ -416,82 +963,459 @@ def write_reports(
         seed,
         retention_mode,
         report_count,
+        **sections,
     )
 
-    # Save profiles per-project
-    AEC_PROFILES_DIR.mkdir(parents=True, exist_ok=True)
-    for project_path, result in project_results.items():
-        project_name = result.get("project", Path(project_path).name)
-        profiles = result.get("profiles", {})
-        if profiles:
-            save_profile(AEC_PROFILES_DIR, project_name, safe_ts, profiles)
-
     return summary_path
 
 
-def run_all_projects(global_mode: bool = True) -> dict:
+def find_scheduled_projects() -> list:
+    """Return tracked repos on disk whose .aec.json schedules any suite.
+
+    Returns:
+        List of ``(TrackedRepo, project_name)`` tuples in tracking order;
+        the project name comes from ``.aec.json`` and defaults to the
+        directory name.
+    """
+    from aec.lib.aec_json import load_aec_json
+    from aec.lib.tracking import list_repos
+
+    projects = []
+    for repo in list_repos():
+        if not repo.exists:
+            continue
+        aec_data = load_aec_json(repo.path)
+        if aec_data is None:
+            continue
+        if aec_data.get("test", {}).get("scheduled", []):
+            name = aec_data.get("project", {}).get("name", repo.path.name)
+            projects.append((repo, name))
+    return projects
+
+
+def collect_scheduled_prerequisites(project_dirs: List[Path]) -> List[str]:
+    """Return every prerequisite the projects' scheduled suites can ask for.
+
+    Covers project-level prerequisites and those of scheduled suites, in
+    first-seen order without duplicates.
+    """
+    from aec.lib.aec_json import load_aec_json
+
+    names: List[str] = []
+    for project_dir in project_dirs:
+        aec_data = load_aec_json(project_dir) or {}
+        test_config = aec_data.get("test", {})
+        names.extend(test_config.get("prerequisites", []))
+        suites = test_config.get("suites", {})
+        for suite_name in test_config.get("scheduled", []):
+            names.extend(suites.get(suite_name, {}).get("prerequisites", []))
+    return list(dict.fromkeys(names))
+
+
+def plan_within_budget(
+    groups: List[list],
+    name_of: Callable,
+    capacity_seconds: float,
+    carried_over: Set[Tuple[str, str]],
+) -> Tuple[List[list], List[dict]]:
+    """Fit each group's scheduled suites into the wall-clock budget.
+
+    Every group (a lane, or all projects of a sequential run) is a separate
+    knapsack of ``capacity_seconds`` (see ``budget``).
+
+    Args:
+        groups: Lists of tracked repos, each run one after another.
+        name_of: Returns a repo's project name.
+        capacity_seconds: Time each group may take.
+        carried_over: ``(project, suite)`` pairs the previous run deferred.
+
+    Returns:
+        ``(groups, deferred)``: the groups without projects that have no
+        suite left, projects with carried-over suites moved to the front,
+        and one ``{"path", "project", "suite", "expected_seconds",
+        "staleness_days"}`` entry per deferred suite.
+    """
+    from contextlib import closing
+
+    from aec.lib.aec_json import load_aec_json
+    from aec.lib.budget import budget_items, select_within_budget
+    from aec.lib.config import AEC_HISTORY_DB, AEC_PROFILES_DIR
+    from aec.lib.history_store import connect
+
+    scheduled: Dict[str, Dict[str, dict]] = {}
+    for group in groups:
+        for repo in group:
+            test_config = (load_aec_json(repo.path) or {}).get("test", {})
+            suites = test_config.get("suites", {})
+            scheduled[name_of(repo)] = {
+                name: suites[name] or {} for name in test_config.get("scheduled", [])
+                if name in suites
+            }
+    with closing(connect(AEC_HISTORY_DB, legacy_profiles_dir=AEC_PROFILES_DIR)) as conn:
+        items = budget_items(conn, scheduled, carried_over)
+
+    planned: List[list] = []
+    deferred: List[dict] = []
+    for group in groups:
+        path_of = {name_of(repo): str(repo.path) for repo in group}
+        _selected, left_out = select_within_budget(
+            [items[(name_of(repo), suite)] for repo in group for suite in scheduled[name_of(repo)]],
+            capacity_seconds,
+        )
+        left_out_of: Dict[str, Set[str]] = {}
+        for item in left_out:
+            left_out_of.setdefault(item.project, set()).add(item.suite)
+            deferred.append({
+                "path": path_of[item.project],
+                "project": item.project,
+                "suite": item.suite,
+                "expected_seconds": round(item.seconds, 1),
+                "staleness_days": item.staleness_days,
+            })
+        kept = [
+            repo for repo in group
+            if not scheduled[name_of(repo)]
+            or set(scheduled[name_of(repo)]) - left_out_of.get(name_of(repo), set())
+        ]
+        # Last night's deferred suites go first
+        kept.sort(key=lambda repo: not any(
+            (name_of(repo), suite) in carried_over for suite in scheduled[name_of(repo)]
+        ))
+        planned.append(kept)
+    return planned, deferred
+
+
+def run_all_projects(
+    global_mode: bool = True, use_cache: bool = True, resume: bool = False
+) -> dict:
     """Run scheduled test suites across all tracked projects.
 
+    Projects run sequentially, in the order chosen by
+    ``execution.order_strategy`` (seeded random by default), unless
+    ``execution.parallel_enabled`` is set and a parallelization plan exists,
+    in which case each planned lane runs in its own worker (bounded by
+    ``execution.max_parallel_lanes``) and projects inside a lane keep their
+    planned order. Each lane runs under its own isolation context
+    (``AEC_LANE``, ``AEC_PORT_OFFSET``, ``COMPOSE_PROJECT_NAME``, ``TMPDIR``;
+    see ``lane_isolation``).
+
+    With ``execution.skip_unchanged`` on (it is off by default), suites
+    unchanged since a recent pass are skipped as ``cached-pass``
+    (``execution.cache_ttl_hours``).
+
+    Prerequisites are probed once per run, all at once up front, and shared
+    by every project and lane (``execution.prerequisite_ttl_seconds``
+    re-probes results older than that).
+
+    With ``execution.rerun_failed`` on, failed suites whose flakiness score
+    reaches ``execution.rerun_flakiness_threshold`` are rerun once all
+    projects have finished (see ``rerun_failed_suites``).
+
+    With ``schedule.max_duration_minutes`` set, only the suites that fit the
+    budget run; the rest are deferred to the next run (see
+    ``plan_within_budget``).
+
+    Progress is journaled to ``journal.jsonl`` in the report directory after
+    every suite, and summary.txt is rewritten as a partial report, so an
+    interrupted run keeps its results and can be continued.
+
     Args:
         global_mode: If True, operates on all tracked repos.
+        use_cache: False forces every suite to run (``--no-cache``).
+        resume: Continue the newest run if it did not complete (same
+            report directory, seed and order), skipping finished suites.
+            Starts a new run when there is nothing to resume.
 
     Returns:
         Overall results dict with per-project results.
     """
-    from aec.lib.aec_json import load_aec_json
-    from aec.lib.config import AEC_SCHEDULER_CONFIG
-    from aec.lib.reports import open_report
+    from contextlib import closing
+
+    from aec.lib.config import (
+        AEC_HISTORY_DB,
+        AEC_PROFILES_DIR,
+        AEC_SCHEDULER_CONFIG,
+        AEC_TESTS_DIR,
+    )
+    from aec.lib.history_store import connect
+    from aec.lib.ordering import order_items, order_lanes, project_history_stats
+    from aec.lib.reports import create_report_dir, open_report
     from aec.lib.scheduler_config import (
+        get_cache_ttl_seconds,
+        get_carried_over,
+        get_governor_settings,
+        get_max_duration_seconds,
+        get_max_parallel_lanes,
+        get_order_strategy,
+        get_parallel_lanes,
+        get_prerequisite_ttl,
+        get_rerun_policy,
+        get_sample_interval,
         load_scheduler_config,
         save_scheduler_config,
         update_last_run,
     )
-    from aec.lib.tracking import list_repos
 
-    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
     sched_config = load_scheduler_config(AEC_SCHEDULER_CONFIG)
+    journal = find_resumable(AEC_TESTS_DIR) if resume else None
+    if journal is not None:
+        timestamp, seed, strategy = journal.timestamp, journal.seed, journal.order_strategy
+        report_dir = journal.path.parent
+    else:
+        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        seed = random.randint(0, 2**31 - 1)
+        strategy = get_order_strategy(sched_config)
+        report_dir = create_report_dir(AEC_TESTS_DIR, timestamp.replace(":", "-"))
+
+    scheduled_projects = find_scheduled_projects()
+    eligible = [repo for repo, _name in scheduled_projects]
+    project_names = {str(repo.path): name for repo, name in scheduled_projects}
+
+    def name_of(repo) -> str:
+        return project_names.get(str(repo.path), repo.path.name)
+
+    history_stats: dict = {}
+    deferred: List[dict] = []
+    if journal is not None:
+        # Keep the interrupted run's order and deferrals; newly scheduled
+        # projects go last
+        deferred = journal.deferred
+        position = {path: i for i, path in enumerate(journal.order)}
+        deferred_paths = {entry["path"] for entry in deferred}
+        eligible = sorted(
+            (r for r in eligible if str(r.path) in position or str(r.path) not in deferred_paths),
+            key=lambda r: position.get(str(r.path), len(position)),
+        )
+    else:
+        # Order by the configured strategy; the seed is recorded either way
+        if strategy != "random":
+            with closing(connect(AEC_HISTORY_DB, legacy_profiles_dir=AEC_PROFILES_DIR)) as conn:
+                history_stats = project_history_stats(conn, project_names.values())
+        eligible = order_items(eligible, strategy, seed, history_stats, name_of)
 
-    # Get tracked repos that exist on disk
-    repos = [r for r in list_repos() if r.exists]
-
-    # Filter to projects that have .aec.json with non-empty test.scheduled
-    eligible = []
-    for repo in repos:
-        aec_data = load_aec_json(repo.path)
-        if aec_data is None:
-            continue
-        scheduled = aec_data.get("test", {}).get("scheduled", [])
-        if scheduled:
-            eligible.append(repo)
-
-    # Randomize order with recorded seed
-    seed = random.randint(0, 2**31 - 1)
-    random.seed(seed)
-    random.shuffle(eligible)
-
-    execution_order = [r.path.name for r in eligible]
     project_results = {}
-    total_passed = 0
-    total_failed = 0
-    total_skipped = 0
-
-    for repo in eligible:
-        result = run_single_project(repo.path, run_all=False)
-        project_results[str(repo.path)] = result
-
-        status = result.get("status", "skipped")
-        if status == "passed":
-            total_passed += 1
-        elif status == "failed":
-            total_failed += 1
+    lane_timings = []
+    plan_lanes = get_parallel_lanes(sched_config)
+    sample_interval = get_sample_interval(sched_config)
+    cache_ttl = get_cache_ttl_seconds(sched_config)
+    cache = ResultCache(AEC_HISTORY_DB, cache_ttl) if use_cache and cache_ttl else None
+
+    lanes = None
+    if journal is not None:
+        if journal.lanes is not None:
+            by_path = {str(r.path): r for r in eligible}
+            lanes = [[by_path[p] for p in lane if p in by_path] for lane in journal.lanes]
+            planned = {p for lane in journal.lanes for p in lane}
+            lanes.append([r for r in eligible if str(r.path) not in planned])
+            lanes = [lane for lane in lanes if lane]
+    elif plan_lanes:
+        from aec.lib.lanes import assign_lanes
+
+        lanes = assign_lanes(
+            eligible,
+            plan_lanes,
+            lambda r: (r.path.name, name_of(r)),
+        )
+        lanes = order_lanes(lanes, strategy, seed, history_stats, name_of)
+
+    # Fit the suites into schedule.max_duration_minutes; each lane gets the
+    # whole budget when all lanes can run at once
+    budget_seconds = get_max_duration_seconds(sched_config)
+    if journal is None and budget_seconds is not None:
+        if lanes:
+            workers = get_max_parallel_lanes(sched_config)
+            capacity = budget_seconds * min(1.0, workers / len(lanes))
+            lanes, deferred = plan_within_budget(
+                lanes, name_of, capacity, get_carried_over(sched_config),
+            )
+            lanes = [lane for lane in lanes if lane]
+            kept = {str(r.path) for lane in lanes for r in lane}
+            eligible = [r for r in eligible if str(r.path) in kept]
         else:
-            total_skipped += 1
-
-    # Write reports and profiles
-    summary_path = write_reports(
-        project_results, timestamp, seed, execution_order,
+            (eligible,), deferred = plan_within_budget(
+                [eligible], name_of, budget_seconds, get_carried_over(sched_config),
+            )
+    deferred_suites: Dict[str, Set[str]] = {}
+    for entry in deferred:
+        deferred_suites.setdefault(entry["path"], set()).add(entry["suite"])
+
+    oracle = PrerequisiteOracle(ttl_seconds=get_prerequisite_ttl(sched_config))
+    oracle.prefetch(collect_scheduled_prerequisites([r.path for r in eligible]))
+
+    if journal is None:
+        journal = RunJournal.create(
+            report_dir / JOURNAL_NAME, timestamp, seed, strategy,
+            order=[str(r.path) for r in eligible],
+            lanes=[[str(r.path) for r in lane] for lane in lanes] if lanes else None,
+            deferred=deferred,
+        )
+        resumed = False
+    else:
+        resumed = True
+
+    run_started = time.monotonic()
+    ordered = [r for lane in lanes for r in lane] if lanes else eligible
+    events = EventStream(AEC_TESTS_DIR / EVENTS_NAME)
+    events.emit(
+        "run_started", timestamp=timestamp, seed=seed, order_strategy=strategy,
+        report_dir=str(report_dir), projects=[name_of(r) for r in ordered],
+        lanes=len(lanes) if lanes else 1, resumed=resumed,
     )
 
+    # A run that raises still tells watchers it is over
+    finished: dict = {"status": "error"}
+    try:
+        governor = None
+
+        def run_project(repo, isolation: Optional[LaneContext] = None) -> dict:
+            """Run one project, reusing and extending the run journal."""
+            key = str(repo.path)
+            finished = journal.project_result(key)
+            if finished is not None:
+                events.emit(
+                    "project_finished", project=finished.get("project", name_of(repo)),
+                    status=finished.get("status"), resumed=True,
+                )
+                return finished
+
+            def checkpoint(suite_name, suite_result, profile, suite_observations):
+                journal.record_suite(
+                    key, name_of(repo), suite_name, suite_result, profile, suite_observations,
+                )
+                write_partial_summary(report_dir, journal)
+
+            result = run_single_project(
+                repo.path, run_all=False, report_dir=report_dir,
+                sample_interval=sample_interval, cache=cache, oracle=oracle,
+                isolation=isolation,
+                completed_suites=journal.completed_suites(key),
+                on_suite=checkpoint,
+                events=events,
+                governor=governor,
+                deferred_suites=deferred_suites.get(key),
+                lanes=len(lanes) if lanes else 1,
+            )
+            journal.finish_project(key, result)
+            events.emit(
+                "project_finished", project=result.get("project", name_of(repo)),
+                status=result.get("status"), reason=result.get("reason"),
+            )
+            return result
+
+        def rerun_checkpoint(project_path, suite_name, suite_result, profile):
+            # Journal the attempts with the suite, keeping its first-run observations
+            done = journal.completed_suites(project_path).get(suite_name, {})
+            project_name = project_results[project_path].get("project", Path(project_path).name)
+            journal.record_suite(
+                project_path, project_name, suite_name, suite_result, profile,
+                done.get("observations"),
+            )
+            write_partial_summary(report_dir, journal)
+
+        # Lane contexts outlive the lanes: flaky-suite reruns use them too
+        contexts: List[LaneContext] = []
+        context_of: Dict[str, LaneContext] = {}
+        try:
+            if lanes:
+                from aec.lib.config import AEC_PORTS_REGISTRY
+                from aec.lib.lane_isolation import create_lane_context
+                from aec.lib.lanes import run_lanes
+                from aec.lib.ports import load_registry
+
+                execution_order = [r.path.name for lane in lanes for r in lane]
+
+                # Each lane gets its own ports, Compose project and TMPDIR
+                port_registry = load_registry(AEC_PORTS_REGISTRY)
+                contexts = [
+                    create_lane_context(number, timestamp, port_registry)
+                    for number in range(1, len(lanes) + 1)
+                ]
+                context_of = {
+                    str(r.path): context for context, lane in zip(contexts, lanes) for r in lane
+                }
+
+                # Admit suites only while load and memory leave room for them
+                governor_settings = get_governor_settings(sched_config)
+                if governor_settings is not None:
+                    from aec.lib.governor import suite_memory_history
+
+                    with closing(connect(AEC_HISTORY_DB, legacy_profiles_dir=AEC_PROFILES_DIR)) as conn:
+                        predicted = suite_memory_history(conn, project_names.values())
+                    governor = ConcurrencyGovernor(
+                        get_max_parallel_lanes(sched_config), predicted, **governor_settings,
+                    )
+                lane_runs = run_lanes(
+                    lanes,
+                    lambda r: run_project(r, isolation=context_of[str(r.path)]),
+                    max_workers=get_max_parallel_lanes(sched_config),
+                )
+                for lane_run in lane_runs:
+                    lane_timings.append({
+                        "lane": lane_run["lane"],
+                        "projects": [r.path.name for r, _ in lane_run["results"]],
+                        "duration_seconds": lane_run["duration_seconds"],
+                        "port_offset": contexts[lane_run["lane"] - 1].port_offset,
+                    })
+                    for repo, result in lane_run["results"]:
+                        result["lane"] = lane_run["lane"]
+                        project_results[str(repo.path)] = result
+            else:
+                execution_order = [r.path.name for r in eligible]
+                for repo in eligible:
+                    project_results[str(repo.path)] = run_project(repo)
+
+            # Rerun likely-flaky failures at the tail, after every first attempt
+            reruns = 0
+            rerun_policy = get_rerun_policy(sched_config)
+            if rerun_policy is not None:
+                from aec.lib.flakiness import suite_flakiness
+
+                with closing(connect(AEC_HISTORY_DB, legacy_profiles_dir=AEC_PROFILES_DIR)) as conn:
+                    prior_flakiness = suite_flakiness(conn, project_names.values())
+                reruns = rerun_failed_suites(
+                    project_results, rerun_policy, prior_flakiness, report_dir, events=events,
+                    contexts=context_of, sample_interval=sample_interval, governor=governor,
+                    on_suite=rerun_checkpoint,
+                )
+        finally:
+            from aec.lib.lane_isolation import release_lane_context
+
+            for context in contexts:
+                release_lane_context(context)
+
+        total_passed = 0
+        total_failed = 0
+        total_skipped = 0
+        for result in project_results.values():
+            status = result.get("status", "skipped")
+            if status == "passed":
+                total_passed += 1
+            elif status == "failed":
+                total_failed += 1
+            else:
+                total_skipped += 1
+
+        # Write reports and profiles
+        summary_path = write_reports(
+            project_results, timestamp, seed, execution_order,
+            lane_timings=lane_timings,
+            prerequisite_timings=oracle.timings(),
+            order_strategy=strategy,
+            governor=governor.report() if governor is not None else None,
+            deferred=deferred,
+        )
+        journal.mark_complete()
+        finished = {
+            "status": "complete", "passed": total_passed, "failed": total_failed,
+            "skipped": total_skipped, "reruns": reruns, "summary_path": str(summary_path),
+        }
+    finally:
+        events.emit(
+            "run_finished", **finished,
+            duration_seconds=round(time.monotonic() - run_started, 3),
+        )
+        events.close()
+
     # Update scheduler config
     sched_config = update_last_run(
         sched_config,
@@ -500,6 +1424,7 @@ def run_all_projects(global_mode: bool = True) -> dict:
         suites_failed=total_failed,
         suites_skipped=total_skipped,
         seed=seed,
+        deferred=[{"project": e["project"], "suite": e["suite"]} for e in deferred],
     )
     save_scheduler_config(sched_config, AEC_SCHEDULER_CONFIG)
 
@@ -519,7 +1444,14 @@ def run_all_projects(global_mode: bool = True) -> dict:
     return {
         "timestamp": timestamp,
         "seed": seed,
+        "order_strategy": strategy,
         "execution_order": execution_order,
+        "lanes": lane_timings,
+        "prerequisites": oracle.timings(),
+        "reruns": reruns,
+        "resumed": resumed,
+        "governor": governor.report() if governor is not None else None,
+        "deferred": deferred,
         "total_projects": len(eligible),
         "passed": total_passed,
         "failed": total_failed,
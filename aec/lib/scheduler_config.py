@@ -18,18 +18,33 @@ def create_default_config() -> dict:
             "enabled": True,
             "time": "02:00",
             "timezone": "local",
+            "max_duration_minutes": None,
         },
         "execution": {
             "mode": "sequential",
             "randomize_order": True,
+            "order_strategy": "random",
             "parallel_enabled": False,
             "parallelization_plan": None,
             "min_profile_runs_for_parallel": 3,
+            "max_parallel_lanes": 4,
+            "adaptive_concurrency": True,
+            "max_load_per_cpu": 1.0,
+            "memory_reserve_mb": 1024,
+            "resource_sample_interval_seconds": 1.0,
+            "skip_unchanged": False,
+            "cache_ttl_hours": 168,
+            "prerequisite_ttl_seconds": 0,
+            "rerun_failed": False,
+            "max_reruns": 2,
+            "rerun_flakiness_threshold": 0.1,
         },
         "retention": {
             "report_mode": "auto",
             "report_days": 30,
             "profile_days": 90,
+            "compress_after_days": 7,
+            "compression": "xz",
         },
         "last_run": None,
     }
@@ -76,9 +91,13 @@ def update_last_run(
     suites_failed: int,
     suites_skipped: int,
     seed: int,
+    deferred: "list | None" = None,
 ) -> dict:
     """Update the last_run section with current timestamp and stats.
 
+    ``deferred`` lists the ``{"project", "suite"}`` pairs a wall-clock budget
+    left out; the next run gives them priority.
+
     Returns the updated config.
     """
     config["last_run"] = {
@@ -88,6 +107,7 @@ def update_last_run(
         "suites_failed": suites_failed,
         "suites_skipped": suites_skipped,
         "seed": seed,
+        "deferred": deferred or [],
     }
     return config
 
@@ -124,6 +144,145 @@ def get_retention_config(config: dict) -> dict:
     return config["retention"]
 
 
+def get_compression_settings(config: dict) -> "tuple[float, str] | None":
+    """Return ``(compress_after_days, codec)``, or None when reports are never compressed."""
+    from aec.lib.report_index import CODECS, DEFAULT_CODEC
+
+    retention = config.get("retention") or {}
+    value = retention.get("compress_after_days", 7)
+    if value is None:
+        return None
+    try:
+        days = float(value)
+    except (TypeError, ValueError):
+        return None
+    if days <= 0:
+        return None
+    codec = retention.get("compression", DEFAULT_CODEC)
+    return days, codec if codec in CODECS else DEFAULT_CODEC
+
+
 def get_execution_config(config: dict) -> dict:
     """Return the execution section dict."""
     return config["execution"]
+
+
+def get_parallel_lanes(config: dict) -> "list[list[str]] | None":
+    """Return the planned lanes when parallel execution is enabled.
+
+    Returns None when ``parallel_enabled`` is off or no plan with at least
+    one non-empty lane has been computed, meaning the run stays sequential.
+    """
+    execution = config.get("execution") or {}
+    if execution.get("parallel_enabled") is not True:
+        return None
+    plan = execution.get("parallelization_plan") or {}
+    lanes = [list(lane) for lane in plan.get("lanes") or [] if lane]
+    return lanes or None
+
+
+def get_max_parallel_lanes(config: dict) -> int:
+    """Return the concurrency bound for parallel lanes (at least 1)."""
+    execution = config.get("execution") or {}
+    try:
+        return max(1, int(execution.get("max_parallel_lanes", 4)))
+    except (TypeError, ValueError):
+        return 4
+
+
+def get_governor_settings(config: dict) -> "dict | None":
+    """Return ``{"max_load_per_cpu", "memory_reserve_mb"}``, or None when adaptive concurrency is off."""
+    execution = config.get("execution") or {}
+    if execution.get("adaptive_concurrency", True) is not True:
+        return None
+    try:
+        max_load = float(execution.get("max_load_per_cpu", 1.0))
+    except (TypeError, ValueError):
+        max_load = 1.0
+    try:
+        reserve = float(execution.get("memory_reserve_mb", 1024))
+    except (TypeError, ValueError):
+        reserve = 1024.0
+    return {
+        "max_load_per_cpu": max_load if max_load > 0 else 1.0,
+        "memory_reserve_mb": max(0.0, reserve),
+    }
+
+
+def get_max_duration_seconds(config: dict) -> "float | None":
+    """Return the wall-clock budget of a scheduled run, or None when unlimited."""
+    value = (config.get("schedule") or {}).get("max_duration_minutes")
+    if value is None:
+        return None
+    try:
+        minutes = float(value)
+    except (TypeError, ValueError):
+        return None
+    return minutes * 60 if minutes > 0 else None
+
+
+def get_carried_over(config: dict) -> set:
+    """Return the ``(project, suite)`` pairs the previous run deferred."""
+    deferred = (config.get("last_run") or {}).get("deferred") or []
+    return {
+        (entry["project"], entry["suite"])
+        for entry in deferred
+        if isinstance(entry, dict) and "project" in entry and "suite" in entry
+    }
+
+
+def get_sample_interval(config: dict) -> float:
+    """Return seconds between resource samples of a running suite (0 = off)."""
+    execution = config.get("execution") or {}
+    try:
+        return max(0.0, float(execution.get("resource_sample_interval_seconds", 1.0)))
+    except (TypeError, ValueError):
+        return 1.0
+
+
+def get_cache_ttl_seconds(config: dict) -> "float | None":
+    """Return how long a cached pass stays valid, or None when skip-unchanged is off."""
+    execution = config.get("execution") or {}
+    if execution.get("skip_unchanged", False) is not True:
+        return None
+    try:
+        hours = float(execution.get("cache_ttl_hours", 168))
+    except (TypeError, ValueError):
+        hours = 168.0
+    return hours * 3600 if hours > 0 else None
+
+
+def get_prerequisite_ttl(config: dict) -> "float | None":
+    """Return seconds before a prerequisite is re-probed, or None to probe once per run."""
+    execution = config.get("execution") or {}
+    try:
+        ttl = float(execution.get("prerequisite_ttl_seconds", 0))
+    except (TypeError, ValueError):
+        return None
+    return ttl if ttl > 0 else None
+
+
+def get_order_strategy(config: dict) -> str:
+    """Return the project ordering strategy; unknown values fall back to "random"."""
+    from aec.lib.ordering import DEFAULT_STRATEGY, STRATEGIES
+
+    strategy = (config.get("execution") or {}).get("order_strategy", DEFAULT_STRATEGY)
+    return strategy if strategy in STRATEGIES else DEFAULT_STRATEGY
+
+
+def get_rerun_policy(config: dict) -> "dict | None":
+    """Return ``{"max_reruns", "flakiness_threshold"}``, or None when reruns are off."""
+    execution = config.get("execution") or {}
+    if execution.get("rerun_failed") is not True:
+        return None
+    try:
+        max_reruns = int(execution.get("max_reruns", 2))
+    except (TypeError, ValueError):
+        max_reruns = 2
+    try:
+        threshold = float(execution.get("rerun_flakiness_threshold", 0.1))
+    except (TypeError, ValueError):
+        threshold = 0.1
+    if max_reruns < 1:
+        return None
+    return {"max_reruns": max_reruns, "flakiness_threshold": max(0.0, threshold)}
@@ -1,10 +1,10 @@
 """Three-level similarity scan engine: Quick (name), Normal (hash), Deep (content)."""
 
-import hashlib
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+from .file_hashing import file_digest, parallel_map
 from .skills_manifest import hash_skill_directory
 
 # Common division prefixes stripped during name normalization.
@@ -88,19 +88,12 @@ def scan_local_items(
     return items
 
 
-def _hash_file(path: Path) -> str:
-    """Compute sha256 hash of a single file."""
-    hasher = hashlib.sha256()
-    hasher.update(path.read_bytes())
-    return f"sha256:{hasher.hexdigest()}"
-
-
 def _hash_local_item(item: dict) -> str:
     """Hash a local item — file or directory."""
     path = Path(item["path"])
     if item["is_dir"]:
         return hash_skill_directory(path)
-    return _hash_file(path)
+    return file_digest(path)
 
 
 def _jaccard_similarity(text_a: str, text_b: str) -> float:
@@ -237,11 +230,16 @@ def scan(
         return sorted(results, key=lambda r: r.local_name)
 
     # --- Level 2: Normal (hash comparison) ---
-    items_by_path = {i["path"]: i for i in local_items}
+    # Every local item is hashed from here on; do it once, in parallel
+    local_hashes = dict(
+        zip(
+            (item["path"] for item in local_items),
+            parallel_map(_hash_local_item, local_items),
+        )
+    )
 
     for result in results:
-        item = items_by_path[result.local_path]
-        result.local_hash = _hash_local_item(item)
+        result.local_hash = local_hashes[result.local_path]
         result.scan_depth = 2
 
         catalog_hash = catalog_hashes.get(result.catalog_item, "")
@@ -262,7 +260,7 @@ def scan(
     for idx, item in enumerate(local_items):
         if idx in name_matched_locals:
             continue
-        local_hash = _hash_local_item(item)
+        local_hash = local_hashes[item["path"]]
         if local_hash in hash_to_catalog:
             cname = hash_to_catalog[local_hash]
             centry = catalog.get(cname, {})
@@ -304,7 +302,7 @@ def scan(
             continue
         local_size = len(local_text)
 
-        local_hash = _hash_local_item(item)
+        local_hash = local_hashes[item["path"]]
         best_sim = 0.0
         best_cname: Optional[str] = None
 
@@ -5,7 +5,10 @@ import json
 import re
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, NamedTuple, Optional, Dict, Any
+from typing import Callable, List, NamedTuple, Optional, Dict, Any
+
+from .catalog_index import Reader, read_direct
+from .file_hashing import update_from_file
 
 
 class SkillDep(NamedTuple):
@@ -221,18 +224,60 @@ def version_is_newer(available: str, installed: str) -> bool:
     return parse_version(available) > parse_version(installed)
 
 
+class SkillTree(NamedTuple):
+    """Hashes of a skill directory: the root ``contentHash`` and one digest per file.
+
+    ``content_hash`` equals ``hash_skill_directory``; ``files`` maps each
+    file's POSIX relative path to its ``sha256:<hex>`` (as ``hash_single_file``).
+    """
+
+    content_hash: str
+    files: Dict[str, str]
+
+
+def skill_tree_files(path: Path) -> List[Path]:
+    """Non-hidden files of a skill directory, in the order they are hashed."""
+    return [
+        filepath
+        for filepath in sorted(path.rglob("*"))
+        if filepath.is_file()
+        and not any(part.startswith(".") for part in filepath.relative_to(path).parts)
+    ]
+
+
 def hash_skill_directory(path: Path) -> str:
     """Compute SHA-256 hash of all non-hidden files in a skill directory."""
     hasher = hashlib.sha256()
-    for filepath in sorted(path.rglob("*")):
-        if filepath.is_file() and not any(
-            part.startswith(".") for part in filepath.relative_to(path).parts
-        ):
-            hasher.update(str(filepath.relative_to(path)).encode())
-            hasher.update(filepath.read_bytes())
+    for filepath in skill_tree_files(path):
+        hasher.update(str(filepath.relative_to(path)).encode())
+        with open(filepath, "rb") as fh:
+            update_from_file(hasher, fh)
     return f"sha256:{hasher.hexdigest()}"
 
 
+def hash_skill_tree(path: Path) -> SkillTree:
+    """Hash a skill directory and each of its files, reading every file once."""
+    root = hashlib.sha256()
+    files = {}
+    for filepath in skill_tree_files(path):
+        rel = filepath.relative_to(path)
+        root.update(str(rel).encode())
+        leaf = hashlib.sha256()
+        with open(filepath, "rb") as fh:
+            update_from_file(root, fh, leaf)
+        files[rel.as_posix()] = f"sha256:{leaf.hexdigest()}"
+    return SkillTree(f"sha256:{root.hexdigest()}", files)
+
+
+def diff_skill_trees(old: Dict[str, str], new: Dict[str, str]) -> Dict[str, List[str]]:
+    """Compare two ``SkillTree.files`` maps: ``{"added", "removed", "modified"}`` paths."""
+    return {
+        "added": sorted(new.keys() - old.keys()),
+        "removed": sorted(old.keys() - new.keys()),
+        "modified": sorted(rel for rel in old.keys() & new.keys() if old[rel] != new[rel]),
+    }
+
+
 def build_skill_manifest_item(
     *,
     version: str,
@@ -285,8 +330,9 @@ def plan_skill_directory_replace(
     if not dst.is_dir() or not src.is_dir():
         return "overwrite" if assume_yes else "prompt"
 
-    current = hash_skill_directory(dst)
-    source = hash_skill_directory(src)
+    from .hash_cache import skill_trees
+
+    current, source = (tree.content_hash for tree in skill_trees([dst, src]))
     if current == source:
         return "sync_manifest"
     if assume_yes:
@@ -336,14 +382,17 @@ def save_installed_manifest(manifest: dict, path: Path) -> None:
     path.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
 
 
-def _scan_skill_paths(source_dir: Path) -> dict:
+def _scan_skill_paths(
+    source_dir: Path,
+    parse: Callable[[Path], Optional[dict]] = parse_skill_frontmatter,
+) -> dict:
     """Scan source directory to build a name -> relative path mapping."""
     paths = {}
     for item in sorted(source_dir.iterdir()):
         if not item.is_dir() or item.name.startswith("."):
             continue
         if (item / "SKILL.md").exists():
-            fm = parse_skill_frontmatter(item)
+            fm = parse(item)
             if fm:
                 paths[fm["name"]] = item.name
             continue
@@ -352,29 +401,47 @@ def _scan_skill_paths(source_dir: Path) -> dict:
             if not sub.is_dir() or sub.name.startswith("."):
                 continue
             if (sub / "SKILL.md").exists():
-                sub_fm = parse_skill_frontmatter(sub)
+                sub_fm = parse(sub)
                 if sub_fm:
                     paths[sub_fm["name"]] = f"{item.name}/{sub.name}"
     return paths
 
 
-def discover_available_skills(source_dir: Path) -> dict:
+def _read_skill_md(skill_md: Path) -> Optional[dict]:
+    return parse_skill_frontmatter(skill_md.parent)
+
+
+def _read_manifest_json(manifest_file: Path):
+    return json.loads(manifest_file.read_text(encoding="utf-8"))
+
+
+def discover_available_skills(source_dir: Path, read: Reader = read_direct) -> dict:
     """Discover available skills from the skills source directory.
 
     Prefers skills-manifest.json if present. Falls back to scanning directories.
     Returns dict of skill_name -> {version, description, author, path}.
+
+    ``read`` parses each file (``catalog_index`` passes one that reuses
+    the values of unchanged files).
     """
+
+    def parse(skill_dir: Path) -> Optional[dict]:
+        skill_md = skill_dir / "SKILL.md"
+        if not skill_md.exists():
+            return None
+        return read(skill_md, _read_skill_md)
+
     # Load manifest entries if available (used as base, not as gate)
     manifest_file = source_dir / "skills-manifest.json"
     manifest_skills = {}
     if manifest_file.exists():
         try:
-            data = json.loads(manifest_file.read_text(encoding="utf-8"))
+            data = read(manifest_file, _read_manifest_json)
             if isinstance(data, dict) and "skills" in data:
                 manifest_skills = data["skills"]
                 needs_path = [k for k, v in manifest_skills.items() if "path" not in v]
                 if needs_path:
-                    scanned = _scan_skill_paths(source_dir)
+                    scanned = _scan_skill_paths(source_dir, parse)
                     for name in needs_path:
                         manifest_skills[name]["path"] = scanned.get(name, name)
         except (json.JSONDecodeError, OSError):
@@ -387,7 +454,7 @@ def discover_available_skills(source_dir: Path) -> dict:
             continue
 
         # Check if this directory itself is a skill
-        fm = parse_skill_frontmatter(item)
+        fm = parse(item)
         if fm:
             if fm["name"] not in skills:
                 skills[fm["name"]] = {
@@ -402,7 +469,7 @@ def discover_available_skills(source_dir: Path) -> dict:
         for sub in sorted(item.iterdir()):
             if not sub.is_dir() or sub.name.startswith("."):
                 continue
-            sub_fm = parse_skill_frontmatter(sub)
+            sub_fm = parse(sub)
             if sub_fm and sub_fm["name"] not in skills:
                 skills[sub_fm["name"]] = {
                     "version": sub_fm.get("version", "0.0.0"),
@@ -411,11 +478,15 @@ def discover_available_skills(source_dir: Path) -> dict:
                     "path": f"{item.name}/{sub.name}",
                 }
 
-    _overlay_skill_metadata_from_skill_md(source_dir, skills)
+    _overlay_skill_metadata_from_skill_md(source_dir, skills, parse)
     return skills
 
 
-def _overlay_skill_metadata_from_skill_md(source_dir: Path, skills: dict) -> None:
+def _overlay_skill_metadata_from_skill_md(
+    source_dir: Path,
+    skills: dict,
+    parse: Callable[[Path], Optional[dict]] = parse_skill_frontmatter,
+) -> None:
     """Prefer SKILL.md frontmatter for version/description/author when the tree exists.
 
     skills-manifest.json can lag behind SKILL.md bumps; stale manifest versions would
@@ -426,7 +497,7 @@ def _overlay_skill_metadata_from_skill_md(source_dir: Path, skills: dict) -> Non
         skill_dir = source_dir / rel
         if not skill_dir.is_dir():
             continue
-        fm = parse_skill_frontmatter(skill_dir)
+        fm = parse(skill_dir)
         if not fm:
             continue
         if "version" in fm:
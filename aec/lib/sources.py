@@ -5,6 +5,7 @@ import subprocess
 from pathlib import Path
 from typing import Optional
 
+from .catalog_index import Reader, discover_indexed, read_direct
 from .config import get_repo_root
 from .manifest_v2 import is_stale
 from .skills_manifest import discover_available_skills, parse_yaml_frontmatter
@@ -13,6 +14,9 @@ from .skills_manifest import discover_available_skills, parse_yaml_frontmatter
 def discover_available(source_dir: Path, item_type: str) -> dict:
     """Discover available items of a given type from the source directory.
 
+    Answered from the persistent catalog index (see ``catalog_index``),
+    which re-parses only files that changed since the last call.
+
     Args:
         source_dir: Root of the source (e.g., repo/.claude/skills/)
         item_type: One of 'skills', 'rules', 'agents', 'mcps'
@@ -22,20 +26,41 @@ def discover_available(source_dir: Path, item_type: str) -> dict:
     """
     if not source_dir.exists():
         return {}
+    if item_type not in ("skills", "rules", "agents", "mcps", "plugins"):
+        return {}
+    return discover_indexed(
+        source_dir, item_type, lambda src, read: _discover(src, item_type, read)
+    )
+
+
+def _discover(source_dir: Path, item_type: str, read: Reader = read_direct) -> dict:
+    """Scan ``source_dir`` for ``item_type`` items, parsing files through ``read``."""
     if item_type == "skills":
-        return discover_available_skills(source_dir)
+        return discover_available_skills(source_dir, read=read)
     elif item_type == "rules":
-        return _discover_available_rules(source_dir)
+        return _discover_available_rules(source_dir, read=read)
     elif item_type == "agents":
-        return _discover_available_agents(source_dir)
+        return _discover_available_agents(source_dir, read=read)
     elif item_type == "mcps":
-        return _discover_available_mcps(source_dir)
+        return _discover_available_mcps(source_dir, read=read)
     elif item_type == "plugins":
-        return _discover_available_plugins(source_dir)
+        return _discover_available_plugins(source_dir, read=read)
     return {}
 
 
-def _discover_available_rules(source_dir: Path) -> dict:
+def _read_frontmatter(path: Path) -> Optional[dict]:
+    return parse_yaml_frontmatter(path.read_text(encoding="utf-8"))
+
+
+def _read_json(path: Path):
+    """Parse a JSON file; None when it is unreadable or malformed."""
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        return None
+
+
+def _discover_available_rules(source_dir: Path, read: Reader = read_direct) -> dict:
     """Discover available rules from the agent-rules source.
 
     Only includes files with valid frontmatter containing name and version.
@@ -46,8 +71,7 @@ def _discover_available_rules(source_dir: Path) -> dict:
     for md_file in sorted(source_dir.rglob("*.md")):
         if md_file.name.startswith("."):
             continue
-        text = md_file.read_text(encoding="utf-8")
-        fm = parse_yaml_frontmatter(text)
+        fm = read(md_file, _read_frontmatter)
         if not fm or "name" not in fm or "version" not in fm:
             continue
         rel = md_file.relative_to(source_dir)
@@ -60,7 +84,7 @@ def _discover_available_rules(source_dir: Path) -> dict:
     return rules
 
 
-def _discover_available_agents(source_dir: Path) -> dict:
+def _discover_available_agents(source_dir: Path, read: Reader = read_direct) -> dict:
     """Discover available agents from the agents source.
 
     Only includes files with valid frontmatter containing name and version.
@@ -72,8 +96,7 @@ def _discover_available_agents(source_dir: Path) -> dict:
     for md_file in sorted(source_dir.rglob("*.md")):
         if md_file.name.startswith("."):
             continue
-        text = md_file.read_text(encoding="utf-8")
-        fm = parse_yaml_frontmatter(text)
+        fm = read(md_file, _read_frontmatter)
         if not fm or "name" not in fm or "version" not in fm:
             continue
         name = md_file.stem
@@ -88,7 +111,7 @@ def _discover_available_agents(source_dir: Path) -> dict:
     return agents
 
 
-def _discover_available_mcps(source_dir: Path) -> dict:
+def _discover_available_mcps(source_dir: Path, read: Reader = read_direct) -> dict:
     """Discover available MCP servers from the mcp-servers source directory.
 
     Each MCP server is a subdirectory containing an mcp.json file with at
@@ -103,9 +126,8 @@ def _discover_available_mcps(source_dir: Path) -> dict:
         mcp_file = mcp_dir / "mcp.json"
         if not mcp_file.exists():
             continue
-        try:
-            data = json.loads(mcp_file.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
+        data = read(mcp_file, _read_json)
+        if data is None:
             continue
         if "name" not in data or "version" not in data:
             continue
@@ -118,14 +140,14 @@ def _discover_available_mcps(source_dir: Path) -> dict:
     return mcps
 
 
-def _discover_available_plugins(source_dir: Path) -> dict:
+def _discover_available_plugins(source_dir: Path, read: Reader = read_direct) -> dict:
     """Discover available plugins from the vendored plugin registry.
 
     Each plugin is a subdirectory containing a loadout manifest. A malformed
     manifest is skipped (mirrors ``_discover_available_mcps``, which catches the
     parse error and continues rather than aborting the whole scan).
     """
-    from .loadout import LoadoutError, find_loadout_file, load_loadout
+    from .loadout import find_loadout_file
 
     plugins = {}
     if not source_dir.exists():
@@ -133,11 +155,11 @@ def _discover_available_plugins(source_dir: Path) -> dict:
     for plugin_dir in sorted(source_dir.iterdir()):
         if not plugin_dir.is_dir() or plugin_dir.name.startswith("."):
             continue
-        if find_loadout_file(plugin_dir) is None:
+        loadout_file = find_loadout_file(plugin_dir)
+        if loadout_file is None:
             continue
-        try:
-            data = load_loadout(plugin_dir)
-        except LoadoutError:
+        data = read(loadout_file, lambda _path, d=plugin_dir: _read_loadout(d))
+        if data is None:
             continue
         plugins[data["name"]] = {
             "version": data["version"],
@@ -148,6 +170,21 @@ def _discover_available_plugins(source_dir: Path) -> dict:
     return plugins
 
 
+def _read_loadout(plugin_dir: Path) -> Optional[dict]:
+    """Return the catalog fields of a plugin's loadout; None when it is malformed."""
+    from .loadout import LoadoutError, load_loadout
+
+    try:
+        data = load_loadout(plugin_dir)
+    except LoadoutError:
+        return None
+    return {
+        key: data[key]
+        for key in ("name", "version", "description", "install_type")
+        if key in data
+    }
+
+
 def get_source_dirs() -> dict:
     """Get source directories for each item type from the AEC repo.
 
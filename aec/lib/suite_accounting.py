@@ -0,0 +1,205 @@
+"""Exact per-suite resource accounting at reap time.
+
+The sampler in ``resource_sampler`` gives a time series, but it can miss
+short spikes and short-lived children. This module collects the kernel's
+own totals for one suite:
+
+* ``rusage`` — from ``os.wait4`` on the suite's shell: user and system CPU
+  seconds, max RSS and block I/O for the shell and every descendant it
+  waited for. Processes that were orphaned (daemonized) are not counted.
+* ``cgroup`` — when cgroup v2 is mounted and the runner may create child
+  cgroups (delegated subtree, root in a container), the suite runs in its
+  own cgroup. ``memory.peak`` and ``cpu.stat`` then cover everything the
+  suite started, including orphans.
+
+Both degrade to None where unsupported (no ``os.wait4`` on Windows, cgroup
+v1 hosts, no delegation).
+"""
+
+import itertools
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+from aec.lib.profiler import PROC_ROOT
+
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+
+_cgroup_counter = itertools.count(1)
+
+
+def rusage_to_dict(ru) -> dict:
+    """Convert a ``resource.struct_rusage`` into the profile representation."""
+    # ru_maxrss is kilobytes on Linux and bytes on macOS.
+    maxrss_bytes = ru.ru_maxrss if sys.platform == "darwin" else ru.ru_maxrss * 1024
+    return {
+        "user_cpu_seconds": round(ru.ru_utime, 3),
+        "system_cpu_seconds": round(ru.ru_stime, 3),
+        "max_rss_mb": round(maxrss_bytes / (1024 * 1024), 1),
+        "block_input_ops": ru.ru_inblock,
+        "block_output_ops": ru.ru_oublock,
+    }
+
+
+def wait_with_rusage(
+    proc: subprocess.Popen, timeout: float
+) -> Tuple[int, Optional[dict]]:
+    """Wait for ``proc`` like ``Popen.wait`` and capture its rusage.
+
+    Reaps the child with ``os.wait4`` so the kernel's resource totals for it
+    and its waited-for descendants are not lost. Falls back to a plain
+    ``proc.wait`` where ``wait4`` is unavailable or the child was already
+    reaped.
+
+    Returns:
+        ``(returncode, rusage dict or None)``.
+
+    Raises:
+        subprocess.TimeoutExpired: The child is still running after
+            ``timeout`` seconds (it is left running, as with ``Popen.wait``).
+    """
+    deadline = time.monotonic() + timeout
+    if not hasattr(os, "wait4"):
+        return proc.wait(timeout=timeout), None
+
+    delay = 0.0005
+    while True:
+        try:
+            pid, status, ru = os.wait4(proc.pid, os.WNOHANG)
+        except ChildProcessError:
+            return proc.wait(timeout=max(0.0, deadline - time.monotonic())), None
+        if pid == proc.pid:
+            proc.returncode = os.waitstatus_to_exitcode(status)
+            return proc.returncode, rusage_to_dict(ru)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise subprocess.TimeoutExpired(proc.args, timeout)
+        time.sleep(min(delay, remaining, 0.05))
+        delay *= 2
+
+
+def own_cgroup(proc_root: Path = PROC_ROOT) -> Optional[str]:
+    """Return this process's cgroup v2 path (e.g. ``/user.slice/x.scope``)."""
+    try:
+        text = (proc_root / "self" / "cgroup").read_text()
+    except OSError:
+        return None
+    for line in text.splitlines():
+        if line.startswith("0::"):
+            return line[3:].strip() or "/"
+    return None
+
+
+def _parse_cpu_stat(text: str) -> dict:
+    values = {}
+    for line in text.splitlines():
+        parts = line.split()
+        if len(parts) == 2 and parts[1].isdigit():
+            values[parts[0]] = int(parts[1])
+    return values
+
+
+class SuiteCgroup:
+    """A throwaway cgroup v2 child holding one suite's processes.
+
+    Usage::
+
+        cgroup = SuiteCgroup.create()
+        proc = subprocess.Popen(...)
+        if cgroup is not None and not cgroup.attach(proc.pid):
+            cgroup = None
+        ...
+        stats = cgroup.read()
+        cgroup.remove()
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    @classmethod
+    def create(
+        cls, cgroup_root: Path = CGROUP_ROOT, proc_root: Path = PROC_ROOT
+    ) -> Optional["SuiteCgroup"]:
+        """Create a child of the runner's cgroup, or return None if not allowed."""
+        if not (cgroup_root / "cgroup.controllers").is_file():
+            return None
+        parent = own_cgroup(proc_root)
+        if parent is None:
+            return None
+        name = f"aec-suite-{os.getpid()}-{next(_cgroup_counter)}"
+        path = cgroup_root / parent.lstrip("/") / name
+        try:
+            path.mkdir()
+        except OSError:
+            return None
+        return cls(path)
+
+    def attach(self, pid: int) -> bool:
+        """Move ``pid`` into this cgroup; on failure the cgroup is removed.
+
+        Processes the suite forks before the move stay in the runner's
+        cgroup, so attach right after spawning.
+        """
+        try:
+            (self.path / "cgroup.procs").write_text(f"{pid}\n")
+        except OSError:
+            self.remove()
+            return False
+        return True
+
+    def set_memory_max(self, megabytes: int) -> bool:
+        """Cap the memory of every process in the cgroup (``memory.max``)."""
+        try:
+            (self.path / "memory.max").write_text(f"{megabytes * 1024 * 1024}\n")
+        except OSError:
+            return False
+        return True
+
+    def kill(self) -> bool:
+        """SIGKILL every process in the cgroup, including ones that left the session."""
+        try:
+            (self.path / "cgroup.kill").write_text("1\n")
+        except OSError:
+            return False
+        return True
+
+    def read(self) -> Optional[dict]:
+        """Return ``peak_memory_mb`` and CPU seconds from the cgroup's counters."""
+        stats: dict = {}
+        try:
+            peak = int((self.path / "memory.peak").read_text().strip())
+            stats["peak_memory_mb"] = round(peak / (1024 * 1024), 1)
+        except (OSError, ValueError):
+            pass
+        try:
+            cpu = _parse_cpu_stat((self.path / "cpu.stat").read_text())
+        except OSError:
+            cpu = {}
+        for key, label in (
+            ("usage_usec", "cpu_seconds"),
+            ("user_usec", "user_cpu_seconds"),
+            ("system_usec", "system_cpu_seconds"),
+        ):
+            if key in cpu:
+                stats[label] = round(cpu[key] / 1_000_000, 3)
+        return stats or None
+
+    def remove(self) -> bool:
+        """Delete the cgroup, first moving any leftover processes to the parent."""
+        try:
+            leftover = (self.path / "cgroup.procs").read_text().split()
+        except OSError:
+            leftover = []
+        for pid in leftover:
+            try:
+                (self.path.parent / "cgroup.procs").write_text(f"{pid}\n")
+            except OSError:
+                pass
+        try:
+            self.path.rmdir()
+        except OSError:
+            return False
+        return True
@@ -0,0 +1,177 @@
+"""Per-suite limits and process-group control for ``execute_suite``.
+
+Suites in ``.aec.json`` may set:
+
+* ``timeout_seconds`` — wall-clock limit (default 3600)
+* ``max_memory_mb`` — per-process data-segment limit (``RLIMIT_DATA``, set
+  with the shell's ``ulimit -d``). When the suite has its own cgroup, it is
+  also tried as the cgroup's ``memory.max``, which would cover the whole
+  process tree. That is best-effort: cgroup v2 only offers ``memory.max``
+  to a child when the parent delegates the memory controller, which a
+  cgroup that still holds the runner itself cannot do. The suite's
+  ``limits`` record whether the cap was applied (``cgroup_memory_max``).
+* ``nice`` — scheduling niceness, 0-19
+
+On POSIX each suite runs in its own session, and so its own process group.
+On timeout the whole group is sent SIGTERM and, after a grace period,
+SIGKILL, so grandchildren such as node servers and browsers die with the
+shell. Processes still in the session afterwards are reported as
+survivors. Limits are applied by the suite's own shell before it runs the
+command, which keeps spawning safe while lanes run on threads (no
+``preexec_fn``).
+"""
+
+import logging
+import os
+import signal
+import subprocess
+import time
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Union
+
+from aec.lib.config import IS_WINDOWS
+from aec.lib.profiler import PROC_ROOT, procfs_available
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT_SECONDS = 3600
+
+# Seconds between SIGTERM and SIGKILL for a timed-out suite's process group.
+KILL_GRACE_SECONDS = 5.0
+
+_MAX_COMMAND_CHARS = 200
+
+
+class SuiteLimits(NamedTuple):
+    """Resource limits for one suite run."""
+    timeout_seconds: float
+    max_memory_mb: Optional[int]
+    nice: Optional[int]
+
+
+def suite_limits(suite_config: dict) -> SuiteLimits:
+    """Read a suite's limits, ignoring (and logging) invalid values."""
+    timeout = suite_config.get("timeout_seconds", DEFAULT_TIMEOUT_SECONDS)
+    if not isinstance(timeout, (int, float)) or isinstance(timeout, bool) or timeout <= 0:
+        logger.warning("Ignoring invalid timeout_seconds %r", timeout)
+        timeout = DEFAULT_TIMEOUT_SECONDS
+
+    memory = suite_config.get("max_memory_mb")
+    if memory is not None and (
+        not isinstance(memory, int) or isinstance(memory, bool) or memory <= 0
+    ):
+        logger.warning("Ignoring invalid max_memory_mb %r", memory)
+        memory = None
+
+    nice = suite_config.get("nice")
+    if nice is not None and (
+        not isinstance(nice, int) or isinstance(nice, bool) or not 0 <= nice <= 19
+    ):
+        logger.warning("Ignoring invalid nice %r (expected 0-19)", nice)
+        nice = None
+
+    return SuiteLimits(float(timeout), memory, nice or None)
+
+
+def suite_args(command: str, limits: SuiteLimits) -> Union[str, List[str]]:
+    """Return the Popen args that run ``command`` under ``limits``.
+
+    Without memory or nice limits (or on Windows) this is the command itself,
+    run with ``shell=True``. Otherwise it is a small ``/bin/sh`` wrapper that
+    applies the limits and then runs the command, passed as ``$1`` so it is
+    never re-quoted.
+    """
+    if IS_WINDOWS or (limits.max_memory_mb is None and limits.nice is None):
+        return command
+    steps = []
+    if limits.max_memory_mb is not None:
+        kb = limits.max_memory_mb * 1024
+        steps.append(
+            f'ulimit -d {kb} 2>/dev/null || echo "aec: could not apply max_memory_mb" >&2'
+        )
+    if limits.nice is not None:
+        steps.append(f'exec nice -n {limits.nice} /bin/sh -c "$1"')
+    else:
+        steps.append('eval "$1"')
+    return ["/bin/sh", "-c", "; ".join(steps), "aec-suite", command]
+
+
+def popen_options() -> dict:
+    """Popen keyword arguments that put the suite in its own process group."""
+    if IS_WINDOWS:
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+
+def _leader_exited(proc: subprocess.Popen) -> bool:
+    """True once the suite's shell has exited.
+
+    Where ``os.waitid`` exists (Linux) the shell is left unreaped, so
+    ``wait_with_rusage`` can still collect its rusage. Elsewhere (macOS has
+    no ``waitid``) ``proc.poll()`` reaps it, and a timed-out suite reports no
+    rusage.
+    """
+    if not hasattr(os, "waitid"):
+        return proc.poll() is not None
+    try:
+        info = os.waitid(os.P_PID, proc.pid, os.WEXITED | os.WNOHANG | os.WNOWAIT)
+    except ChildProcessError:
+        return True
+    return info is not None
+
+
+def kill_process_group(proc: subprocess.Popen, grace_seconds: float = KILL_GRACE_SECONDS) -> None:
+    """Terminate a suite and everything in its process group.
+
+    Sends SIGTERM to the group, waits up to ``grace_seconds`` for the suite's
+    shell to exit, then SIGKILLs the group. The shell itself is left for the
+    caller to reap.
+    """
+    if IS_WINDOWS:
+        subprocess.run(
+            ["taskkill", "/F", "/T", "/PID", str(proc.pid)], capture_output=True,
+        )
+        proc.kill()
+        return
+
+    try:
+        os.killpg(proc.pid, signal.SIGTERM)
+    except (ProcessLookupError, PermissionError):
+        pass
+    deadline = time.monotonic() + grace_seconds
+    while time.monotonic() < deadline and not _leader_exited(proc):
+        time.sleep(0.05)
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+    proc.kill()
+
+
+def session_members(session_id: int, proc_root: Path = PROC_ROOT) -> List[dict]:
+    """Return live (non-zombie) processes in a session, as ``{pid, command}``.
+
+    Linux only (reads /proc); returns an empty list elsewhere.
+    """
+    from aec.lib.profiler import _read_proc_entry, read_proc_stat
+
+    if not procfs_available(proc_root):
+        return []
+    members = []
+    for entry in os.scandir(proc_root):
+        if not entry.name.isdigit():
+            continue
+        pid_dir = Path(entry.path)
+        parsed = read_proc_stat(pid_dir)
+        if parsed is None:
+            continue
+        fields = parsed[1]
+        try:
+            if int(fields[3]) != session_id or fields[0] == "Z":
+                continue
+        except (ValueError, IndexError):
+            continue
+        details = _read_proc_entry(pid_dir)
+        command = details[1] if details else f"[{parsed[0]}]"
+        members.append({"pid": int(entry.name), "command": command[:_MAX_COMMAND_CHARS]})
+    return sorted(members, key=lambda m: m["pid"])
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Benchmark: catalog content hashing, whole-file serial vs streamed on a thread pool.
+
+Builds a synthetic catalog of ``--items`` items (skills with a binary
+asset, agents and rules) in a temporary directory and times
+``generate_catalog_hashes`` three ways:
+
+* legacy: ``read_bytes()`` per file, one item after another (the hashing
+  before ``aec.lib.file_hashing``)
+* serial: streamed through ``file_hashing``, one thread
+* parallel: streamed, items fanned out over ``file_hashing.parallel_map``
+
+All three must produce identical hashes. Threads only help as far as the
+machine has cores (and I/O to overlap), so run it where that matters.
+
+Usage:
+    python scripts/benchmark-hashing.py [--items 1000] [--asset-kb 256] [--rounds 3]
+"""
+
+import argparse
+import hashlib
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+# Allow imports from aec/ regardless of how the script is invoked
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from aec.lib import catalog_hashes, config, file_hashing
+from aec.lib.skills_manifest import skill_tree_files
+
+
+def _legacy_file(path: Path) -> str:
+    return f"sha256:{hashlib.sha256(path.read_bytes()).hexdigest()}"
+
+
+def _legacy_directory(path: Path) -> str:
+    hasher = hashlib.sha256()
+    for filepath in skill_tree_files(path):
+        hasher.update(str(filepath.relative_to(path)).encode())
+        hasher.update(filepath.read_bytes())
+    return f"sha256:{hasher.hexdigest()}"
+
+
+def _frontmatter(name: str) -> str:
+    return f"---\nname: {name}\nversion: 1.0.0\ndescription: Synthetic {name}\n---\n" + "Body.\n" * 200
+
+
+def _build_catalog(root: Path, items: int, asset_kb: int) -> dict:
+    source_dirs = {"skills": root / "skills", "agents": root / "agents", "rules": root / "rules"}
+    for path in source_dirs.values():
+        path.mkdir(parents=True)
+    skills = items * 2 // 5
+    agents = (items - skills) // 2
+    for i in range(skills):
+        skill = source_dirs["skills"] / f"skill-{i}"
+        (skill / "references").mkdir(parents=True)
+        (skill / "SKILL.md").write_text(_frontmatter(f"skill-{i}"))
+        (skill / "references" / "guide.md").write_text("Guide line.\n" * 400)
+        (skill / "asset.bin").write_bytes(os.urandom(asset_kb * 1024))
+    for i in range(agents):
+        (source_dirs["agents"] / f"agent-{i}.md").write_text(_frontmatter(f"agent-{i}"))
+    for i in range(items - skills - agents):
+        (source_dirs["rules"] / f"rule-{i}.md").write_text(_frontmatter(f"rule-{i}"))
+    return source_dirs
+
+
+def _time(fn, rounds: int) -> list:
+    fn()  # warm up the page cache, imports and the catalog index
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _hashes(catalog: dict) -> dict:
+    return {t: catalog[t] for t in ("agents", "skills", "rules")}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=1000, help="Catalog items")
+    parser.add_argument("--asset-kb", type=int, default=256, help="Binary asset size per skill")
+    parser.add_argument("--rounds", type=int, default=3, help="Timed rounds per approach")
+    parser.add_argument("--workers", type=int, default=None, help="Threads for the parallel run")
+    args = parser.parse_args()
+    workers = args.workers or file_hashing.default_workers()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        source_dirs = _build_catalog(root / "catalog", args.items, args.asset_kb)
+        config.AEC_CATALOG_INDEX = root / "catalog-index.json"
+
+        def legacy():
+            with patch.object(catalog_hashes, "hash_single_file", _legacy_file), \
+                    patch.object(catalog_hashes, "hash_skill_directory", _legacy_directory):
+                return catalog_hashes.generate_catalog_hashes(source_dirs, workers=1)
+
+        def serial():
+            return catalog_hashes.generate_catalog_hashes(source_dirs, workers=1)
+
+        def parallel():
+            return catalog_hashes.generate_catalog_hashes(source_dirs, workers=workers)
+
+        if not _hashes(legacy()) == _hashes(serial()) == _hashes(parallel()):
+            print("error: hashes differ between approaches", file=sys.stderr)
+            return 1
+
+        print(f"{args.items} items, {args.asset_kb} KiB asset per skill, {workers} workers, "
+              f"{os.cpu_count()} CPUs")
+        results = {
+            "legacy": _time(legacy, args.rounds),
+            "serial": _time(serial, args.rounds),
+            "parallel": _time(parallel, args.rounds),
+        }
+        for name, samples in results.items():
+            print(
+                f"{name:<9} median {statistics.median(samples) * 1000:9.2f} ms   "
+                f"best {min(samples) * 1000:9.2f} ms   ({args.rounds} rounds)"
+            )
+        ratio = statistics.median(results["legacy"]) / statistics.median(results["parallel"])
+        print(f"parallel is {ratio:.1f}x faster than legacy")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
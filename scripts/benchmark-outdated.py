@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Benchmark: fleet-wide outdated check, per-repo discovery vs aec.lib.outdated_matrix.
+
+Builds a synthetic catalog (skills, rules, agents) and a manifest tracking
+``--repos`` repos in a temporary directory, then times the check behind
+``aec upgrade``'s "other tracked repos have upgrades" prompt two ways:
+
+* per-repo: discover every item type's catalog again for each repo, as
+  ``_find_outdated_repos`` used to
+* matrix: discover each catalog once and compute every repo's outdated
+  items in one pass (``discover_catalog`` + ``outdated_matrix``)
+
+Both are run with the catalog index off (every discovery reads the
+sources) and on (discoveries answered from ``catalog-index.json``).
+
+Usage:
+    python scripts/benchmark-outdated.py [--repos 200] [--items 60] [--rounds 5]
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+# Allow imports from aec/ regardless of how the script is invoked
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from aec.lib import config, sources
+from aec.lib.outdated_matrix import discover_catalog, outdated_matrix, upgradable_count
+from aec.lib.skills_manifest import version_is_newer
+
+TYPES = ("skills", "rules", "agents")
+
+
+def _frontmatter(name: str, version: str) -> str:
+    return f"---\nname: {name}\nversion: {version}\ndescription: Synthetic {name}\n---\nBody\n"
+
+
+def _build_catalog(root: Path, items: int) -> dict:
+    source_dirs = {
+        "skills": root / "skills",
+        "rules": root / "rules",
+        "agents": root / "agents",
+    }
+    for i in range(items):
+        skill = source_dirs["skills"] / f"skill-{i}"
+        skill.mkdir(parents=True)
+        (skill / "SKILL.md").write_text(_frontmatter(f"skill-{i}", "2.0.0"))
+        source_dirs["rules"].mkdir(exist_ok=True)
+        (source_dirs["rules"] / f"rule-{i}.md").write_text(_frontmatter(f"rule-{i}", "2.0.0"))
+        source_dirs["agents"].mkdir(exist_ok=True)
+        (source_dirs["agents"] / f"agent-{i}.md").write_text(_frontmatter(f"agent-{i}", "2.0.0"))
+    return source_dirs
+
+
+def _build_manifest(repos: int, items: int) -> tuple:
+    manifest = {"manifestVersion": 2, "global": {}, "repos": {}}
+    paths = []
+    for r in range(repos):
+        path = Path(f"/synthetic/repo-{r}")
+        paths.append(path)
+        # Each repo installs a third of the catalog, a third of it outdated
+        manifest["repos"][str(path)] = {
+            item_type: {
+                f"{item_type[:-1]}-{i}": {"version": "1.0.0" if i % 3 else "2.0.0"}
+                for i in range(r % 3, items, 3)
+            }
+            for item_type in TYPES
+        }
+    return manifest, paths
+
+
+def _per_repo(manifest: dict, repos: list, source_dirs: dict) -> list:
+    results = []
+    for repo_path in repos:
+        scope = manifest["repos"][str(repo_path)]
+        count = 0
+        for item_type, source_dir in source_dirs.items():
+            available = sources.discover_available(source_dir, item_type)
+            for name, info in scope.get(item_type, {}).items():
+                if name in available and version_is_newer(
+                    available[name].get("version", "0.0.0"), info.get("version", "0.0.0")
+                ):
+                    count += 1
+        if count:
+            results.append((repo_path, count))
+    return results
+
+
+def _matrix(manifest: dict, repos: list, source_dirs: dict) -> list:
+    matrix = outdated_matrix(manifest, discover_catalog(source_dirs), [str(r) for r in repos])
+    return [(r, upgradable_count(matrix[str(r)])) for r in repos if upgradable_count(matrix[str(r)])]
+
+
+def _time(fn, rounds: int) -> list:
+    fn()  # warm up caches, imports and the catalog index
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _uncached(source_dir: Path, item_type: str) -> dict:
+    """``discover_available`` without the catalog index."""
+    return sources._discover(source_dir, item_type)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repos", type=int, default=200, help="Tracked repos in the manifest")
+    parser.add_argument("--items", type=int, default=60, help="Catalog items per type")
+    parser.add_argument("--rounds", type=int, default=5, help="Timed rounds per approach")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        source_dirs = _build_catalog(root / "catalog", args.items)
+        manifest, repos = _build_manifest(args.repos, args.items)
+        config.AEC_CATALOG_INDEX = root / "catalog-index.json"
+
+        if _per_repo(manifest, repos, source_dirs) != _matrix(manifest, repos, source_dirs):
+            print("error: the two approaches disagree", file=sys.stderr)
+            return 1
+
+        print(f"{args.repos} repos x {len(TYPES)} types x {args.items} catalog items")
+        for label, discover in (("no index", _uncached), ("index", sources.discover_available)):
+            with patch.object(sources, "discover_available", discover):
+                results = {
+                    "per-repo": _time(lambda: _per_repo(manifest, repos, source_dirs), args.rounds),
+                    "matrix": _time(lambda: _matrix(manifest, repos, source_dirs), args.rounds),
+                }
+            for name, samples in results.items():
+                print(
+                    f"{label:<9} {name:<9} median {statistics.median(samples) * 1000:9.2f} ms   "
+                    f"best {min(samples) * 1000:9.2f} ms   ({args.rounds} rounds)"
+                )
+            ratio = statistics.median(results["per-repo"]) / statistics.median(results["matrix"])
+            print(f"{label:<9} matrix is {ratio:.1f}x faster")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: /proc vs subprocess snapshot backends in aec.lib.profiler.
+
+Times the port and process parts of ``take_snapshot`` (the parts the two
+backends implement differently) over several rounds and prints the median
+and best time per backend. Linux only; the /proc backend needs /proc.
+
+Usage:
+    python scripts/benchmark-profiler.py [--rounds 20]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Allow imports from aec/ regardless of how the script is invoked
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from aec.lib import profiler
+
+
+def _procfs() -> None:
+    profiler.snapshot_ports_procfs()
+    profiler.snapshot_processes_procfs()
+
+
+def _subprocess() -> None:
+    profiler.snapshot_ports()
+    profiler.snapshot_processes()
+    profiler.snapshot_process_details()
+
+
+def _time(fn, rounds: int) -> list[float]:
+    fn()  # warm up caches and imports
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20, help="Timed rounds per backend")
+    args = parser.parse_args()
+
+    if not profiler.procfs_available():
+        print("error: /proc backend unavailable on this platform", file=sys.stderr)
+        return 1
+
+    results = {
+        "procfs": _time(_procfs, args.rounds),
+        "subprocess": _time(_subprocess, args.rounds),
+    }
+    for name, samples in results.items():
+        print(
+            f"{name:<11} median {statistics.median(samples) * 1000:8.2f} ms   "
+            f"best {min(samples) * 1000:8.2f} ms   ({args.rounds} rounds)"
+        )
+    ratio = statistics.median(results["subprocess"]) / statistics.median(results["procfs"])
+    print(f"procfs is {ratio:.1f}x faster per snapshot")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
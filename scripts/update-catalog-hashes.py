@@ -12,12 +12,16 @@ REPO_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(REPO_ROOT))
 
 from aec.lib.catalog_hashes import generate_catalog_hashes, load_catalog_hashes
+from aec.lib.hash_cache import CACHE_NAME, HashCache
 from aec.lib.sources import get_source_dirs
 
 
 def incremental_update(catalog_path: Path, source_dirs: Optional[dict] = None) -> bool:
     """Incrementally update catalog-hashes.json, recomputing only changed items.
 
+    Content hashes are cached in ``CACHE_NAME`` next to ``catalog_path``,
+    so only files changed since the last run are read.
+
     Args:
         catalog_path: Path to the catalog-hashes.json file.
         source_dirs: Optional dict of item_type -> Path. If None, auto-discovered.
@@ -30,8 +34,12 @@ def incremental_update(catalog_path: Path, source_dirs: Optional[dict] = None) -
 
     existing = load_catalog_hashes(catalog_path)
 
-    # Generate a full fresh catalog to get current state of all items
-    fresh = generate_catalog_hashes(source_dirs)
+    # Generate a full fresh catalog to get current state of all items;
+    # the cache answers for every file that has not changed
+    cache = HashCache.load(catalog_path.with_name(CACHE_NAME))
+    fresh = generate_catalog_hashes(source_dirs, cache=cache)
+    cache.forget_unused()
+    cache.save()
 
     changed = False
 
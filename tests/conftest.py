@@ -15,6 +15,22 @@ def temp_dir() -> Generator[Path, None, None]:
         yield Path(tmpdir)
 
 
+@pytest.fixture(autouse=True)
+def isolated_catalog_index(tmp_path_factory, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep the catalog index that discover_available writes out of the real AEC_HOME."""
+    index = tmp_path_factory.mktemp("catalog-index") / "catalog-index.json"
+    monkeypatch.setattr("aec.lib.config.AEC_CATALOG_INDEX", index)
+    return index
+
+
+@pytest.fixture(autouse=True)
+def isolated_hash_cache(tmp_path_factory, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep the skill tree hash cache out of the real AEC_HOME."""
+    cache = tmp_path_factory.mktemp("hash-cache") / "hash-cache.json"
+    monkeypatch.setattr("aec.lib.config.AEC_HASH_CACHE", cache)
+    return cache
+
+
 @pytest.fixture
 def mock_home(temp_dir: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
     """Mock the home directory for testing."""
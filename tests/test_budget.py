@@ -0,0 +1,92 @@
+"""Tests for aec.lib.budget — fitting scheduled suites into a time budget."""
+
+import time
+from pathlib import Path
+
+
+def _item(suite, seconds, value, project="web"):
+    from aec.lib.budget import BudgetItem
+
+    return BudgetItem(project, suite, seconds, value, None, False)
+
+
+class TestSuiteValue:
+    """Tests for suite_value()."""
+
+    def test_priority_staleness_and_carry_over(self):
+        from aec.lib.budget import DEFERRED_BOOST, MAX_STALENESS_DAYS, suite_value
+
+        assert suite_value(0, 0.0, False) == 1.0
+        assert suite_value(0, 3.0, False) == 4.0
+        assert suite_value(2, 3.0, False) == 16.0
+        assert suite_value(-1, 0.0, False) == 0.5
+        assert suite_value(0, None, False) == 1.0 + MAX_STALENESS_DAYS
+        assert suite_value(0, 400.0, False) == 1.0 + MAX_STALENESS_DAYS
+        assert suite_value(0, 3.0, True) == 4.0 * DEFERRED_BOOST
+
+
+class TestSelectWithinBudget:
+    """Tests for select_within_budget()."""
+
+    def test_everything_fits(self):
+        from aec.lib.budget import select_within_budget
+
+        items = [_item("a", 60, 1.0), _item("b", 60, 1.0)]
+        assert select_within_budget(items, 600) == (items, [])
+
+    def test_maximizes_value_not_greedy_ratio(self):
+        from aec.lib.budget import select_within_budget
+
+        # Greedy by value/second takes "a" first and then only fits "c"
+        a, b, c = _item("a", 60, 7.0), _item("b", 50, 5.0), _item("c", 50, 5.0)
+        selected, deferred = select_within_budget([a, b, c], 100)
+        assert selected == [b, c]
+        assert deferred == [a]
+
+    def test_defers_suites_longer_than_the_budget(self):
+        from aec.lib.budget import select_within_budget
+
+        long, short = _item("e2e", 7200, 100.0), _item("unit", 30, 1.0)
+        selected, deferred = select_within_budget([long, short], 3600)
+        assert selected == [short]
+        assert deferred == [long]
+
+    def test_large_budgets_stay_within_capacity_units(self):
+        from aec.lib.budget import select_within_budget
+
+        items = [_item(f"s{i}", 600 + i, 1.0 + i % 3) for i in range(200)]
+        selected, deferred = select_within_budget(items, 4 * 3600)
+        assert sum(item.seconds for item in selected) <= 4 * 3600
+        assert len(selected) + len(deferred) == 200
+
+
+class TestBudgetItems:
+    """Tests for last_verified() and budget_items()."""
+
+    def test_durations_staleness_and_priority(self):
+        from aec.lib.budget import DEFAULT_SUITE_SECONDS, budget_items, last_verified
+        from aec.lib.history_store import connect, record_run, set_cached_pass
+
+        now = time.time()
+        conn = connect(Path(":memory:"))
+        record_run(conn, "web", "2026-04-01T02-00-00Z", {
+            "unit": {"status": "passed", "duration_seconds": 40.0},
+            "e2e": {"status": "failed", "duration_seconds": 900.0},
+        }, created_at=now - 5 * 86400)
+        set_cached_pass(conn, "web", "lint", "key", "/r", now - 86400)
+
+        assert set(last_verified(conn, ["web"])) == {("web", "unit"), ("web", "lint")}
+
+        items = budget_items(conn, {
+            "web": {"unit": {}, "e2e": {"priority": 1}, "lint": {}, "docs": {}},
+        }, carried_over={("web", "docs")}, now=now)
+        conn.close()
+
+        assert items[("web", "unit")].seconds == 40.0
+        assert round(items[("web", "unit")].staleness_days) == 5
+        assert items[("web", "e2e")].seconds == 900.0
+        assert items[("web", "e2e")].staleness_days is None
+        assert items[("web", "e2e")].value == 2 * 31.0
+        assert round(items[("web", "lint")].staleness_days) == 1
+        assert items[("web", "docs")].seconds == DEFAULT_SUITE_SECONDS
+        assert items[("web", "docs")].carried_over
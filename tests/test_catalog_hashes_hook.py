@@ -315,3 +315,57 @@ class TestContentHashAccuracy:
         skill_path = source_dirs["skills"] / "code-review"
         expected = hash_skill_directory(skill_path)
         assert data["skills"]["code-review"]["contentHash"] == expected
+
+
+# -------------------------------------------------------------------
+# Tests: hash cache
+# -------------------------------------------------------------------
+
+
+def _age(root: Path, seconds: float = 60) -> None:
+    """Move mtimes of every file under root into the past (out of the racy window)."""
+    import os
+    import time
+
+    past = time.time() - seconds
+    for path in root.rglob("*"):
+        os.utime(path, (past, past))
+
+
+class TestHashCache:
+    def test_writes_cache_next_to_catalog(self, tmp_path: Path, source_dirs: dict) -> None:
+        from aec.lib.hash_cache import CACHE_NAME
+
+        catalog_path = tmp_path / "catalog-hashes.json"
+        incremental_update(catalog_path, source_dirs)
+        assert (tmp_path / CACHE_NAME).exists()
+
+    def test_unchanged_files_are_not_read_again(
+        self, tmp_path: Path, source_dirs: dict, monkeypatch
+    ) -> None:
+        from aec.lib import catalog_hashes
+
+        _age(tmp_path)
+        catalog_path = tmp_path / "catalog-hashes.json"
+        incremental_update(catalog_path, source_dirs)
+
+        def fail(path):
+            raise AssertionError(f"{path} was hashed again")
+
+        monkeypatch.setattr(catalog_hashes, "hash_single_file", fail)
+        monkeypatch.setattr(catalog_hashes, "hash_skill_directory", fail)
+        monkeypatch.setattr(catalog_hashes, "hash_skill_tree", fail)
+        assert incremental_update(catalog_path, source_dirs) is False
+
+    def test_changed_file_is_hashed_again(self, tmp_path: Path, source_dirs: dict) -> None:
+        _age(tmp_path)
+        catalog_path = tmp_path / "catalog-hashes.json"
+        incremental_update(catalog_path, source_dirs)
+
+        prompt = source_dirs["skills"] / "code-review" / "prompt.md"
+        prompt.write_text("Changed prompt, same version.\n", encoding="utf-8")
+        assert incremental_update(catalog_path, source_dirs) is True
+
+        data = json.loads(catalog_path.read_text(encoding="utf-8"))
+        expected = hash_skill_directory(source_dirs["skills"] / "code-review")
+        assert data["skills"]["code-review"]["contentHash"] == expected
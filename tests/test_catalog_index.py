@@ -0,0 +1,152 @@
+"""Tests for aec.lib.catalog_index — the persistent catalog index behind discover_available."""
+
+import json
+import os
+import time
+
+import pytest
+
+RULE = "---\nname: {name}\nversion: {version}\ndescription: Rule\n---\n# Rule\n"
+
+
+def _age(root, seconds_ago=3600):
+    """Move every mtime under ``root`` into the past, out of the racy window."""
+    past = time.time() - seconds_ago
+    for dirpath, _dirs, files in os.walk(root):
+        for name in files:
+            os.utime(os.path.join(dirpath, name), (past, past))
+        os.utime(dirpath, (past, past))
+
+
+@pytest.fixture
+def rules_source(temp_dir):
+    source = temp_dir / "rules"
+    (source / "python").mkdir(parents=True)
+    (source / "python" / "style.md").write_text(RULE.format(name="python/style", version="1.0.0"))
+    (source / "git.md").write_text(RULE.format(name="git", version="2.0.0"))
+    (source / "README.md").write_text("# Rules\n")
+    _age(source)
+    return source
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    """Record every frontmatter parse done by the rules/agents discovery."""
+    from aec.lib import sources
+
+    seen = []
+    real = sources.parse_yaml_frontmatter
+    monkeypatch.setattr(
+        sources, "parse_yaml_frontmatter", lambda text: seen.append(text) or real(text)
+    )
+    return seen
+
+
+class TestDiscoverIndexed:
+    """Tests for discover_indexed() through discover_available()."""
+
+    def test_unchanged_tree_is_answered_from_the_index(self, rules_source, parses):
+        from aec.lib.sources import discover_available
+
+        first = discover_available(rules_source, "rules")
+        assert len(parses) == 3
+        parses.clear()
+
+        assert discover_available(rules_source, "rules") == first
+        assert parses == []
+        assert set(first) == {"python/style", "git"}
+
+    def test_only_changed_files_are_parsed_again(self, rules_source, parses):
+        from aec.lib.sources import discover_available
+
+        discover_available(rules_source, "rules")
+        parses.clear()
+        (rules_source / "git.md").write_text(RULE.format(name="git", version="2.1.0"))
+        _age(rules_source / "git.md", seconds_ago=60)
+
+        assert discover_available(rules_source, "rules")["git"]["version"] == "2.1.0"
+        assert len(parses) == 1
+
+    def test_added_and_removed_files_are_noticed(self, rules_source, parses):
+        from aec.lib.sources import discover_available
+
+        discover_available(rules_source, "rules")
+        (rules_source / "python" / "typing.md").write_text(
+            RULE.format(name="python/typing", version="1.0.0")
+        )
+        (rules_source / "git.md").unlink()
+        _age(rules_source, seconds_ago=60)
+
+        assert set(discover_available(rules_source, "rules")) == {"python/style", "python/typing"}
+
+    def test_racily_modified_files_are_always_read(self, temp_dir):
+        from aec.lib.sources import discover_available
+
+        source = temp_dir / "rules"
+        source.mkdir()
+        rule = source / "git.md"
+        rule.write_text(RULE.format(name="git", version="1.0.0"))
+        stat = rule.stat()
+        discover_available(source, "rules")
+
+        # Same size and mtime: only the racy check catches this edit
+        rule.write_text(RULE.format(name="git", version="1.0.1"))
+        os.utime(rule, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert discover_available(source, "rules")["git"]["version"] == "1.0.1"
+
+    def test_corrupt_index_is_rebuilt(self, rules_source, isolated_catalog_index):
+        from aec.lib.sources import discover_available
+
+        isolated_catalog_index.write_text("{broken")
+        assert set(discover_available(rules_source, "rules")) == {"python/style", "git"}
+        assert json.loads(isolated_catalog_index.read_text())["version"] == 1
+
+    def test_index_keeps_skill_dependencies_and_detached_items(
+        self, temp_dir, isolated_catalog_index
+    ):
+        from aec.lib.sources import discover_available
+
+        source = temp_dir / "skills"
+        skill = source / "deploy"
+        skill.mkdir(parents=True)
+        (skill / "SKILL.md").write_text(
+            "---\nname: deploy\nversion: 1.0.0\ndescription: Deploys\n"
+            "dependencies:\n  skills:\n    - name: build\n      min_version: \"1.2.0\"\n"
+            "      reason: \"builds first\"\n---\n"
+        )
+        _age(source)
+
+        available = discover_available(source, "skills")
+        available["deploy"]["version"] = "mutated"
+
+        entry = json.loads(isolated_catalog_index.read_text())["catalogs"][f"skills:{source}"]
+        assert entry["dependencies"] == {"deploy": [["build", "1.2.0", "builds first"]]}
+        assert discover_available(source, "skills")["deploy"]["version"] == "1.0.0"
+
+    def test_drops_catalogs_of_vanished_sources(self, temp_dir, isolated_catalog_index):
+        import shutil
+
+        from aec.lib.sources import discover_available
+
+        for name in ("a", "b"):
+            (temp_dir / name).mkdir()
+            (temp_dir / name / "r.md").write_text(RULE.format(name=name, version="1.0.0"))
+        discover_available(temp_dir / "a", "rules")
+        shutil.rmtree(temp_dir / "a")
+        discover_available(temp_dir / "b", "rules")
+
+        catalogs = json.loads(isolated_catalog_index.read_text())["catalogs"]
+        assert list(catalogs) == [f"rules:{temp_dir / 'b'}"]
+
+    def test_unwritable_index_still_discovers(self, rules_source, temp_dir):
+        from aec.lib.catalog_index import discover_indexed
+        from aec.lib.sources import _discover
+
+        blocker = temp_dir / "not-a-dir"
+        blocker.write_text("")
+        items = discover_indexed(
+            rules_source, "rules", lambda src, read: _discover(src, "rules", read),
+            index_path=blocker / "catalog-index.json",
+        )
+        assert set(items) == {"python/style", "git"}
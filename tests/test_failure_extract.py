@@ -0,0 +1,206 @@
+"""Tests for aec.lib.failure_extract — failing tests pulled from suite output."""
+
+import io
+
+import pytest
+
+PYTEST = """\
+============================= test session starts ==============================
+collected 3 items
+
+tests/test_api.py .F.                                                     [100%]
+
+=================================== FAILURES ===================================
+__________________________ TestLogin.test_bad_password _________________________
+
+    def test_bad_password(self):
+>       assert login("x") == 200
+E       assert 401 == 200
+E        +  where 401 = login('x')
+
+tests/test_api.py:12: AssertionError
+=========================== short test summary info ============================
+FAILED tests/test_api.py::TestLogin::test_bad_password - assert 401 == 200
+ERROR tests/test_db.py::test_connect
+========================= 1 failed, 2 passed in 0.12s ==========================
+"""
+
+JEST = """\
+FAIL src/sum.test.js
+  ● math › adds numbers
+
+    expect(received).toBe(expected) // Object.is equality
+
+      at Object.<anonymous> (src/sum.test.js:4:17)
+
+  ● Console
+
+    console.log
+      hello
+
+Tests:       1 failed, 3 passed, 4 total
+"""
+
+VITEST = """\
+ ❯ src/basic.test.ts (2 tests | 1 failed) 5ms
+   × suite > adds
+
+⎯⎯⎯⎯⎯⎯⎯ Failed Tests 1 ⎯⎯⎯⎯⎯⎯⎯
+
+ FAIL  src/basic.test.ts > suite > adds
+AssertionError: expected 2 to be 3 // Object.is equality
+"""
+
+PLAYWRIGHT = """\
+Running 3 tests using 1 worker
+
+  1) [chromium] › example.spec.ts:3:5 › has title ────────────────────────────
+
+    Error: Timed out 5000ms waiting for expect(locator).toHaveTitle(expected)
+
+  1 failed
+    [chromium] › example.spec.ts:3:5 › has title
+  2 passed (4.1s)
+"""
+
+CARGO = """\
+running 2 tests
+test tests::it_works ... ok
+test tests::it_fails ... FAILED
+
+failures:
+
+---- tests::it_fails stdout ----
+thread 'tests::it_fails' panicked at src/lib.rs:10:9:
+assertion `left == right` failed
+  left: 1
+ right: 2
+
+failures:
+    tests::it_fails
+
+test result: FAILED. 1 passed; 1 failed
+"""
+
+GO = """\
+=== RUN   TestAdd
+--- FAIL: TestAdd (0.00s)
+    add_test.go:10: expected 3, got 4
+=== RUN   TestSub
+--- PASS: TestSub (0.00s)
+FAIL
+FAIL\texample.com/calc\t0.002s
+"""
+
+RSPEC = """\
+..F
+
+Failures:
+
+  1) Calculator adds numbers
+     Failure/Error: expect(1 + 1).to eq(3)
+
+       expected: 3
+            got: 2
+
+Finished in 0.01 seconds (files took 0.1 seconds to load)
+3 examples, 1 failure
+
+Failed examples:
+
+rspec ./spec/calc_spec.rb:4 # Calculator adds numbers
+"""
+
+
+def _extract(text, framework, **kwargs):
+    from aec.lib.failure_extract import extract_failures
+
+    return extract_failures(io.BytesIO(text.encode("utf-8")), 0, framework, **kwargs)
+
+
+class TestExtractFailures:
+    """Tests for extract_failures()."""
+
+    @pytest.mark.parametrize("framework, text, expected", [
+        ("pytest", PYTEST, [
+            {"test": "tests/test_api.py::TestLogin::test_bad_password",
+             "error": "assert 401 == 200"},
+            {"test": "tests/test_db.py::test_connect", "error": None},
+        ]),
+        ("jest", JEST, [
+            {"test": "math › adds numbers",
+             "error": "expect(received).toBe(expected) // Object.is equality"},
+        ]),
+        ("vitest", VITEST, [
+            {"test": "src/basic.test.ts > suite > adds",
+             "error": "AssertionError: expected 2 to be 3 // Object.is equality"},
+        ]),
+        ("playwright", PLAYWRIGHT, [
+            {"test": "[chromium] › example.spec.ts:3:5 › has title",
+             "error": "Error: Timed out 5000ms waiting for expect(locator).toHaveTitle(expected)"},
+        ]),
+        ("cargo_test", CARGO, [
+            {"test": "tests::it_fails", "error": "assertion `left == right` failed"},
+        ]),
+        ("go_test", GO, [
+            {"test": "TestAdd", "error": "add_test.go:10: expected 3, got 4"},
+        ]),
+        ("rspec", RSPEC, [
+            {"test": "Calculator adds numbers", "error": "expected: 3"},
+        ]),
+    ])
+    def test_framework_output(self, framework, text, expected):
+        result = _extract(text, framework)
+        assert result == {"framework": framework, "failures": expected, "omitted": 0}
+
+    def test_every_framework_has_an_extractor(self):
+        from aec.lib.failure_extract import EXTRACTORS
+        from aec.lib.test_detection import TEST_FRAMEWORK_HOOKS
+
+        assert set(TEST_FRAMEWORK_HOOKS) <= set(EXTRACTORS)
+
+    def test_unknown_framework_tries_every_extractor(self):
+        result = _extract(GO, None)
+        assert result["framework"] == "go_test"
+        assert result["failures"][0]["test"] == "TestAdd"
+
+    def test_pytest_without_short_summary_uses_section_headers(self):
+        text = PYTEST[: PYTEST.index("=========================== short")]
+        assert _extract(text, "pytest")["failures"] == [
+            {"test": "TestLogin.test_bad_password", "error": "assert 401 == 200"},
+        ]
+
+    def test_keeps_at_most_limit_failures(self):
+        text = "".join(f"--- FAIL: Test{i} (0.00s)\n    x_test.go:1: boom\n" for i in range(30))
+        result = _extract(text, "go_test", limit=5)
+        assert [f["test"] for f in result["failures"]] == [f"Test{i}" for i in range(5)]
+        assert result["omitted"] == 25
+
+    def test_long_lines_and_colors_and_offset(self, monkeypatch):
+        from aec.lib import failure_extract
+
+        monkeypatch.setattr(failure_extract, "MAX_LINE_BYTES", 64)
+        prefix = b"=== unit ===\n--- FAIL: TestOld (0.00s)\n"
+        text = (
+            b"x" * 1000 + b"\n"
+            + b"\x1b[31m--- FAIL: TestNew (0.00s)\x1b[0m\n"
+            + b"    " + b"y" * 1000 + b"\n"
+        )
+        result = failure_extract.extract_failures(io.BytesIO(prefix + text), len(prefix), "go_test")
+        assert result["failures"] == [{"test": "TestNew", "error": "y" * 60}]
+
+    def test_nothing_recognised(self):
+        assert _extract("npm ERR! missing script: test\n", None) is None
+
+
+class TestSuiteFramework:
+    """Tests for suite_framework()."""
+
+    def test_resolution_order(self):
+        from aec.lib.failure_extract import suite_framework
+
+        assert suite_framework("unit", {"command": "make test", "framework": "rspec"}) == "rspec"
+        assert suite_framework("fw:go_test", {"command": "make test"}) == "go_test"
+        assert suite_framework("e2e", {"command": "npx playwright test"}) == "playwright"
+        assert suite_framework("unit", {"command": "uv run pytest -x"}) == "pytest"
+        assert suite_framework("unit", {"command": "npm test"}) is None
@@ -0,0 +1,117 @@
+"""Tests for aec.lib.file_hashing."""
+
+import hashlib
+import threading
+from pathlib import Path
+
+import pytest
+
+
+def _legacy_digest(path: Path) -> str:
+    """How contentHash was computed before streaming."""
+    return f"sha256:{hashlib.sha256(path.read_bytes()).hexdigest()}"
+
+
+@pytest.fixture
+def sample_files(tmp_path: Path) -> list:
+    sizes = {"empty.bin": 0, "small.md": 37, "chunked.bin": 5 * 1024 + 3}
+    paths = []
+    for name, size in sizes.items():
+        path = tmp_path / name
+        path.write_bytes(bytes(i % 251 for i in range(size)))
+        paths.append(path)
+    return paths
+
+
+class TestFileDigest:
+    """Tests for file_digest() and sha256_file()."""
+
+    def test_matches_read_bytes_digest(self, sample_files, monkeypatch):
+        from aec.lib import file_hashing
+
+        monkeypatch.setattr(file_hashing, "CHUNK_BYTES", 1024)
+        for path in sample_files:
+            assert file_hashing.file_digest(path) == _legacy_digest(path)
+
+    def test_fallback_without_hashlib_file_digest(self, sample_files, monkeypatch):
+        from aec.lib import file_hashing
+
+        monkeypatch.delattr(hashlib, "file_digest", raising=False)
+        monkeypatch.setattr(file_hashing, "CHUNK_BYTES", 1024)
+        for path in sample_files:
+            assert file_hashing.file_digest(path) == _legacy_digest(path)
+
+    def test_skill_directory_hash_is_unchanged(self, tmp_path, monkeypatch):
+        from aec.lib import file_hashing
+        from aec.lib.skills_manifest import hash_skill_directory, hash_skill_tree
+
+        skill = tmp_path / "skill"
+        (skill / "assets").mkdir(parents=True)
+        (skill / "SKILL.md").write_text("---\nname: s\n---\n")
+        (skill / "assets" / "big.bin").write_bytes(b"\x01\x02" * 4000)
+
+        legacy = hashlib.sha256()
+        for filepath in sorted(skill.rglob("*")):
+            if filepath.is_file():
+                legacy.update(str(filepath.relative_to(skill)).encode())
+                legacy.update(filepath.read_bytes())
+
+        monkeypatch.setattr(file_hashing, "CHUNK_BYTES", 1024)
+        assert hash_skill_directory(skill) == f"sha256:{legacy.hexdigest()}"
+        assert hash_skill_tree(skill).content_hash == f"sha256:{legacy.hexdigest()}"
+
+
+class TestParallelMap:
+    """Tests for parallel_map()."""
+
+    def test_preserves_order(self):
+        from aec.lib.file_hashing import parallel_map
+
+        items = list(range(50))
+        assert parallel_map(lambda n: n * n, items, workers=4) == [n * n for n in items]
+
+    def test_small_batches_run_on_calling_thread(self):
+        from aec.lib.file_hashing import PARALLEL_MIN_ITEMS, parallel_map
+
+        threads = parallel_map(
+            lambda _n: threading.get_ident(), range(PARALLEL_MIN_ITEMS - 1), workers=4
+        )
+        assert set(threads) == {threading.get_ident()}
+
+    def test_exceptions_propagate(self):
+        from aec.lib.file_hashing import parallel_map
+
+        def boom(n):
+            if n == 20:
+                raise ValueError("bad item")
+            return n
+
+        with pytest.raises(ValueError, match="bad item"):
+            parallel_map(boom, range(40), workers=4)
+
+
+class TestParallelCatalogHashes:
+    """generate_catalog_hashes() gives the same hashes serially and in parallel."""
+
+    def test_serial_and_parallel_agree(self, tmp_path):
+        from aec.lib.catalog_hashes import generate_catalog_hashes
+
+        agents = tmp_path / "agents"
+        skills = tmp_path / "skills"
+        agents.mkdir()
+        for i in range(12):
+            (agents / f"agent-{i}.md").write_text(
+                f"---\nname: agent-{i}\nversion: 1.0.{i}\n---\nBody {i}\n"
+            )
+            skill = skills / f"skill-{i}"
+            skill.mkdir(parents=True)
+            (skill / "SKILL.md").write_text(f"---\nname: skill-{i}\nversion: 1.0.{i}\n---\n")
+            (skill / "asset.bin").write_bytes(bytes([i]) * 3000)
+
+        source_dirs = {"agents": agents, "skills": skills}
+        serial = generate_catalog_hashes(source_dirs, workers=1)
+        parallel = generate_catalog_hashes(source_dirs, workers=4)
+        for item_type in ("agents", "skills", "rules"):
+            assert serial[item_type] == parallel[item_type]
+        assert len(parallel["skills"]) == 12
+        assert parallel["agents"]["agent-3"]["contentHash"] == _legacy_digest(agents / "agent-3.md")
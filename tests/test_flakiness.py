@@ -0,0 +1,60 @@
+"""Tests for aec.lib.flakiness — flakiness scores from run history."""
+
+from pathlib import Path
+
+
+class TestRunOutcome:
+    """Tests for run_outcome()."""
+
+    def test_outcomes(self):
+        from aec.lib.flakiness import run_outcome
+
+        assert run_outcome({"status": "passed"}) == "pass"
+        assert run_outcome({"status": "failed"}) == "fail"
+        assert run_outcome({"status": "failed", "reruns": [
+            {"attempt": 1, "status": "failed"}, {"attempt": 2, "status": "passed"},
+        ]}) == "flaky"
+        assert run_outcome({"status": "cached-pass"}) is None
+        assert run_outcome({"status": "skipped"}) is None
+
+
+class TestFlakinessScore:
+    """Tests for flakiness_score()."""
+
+    def test_stable_suites_score_zero(self):
+        from aec.lib.flakiness import flakiness_score
+
+        assert flakiness_score(["pass"] * 5) == 0.0
+        assert flakiness_score(["fail"] * 5) == 0.0
+        assert flakiness_score(["fail"]) == 0.0
+        assert flakiness_score([]) == 0.0
+
+    def test_flips_and_flaky_runs_count(self):
+        from aec.lib.flakiness import flakiness_score
+
+        assert flakiness_score(["pass", "fail", "pass", "fail"]) == 0.75
+        assert flakiness_score(["pass", "pass", "flaky", "pass"]) == 0.25
+        assert flakiness_score(["flaky"]) == 1.0
+
+
+class TestSuiteFlakiness:
+    """Tests for suite_flakiness() against the history store."""
+
+    def test_scores_each_suite(self):
+        from aec.lib.flakiness import suite_flakiness
+        from aec.lib.history_store import connect, record_run
+
+        conn = connect(Path(":memory:"))
+        statuses = ["passed", "failed", "passed", "passed"]
+        for day, status in enumerate(statuses, start=1):
+            record_run(conn, "web", f"2026-04-0{day}T02-00-00Z", {
+                "unit": {"status": status},
+                "lint": {"status": "passed"},
+                "e2e": {"status": "skipped"},
+            })
+        scores = suite_flakiness(conn, ["web", "unknown"])
+        conn.close()
+
+        assert scores[("web", "unit")] == {"score": 0.5, "runs": 4}
+        assert scores[("web", "lint")] == {"score": 0.0, "runs": 4}
+        assert ("web", "e2e") not in scores
@@ -0,0 +1,165 @@
+"""Tests for aec.lib.governor — load-adaptive admission of parallel suites."""
+
+import threading
+import time
+from pathlib import Path
+
+
+def _governor(load=0.2, memory=8000.0, max_concurrency=3, predicted=None, **kwargs):
+    from aec.lib.governor import ConcurrencyGovernor
+
+    readings = {"load": load, "memory": memory}
+    governor = ConcurrencyGovernor(
+        max_concurrency,
+        predicted or {},
+        max_load_per_cpu=1.0,
+        memory_reserve_mb=1000.0,
+        load=lambda: readings["load"],
+        memory=lambda: readings["memory"],
+        poll_interval=0.01,
+        **kwargs,
+    )
+    return governor, readings
+
+
+def _acquire_in_thread(governor, project, suite):
+    tokens = []
+    thread = threading.Thread(target=lambda: tokens.append(governor.acquire(project, suite)))
+    thread.start()
+    return thread, tokens
+
+
+class TestSensors:
+    """Tests for available_memory_mb() and load_per_cpu()."""
+
+    def test_reads_mem_available(self, temp_dir):
+        from aec.lib.governor import available_memory_mb
+
+        meminfo = temp_dir / "meminfo"
+        meminfo.write_text(
+            "MemTotal:       16384000 kB\n"
+            "MemFree:         1024000 kB\n"
+            "MemAvailable:    4096000 kB\n"
+        )
+        assert available_memory_mb(meminfo) == 4000.0
+        assert available_memory_mb(temp_dir / "missing") is None
+
+    def test_load_per_cpu_is_unavailable_without_getloadavg(self, monkeypatch):
+        from aec.lib.governor import load_per_cpu
+
+        monkeypatch.delattr("os.getloadavg", raising=False)
+        assert load_per_cpu() is None
+
+
+class TestSuiteMemoryHistory:
+    """Tests for suite_memory_history()."""
+
+    def test_highest_recorded_peak_per_suite(self):
+        from aec.lib.governor import suite_memory_history
+        from aec.lib.history_store import connect, record_run
+
+        conn = connect(Path(":memory:"))
+        record_run(conn, "web", "2026-04-01T02-00-00Z", {
+            "unit": {"cgroup": {"peak_memory_mb": 300.0}},
+            "lint": {"status": "passed"},
+        })
+        record_run(conn, "web", "2026-04-02T02-00-00Z", {
+            "unit": {"rusage": {"max_rss_mb": 120.0}, "resources": {"peak_rss_mb": 410.5}},
+        })
+        assert suite_memory_history(conn, ["web", "api"]) == {("web", "unit"): 410.5}
+        conn.close()
+
+
+class TestConcurrencyGovernor:
+    """Tests for ConcurrencyGovernor."""
+
+    def test_always_admits_when_nothing_runs(self):
+        governor, _ = _governor(load=50.0, memory=0.0)
+        token = governor.acquire("web", "e2e")
+        governor.release(token)
+        assert governor.report()["deferred"] == 0
+
+    def test_waits_for_slots(self):
+        governor, _ = _governor(max_concurrency=1)
+        first = governor.acquire("web", "unit")
+        thread, tokens = _acquire_in_thread(governor, "api", "unit")
+        time.sleep(0.05)
+        assert tokens == []
+        governor.release(first)
+        thread.join(timeout=2)
+        assert len(tokens) == 1
+        decision = governor.report()["decisions"][1]
+        assert decision["waited_for"] == ["slots"]
+        assert decision["waited_seconds"] > 0
+
+    def test_waits_while_load_is_high(self):
+        governor, readings = _governor(load=2.5)
+        governor.acquire("web", "unit")
+        thread, tokens = _acquire_in_thread(governor, "api", "unit")
+        time.sleep(0.05)
+        assert tokens == []
+        readings["load"] = 0.5
+        thread.join(timeout=2)
+        assert len(tokens) == 1
+        assert governor.report()["decisions"][1]["waited_for"] == ["load"]
+
+    def test_admits_only_when_predicted_memory_fits(self):
+        # 3000 MB available - 1000 reserve - 1500 for the running suite = 500
+        governor, readings = _governor(
+            memory=3000.0,
+            predicted={("web", "e2e"): 1500.0, ("api", "e2e"): 800.0, ("api", "unit"): 400.0},
+        )
+        governor.acquire("web", "e2e")
+        small = governor.acquire("api", "unit")
+        assert governor.report()["decisions"][1]["waited_for"] == []
+        governor.release(small)
+
+        thread, tokens = _acquire_in_thread(governor, "api", "e2e")
+        time.sleep(0.05)
+        assert tokens == []
+        readings["memory"] = 4000.0
+        thread.join(timeout=2)
+        decision = governor.report()["decisions"][2]
+        assert decision["waited_for"] == ["memory"]
+        assert decision["predicted_mb"] == 800.0
+        assert decision["available_mb"] == 4000.0
+
+    def test_unknown_signals_are_not_checked(self):
+        governor, _ = _governor(load=None, memory=None)
+        governor.acquire("web", "unit")
+        governor.acquire("api", "unit")
+        assert governor.report()["deferred"] == 0
+
+    def test_unknown_suites_use_default_prediction(self):
+        from aec.lib.governor import DEFAULT_SUITE_MEMORY_MB
+
+        governor, _ = _governor()
+        assert governor.predicted("web", "unit") == DEFAULT_SUITE_MEMORY_MB
+
+    def test_reports_time_weighted_utilization(self):
+        now = [0.0]
+        governor, _ = _governor(max_concurrency=2, clock=lambda: now[0])
+        a = governor.acquire("web", "unit")
+        now[0] = 10.0
+        b = governor.acquire("api", "unit")
+        now[0] = 20.0
+        governor.release(a)
+        governor.release(b)
+
+        report = governor.report()
+        # 1 suite for 10s, then 2 suites for 10s
+        assert report["mean_concurrency"] == 1.5
+        assert report["utilization"] == 0.75
+        assert report["peak_concurrency"] == 2
+        assert report["admitted"] == 2
+
+    def test_slot_releases_on_error(self):
+        governor, _ = _governor(max_concurrency=1)
+        try:
+            with governor.slot("web", "unit"):
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+        with governor.slot("api", "unit"):
+            pass
+        assert governor.report()["deferred"] == 0
@@ -0,0 +1,217 @@
+"""Tests for aec.lib.hash_cache."""
+
+import json
+import os
+import time
+from pathlib import Path
+
+
+def _write_old(path: Path, text: str) -> Path:
+    """Write a file with an mtime outside the racy window."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    past = time.time() - 60
+    os.utime(path, (past, past))
+    return path
+
+
+class Counter:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, path):
+        self.calls += 1
+        return f"digest:{self.calls}"
+
+
+class TreeCounter:
+    """Counts tree hashes; file digests are real so unchanged files match."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, path):
+        from aec.lib.skills_manifest import hash_skill_tree
+
+        self.calls += 1
+        return hash_skill_tree(path)._replace(content_hash=f"digest:{self.calls}")
+
+
+class TestHashFile:
+    """Tests for HashCache.hash_file()."""
+
+    def test_unchanged_file_uses_cache(self, tmp_path):
+        from aec.lib.hash_cache import HashCache
+
+        path = _write_old(tmp_path / "a.md", "one")
+        cache, hasher = HashCache(), Counter()
+        assert cache.hash_file(path, hasher) == "digest:1"
+        assert cache.hash_file(path, hasher) == "digest:1"
+        assert hasher.calls == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_changed_size_or_mtime_hashes_again(self, tmp_path):
+        from aec.lib.hash_cache import HashCache
+
+        path = _write_old(tmp_path / "a.md", "one")
+        cache, hasher = HashCache(), Counter()
+        cache.hash_file(path, hasher)
+        _write_old(path, "longer")
+        assert cache.hash_file(path, hasher) == "digest:2"
+
+    def test_recently_modified_file_is_always_read(self, tmp_path):
+        from aec.lib.hash_cache import HashCache
+
+        path = tmp_path / "a.md"
+        path.write_text("fresh", encoding="utf-8")
+        cache, hasher = HashCache(), Counter()
+        cache.hash_file(path, hasher)
+        cache.hash_file(path, hasher)
+        assert hasher.calls == 2
+
+    def test_default_hasher_matches_hash_single_file(self, tmp_path):
+        from aec.lib.catalog_hashes import hash_single_file
+        from aec.lib.hash_cache import HashCache
+
+        path = _write_old(tmp_path / "a.md", "content")
+        assert HashCache().hash_file(path) == hash_single_file(path)
+
+
+class TestHashDirectory:
+    """Tests for HashCache.hash_directory()."""
+
+    def test_reused_until_a_file_changes_or_appears(self, tmp_path):
+        from aec.lib.hash_cache import HashCache
+
+        skill = tmp_path / "skill"
+        _write_old(skill / "SKILL.md", "skill")
+        _write_old(skill / "docs" / "ref.md", "ref")
+        cache, hasher = HashCache(), TreeCounter()
+        cache.hash_directory(skill, hasher)
+        cache.hash_directory(skill, hasher)
+        assert hasher.calls == 1
+
+        _write_old(skill / "extra.md", "new file")
+        cache.hash_directory(skill, hasher)
+        assert hasher.calls == 2
+
+        _write_old(skill / "docs" / "ref.md", "edited ref")
+        cache.hash_directory(skill, hasher)
+        assert hasher.calls == 3
+
+    def test_hidden_files_are_ignored(self, tmp_path):
+        from aec.lib.hash_cache import HashCache
+
+        skill = tmp_path / "skill"
+        _write_old(skill / "SKILL.md", "skill")
+        cache, hasher = HashCache(), TreeCounter()
+        cache.hash_directory(skill, hasher)
+        _write_old(skill / ".DS_Store", "noise")
+        cache.hash_directory(skill, hasher)
+        assert hasher.calls == 1
+
+    def test_default_hasher_matches_hash_skill_directory(self, tmp_path):
+        from aec.lib.hash_cache import HashCache
+        from aec.lib.skills_manifest import hash_skill_directory
+
+        skill = tmp_path / "skill"
+        _write_old(skill / "SKILL.md", "skill")
+        assert HashCache().hash_directory(skill) == hash_skill_directory(skill)
+
+
+class TestHashTree:
+    """Tests for HashCache.hash_tree() and skill_trees()."""
+
+    def test_touched_files_keep_root_without_rehashing_tree(self, tmp_path):
+        from aec.lib.hash_cache import HashCache
+        from aec.lib.skills_manifest import hash_skill_directory
+
+        skill = tmp_path / "skill"
+        _write_old(skill / "SKILL.md", "skill")
+        _write_old(skill / "ref.md", "ref")
+        cache, hasher = HashCache(), TreeCounter()
+        first = cache.hash_tree(skill, hasher)
+
+        # Same content, new mtime: the file is read again, the root is not
+        _write_old(skill / "ref.md", "ref")
+        os.utime(skill / "ref.md", (time.time() - 30, time.time() - 30))
+        second = cache.hash_tree(skill, hasher)
+        assert hasher.calls == 1
+        assert second == first
+
+        tree = HashCache().hash_tree(skill)
+        assert tree.content_hash == hash_skill_directory(skill)
+        assert set(tree.files) == {"SKILL.md", "ref.md"}
+
+    def test_miss_reads_root_and_files_together(self, tmp_path, monkeypatch):
+        from aec.lib import catalog_hashes
+        from aec.lib.hash_cache import HashCache
+        from aec.lib.skills_manifest import hash_skill_tree
+
+        skill = tmp_path / "skill"
+        _write_old(skill / "SKILL.md", "skill")
+        _write_old(skill / "docs" / "ref.md", "ref")
+
+        def fail(path):
+            raise AssertionError(f"{path} was read on its own")
+
+        monkeypatch.setattr(catalog_hashes, "hash_single_file", fail)
+        cache = HashCache()
+        tree = cache.hash_tree(skill)
+        assert tree == hash_skill_tree(skill)
+        # The file digests came from the same read and are cached
+        assert cache.hash_file(skill / "docs" / "ref.md") == tree.files["docs/ref.md"]
+        assert cache.hash_tree(skill, fail) == tree
+
+    def test_skill_trees_uses_shared_cache(self, tmp_path, isolated_hash_cache):
+        from aec.lib.hash_cache import HashCache, skill_trees
+        from aec.lib.skills_manifest import hash_skill_directory
+
+        skill = tmp_path / "skill"
+        _write_old(skill / "SKILL.md", "skill")
+        (tree,) = skill_trees([skill])
+        assert tree.content_hash == hash_skill_directory(skill)
+        assert os.path.abspath(skill) in HashCache.load(isolated_hash_cache).dirs
+
+
+class TestPersistence:
+    """Tests for HashCache.load(), save() and forget_unused()."""
+
+    def test_round_trip(self, tmp_path):
+        from aec.lib.hash_cache import HashCache
+
+        path = _write_old(tmp_path / "a.md", "one")
+        cache_path = tmp_path / "cache.json"
+        cache = HashCache.load(cache_path)
+        cache.hash_file(path, Counter())
+        cache.save()
+
+        hasher = Counter()
+        assert HashCache.load(cache_path).hash_file(path, hasher) == "digest:1"
+        assert hasher.calls == 0
+
+    def test_corrupt_or_old_cache_starts_empty(self, tmp_path):
+        from aec.lib.hash_cache import HashCache
+
+        cache_path = tmp_path / "cache.json"
+        cache_path.write_text("{not json")
+        assert HashCache.load(cache_path).files == {}
+        cache_path.write_text(json.dumps({"version": 0, "files": {"x": []}}))
+        assert HashCache.load(cache_path).files == {}
+
+    def test_forget_unused_drops_removed_paths(self, tmp_path):
+        from aec.lib.hash_cache import HashCache
+
+        keep = _write_old(tmp_path / "keep.md", "keep")
+        gone = _write_old(tmp_path / "gone.md", "gone")
+        cache_path = tmp_path / "cache.json"
+        cache = HashCache.load(cache_path)
+        cache.hash_file(keep, Counter())
+        cache.hash_file(gone, Counter())
+        cache.save()
+
+        cache = HashCache.load(cache_path)
+        cache.hash_file(keep, Counter())
+        cache.forget_unused()
+        cache.save()
+        assert list(HashCache.load(cache_path).files) == [os.path.abspath(keep)]
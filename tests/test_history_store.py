@@ -0,0 +1,127 @@
+"""Tests for aec.lib.history_store — the SQLite run-history store."""
+
+import json
+import os
+import time
+from contextlib import closing
+
+import pytest
+
+
+@pytest.fixture
+def conn(temp_dir):
+    from aec.lib.history_store import connect
+
+    with closing(connect(temp_dir / "history.db")) as connection:
+        yield connection
+
+
+class TestRecordAndLoad:
+    """Tests for record_run() and load_project_profiles()."""
+
+    def test_round_trips_newest_first(self, conn):
+        """Runs come back as {suite: profile} dicts, newest first, limited."""
+        from aec.lib.history_store import load_project_profiles, record_run
+
+        for day in (1, 3, 2):
+            record_run(conn, "web", f"2026-04-0{day}T02-00-00Z", {
+                "unit": {"duration_seconds": day, "status": "passed"},
+                "e2e": {"duration_seconds": day * 10, "status": "failed"},
+            })
+        record_run(conn, "api", "2026-04-09T02-00-00Z", {"unit": {"duration_seconds": 1}})
+
+        runs = load_project_profiles(conn, "web", limit=2)
+        assert [run["unit"]["duration_seconds"] for run in runs] == [3, 2]
+        assert list(runs[0]) == ["unit", "e2e"]
+        assert load_project_profiles(conn, "missing") == []
+
+    def test_rerecording_a_run_replaces_it(self, conn):
+        """Saving the same project/timestamp twice keeps only the latest copy."""
+        from aec.lib.history_store import load_project_profiles, record_run
+
+        record_run(conn, "web", "2026-04-01T02-00-00Z", {"unit": {"status": "failed"}})
+        record_run(conn, "web", "2026-04-01T02-00-00Z", {"unit": {"status": "passed"}})
+        assert load_project_profiles(conn, "web") == [{"unit": {"status": "passed"}}]
+
+
+class TestQueries:
+    """Tests for suite_history() and suite_duration_percentiles()."""
+
+    def test_suite_history_returns_last_n(self, conn):
+        """Only the requested suite, newest first."""
+        from aec.lib.history_store import record_run, suite_history
+
+        for day in range(1, 6):
+            record_run(conn, "web", f"2026-04-0{day}T02-00-00Z", {
+                "unit": {"duration_seconds": day, "status": "passed"},
+                "lint": {"duration_seconds": 1, "status": "passed"},
+            })
+        history = suite_history(conn, "web", "unit", limit=3)
+        assert [h["duration_seconds"] for h in history] == [5.0, 4.0, 3.0]
+        assert history[0]["timestamp"] == "2026-04-05T02-00-00Z"
+        assert history[0]["profile"] == {"duration_seconds": 5, "status": "passed"}
+
+    def test_p95_per_suite(self, conn):
+        """Nearest-rank percentile per (project, suite)."""
+        from aec.lib.history_store import record_run, suite_duration_percentiles
+
+        for i in range(20):
+            record_run(conn, "web", f"2026-04-{i + 1:02d}T02-00-00Z", {
+                "unit": {"duration_seconds": i + 1},
+                "e2e": {"status": "skipped"},
+            })
+        record_run(conn, "api", "2026-04-01T02-00-00Z", {"unit": {"duration_seconds": 7}})
+
+        p95 = suite_duration_percentiles(conn, 95)
+        assert p95 == {("web", "unit"): 19, ("api", "unit"): 7}
+        assert suite_duration_percentiles(conn, 50, project="web") == {("web", "unit"): 10}
+
+
+class TestPruneHistory:
+    """Tests for prune_history()."""
+
+    def test_deletes_old_runs_and_their_suites(self, conn):
+        """Runs past the cutoff go, suites cascade with them."""
+        from aec.lib.history_store import prune_history, record_run
+
+        old = time.time() - 40 * 86400
+        record_run(conn, "web", "2026-01-01T02-00-00Z", {"unit": {}, "e2e": {}}, created_at=old)
+        record_run(conn, "web", "2026-03-01T02-00-00Z", {"unit": {}})
+
+        assert prune_history(conn, max_days=30) == 1
+        assert conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0] == 1
+        assert conn.execute("SELECT COUNT(*) FROM suites").fetchone()[0] == 1
+
+
+class TestImportJsonProfiles:
+    """Tests for the one-time import of the legacy JSON tree."""
+
+    def _legacy_tree(self, temp_dir):
+        profiles = temp_dir / "profiles"
+        (profiles / "web").mkdir(parents=True)
+        (profiles / "web" / "2026-04-01T02-00-00Z.json").write_text(
+            json.dumps({"unit": {"duration_seconds": 4, "status": "passed"}})
+        )
+        (profiles / "web" / "2026-04-02T02-00-00Z.json").write_text("{not json")
+        stale = profiles / "web" / "2026-01-01T02-00-00Z.json"
+        stale.write_text(json.dumps({"unit": {"duration_seconds": 9}}))
+        old = time.time() - 200 * 86400
+        os.utime(stale, (old, old))
+        return profiles
+
+    def test_imports_once_on_first_connect(self, temp_dir):
+        """Readable files are imported with their mtime; later connects skip it."""
+        from aec.lib.history_store import connect, load_project_profiles, prune_history
+
+        profiles = self._legacy_tree(temp_dir)
+        db = temp_dir / "history.db"
+        with closing(connect(db, legacy_profiles_dir=profiles)) as conn:
+            runs = load_project_profiles(conn, "web")
+            assert [r["unit"]["duration_seconds"] for r in runs] == [4, 9]
+            assert prune_history(conn, max_days=90) == 1
+
+        (profiles / "api").mkdir()
+        (profiles / "api" / "2026-04-05T02-00-00Z.json").write_text(json.dumps({"unit": {}}))
+        with closing(connect(db, legacy_profiles_dir=profiles)) as conn:
+            assert load_project_profiles(conn, "api") == []
+            assert len(load_project_profiles(conn, "web")) == 1
@@ -0,0 +1,131 @@
+"""Tests for aec.lib.junit — streaming JUnit XML ingestion."""
+
+import os
+
+REPORT = """<?xml version="1.0" encoding="utf-8"?>
+<testsuites>
+  <testsuite name="pytest" tests="5">
+    <testcase classname="tests.test_a" name="test_ok" time="0.5"/>
+    <testcase classname="tests.test_a" name="test_slow" time="3.25"/>
+    <testcase classname="tests.test_a" name="test_bad" time="1.0">
+      <failure message="assert 1 == 2">Traceback...</failure>
+    </testcase>
+    <testcase classname="tests.test_b" name="test_crash" time="0.1">
+      <error>RuntimeError: boom
+more detail</error>
+    </testcase>
+    <testcase name="test_later" time="0"><skipped message="todo"/></testcase>
+  </testsuite>
+</testsuites>
+"""
+
+
+class TestSummarizeJunit:
+    """Tests for summarize_junit()."""
+
+    def test_counts_outcomes_and_failed_tests(self, tmp_path):
+        from aec.lib.junit import summarize_junit
+
+        path = tmp_path / "junit.xml"
+        path.write_text(REPORT)
+
+        summary = summarize_junit([path])
+        assert summary["files"] == 1
+        assert (summary["tests"], summary["passed"], summary["failures"],
+                summary["errors"], summary["skipped"]) == (5, 2, 1, 1, 1)
+        assert summary["time_seconds"] == 4.85
+        assert summary["failed"] == [
+            {"test": "tests.test_a::test_bad", "kind": "failure", "message": "assert 1 == 2"},
+            {"test": "tests.test_b::test_crash", "kind": "error", "message": "RuntimeError: boom"},
+        ]
+        assert "truncated" not in summary
+
+    def test_keeps_the_slowest_tests(self, tmp_path):
+        from aec.lib.junit import summarize_junit
+
+        path = tmp_path / "junit.xml"
+        path.write_text(REPORT)
+
+        slowest = summarize_junit([path], slowest=2)["slowest"]
+        assert slowest == [
+            {"test": "tests.test_a::test_slow", "seconds": 3.25},
+            {"test": "tests.test_a::test_bad", "seconds": 1.0},
+        ]
+
+    def test_handles_namespaced_tags_and_multiple_files(self, tmp_path):
+        from aec.lib.junit import summarize_junit
+
+        first = tmp_path / "a.xml"
+        first.write_text(REPORT)
+        second = tmp_path / "b.xml"
+        second.write_text(
+            '<t:testsuite xmlns:t="urn:x"><t:testcase name="n">'
+            '<t:failure message="nope"/></t:testcase></t:testsuite>'
+        )
+
+        summary = summarize_junit([first, second])
+        assert summary["files"] == 2
+        assert summary["tests"] == 6
+        assert summary["failures"] == 2
+
+    def test_truncated_file_keeps_counted_tests(self, tmp_path):
+        from aec.lib.junit import summarize_junit
+
+        path = tmp_path / "junit.xml"
+        path.write_text(REPORT[: REPORT.index("<testcase classname=\"tests.test_b\"")])
+
+        summary = summarize_junit([path])
+        assert summary["truncated"] is True
+        assert summary["tests"] == 3
+
+    def test_returns_none_without_readable_files(self, tmp_path):
+        from aec.lib.junit import summarize_junit
+
+        garbage = tmp_path / "junit.xml"
+        garbage.write_text("not xml")
+        assert summarize_junit([garbage, tmp_path / "missing.xml"]) is None
+        assert summarize_junit([]) is None
+
+    def test_caps_failed_tests(self, tmp_path, monkeypatch):
+        from aec.lib import junit
+
+        monkeypatch.setattr(junit, "MAX_FAILED_TESTS", 2)
+        path = tmp_path / "junit.xml"
+        path.write_text(
+            "<testsuite>"
+            + "".join(f'<testcase name="t{i}"><failure/></testcase>' for i in range(5))
+            + "</testsuite>"
+        )
+
+        summary = junit.summarize_junit([path])
+        assert summary["failures"] == 5
+        assert len(summary["failed"]) == 2
+
+
+class TestJunitReports:
+    """Tests for junit_reports()."""
+
+    def test_ignores_files_older_than_the_run(self, tmp_path):
+        from aec.lib.junit import junit_reports
+
+        reports = tmp_path / "reports"
+        reports.mkdir()
+        (reports / "old.xml").write_text(REPORT)
+        os.utime(reports / "old.xml", (1000, 1000))
+        (reports / "new.xml").write_text(REPORT)
+        (reports / "notes.txt").write_text("")
+
+        assert junit_reports(tmp_path, "reports/*.xml", since=2000) == [reports / "new.xml"]
+        assert junit_reports(tmp_path, "missing/*.xml", since=0) == []
+
+    def test_absolute_patterns_match_from_their_root(self, tmp_path):
+        from aec.lib.junit import junit_reports
+
+        reports = tmp_path / "shared" / "reports"
+        reports.mkdir(parents=True)
+        (reports / "junit.xml").write_text(REPORT)
+        project = tmp_path / "project"
+        project.mkdir()
+
+        assert junit_reports(project, str(reports / "*.xml"), since=0) == [reports / "junit.xml"]
+        assert junit_reports(project, str(reports / "junit.xml"), since=0) == [reports / "junit.xml"]
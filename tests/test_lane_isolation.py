@@ -0,0 +1,66 @@
+"""Tests for aec.lib.lane_isolation — per-lane ports, Compose projects and TMPDIR."""
+
+
+def _registry(*ports):
+    return {"version": "1.0.0", "ports": {str(p): {"port": p} for p in ports}}
+
+
+class TestPortOffsets:
+    """Tests for port_offset_step() and lane_port_offset()."""
+
+    def test_registered_ports_reads_keys_and_entries(self):
+        from aec.lib.lane_isolation import registered_ports
+
+        registry = {"ports": {"3000": {"port": 3000}, "8080": {}, "junk": {}}}
+        assert registered_ports(registry) == [3000, 8080]
+
+    def test_step_covers_registered_span(self):
+        from aec.lib.lane_isolation import port_offset_step
+
+        assert port_offset_step(_registry()) == 100
+        assert port_offset_step(_registry(3000, 3005)) == 100
+        assert port_offset_step(_registry(3000, 5432)) == 2500
+
+    def test_first_lane_is_unshifted(self):
+        from aec.lib.lane_isolation import lane_port_offset
+
+        registry = _registry(3000, 5432)
+        assert lane_port_offset(1, registry) == 0
+        assert lane_port_offset(3, registry) == 5000
+
+    def test_offset_past_port_range_falls_back_to_zero(self):
+        from aec.lib.lane_isolation import lane_port_offset
+
+        assert lane_port_offset(3, _registry(1000, 40000)) == 0
+
+
+    def test_offsets_of_every_lane(self):
+        from aec.lib.lane_isolation import lane_port_offsets
+
+        assert lane_port_offsets(3, _registry(3000, 3005)) == [0, 100, 200]
+        assert lane_port_offsets(1, _registry(3000)) == [0]
+
+    def test_unshift_ports_maps_back_registered_ports_only(self):
+        from aec.lib.lane_isolation import unshift_ports
+
+        registry = _registry(3000, 3001)
+        assert unshift_ports([3100, 3101, 8080], registry, 100) == [3000, 3001, 8080]
+        assert unshift_ports([3000, 3100], registry, 0) == [3000, 3100]
+
+
+class TestLaneContext:
+    """Tests for create_lane_context() and release_lane_context()."""
+
+    def test_context_env_and_cleanup(self, tmp_path):
+        from aec.lib.lane_isolation import create_lane_context, release_lane_context
+
+        context = create_lane_context(2, "2026-04-08T02:00:00Z", _registry(3000), tmp_path)
+        env = context.env()
+        assert env["AEC_LANE"] == "2"
+        assert env["AEC_PORT_OFFSET"] == "100"
+        assert env["COMPOSE_PROJECT_NAME"] == "aec20260408t020000z-lane2"
+        assert context.tmpdir.parent == tmp_path and context.tmpdir.is_dir()
+
+        (context.tmpdir / "scratch").write_text("x")
+        release_lane_context(context)
+        assert not context.tmpdir.exists()
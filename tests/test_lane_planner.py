@@ -0,0 +1,155 @@
+"""Tests for aec.lib.lane_planner — lane plans from profile history."""
+
+import json
+
+
+def _stats(seconds, ports=(), docker=(), runs=3):
+    return {"runs": runs, "expected_seconds": seconds, "ports": set(ports), "docker": set(docker)}
+
+
+class TestSummarizeProjectHistory:
+    """Tests for summarize_project_history()."""
+
+    def test_median_of_per_run_totals(self):
+        """Expected duration is the median of summed suite durations per run."""
+        from aec.lib.lane_planner import summarize_project_history
+
+        runs = [
+            {"unit": {"duration_seconds": 10}, "e2e": {"duration_seconds": 20}},
+            {"unit": {"duration_seconds": 12}, "e2e": {"duration_seconds": 18}},
+            {"unit": {"duration_seconds": 100}},
+        ]
+        summary = summarize_project_history(runs)
+        assert summary["runs"] == 3
+        assert summary["expected_seconds"] == 30.0
+
+    def test_collects_ports_and_containers(self):
+        """Observed new ports and started containers are unioned across runs."""
+        from aec.lib.lane_planner import summarize_project_history
+
+        runs = [
+            {"unit": {"ports_new": [3000], "docker_started": ["db"]}},
+            {"unit": {"ports_new": [3001], "docker_started": []}},
+        ]
+        summary = summarize_project_history(runs)
+        assert summary["ports"] == {3000, 3001}
+        assert summary["docker"] == {"db"}
+        assert summary["expected_seconds"] == 0.0
+
+
+class TestGroupConflicting:
+    """Tests for group_conflicting()."""
+
+    def test_shared_port_or_container_groups_transitively(self):
+        """A-B share a port and B-C share a container → one group."""
+        from aec.lib.lane_planner import group_conflicting
+
+        stats = {
+            "a": _stats(1, ports=[5432]),
+            "b": _stats(1, ports=[5432], docker=["redis"]),
+            "c": _stats(1, docker=["redis"]),
+            "d": _stats(1, ports=[8080]),
+        }
+        groups = sorted(group_conflicting(stats))
+        assert groups == [["a", "b", "c"], ["d"]]
+
+
+class TestPlanLanes:
+    """Tests for plan_lanes()."""
+
+    def test_balances_by_expected_duration(self):
+        """Longest-first packing yields balanced lanes and a shorter makespan."""
+        from aec.lib.lane_planner import plan_lanes
+
+        stats = {name: _stats(s) for name, s in {"a": 60, "b": 50, "c": 40, "d": 30, "e": 20}.items()}
+        plan = plan_lanes(stats, 2)
+        assert plan["serial_seconds"] == 200
+        assert plan["makespan_seconds"] == 110
+        assert sorted(plan["lane_seconds"]) == [90, 110]
+        assert sorted(n for lane in plan["lanes"] for n in lane) == ["a", "b", "c", "d", "e"]
+
+    def test_conflicting_projects_share_a_lane(self):
+        """Projects with a shared port never end up in different lanes."""
+        from aec.lib.lane_planner import plan_lanes
+
+        stats = {
+            "a": _stats(10, ports=[3000]),
+            "b": _stats(10, ports=[3000]),
+            "c": _stats(10),
+        }
+        plan = plan_lanes(stats, 3)
+        lane_of = {name: i for i, lane in enumerate(plan["lanes"]) for name in lane}
+        assert lane_of["a"] == lane_of["b"]
+        assert len(plan["lanes"]) == 2
+
+
+class TestComputePlan:
+    """Tests for compute_plan()."""
+
+    def test_excludes_projects_below_min_runs(self, temp_dir):
+        """Projects without enough profiled runs are reported, not planned."""
+        from aec.lib.history_store import connect, record_run
+        from aec.lib.lane_planner import compute_plan
+
+        conn = connect(temp_dir / "history.db")
+        for i in range(3):
+            record_run(conn, "web", f"2026-01-0{i + 1}T02-00-00Z",
+                       {"unit": {"duration_seconds": 30}})
+            record_run(conn, "api", f"2026-01-0{i + 1}T02-00-00Z",
+                       {"unit": {"duration_seconds": 10}})
+        record_run(conn, "new", "2026-01-03T02-00-00Z", {"unit": {"duration_seconds": 5}})
+
+        plan = compute_plan(conn, ["web", "api", "new"], lane_count=2, min_runs=3)
+        conn.close()
+        assert plan["lanes"] == [["web"], ["api"]]
+        assert plan["insufficient"] == {"new": 1}
+        assert plan["based_on_runs"] == 3
+        assert plan["makespan_seconds"] == 30
+
+
+class TestRunTestPlan:
+    """Tests for the ``aec test plan`` command handler."""
+
+    def _setup(self, temp_dir, monkeypatch):
+        # Legacy JSON profiles: the first plan imports them into the store.
+        from aec.lib.tracking import TrackedRepo
+
+        for i in range(3):
+            for name, seconds in (("web", 60), ("api", 40), ("cli", 20)):
+                project_dir = temp_dir / "profiles" / name
+                project_dir.mkdir(parents=True, exist_ok=True)
+                (project_dir / f"2026-01-0{i + 1}T02-00-00Z.json").write_text(
+                    json.dumps({"unit": {"duration_seconds": seconds}})
+                )
+        config_path = temp_dir / "scheduler-config.json"
+        monkeypatch.setattr("aec.lib.config.AEC_PROFILES_DIR", temp_dir / "profiles")
+        monkeypatch.setattr("aec.lib.config.AEC_HISTORY_DB", temp_dir / "history.db")
+        monkeypatch.setattr("aec.lib.config.AEC_SCHEDULER_CONFIG", config_path)
+        monkeypatch.setattr(
+            "aec.lib.runner.find_scheduled_projects",
+            lambda: [(TrackedRepo("", "", temp_dir / n, True), n) for n in ("web", "api", "cli")],
+        )
+        return config_path
+
+    def test_dry_run_previews_without_saving(self, temp_dir, monkeypatch, capsys):
+        """--dry-run prints lanes and makespan vs serial and writes nothing."""
+        from aec.commands.test_cmd import run_test_plan
+
+        config_path = self._setup(temp_dir, monkeypatch)
+        assert run_test_plan(lanes=2, dry_run=True) == 0
+        out = capsys.readouterr().out
+        assert "Lane 1" in out and "Lane 2" in out
+        assert "Predicted makespan: 1m00s (serial: 2m00s, 2.0x faster)" in out
+        assert not config_path.exists()
+
+    def test_saves_plan_and_enables(self, temp_dir, monkeypatch):
+        """Without --dry-run the plan is stored; --enable turns on parallel runs."""
+        from aec.commands.test_cmd import run_test_plan
+
+        config_path = self._setup(temp_dir, monkeypatch)
+        assert run_test_plan(lanes=2, enable=True) == 0
+        config = json.loads(config_path.read_text())
+        plan = config["execution"]["parallelization_plan"]
+        assert plan["lanes"] == [["web"], ["api", "cli"]]
+        assert plan["based_on_runs"] == 3
+        assert config["execution"]["parallel_enabled"] is True
@@ -0,0 +1,88 @@
+"""Tests for aec.lib.lanes — parallel lane assignment and execution."""
+
+import threading
+import time
+
+
+class TestAssignLanes:
+    """Tests for assign_lanes()."""
+
+    def test_follows_plan_order(self):
+        """Items land in their planned lane, in planned order."""
+        from aec.lib.lanes import assign_lanes
+
+        lanes = assign_lanes(["a", "b", "c", "d"], [["d", "a"], ["c", "b"]], lambda x: [x])
+        assert lanes == [["d", "a"], ["c", "b"]]
+
+    def test_unplanned_items_share_trailing_lane(self):
+        """Items missing from the plan run together in one extra lane."""
+        from aec.lib.lanes import assign_lanes
+
+        lanes = assign_lanes(["x", "a", "y"], [["a"]], lambda x: [x])
+        assert lanes == [["a"], ["x", "y"]]
+
+    def test_matches_any_alias_and_drops_empty_lanes(self):
+        """An item matches by any of its names; lanes with no items are dropped."""
+        from aec.lib.lanes import assign_lanes
+
+        items = [("repo-dir", "project-name")]
+        lanes = assign_lanes(items, [["gone"], ["project-name"]], lambda x: x)
+        assert lanes == [[("repo-dir", "project-name")]]
+
+
+class TestRunLanes:
+    """Tests for run_lanes()."""
+
+    def test_items_in_a_lane_run_in_order(self):
+        """Items within one lane execute sequentially in lane order."""
+        from aec.lib.lanes import run_lanes
+
+        seen = []
+        result = run_lanes([[1, 2, 3]], lambda i: seen.append(i) or {"status": "passed"}, 4)
+        assert seen == [1, 2, 3]
+        assert [item for item, _ in result[0]["results"]] == [1, 2, 3]
+        assert result[0]["lane"] == 1
+        assert result[0]["duration_seconds"] >= 0
+
+    def test_bounds_concurrency(self):
+        """No more than max_workers lanes execute at once."""
+        from aec.lib.lanes import run_lanes
+
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def run(item):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return {"status": "passed"}
+
+        run_lanes([[i] for i in range(6)], run, max_workers=2)
+        assert peak <= 2
+
+    def test_runs_lanes_concurrently(self):
+        """Separate lanes overlap in time."""
+        from aec.lib.lanes import run_lanes
+
+        barrier = threading.Barrier(2, timeout=5)
+        result = run_lanes([["a"], ["b"]], lambda i: barrier.wait() and {} or {}, 2)
+        assert [r["lane"] for r in result] == [1, 2]
+
+    def test_error_in_one_item_is_recorded(self):
+        """An exception becomes a failed result instead of aborting the run."""
+        from aec.lib.lanes import run_lanes
+
+        def run(item):
+            if item == "bad":
+                raise RuntimeError("boom")
+            return {"status": "passed"}
+
+        result = run_lanes([["bad", "good"]], run, 1)
+        statuses = [r["status"] for _, r in result[0]["results"]]
+        assert statuses == ["failed", "passed"]
+        assert "boom" in result[0]["results"][0][1]["reason"]
@@ -0,0 +1,102 @@
+"""Tests for aec.lib.ordering — history-aware execution order."""
+
+
+STATS = {
+    "slow": {"runs": 5, "expected_seconds": 600.0, "fail_rate": 0.0},
+    "flaky": {"runs": 5, "expected_seconds": 120.0, "fail_rate": 0.8},
+    "fast": {"runs": 5, "expected_seconds": 10.0, "fail_rate": 0.0},
+    "broken": {"runs": 5, "expected_seconds": 30.0, "fail_rate": 0.8},
+}
+NAMES = ["fast", "new", "slow", "flaky", "broken"]
+
+
+def _order(strategy, seed=7, stats=STATS):
+    from aec.lib.ordering import order_items
+
+    return order_items(NAMES, strategy, seed, stats, lambda n: n)
+
+
+class TestOrderItems:
+    """Tests for order_items()."""
+
+    def test_random_matches_seeded_shuffle(self):
+        """random is the historical seeded shuffle, reproducible by seed."""
+        import random
+
+        expected = list(NAMES)
+        random.Random(7).shuffle(expected)
+        assert _order("random") == expected
+
+    def test_longest_first(self):
+        """Unknown projects first, then by expected duration descending."""
+        assert _order("longest-first") == ["new", "slow", "flaky", "broken", "fast"]
+
+    def test_fail_first_breaks_ties_by_shortest(self):
+        """Highest failure rate first; shorter first among equals."""
+        assert _order("fail-first") == ["new", "broken", "flaky", "fast", "slow"]
+
+    def test_seeded_weighted_is_deterministic_permutation(self):
+        """Same seed, same order; every project appears exactly once."""
+        first = _order("seeded-weighted", seed=123)
+        assert first == _order("seeded-weighted", seed=123)
+        assert sorted(first) == sorted(NAMES)
+
+    def test_seeded_weighted_favours_risky_projects(self):
+        """Across seeds, failure-prone projects lead far more often."""
+        leads = [_order("seeded-weighted", seed=s).index("broken") for s in range(300)]
+        fast = [_order("seeded-weighted", seed=s).index("fast") for s in range(300)]
+        assert sum(leads) < sum(fast)
+
+    def test_unknown_strategy_falls_back_to_random(self):
+        """A typo in the config never breaks the run."""
+        assert _order("fastest") == _order("random")
+
+
+class TestOrderLanes:
+    """Tests for order_lanes()."""
+
+    def test_random_keeps_plan_order(self):
+        """Lanes from the planner are left as planned."""
+        from aec.lib.ordering import order_lanes
+
+        lanes = [["fast", "slow"], ["flaky"]]
+        assert order_lanes(lanes, "random", 1, STATS, lambda n: n) == lanes
+
+    def test_longest_first_starts_heaviest_lane(self):
+        """Heaviest lane first; projects within lanes longest first."""
+        from aec.lib.ordering import order_lanes
+
+        lanes = [["broken", "fast"], ["fast2", "slow"]]
+        ordered = order_lanes(lanes, "longest-first", 1, STATS, lambda n: n)
+        assert ordered == [["fast2", "slow"], ["broken", "fast"]]
+
+    def test_fail_first_starts_riskiest_lane(self):
+        """The lane holding the likeliest failure starts first."""
+        from aec.lib.ordering import order_lanes
+
+        lanes = [["slow"], ["fast", "flaky"]]
+        ordered = order_lanes(lanes, "fail-first", 1, STATS, lambda n: n)
+        assert ordered == [["flaky", "fast"], ["slow"]]
+
+
+class TestProjectHistoryStats:
+    """Tests for project_history_stats()."""
+
+    def test_recent_failures_weigh_more(self, temp_dir):
+        """Duration is the median run total; failure rate decays with age."""
+        from aec.lib.history_store import connect, record_run
+        from aec.lib.ordering import project_history_stats
+
+        conn = connect(temp_dir / "history.db")
+        for day, status in ((1, "failed"), (2, "passed"), (3, "passed")):
+            record_run(conn, "old-fail", f"2026-04-0{day}T02-00-00Z",
+                       {"unit": {"duration_seconds": 10, "status": status}})
+        for day, status in ((1, "passed"), (2, "passed"), (3, "failed")):
+            record_run(conn, "new-fail", f"2026-04-0{day}T02-00-00Z",
+                       {"unit": {"duration_seconds": 20, "status": status}})
+
+        stats = project_history_stats(conn, ["old-fail", "new-fail", "never-run"])
+        conn.close()
+        assert set(stats) == {"old-fail", "new-fail"}
+        assert stats["new-fail"]["expected_seconds"] == 20
+        assert stats["new-fail"]["fail_rate"] > stats["old-fail"]["fail_rate"] > 0
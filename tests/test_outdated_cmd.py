@@ -115,6 +115,37 @@ class TestOutdated:
         assert "1.0.0" in output
 
 
+    @patch("aec.commands.outdated.get_all_tracked_repos")
+    @patch("aec.commands.outdated.get_source_dirs")
+    @patch("aec.commands.outdated.get_repo_root")
+    def test_json_all_includes_tracked_repos(
+        self, mock_root, mock_dirs, mock_repos, outdated_env, capsys, temp_dir
+    ):
+        from aec.commands.outdated import run_outdated
+
+        tracked = temp_dir / "tracked"
+        tracked.mkdir()
+        mp = temp_dir / ".agents-environment-config" / "installed-manifest.json"
+        m = json.loads(mp.read_text())
+        m["repos"][str(tracked.resolve())] = {
+            "skills": {"old-skill": {"version": "1.5.0", "contentHash": "", "installedAt": ""}},
+            "rules": {},
+            "agents": {},
+        }
+        mp.write_text(json.dumps(m))
+
+        mock_root.return_value = outdated_env
+        mock_dirs.return_value = _make_source_dirs(outdated_env)
+        mock_repos.return_value = [tracked]
+        run_outdated(show_all=True, json_out=True)
+        payload = json.loads(capsys.readouterr().out)
+        assert payload["scopes"]["global"]["outdated"][0]["available"] == "2.0.0"
+        assert payload["scopes"][str(tracked.resolve())]["outdated"] == [
+            {"type": "skills", "name": "old-skill", "installed": "1.5.0", "available": "2.0.0"}
+        ]
+        assert payload["total_upgradable"] == 2
+
+
 def _add_plugin_to_manifest(temp_dir, name, fields):
     mp = temp_dir / ".agents-environment-config" / "installed-manifest.json"
     m = json.loads(mp.read_text())
@@ -0,0 +1,107 @@
+"""Tests for aec.lib.outdated_matrix."""
+
+import json
+from unittest.mock import patch
+
+
+def _scope(**items):
+    return {
+        "skills": items.get("skills", {}),
+        "rules": items.get("rules", {}),
+        "agents": items.get("agents", {}),
+        "plugins": items.get("plugins", {}),
+    }
+
+
+def _manifest(global_scope, repos):
+    return {"manifestVersion": 2, "global": global_scope, "repos": repos}
+
+
+CATALOG = {
+    "skills": {"a": {"version": "2.0.0"}, "b": {"version": "1.0.0"}},
+    "plugins": {"p": {"version": "1.1.0"}},
+}
+
+
+class TestDiscoverCatalog:
+    """Tests for discover_catalog()."""
+
+    def test_discovers_each_type_once_and_skips_missing_dirs(self, tmp_path):
+        from aec.lib.outdated_matrix import discover_catalog
+
+        (tmp_path / "skills").mkdir()
+        source_dirs = {"skills": tmp_path / "skills", "rules": tmp_path / "missing", "agents": None}
+        with patch(
+            "aec.lib.sources.discover_available", return_value={"a": {"version": "1.0.0"}}
+        ) as mock_discover:
+            catalog = discover_catalog(source_dirs)
+        assert catalog == {"skills": {"a": {"version": "1.0.0"}}}
+        mock_discover.assert_called_once_with(tmp_path / "skills", "skills")
+
+    def test_types_limit_discovery(self, tmp_path):
+        from aec.lib.outdated_matrix import discover_catalog
+
+        (tmp_path / "skills").mkdir()
+        (tmp_path / "rules").mkdir()
+        source_dirs = {"skills": tmp_path / "skills", "rules": tmp_path / "rules"}
+        with patch("aec.lib.sources.discover_available", return_value={}):
+            catalog = discover_catalog(source_dirs, ("rules",))
+        assert list(catalog) == ["rules"]
+
+
+class TestOutdatedMatrix:
+    """Tests for outdated_matrix()."""
+
+    def test_rows_for_every_scope(self):
+        from aec.lib.outdated_matrix import outdated_matrix
+
+        manifest = _manifest(
+            _scope(skills={"a": {"version": "1.0.0"}, "b": {"version": "1.0.0"}}),
+            {
+                "/r1": _scope(skills={"a": {"version": "2.0.0"}}),
+                "/r2": _scope(skills={"a": {"version": "1.5.0"}}, plugins={"url": {"version": "0.0.0"}}),
+            },
+        )
+        matrix = outdated_matrix(manifest, CATALOG)
+        assert matrix == {
+            "global": [{"type": "skills", "name": "a", "installed": "1.0.0", "available": "2.0.0"}],
+            "/r1": [],
+            "/r2": [
+                {"type": "skills", "name": "a", "installed": "1.5.0", "available": "2.0.0"},
+                {"type": "plugins", "name": "url", "installed": "0.0.0", "available": None},
+            ],
+        }
+
+    def test_selected_scopes_only(self):
+        from aec.lib.outdated_matrix import outdated_matrix
+
+        manifest = _manifest(
+            _scope(skills={"a": {"version": "1.0.0"}}),
+            {"/r1": _scope(skills={"a": {"version": "1.0.0"}})},
+        )
+        matrix = outdated_matrix(manifest, CATALOG, ["/r1", "/untracked"])
+        assert list(matrix) == ["/r1", "/untracked"]
+        assert matrix["/untracked"] == []
+
+    def test_types_missing_from_catalog_are_not_reported(self):
+        from aec.lib.outdated_matrix import outdated_matrix
+
+        manifest = _manifest(_scope(rules={"r": {"version": "0.1.0"}}), {})
+        assert outdated_matrix(manifest, CATALOG) == {"global": []}
+
+
+class TestToJson:
+    """Tests for to_json()."""
+
+    def test_counts_exclude_unknown_versions(self):
+        from aec.lib.outdated_matrix import to_json
+
+        matrix = {
+            "global": [{"type": "skills", "name": "a", "installed": "1.0.0", "available": "2.0.0"}],
+            "/r": [{"type": "plugins", "name": "p", "installed": "0.0.0", "available": None}],
+        }
+        payload = json.loads(to_json(matrix))
+        assert payload["scopes"]["global"]["upgradable"] == 1
+        assert payload["scopes"]["/r"]["upgradable"] == 0
+        assert payload["scopes"]["/r"]["outdated"][0]["available"] is None
+        assert payload["total_upgradable"] == 1
@@ -171,3 +171,95 @@ class TestCheckPrerequisites:
         assert name == "sh"
         assert isinstance(available, bool)
         assert isinstance(detail, str)
+
+
+class TestPrerequisiteOracle:
+    """Test PrerequisiteOracle run-scoped memoization."""
+
+    def _counting_check(self, monkeypatch, delay=0.0, fail=()):
+        import threading
+        import time
+
+        calls = []
+        lock = threading.Lock()
+
+        def fake_check(name):
+            with lock:
+                calls.append(name)
+            time.sleep(delay)
+            if name in fail:
+                raise RuntimeError("boom")
+            return (name != "missing", f"{name} ok")
+
+        monkeypatch.setattr("aec.lib.prerequisites.check_prerequisite", fake_check)
+        return calls
+
+    def test_probes_each_name_once(self, monkeypatch):
+        """Repeated checks are answered from the memo, in input order."""
+        from aec.lib.prerequisites import PrerequisiteOracle
+
+        calls = self._counting_check(monkeypatch)
+        oracle = PrerequisiteOracle()
+        assert oracle.check(["docker", "missing"]) == [
+            ("docker", True, "docker ok"), ("missing", False, "missing ok"),
+        ]
+        oracle.check(["docker"])
+        oracle.check(["docker", "node"])
+        assert sorted(calls) == ["docker", "missing", "node"]
+
+        docker = next(t for t in oracle.timings() if t["name"] == "docker")
+        assert docker["probes"] == 1
+        assert docker["checks"] == 3
+        assert docker["available"] is True
+
+    def test_prefetch_probes_concurrently(self, monkeypatch):
+        """Slow probes overlap, and prefetching does not count as a check."""
+        import time
+
+        from aec.lib.prerequisites import PrerequisiteOracle
+
+        calls = self._counting_check(monkeypatch, delay=0.2)
+        oracle = PrerequisiteOracle()
+        start = time.monotonic()
+        oracle.prefetch(["docker", "node", "cargo", "docker"])
+        assert time.monotonic() - start < 0.5
+        assert sorted(calls) == ["cargo", "docker", "node"]
+        assert all(t["checks"] == 0 for t in oracle.timings())
+
+        oracle.check(["node"])
+        assert len(calls) == 3
+
+    def test_concurrent_callers_share_one_probe(self, monkeypatch):
+        """Lanes asking at the same time wait for the in-flight probe."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from aec.lib.prerequisites import PrerequisiteOracle
+
+        calls = self._counting_check(monkeypatch, delay=0.1)
+        oracle = PrerequisiteOracle()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: oracle.check(["docker"]), range(4)))
+        assert calls == ["docker"]
+        assert all(r == [("docker", True, "docker ok")] for r in results)
+
+    def test_ttl_reprobes_stale_results(self, monkeypatch):
+        """With a TTL, results older than it are probed again."""
+        import time
+
+        from aec.lib.prerequisites import PrerequisiteOracle
+
+        calls = self._counting_check(monkeypatch)
+        oracle = PrerequisiteOracle(ttl_seconds=0.05)
+        oracle.check(["docker"])
+        oracle.check(["docker"])
+        time.sleep(0.1)
+        oracle.check(["docker"])
+        assert calls == ["docker", "docker"]
+
+    def test_failing_check_is_reported_unavailable(self, monkeypatch):
+        """An exception in a check becomes an unavailable result."""
+        from aec.lib.prerequisites import PrerequisiteOracle
+
+        self._counting_check(monkeypatch, fail=("docker",))
+        oracle = PrerequisiteOracle()
+        assert oracle.check(["docker"]) == [("docker", False, "check failed: boom")]
@@ -1,6 +1,6 @@
 """Tests for aec.lib.profiler module — system state profiling."""
 
-import json
+import os
 import subprocess
 from pathlib import Path
 from unittest.mock import MagicMock
@@ -287,61 +287,166 @@ class TestDiffSnapshots:
         assert result["memory_delta_mb"] == 0.0
 
 
-class TestSaveProfile:
-    """Test save_profile function."""
+def _fake_proc(root: Path) -> Path:
+    """Build a minimal /proc tree: tcp tables, uptime, and four processes."""
+    (root / "net").mkdir(parents=True)
+    header = "  sl  local_address rem_address   st tx_queue rx_queue\n"
+    (root / "net" / "tcp").write_text(
+        header
+        + "   0: 0100007F:0BB8 00000000:0000 0A 00000000:00000000\n"   # 3000 LISTEN
+        + "   1: 00000000:1538 00000000:0000 0A 00000000:00000000\n"   # 5432 LISTEN
+        + "   2: 0100007F:1F90 0100007F:D431 01 00000000:00000000\n"   # 8080 ESTABLISHED
+    )
+    (root / "net" / "tcp6").write_text(
+        header
+        + "   0: 00000000000000000000000000000000:1539 00000000000000000000000000000000:0000 0A 0\n"
+    )
+    (root / "uptime").write_text("1000.00 500.00\n")
+
+    def proc(pid, comm, state, cmdline, start_ticks=0):
+        d = root / str(pid)
+        d.mkdir()
+        rest = " ".join(["0"] * 17 + [str(start_ticks)] + ["0"] * 5)
+        (d / "stat").write_text(f"{pid} ({comm}) {state} 1 {rest}\n")
+        (d / "cmdline").write_bytes(cmdline)
+
+    proc(12345, "node", "S", b"node\0server.js\0", start_ticks=40000)
+    proc(12346, "defunct", "Z", b"")
+    proc(12347, "some io (task)", "D", b"some_io_task\0")
+    proc(12348, "node", "S", b"node\0jest.config.ts\0", start_ticks=99000)
+    (root / "self").mkdir()
+    return root
+
+
+class TestProcfsBackend:
+    """Test the Linux /proc snapshot backend."""
+
+    def test_ports_from_tcp_tables(self, temp_dir):
+        """Only LISTEN sockets from tcp and tcp6 are reported."""
+        from aec.lib import profiler
 
-    def test_creates_directory_structure(self, temp_dir):
-        """Should create profiles/{project}/ directory."""
-        from aec.lib.profiler import save_profile
+        proc_root = _fake_proc(temp_dir / "proc")
+        assert profiler.snapshot_ports_procfs(proc_root) == [3000, 5432, 5433]
 
-        profile_data = {"ports": [3000], "timestamp": "2026-04-08T02:00:00Z"}
-        result = save_profile(temp_dir, "my-project", "2026-04-08T02-00-00Z", profile_data)
+    def test_process_counts_and_details(self, temp_dir, monkeypatch):
+        """Counts match the ps aux categories; details include elapsed time."""
+        from aec.lib import profiler
 
-        assert result.parent.name == "my-project"
-        assert result.parent.parent == temp_dir
-        assert result.exists()
+        monkeypatch.setattr(profiler.os, "sysconf", lambda name: 100)
+        proc_root = _fake_proc(temp_dir / "proc")
+        counts, details = profiler.snapshot_processes_procfs(proc_root)
 
-    def test_writes_valid_json(self, temp_dir):
-        """Should write valid JSON with indent=2."""
-        from aec.lib.profiler import save_profile
+        assert counts == {
+            "zombies": 1,
+            "stuck_io": 1,
+            "node_processes": 2,
+            "test_processes": 1,
+        }
+        assert details == [
+            {"pid": 12348, "command": "node jest.config.ts", "elapsed": "00:10"},
+        ]
 
-        profile_data = {"ports": [3000, 5432], "memory_mb": 128.5}
-        path = save_profile(temp_dir, "my-project", "2026-04-08T02-00-00Z", profile_data)
+    def test_format_etime_matches_ps(self):
+        """Elapsed formatting follows ps etime: mm:ss, hh:mm:ss, d-hh:mm:ss."""
+        from aec.lib.profiler import _format_etime
 
-        loaded = json.loads(path.read_text())
-        assert loaded == profile_data
+        assert _format_etime(75) == "01:15"
+        assert _format_etime(3 * 3600 + 5) == "03:00:05"
+        assert _format_etime(2 * 86400 + 61) == "2-00:01:01"
 
+    def test_take_snapshot_procfs_forks_only_for_docker(self, monkeypatch):
+        """The procfs backend keeps the snapshot shape and skips lsof/ps/pgrep."""
+        from aec.lib import profiler
 
-class TestLoadProfiles:
-    """Test load_profiles function."""
+        monkeypatch.setattr(profiler, "snapshot_ports_procfs", lambda: [3000])
+        monkeypatch.setattr(
+            profiler, "snapshot_processes_procfs",
+            lambda: ({"zombies": 0, "stuck_io": 0, "node_processes": 0, "test_processes": 0}, []),
+        )
+        called = []
 
-    def test_returns_sorted_by_timestamp(self, temp_dir):
-        """Should return profiles sorted by filename (timestamp) descending."""
-        from aec.lib.profiler import load_profiles, save_profile
+        def fake_run(args, **kwargs):
+            called.append(args[0])
+            return _make_run_mock()
 
-        save_profile(temp_dir, "proj", "2026-04-01T00-00-00Z", {"ts": "first"})
-        save_profile(temp_dir, "proj", "2026-04-03T00-00-00Z", {"ts": "third"})
-        save_profile(temp_dir, "proj", "2026-04-02T00-00-00Z", {"ts": "second"})
+        monkeypatch.setattr(subprocess, "run", fake_run)
 
-        results = load_profiles(temp_dir, "proj")
-        assert len(results) == 3
-        assert results[0]["ts"] == "third"
-        assert results[1]["ts"] == "second"
-        assert results[2]["ts"] == "first"
+        result = profiler.take_snapshot(backend="procfs")
+        assert result["ports"] == [3000]
+        assert set(result) == {
+            "ports", "processes", "process_details",
+            "docker_containers", "memory_mb", "timestamp",
+        }
+        assert called == ["docker"]
 
-    def test_returns_empty_for_missing_project(self, temp_dir):
-        """Should return empty list when project directory doesn't exist."""
-        from aec.lib.profiler import load_profiles
+    def test_auto_falls_back_to_subprocess_off_linux(self, monkeypatch):
+        """Without Linux /proc, take_snapshot uses the subprocess backend."""
+        from aec.lib import profiler
 
-        result = load_profiles(temp_dir, "nonexistent-project")
-        assert result == []
+        monkeypatch.setattr(profiler, "IS_LINUX", False)
+        monkeypatch.setattr(profiler, "IS_WINDOWS", False)
+        monkeypatch.setattr(profiler, "IS_MACOS", True)
+        called = []
 
-    def test_respects_limit(self, temp_dir):
-        """Should only return up to limit profiles."""
-        from aec.lib.profiler import load_profiles, save_profile
+        def fake_run(args, **kwargs):
+            called.append(args[0])
+            return _make_run_mock()
+
+        monkeypatch.setattr(subprocess, "run", fake_run)
+
+        profiler.take_snapshot()
+        assert "lsof" in called and "ps" in called
 
-        for i in range(5):
-            save_profile(temp_dir, "proj", f"2026-04-0{i+1}T00-00-00Z", {"idx": i})
 
-        results = load_profiles(temp_dir, "proj", limit=2)
-        assert len(results) == 2
+class TestScopeDiffToSession:
+    """Tests for listening_ports_of() and scope_diff_to_session()."""
+
+    def _proc_with_sockets(self, root: Path) -> Path:
+        proc_root = _fake_proc(root)
+        header = "  sl  local_address rem_address   st tx_queue tr retrnsmt uid timeout inode\n"
+        (proc_root / "net" / "tcp").write_text(
+            header
+            + "   0: 0100007F:0BB8 00000000:0000 0A 0:0 0:0 0 1000 0 111\n"   # 3000
+            + "   1: 00000000:1538 00000000:0000 0A 0:0 0:0 0 1000 0 222\n"   # 5432
+        )
+        fd_dir = proc_root / "12345" / "fd"
+        fd_dir.mkdir()
+        os.symlink("socket:[111]", fd_dir / "3")
+        os.symlink("/dev/null", fd_dir / "4")
+        return proc_root
+
+    def test_listening_ports_of_matches_socket_inodes(self, temp_dir, monkeypatch):
+        from aec.lib import profiler
+
+        monkeypatch.setattr(profiler, "IS_LINUX", True)
+        proc_root = self._proc_with_sockets(temp_dir / "proc")
+        assert profiler.listening_ports_of([12345], proc_root) == [3000]
+        assert profiler.listening_ports_of([12348, 99999], proc_root) == []
+
+    def test_scopes_ports_containers_and_leaks(self, temp_dir, monkeypatch):
+        from aec.lib import profiler
+
+        monkeypatch.setattr(profiler, "IS_LINUX", True)
+        proc_root = self._proc_with_sockets(temp_dir / "proc")
+        diff = {
+            "ports_new": [3000, 5432],
+            "ports_gone": [8080],
+            "docker_started": ["aecrun-lane2-db-1", "aecrun-lane1-db-1"],
+            "docker_remaining": ["aecrun-lane2-db-1", "aecrun-lane1-db-1"],
+            "processes_leaked": 3,
+            "leaked_details": [],
+            "memory_delta_mb": 40.0,
+        }
+        survivors = [{"pid": 12345, "command": "node server.js"}]
+
+        scoped = profiler.scope_diff_to_session(diff, survivors, "aecrun-lane2", proc_root)
+        assert scoped == {
+            "ports_new": [3000],
+            "docker_started": ["aecrun-lane2-db-1"],
+            "docker_remaining": ["aecrun-lane2-db-1"],
+            "processes_leaked": 1,
+            "leaked_details": survivors,
+            "scope": "session",
+        }
+        # Nothing left in the session: no ports are attributed to the suite
+        assert profiler.scope_diff_to_session(diff, [], None, proc_root)["ports_new"] == []
@@ -0,0 +1,158 @@
+"""Tests for aec.lib.report_index — the report index and report compression."""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+NOW = datetime(2026, 4, 20, tzinfo=timezone.utc)
+
+
+def _report(base, name, files=None):
+    report_dir = base / name
+    report_dir.mkdir(parents=True)
+    for filename, content in (files or {"summary.txt": "summary\n"}).items():
+        (report_dir / filename).write_text(content)
+    return report_dir
+
+
+class TestReportTime:
+    """Tests for report_time()."""
+
+    def test_parses_colon_and_dash_names(self):
+        from aec.lib.report_index import report_time
+
+        expected = datetime(2026, 10, 17, 2, 0, 0, tzinfo=timezone.utc)
+        assert report_time("2026-10-17T02:00:00Z") == expected
+        assert report_time("2026-10-17T02-00-00Z") == expected
+
+    def test_rejects_other_names(self):
+        from aec.lib.report_index import report_time
+
+        assert report_time("latest") is None
+        assert report_time("2026-10-17Tnoon") is None
+
+
+class TestLoadIndex:
+    """Tests for load_index()."""
+
+    def test_rebuilds_missing_or_corrupt_index(self, temp_dir):
+        from aec.lib.report_index import INDEX_NAME, load_index
+
+        _report(temp_dir, "2026-04-01T02:00:00Z")
+        (temp_dir / "events.jsonl").write_text("")
+
+        assert load_index(temp_dir) == {"2026-04-01T02:00:00Z": {"compressed": None}}
+        assert (temp_dir / INDEX_NAME).exists()
+
+        (temp_dir / INDEX_NAME).write_text("{not json")
+        assert list(load_index(temp_dir)) == ["2026-04-01T02:00:00Z"]
+
+    def test_reads_the_index_without_listing(self, temp_dir):
+        from aec.lib.report_index import add_report, load_index
+
+        add_report(temp_dir, "2026-04-01T02:00:00Z")
+        # Directories the index does not know about are not picked up
+        (temp_dir / "2026-04-02T02:00:00Z").mkdir()
+
+        assert list(load_index(temp_dir)) == ["2026-04-01T02:00:00Z"]
+
+    def test_missing_base_dir(self, temp_dir):
+        from aec.lib.report_index import load_index
+
+        assert load_index(temp_dir / "nope") == {}
+
+
+class TestCompressOldReports:
+    """Tests for compress_old_reports()."""
+
+    @pytest.mark.parametrize("codec", ["xz", "gzip"])
+    def test_compresses_old_reports_in_place(self, temp_dir, codec):
+        from aec.lib.report_index import (
+            CODECS,
+            INDEX_NAME,
+            compress_old_reports,
+            read_report_text,
+        )
+
+        output = "line of test output\n" * 5000
+        old = _report(temp_dir, "2026-04-01T02:00:00Z", {
+            "summary.txt": "old summary\n", "web_test_output.txt": output,
+        })
+        recent = _report(temp_dir, "2026-04-18T02:00:00Z")
+        suffix = CODECS[codec][0]
+
+        assert compress_old_reports(temp_dir, 7, codec, now=NOW) == 1
+
+        assert sorted(p.name for p in old.iterdir()) == [
+            f"summary.txt{suffix}", f"web_test_output.txt{suffix}",
+        ]
+        assert (old / f"web_test_output.txt{suffix}").stat().st_size < len(output)
+        assert read_report_text(old / "web_test_output.txt") == output
+        assert (recent / "summary.txt").exists()
+
+        index = json.loads((temp_dir / INDEX_NAME).read_text())["reports"]
+        assert index["2026-04-01T02:00:00Z"] == {"compressed": codec}
+        assert index["2026-04-18T02:00:00Z"] == {"compressed": None}
+        # Already compressed reports are skipped
+        assert compress_old_reports(temp_dir, 7, codec, now=NOW) == 0
+
+    def test_compresses_reports_named_by_the_runner(self, temp_dir):
+        from aec.lib.report_index import compress_old_reports
+        from aec.lib.reports import create_report_dir
+
+        # The runner replaces ":" with "-" in the directory name
+        timestamp = datetime(2026, 4, 1, 2, tzinfo=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        report_dir = create_report_dir(temp_dir, timestamp.replace(":", "-"))
+        (report_dir / "summary.txt").write_text("summary\n")
+
+        assert compress_old_reports(temp_dir, 7, "gzip", now=NOW) == 1
+        assert (report_dir / "summary.txt.gz").exists()
+
+    def test_rebuilt_index_detects_compressed_reports(self, temp_dir):
+        from aec.lib.report_index import INDEX_NAME, compress_old_reports, load_index
+
+        _report(temp_dir, "2026-04-01T02:00:00Z")
+        compress_old_reports(temp_dir, 7, "gzip", now=NOW)
+        (temp_dir / INDEX_NAME).unlink()
+
+        assert load_index(temp_dir) == {"2026-04-01T02:00:00Z": {"compressed": "gzip"}}
+
+    def test_rejects_unknown_codec(self, temp_dir):
+        from aec.lib.report_index import compress_old_reports
+
+        with pytest.raises(ValueError, match="zstd"):
+            compress_old_reports(temp_dir, 7, "zstd")
+
+
+class TestCompressFile:
+    """Tests for compress_file()."""
+
+    def test_failure_keeps_the_original(self, temp_dir, monkeypatch):
+        import shutil
+
+        from aec.lib.report_index import compress_file
+
+        path = temp_dir / "out.txt"
+        path.write_text("keep me")
+
+        def boom(*args):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(shutil, "copyfileobj", boom)
+        with pytest.raises(OSError):
+            compress_file(path)
+
+        assert path.read_text() == "keep me"
+        assert [p.name for p in temp_dir.iterdir()] == ["out.txt"]
+
+
+class TestReadReportText:
+    """Tests for read_report_text()."""
+
+    def test_reads_plain_files_and_reports_missing(self, temp_dir):
+        from aec.lib.report_index import read_report_text
+
+        (temp_dir / "summary.txt").write_text("plain")
+        assert read_report_text(temp_dir / "summary.txt") == "plain"
+        assert read_report_text(temp_dir / "missing.txt") is None
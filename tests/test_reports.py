@@ -239,6 +239,223 @@ class TestGenerateSummary:
         content = (report_dir / "summary.txt").read_text()
         assert "Process observations:" not in content
 
+    def test_includes_lane_section_and_project_lane(self, temp_dir):
+        """Parallel runs show each project's lane and per-lane wall clock."""
+        from aec.lib.reports import generate_summary
+
+        report_dir = self._make_report_dir(temp_dir)
+        results = [dict(r, lane=1 if r["project"] == "barevents" else 2)
+                   for r in self._sample_results()]
+        lanes = [
+            {"lane": 1, "projects": ["barevents"], "duration_seconds": 23.4},
+            {"lane": 2, "projects": ["earnlearn"], "duration_seconds": 57.3},
+        ]
+        generate_summary(
+            report_dir, results, [], [], ["barevents", "earnlearn"],
+            42, "auto", 0, lanes=lanes,
+        )
+        content = (report_dir / "summary.txt").read_text()
+        assert "barevents  [lane 1]" in content
+        assert "earnlearn  [lane 2]" in content
+        assert "Lanes:" in content
+        assert "Lane 2  57.3s  earnlearn" in content
+
+    def test_omits_lane_section_for_sequential_runs(self, temp_dir):
+        """Sequential runs have no lane annotations."""
+        from aec.lib.reports import generate_summary
+
+        report_dir = self._make_report_dir(temp_dir)
+        generate_summary(
+            report_dir, self._sample_results(), [], [], ["barevents"],
+            42, "auto", 0,
+        )
+        content = (report_dir / "summary.txt").read_text()
+        assert "Lanes:" not in content
+        assert "[lane" not in content
+
+    def test_lists_top_resource_suites(self, temp_dir):
+        """Suites with accounting are ranked by CPU and peak memory."""
+        from aec.lib.reports import generate_summary
+
+        report_dir = self._make_report_dir(temp_dir)
+        results = self._sample_results()
+        results[0]["rusage"] = {
+            "user_cpu_seconds": 10.0, "system_cpu_seconds": 2.5, "max_rss_mb": 300.0,
+        }
+        results[1]["cgroup"] = {"cpu_seconds": 40.0, "peak_memory_mb": 1200.0}
+        results[1]["rusage"] = {
+            "user_cpu_seconds": 1.0, "system_cpu_seconds": 1.0, "max_rss_mb": 50.0,
+        }
+        generate_summary(
+            report_dir, results, [], [], ["barevents", "earnlearn"], 42, "auto", 0,
+        )
+        content = (report_dir / "summary.txt").read_text()
+        cpu = content.split("Top CPU (user+system):")[1].splitlines()
+        assert f"{results[1]['project']}/{results[1]['suite']}" in cpu[1]
+        assert "40.0s" in cpu[1]
+        assert "12.5s" in cpu[2]
+        assert "1200 MB" in content.split("Top memory (peak):")[1]
+
+    def test_omits_resource_sections_without_accounting(self, temp_dir):
+        """No rusage or cgroup data means no resource sections."""
+        from aec.lib.reports import generate_summary
+
+        report_dir = self._make_report_dir(temp_dir)
+        generate_summary(
+            report_dir, self._sample_results(), [], [], ["barevents"], 42, "auto", 0,
+        )
+        content = (report_dir / "summary.txt").read_text()
+        assert "Top CPU" not in content
+        assert "Top memory" not in content
+
+    def test_cached_pass_links_original_report(self, temp_dir):
+        """Cached suites say so and point at the run that passed."""
+        from aec.lib.reports import generate_summary
+
+        report_dir = self._make_report_dir(temp_dir)
+        results = [{
+            "project": "barevents", "suite": "unit", "status": "cached-pass",
+            "cached_from": "/reports/2026-04-01T02-00-00Z",
+        }]
+        generate_summary(report_dir, results, [], [], ["barevents"], 42, "auto", 0)
+        content = (report_dir / "summary.txt").read_text()
+        assert "↺ unit          cached-pass" in content
+        assert "→ see /reports/2026-04-01T02-00-00Z" in content
+
+    def test_lists_prerequisite_probe_timings(self, temp_dir):
+        """Each prerequisite shows its probe time, probe count and check count."""
+        from aec.lib.reports import generate_summary
+
+        report_dir = self._make_report_dir(temp_dir)
+        prerequisites = [
+            {"name": "docker", "available": True, "detail": "Docker running",
+             "seconds": 0.84, "probes": 1, "checks": 14},
+            {"name": "cargo", "available": False, "detail": "not found on PATH",
+             "seconds": 0.0, "probes": 1, "checks": 2},
+        ]
+        generate_summary(
+            report_dir, self._sample_results(), [], [], ["barevents"], 42, "auto", 0,
+            prerequisites=prerequisites,
+        )
+        content = (report_dir / "summary.txt").read_text()
+        assert "Prerequisites:" in content
+        assert "✓ docker        0.84s  1 probe, 14 checks  Docker running" in content
+        assert "✗ cargo" in content
+
+    def test_records_non_default_order_strategy(self, temp_dir):
+        """History-based orderings are named next to the seed."""
+        from aec.lib.reports import generate_summary
+
+        report_dir = self._make_report_dir(temp_dir)
+        generate_summary(
+            report_dir, self._sample_results(), [], [], ["earnlearn", "barevents"],
+            42, "auto", 0, order_strategy="longest-first",
+        )
+        content = (report_dir / "summary.txt").read_text()
+        assert "Execution order: earnlearn, barevents (seed: 42, strategy: longest-first)" in content
+
+    def test_partial_summary_shows_progress(self, temp_dir):
+        """A summary written mid-run says how far the run has got."""
+        from aec.lib.reports import generate_summary
+
+        report_dir = self._make_report_dir(temp_dir)
+        generate_summary(
+            report_dir, self._sample_results(), [], [], ["earnlearn", "barevents"],
+            42, "auto", 0, progress="1 of 2 projects finished",
+        )
+        content = (report_dir / "summary.txt").read_text()
+        assert "In progress: 1 of 2 projects finished" in content
+
+    def test_governor_section_lists_utilization_and_waits(self, temp_dir):
+        """Governor decisions and utilization are summarized for parallel runs."""
+        from aec.lib.reports import generate_summary
+
+        report_dir = self._make_report_dir(temp_dir)
+        governor = {
+            "max_concurrency": 4, "peak_concurrency": 3, "mean_concurrency": 2.1,
+            "utilization": 0.525, "wait_seconds": 42.5,
+            "decisions": [
+                {"project": "earnlearn", "suite": "unit", "waited_seconds": 0.0,
+                 "waited_for": [], "predicted_mb": 256.0, "available_mb": 9000.0,
+                 "load_per_cpu": 0.3},
+                {"project": "barevents", "suite": "e2e", "waited_seconds": 42.5,
+                 "waited_for": ["memory", "load"], "predicted_mb": 1800.0,
+                 "available_mb": 2100.0, "load_per_cpu": 1.25},
+            ],
+        }
+        generate_summary(
+            report_dir, self._sample_results(), [], [], ["earnlearn", "barevents"],
+            42, "auto", 0, governor=governor,
+        )
+        content = (report_dir / "summary.txt").read_text()
+        assert "Concurrency governor:" in content
+        assert "Up to 4 suites at once; peak 3, mean 2.10 (52% utilization)" in content
+        assert "2 suites admitted, 1 deferred for 42.5s (load: 1, memory: 1)" in content
+        assert (
+            "waited   42.5s  barevents/e2e  (memory, load; 1800 MB predicted, "
+            "2100 MB available, load 1.25/CPU)"
+        ) in content
+
+    def test_lists_suites_deferred_by_the_budget(self, temp_dir):
+        """Suites left out by schedule.max_duration_minutes are listed."""
+        from aec.lib.reports import generate_summary
+
+        report_dir = self._make_report_dir(temp_dir)
+        generate_summary(
+            report_dir, self._sample_results(), [], [], ["earnlearn", "barevents"],
+            42, "auto", 0,
+            deferred=[
+                {"project": "barevents", "suite": "e2e", "expected_seconds": 1500.0,
+                 "staleness_days": 3.25},
+                {"project": "earnlearn", "suite": "load", "expected_seconds": 300.0,
+                 "staleness_days": None},
+            ],
+        )
+        content = (report_dir / "summary.txt").read_text()
+        assert "Deferred by the time budget (2, run first next time):" in content
+        assert "  barevents/e2e  ~1500s expected, last passed 3.2 days ago" in content
+        assert "  earnlearn/load  ~300s expected, never passed" in content
+
+    def test_lists_junit_counts_and_failed_tests(self, temp_dir):
+        """Suites with JUnit XML show its counts and failed tests."""
+        from aec.lib.reports import generate_summary
+
+        results = self._sample_results()
+        results[3]["junit"] = {
+            "tests": 120, "passed": 115, "failures": 2, "errors": 1, "skipped": 2,
+            "failed": [
+                {"test": "tests.test_api::test_login", "kind": "failure", "message": "401"},
+                {"test": "tests.test_api::test_crash", "kind": "error", "message": ""},
+            ],
+        }
+        report_dir = self._make_report_dir(temp_dir)
+        generate_summary(report_dir, results, [], [], ["earnlearn"], 42, "auto", 0)
+        content = (report_dir / "summary.txt").read_text()
+        assert "    junit: 120 tests, 115 passed, 3 failed, 2 skipped" in content
+        assert "      ✗ tests.test_api::test_login — 401" in content
+        assert "      ✗ tests.test_api::test_crash\n" in content
+
+    def test_lists_failing_tests_from_the_output(self, temp_dir, monkeypatch):
+        """Failing tests extracted from the output are listed, with a count of the rest."""
+        from aec.lib import reports
+
+        monkeypatch.setattr(reports, "TOP_FAILED_TESTS", 1)
+        results = self._sample_results()
+        results[3]["failures"] = {
+            "framework": "pytest",
+            "failures": [
+                {"test": "tests/test_api.py::test_login", "error": "assert 401 == 200"},
+                {"test": "tests/test_api.py::test_logout", "error": None},
+            ],
+            "omitted": 3,
+        }
+        report_dir = self._make_report_dir(temp_dir)
+        reports.generate_summary(report_dir, results, [], [], ["earnlearn"], 42, "auto", 0)
+        content = (report_dir / "summary.txt").read_text()
+        assert "    ✗ tests/test_api.py::test_login — assert 401 == 200" in content
+        assert "test_logout" not in content
+        assert "    … 4 more failing" in content
+
     def test_failed_result_references_output_file(self, temp_dir):
         """Failed results should reference the project's test output file."""
         from aec.lib.reports import generate_summary
@@ -251,6 +468,79 @@ class TestGenerateSummary:
         content = (report_dir / "summary.txt").read_text()
         assert "→ see earnlearn_test_output.txt" in content
 
+    def test_timeouts_and_survivors(self, temp_dir):
+        """Timed-out suites say so, and processes they left behind are listed."""
+        from aec.lib.reports import generate_summary
+
+        report_dir = self._make_report_dir(temp_dir)
+        results = [{
+            "project": "earnlearn", "suite": "e2e", "status": "failed",
+            "duration_seconds": 600.0, "exit_code": -1, "timed_out": True,
+            "survivors": [{"pid": 4321, "command": "chrome"}],
+        }]
+        generate_summary(report_dir, results, [], [], ["earnlearn"], 42, "auto", 0)
+        content = (report_dir / "summary.txt").read_text()
+        assert "FAILED (timed out)" in content
+        assert "! 1 process survived the suite (PIDs: 4321)" in content
+
+    def test_reruns_and_flakiness(self, temp_dir):
+        """Reruns are listed under the failure; flaky suites get their own section."""
+        from aec.lib.reports import generate_summary
+
+        report_dir = self._make_report_dir(temp_dir)
+        results = [{
+            "project": "earnlearn", "suite": "unit", "status": "failed",
+            "duration_seconds": 4.0, "exit_code": 1,
+            "reruns": [
+                {"attempt": 1, "status": "failed", "exit_code": 1, "duration_seconds": 3.5},
+                {"attempt": 2, "status": "passed", "exit_code": 0, "duration_seconds": 3.2},
+            ],
+        }]
+        generate_summary(
+            report_dir, results, [], [], ["earnlearn"], 42, "auto", 0,
+            flakiness=[{"project": "earnlearn", "suite": "unit", "score": 0.35, "runs": 20}],
+        )
+        content = (report_dir / "summary.txt").read_text()
+        assert "↻ rerun 1     3.5s   failed (exit code 1)" in content
+        assert "↻ rerun 2     3.2s   passed (flaky)" in content
+        assert "Flakiness (last 20 runs):" in content
+        assert "0.35  earnlearn/unit  (20 runs)" in content
+
+
+class TestWriteSummaryJson:
+    """Test write_summary_json function."""
+
+    def test_writes_results_totals_and_sections(self, temp_dir):
+        """summary.json holds the flat results, totals and optional sections."""
+        import json
+
+        from aec.lib.reports import SUMMARY_JSON_VERSION, write_summary_json
+
+        report_dir = temp_dir / "2026-04-08T02:00:00Z"
+        report_dir.mkdir()
+        results = [
+            {"project": "a", "suite": "unit", "status": "passed"},
+            {"project": "a", "suite": "e2e", "status": "failed"},
+            {"project": "b", "suite": "unit", "status": "passed"},
+        ]
+        port_obs = [{"type": "unregistered_port", "port": 3000}]
+
+        path = write_summary_json(
+            report_dir, results, port_obs, [], ["a", "b"], 42,
+            order_strategy="random", deferred=[],
+        )
+        assert path == report_dir / "summary.json"
+        document = json.loads(path.read_text())
+        assert document["version"] == SUMMARY_JSON_VERSION
+        assert document["report"] == "2026-04-08T02:00:00Z"
+        assert document["seed"] == 42
+        assert document["execution_order"] == ["a", "b"]
+        assert document["totals"] == {"passed": 2, "failed": 1}
+        assert document["results"] == results
+        assert document["observations"] == {"ports": port_obs, "processes": []}
+        assert document["order_strategy"] == "random"
+        assert document["deferred"] == []
+
 
 class TestCountReportDays:
     """Test count_report_days function."""
@@ -277,6 +567,16 @@ class TestCountReportDays:
 
         assert count_report_days(temp_dir / "nonexistent") == 0
 
+    def test_counts_from_the_index(self, temp_dir):
+        """Reports created by create_report_dir are counted without listing."""
+        from aec.lib.reports import count_report_days, create_report_dir
+
+        create_report_dir(temp_dir, "2026-04-01T00:00:00Z")
+        create_report_dir(temp_dir, "2026-04-02T00:00:00Z")
+        create_report_dir(temp_dir, "2026-04-02T00:00:00Z")
+
+        assert count_report_days(temp_dir) == 2
+
     def test_ignores_files(self, temp_dir):
         """Should only count directories, not files."""
         from aec.lib.reports import count_report_days
@@ -320,6 +620,28 @@ class TestPruneOldReports:
         assert deleted == 0
         assert recent_dir.exists()
 
+    def test_removes_pruned_reports_from_the_index(self, temp_dir):
+        """Pruned directories leave the index, so counts stay right."""
+        from aec.lib.reports import count_report_days, create_report_dir, prune_old_reports
+
+        create_report_dir(temp_dir, "2026-03-01T00:00:00Z")
+        create_report_dir(temp_dir, datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"))
+
+        assert prune_old_reports(temp_dir, max_days=7) == 1
+        assert count_report_days(temp_dir) == 1
+
+    def test_prunes_reports_named_by_the_runner(self, temp_dir):
+        """Directory names with "-" in the time, as the runner creates them, are pruned."""
+        from aec.lib.reports import create_report_dir, prune_old_reports
+
+        old_dir = create_report_dir(temp_dir, "2026-03-01T00-00-00Z")
+        recent = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        recent_dir = create_report_dir(temp_dir, recent.replace(":", "-"))
+
+        assert prune_old_reports(temp_dir, max_days=7) == 1
+        assert not old_dir.exists()
+        assert recent_dir.exists()
+
     def test_returns_zero_for_missing_dir(self, temp_dir):
         """Should return 0 if base_dir doesn't exist."""
         from aec.lib.reports import prune_old_reports
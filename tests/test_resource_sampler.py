@@ -0,0 +1,116 @@
+"""Tests for aec.lib.resource_sampler — per-suite process-tree sampling."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def _proc(root: Path, pid: int, ppid: int, utime=0, stime=0, cutime=0, cstime=0,
+          threads=1, rss_pages=0, fds=0):
+    d = root / str(pid)
+    (d / "fd").mkdir(parents=True)
+    for i in range(fds):
+        (d / "fd" / str(i)).write_text("")
+    # fields after comm: state ppid pgrp session tty tpgid flags minflt cminflt
+    # majflt cmajflt utime stime cutime cstime priority nice num_threads
+    # itrealvalue starttime vsize rss
+    fields = ["S", ppid, 0, 0, 0, 0, 0, 0, 0, 0, 0, utime, stime, cutime, cstime,
+              20, 0, threads, 0, 0, 0, rss_pages]
+    (d / "stat").write_text(f"{pid} (proc {pid}) " + " ".join(str(f) for f in fields) + "\n")
+
+
+class TestSampleProcessTree:
+    """Tests for sample_process_tree()."""
+
+    def test_sums_root_and_descendants_only(self, temp_dir, monkeypatch):
+        """Metrics cover the root and its descendants, not unrelated processes."""
+        from aec.lib import resource_sampler
+
+        monkeypatch.setattr(resource_sampler, "_clock_ticks", lambda: 100)
+        monkeypatch.setattr(resource_sampler, "_page_size", lambda: 4096)
+        _proc(temp_dir, 10, 1, utime=100, stime=50, threads=1, rss_pages=256, fds=3)
+        _proc(temp_dir, 11, 10, utime=200, cutime=50, threads=4, rss_pages=512, fds=5)
+        _proc(temp_dir, 12, 11, stime=100, threads=2, rss_pages=256, fds=1)
+        _proc(temp_dir, 99, 1, utime=9999, threads=50, rss_pages=99999, fds=9)
+
+        sample = resource_sampler.sample_process_tree(10, temp_dir)
+        assert sample == {
+            "rss_bytes": (256 + 512 + 256) * 4096,
+            "cpu_seconds": 5.0,
+            "threads": 7,
+            "fds": 9,
+            "processes": 3,
+        }
+
+    def test_returns_none_when_root_gone(self, temp_dir):
+        """A finished suite yields no sample."""
+        from aec.lib.resource_sampler import sample_process_tree
+
+        _proc(temp_dir, 10, 1)
+        assert sample_process_tree(11, temp_dir) is None
+
+
+class TestResourceSampler:
+    """Tests for ResourceSampler."""
+
+    def _sample(self, rss_mb, cpu, threads=1, fds=3):
+        return {"rss_bytes": rss_mb * 1024 * 1024, "cpu_seconds": cpu,
+                "threads": threads, "fds": fds, "processes": 1}
+
+    def test_summary_tracks_peaks(self):
+        """Peaks are maxima over samples; CPU is the latest cumulative total."""
+        from aec.lib.resource_sampler import ResourceSampler
+
+        sampler = ResourceSampler(interval=1.0)
+        sampler.record(self._sample(100, 1.0, threads=4, fds=10))
+        sampler.record(self._sample(300, 2.5, threads=2, fds=12))
+        sampler.record(None)
+        sampler.record(self._sample(200, 3.0, threads=3, fds=8))
+
+        summary = sampler.summary()
+        assert summary["samples"] == 3
+        assert summary["peak_rss_mb"] == 300.0
+        assert summary["cpu_seconds"] == 3.0
+        assert summary["peak_threads"] == 4
+        assert summary["peak_open_fds"] == 12
+        assert summary["series"]["columns"] == ["t", "rss_mb", "cpu_s", "threads", "fds"]
+        assert [row[1] for row in summary["series"]["rows"]] == [100.0, 300.0, 200.0]
+
+    def test_series_is_thinned_to_max_points(self):
+        """Long runs keep at most max_points rows."""
+        from aec.lib.resource_sampler import ResourceSampler
+
+        sampler = ResourceSampler(interval=1.0, max_points=10)
+        for i in range(1000):
+            sampler.record(self._sample(i, float(i)))
+        rows = sampler.summary()["series"]["rows"]
+        assert len(rows) <= 10
+        assert sampler.summary()["peak_rss_mb"] == 999.0
+
+    def test_no_summary_without_samples(self):
+        """A disabled sampler produces no profile entry."""
+        from aec.lib.resource_sampler import ResourceSampler
+
+        sampler = ResourceSampler(interval=0)
+        sampler.start(1)
+        sampler.stop()
+        assert sampler.summary() is None
+
+    def test_samples_a_real_process(self):
+        """End to end on Linux: a running child is sampled at least once."""
+        from aec.lib.resource_sampler import ResourceSampler
+
+        sampler = ResourceSampler(interval=0.02)
+        if not sampler.enabled:
+            pytest.skip("/proc sampling is Linux-only")
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(0.3)"])
+        sampler.start(proc.pid)
+        proc.wait()
+        sampler.stop()
+
+        summary = sampler.summary()
+        assert summary["samples"] >= 1
+        assert summary["peak_rss_mb"] > 0
+        assert summary["peak_threads"] >= 1
@@ -0,0 +1,113 @@
+"""Tests for aec.lib.result_cache — the skip-unchanged cache."""
+
+import shutil
+import subprocess
+import time
+
+import pytest
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=repo, check=True, capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(temp_dir):
+    path = temp_dir / "repo"
+    path.mkdir()
+    _git(path, "init", "-q")
+    (path / "app.py").write_text("print('hi')\n")
+    (path / ".gitignore").write_text("build/\n")
+    _git(path, "add", ".")
+    _git(path, "commit", "-q", "-m", "init")
+    return path
+
+
+class TestRepoFingerprint:
+    """Tests for repo_fingerprint()."""
+
+    def test_not_a_git_repo(self, temp_dir):
+        """Non-git projects are never cached."""
+        from aec.lib.result_cache import repo_fingerprint
+
+        assert repo_fingerprint(temp_dir) is None
+
+    def test_clean_tree_has_empty_dirty_hash(self, repo):
+        """A clean checkout is identified by HEAD alone."""
+        from aec.lib.result_cache import repo_fingerprint
+
+        fp = repo_fingerprint(repo)
+        assert len(fp["head"]) == 40
+        assert fp["dirty"] == ""
+
+    def test_edits_and_untracked_files_change_dirty_hash(self, repo):
+        """Tracked edits and untracked files count; ignored files do not."""
+        from aec.lib.result_cache import repo_fingerprint
+
+        (repo / "build").mkdir()
+        (repo / "build" / "out.js").write_text("ignored")
+        assert repo_fingerprint(repo)["dirty"] == ""
+
+        (repo / "app.py").write_text("print('changed')\n")
+        edited = repo_fingerprint(repo)["dirty"]
+        assert edited
+
+        (repo / "new.py").write_text("x = 1\n")
+        with_new = repo_fingerprint(repo)["dirty"]
+        assert with_new != edited
+
+        (repo / "new.py").write_text("x = 2\n")
+        assert repo_fingerprint(repo)["dirty"] != with_new
+
+
+class TestSuiteCacheKey:
+    """Tests for suite_cache_key()."""
+
+    def test_key_covers_command_and_lockfiles(self, repo):
+        """Changing the command, a lockfile or a cache_inputs file changes the key."""
+        from aec.lib.result_cache import repo_fingerprint, suite_cache_key
+
+        fp = repo_fingerprint(repo)
+        (repo / "uv.lock").write_text("a")
+        (repo / "fixtures.json").write_text("{}")
+        suite = {"command": "pytest", "cache_inputs": ["fixtures.json"]}
+        key = suite_cache_key(repo, fp, suite)
+
+        assert suite_cache_key(repo, fp, dict(suite)) == key
+        assert suite_cache_key(repo, fp, dict(suite, command="pytest -x")) != key
+        (repo / "uv.lock").write_text("b")
+        lock_changed = suite_cache_key(repo, fp, suite)
+        assert lock_changed != key
+        (repo / "fixtures.json").write_text("[]")
+        assert suite_cache_key(repo, fp, suite) != lock_changed
+
+
+class TestResultCache:
+    """Tests for ResultCache."""
+
+    def test_lookup_record_forget_and_ttl(self, temp_dir):
+        """Hits need the same key and a fresh entry; failures clear it."""
+        from aec.lib.history_store import connect, set_cached_pass
+        from aec.lib.result_cache import ResultCache
+
+        db = temp_dir / "history.db"
+        cache = ResultCache(db, ttl_seconds=3600)
+        assert cache.lookup("web", "unit", "k1") is None
+
+        cache.record_pass("web", "unit", "k1", temp_dir / "2026-04-01T02-00-00Z")
+        hit = cache.lookup("web", "unit", "k1")
+        assert hit["report_dir"] == str(temp_dir / "2026-04-01T02-00-00Z")
+        assert cache.lookup("web", "unit", "k2") is None
+
+        cache.forget("web", "unit")
+        assert cache.lookup("web", "unit", "k1") is None
+
+        conn = connect(db)
+        set_cached_pass(conn, "web", "unit", "k1", "old", verified_at=time.time() - 7200)
+        conn.close()
+        assert cache.lookup("web", "unit", "k1") is None
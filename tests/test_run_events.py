@@ -0,0 +1,107 @@
+"""Tests for aec.lib.run_events — the live event stream of a scheduled run."""
+
+import json
+
+
+class TestEventStream:
+    """Tests for EventStream and read_events()."""
+
+    def test_emits_one_json_line_per_event(self, temp_dir):
+        from aec.lib.run_events import EventStream, read_events
+
+        stream = EventStream(temp_dir / "events.jsonl")
+        stream.emit("run_started", seed=42, projects=["a"])
+        stream.emit("suite_started", project="a", suite="unit")
+
+        # Line-buffered: readable before the stream is closed
+        events, offset = read_events(temp_dir / "events.jsonl")
+        assert [e["event"] for e in events] == ["run_started", "suite_started"]
+        assert events[0]["seed"] == 42
+        assert isinstance(events[0]["ts"], float)
+
+        stream.emit("run_finished", passed=1)
+        stream.close()
+        events, offset = read_events(temp_dir / "events.jsonl", offset)
+        assert [e["event"] for e in events] == ["run_finished"]
+
+    def test_new_stream_truncates_previous_run(self, temp_dir):
+        from aec.lib.run_events import EventStream
+
+        path = temp_dir / "events.jsonl"
+        EventStream(path).emit("run_started", seed=1)
+        EventStream(path).emit("run_started", seed=2)
+        lines = path.read_text().splitlines()
+        assert [json.loads(line)["seed"] for line in lines] == [2]
+
+    def test_read_events_leaves_partial_line(self, temp_dir):
+        from aec.lib.run_events import read_events
+
+        path = temp_dir / "events.jsonl"
+        path.write_text('{"event": "run_started"}\n{"event": "suite_st')
+        events, offset = read_events(path)
+        assert [e["event"] for e in events] == ["run_started"]
+
+        with open(path, "a") as fh:
+            fh.write('arted"}\n')
+        events, offset = read_events(path, offset)
+        assert [e["event"] for e in events] == ["suite_started"]
+
+    def test_read_events_restarts_after_truncation(self, temp_dir):
+        from aec.lib.run_events import read_events
+
+        path = temp_dir / "events.jsonl"
+        path.write_text('{"event": "run_started", "seed": 1}\n' * 3)
+        _events, offset = read_events(path)
+        path.write_text('{"event": "run_started", "seed": 2}\n')
+        events, offset = read_events(path, offset)
+        assert [e["seed"] for e in events] == [2]
+        assert offset == path.stat().st_size
+        assert read_events(temp_dir / "missing.jsonl") == ([], 0)
+
+
+class TestRunProgress:
+    """Tests for RunProgress."""
+
+    def _progress(self):
+        from aec.lib.run_events import RunProgress
+
+        progress = RunProgress()
+        for event in [
+            {"event": "run_started", "ts": 0.0, "seed": 42, "projects": ["a", "b", "c"], "lanes": 2},
+            {"event": "project_started", "ts": 0.0, "project": "a", "suites": ["unit", "e2e"], "lane": 1},
+            {"event": "suite_started", "ts": 0.0, "project": "a", "suite": "unit", "lane": 1},
+            {"event": "suite_finished", "ts": 10.0, "project": "a", "suite": "unit",
+             "status": "failed", "duration_seconds": 10.0},
+            {"event": "observation", "ts": 10.0, "project": "a", "suite": "unit", "type": "port"},
+            {"event": "suite_started", "ts": 10.0, "project": "a", "suite": "e2e", "lane": 1},
+            {"event": "project_finished", "ts": 12.0, "project": "b", "status": "passed"},
+        ]:
+            progress.apply(event)
+        return progress
+
+    def test_folds_events_per_project(self):
+        progress = self._progress()
+        a = progress.projects["a"]
+        assert a["status"] == "running"
+        assert a["current"] == "e2e"
+        assert (a["done"], a["failed"], a["elapsed"]) == (1, 1, 10.0)
+        assert progress.projects["b"]["status"] == "passed"
+        assert progress.projects["c"]["status"] == "queued"
+        assert progress.observations == 1
+
+    def test_eta_spreads_remaining_history_over_lanes(self):
+        progress = self._progress()
+        # a: 100s expected, 10s done + 20s into e2e; c: 50s; b is finished
+        eta, unknown = progress.eta_seconds({"a": 100.0, "b": 30.0, "c": 50.0}, now=30.0)
+        assert eta == (70.0 + 50.0) / 2
+        assert unknown == 0
+
+        eta, unknown = progress.eta_seconds({"a": 100.0}, now=30.0)
+        assert eta == 35.0
+        assert unknown == 1
+
+    def test_run_started_resets_progress(self):
+        progress = self._progress()
+        progress.apply({"event": "run_started", "ts": 100.0, "projects": ["z"]})
+        assert list(progress.projects) == ["z"]
+        assert progress.observations == 0
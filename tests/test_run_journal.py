@@ -0,0 +1,114 @@
+"""Tests for aec.lib.run_journal — the resumable journal of a scheduled run."""
+
+from pathlib import Path
+
+
+def _journal(temp_dir: Path):
+    from aec.lib.run_journal import JOURNAL_NAME, RunJournal
+
+    return RunJournal.create(
+        temp_dir / "2026-04-08T02-00-00Z" / JOURNAL_NAME,
+        "2026-04-08T02:00:00Z", 42, "longest-first",
+        order=["/repos/a", "/repos/b"],
+    )
+
+
+class TestRunJournal:
+    """Tests for RunJournal."""
+
+    def test_round_trips_suites_and_projects(self, temp_dir):
+        from aec.lib.run_journal import RunJournal
+
+        journal = _journal(temp_dir)
+        obs = {"type": "process_leak", "message": "leaked"}
+        journal.record_suite(
+            "/repos/a", "a", "unit",
+            {"status": "passed", "output": "tail", "output_path": "/r/a.txt"},
+            profile={"status": "passed"}, observations=[obs],
+        )
+        journal.record_suite("/repos/a", "a", "e2e", {"status": "failed", "output": "boom"})
+        journal.finish_project(
+            "/repos/a",
+            {"project": "a", "status": "failed", "suites": {}, "observations": []},
+        )
+        journal.record_suite("/repos/b", "b", "unit", {"status": "passed"})
+
+        loaded = RunJournal.load(journal.path)
+        assert loaded.seed == 42
+        assert loaded.order_strategy == "longest-first"
+        assert loaded.order == ["/repos/a", "/repos/b"]
+        assert loaded.lanes is None
+        assert not loaded.complete
+        assert loaded.finished_count() == 1
+
+        result = loaded.project_result("/repos/a")
+        assert result["status"] == "failed"
+        # The output tail is dropped once the full log is on disk
+        assert result["suites"]["unit"] == {"status": "passed", "output_path": "/r/a.txt"}
+        assert result["suites"]["e2e"]["output"] == "boom"
+        assert result["profiles"] == {"unit": {"status": "passed"}}
+        assert result["observations"] == [obs]
+
+        assert loaded.project_result("/repos/b") is None
+        assert loaded.completed_suites("/repos/b") == {
+            "unit": {"result": {"status": "passed"}, "profile": None, "observations": []},
+        }
+        assert loaded.completed_suites("/repos/c") == {}
+
+    def test_records_budget_deferrals(self, temp_dir):
+        from aec.lib.run_journal import JOURNAL_NAME, RunJournal
+
+        deferred = [{"path": "/repos/a", "project": "a", "suite": "e2e"}]
+        journal = RunJournal.create(
+            temp_dir / JOURNAL_NAME, "2026-04-08T02:00:00Z", 42, "random",
+            order=["/repos/a"], deferred=deferred,
+        )
+        assert RunJournal.load(journal.path).deferred == deferred
+
+    def test_ignores_torn_last_line(self, temp_dir):
+        from aec.lib.run_journal import RunJournal
+
+        journal = _journal(temp_dir)
+        journal.record_suite("/repos/a", "a", "unit", {"status": "passed"})
+        with open(journal.path, "a") as fh:
+            fh.write('{"type": "suite", "path": "/repos/a", "su')
+
+        loaded = RunJournal.load(journal.path)
+        assert list(loaded.completed_suites("/repos/a")) == ["unit"]
+
+    def test_load_rejects_missing_or_headless_files(self, temp_dir):
+        from aec.lib.run_journal import RunJournal
+
+        assert RunJournal.load(temp_dir / "missing.jsonl") is None
+        path = temp_dir / "journal.jsonl"
+        path.write_text('{"type": "suite", "path": "/repos/a", "suite": "unit"}\n')
+        assert RunJournal.load(path) is None
+
+
+class TestFindResumable:
+    """Tests for find_resumable()."""
+
+    def test_returns_newest_incomplete_run(self, temp_dir):
+        from aec.lib.run_journal import find_resumable
+
+        journal = _journal(temp_dir)
+        assert find_resumable(temp_dir).path == journal.path
+
+        journal.mark_complete()
+        assert find_resumable(temp_dir) is None
+
+    def test_only_the_newest_run_is_considered(self, temp_dir):
+        from aec.lib.run_journal import JOURNAL_NAME, RunJournal, find_resumable
+
+        _journal(temp_dir)
+        newer = RunJournal.create(
+            temp_dir / "2026-04-09T02-00-00Z" / JOURNAL_NAME,
+            "2026-04-09T02:00:00Z", 7, "random", order=[],
+        )
+        newer.mark_complete()
+        assert find_resumable(temp_dir) is None
+
+    def test_missing_tests_dir(self, temp_dir):
+        from aec.lib.run_journal import find_resumable
+
+        assert find_resumable(temp_dir / "nope") is None
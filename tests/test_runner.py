@@ -1,49 +1,142 @@
 """Tests for aec/lib/runner.py — the core test runner."""
 
+import os
 import subprocess
+import sys
 import time
 from pathlib import Path
 
 import pytest
 
 
+def _fake_popen(returncode: int = 0, timeout: bool = False):
+    """Return a subprocess.Popen stand-in whose wait() yields ``returncode``.
+
+    With ``timeout=True`` the first timed wait raises TimeoutExpired, as a
+    suite that never finishes would.
+    """
+
+    class FakePopen:
+        pid = 424242
+
+        def __init__(self, *args, **kwargs):
+            self.args = args
+            self.kwargs = kwargs
+            self.returncode = None
+            self.timed_out = False
+
+        def wait(self, timeout_s=None, **kwargs):
+            timeout_s = kwargs.get("timeout", timeout_s)
+            if timeout and timeout_s is not None and not self.timed_out:
+                self.timed_out = True
+                raise subprocess.TimeoutExpired(cmd=self.args[0], timeout=timeout_s)
+            self.returncode = -9 if timeout else returncode
+            return self.returncode
+
+        def poll(self):
+            return self.returncode
+
+        def kill(self):
+            self.returncode = -9
+
+    return FakePopen
+
+
+def _use_fake_popen(monkeypatch, popen_cls) -> None:
+    """Install a fake Popen, and keep timeouts from signalling its made-up pid.
+
+    ``kill_process_group`` would otherwise ``killpg`` whatever process group
+    on this machine happens to have the fake's pid.
+    """
+    monkeypatch.setattr(subprocess, "Popen", popen_cls)
+    monkeypatch.setattr(
+        "aec.lib.suite_limits.kill_process_group",
+        lambda proc, grace_seconds=None: proc.kill(),
+    )
+
+
 class TestExecuteSuite:
     """Tests for execute_suite()."""
 
-    def test_captures_output_and_exit_code(self, monkeypatch):
+    def test_captures_output_and_exit_code(self, tmp_path):
         """execute_suite returns stdout, exit code, and status."""
         from aec.lib.runner import execute_suite
 
-        fake_result = subprocess.CompletedProcess(
-            args="echo hello",
-            returncode=0,
-            stdout="hello\n",
-            stderr="",
-        )
-        monkeypatch.setattr(subprocess, "run", lambda *a, **kw: fake_result)
-
-        result = execute_suite(Path("/tmp"), "unit", {"command": "echo hello"})
+        result = execute_suite(tmp_path, "unit", {"command": "echo hello"})
         assert result["status"] == "passed"
         assert result["exit_code"] == 0
         assert "hello" in result["output"]
 
-    def test_failed_exit_code(self, monkeypatch):
-        """execute_suite returns 'failed' for non-zero exit code."""
+    @pytest.mark.skipif(not hasattr(os, "wait4"), reason="wait4 is POSIX-only")
+    def test_records_rusage_of_the_suite(self, tmp_path):
+        """The suite's own CPU time and max RSS are captured when it is reaped."""
         from aec.lib.runner import execute_suite
 
-        fake_result = subprocess.CompletedProcess(
-            args="false",
-            returncode=1,
-            stdout="",
-            stderr="error occurred",
-        )
-        monkeypatch.setattr(subprocess, "run", lambda *a, **kw: fake_result)
+        command = f"{sys.executable} -c \"sum(range(3_000_000))\""
+        result = execute_suite(tmp_path, "cpu", {"command": command})
+        assert result["status"] == "passed"
+        rusage = result["rusage"]
+        assert rusage["user_cpu_seconds"] + rusage["system_cpu_seconds"] > 0
+        assert rusage["max_rss_mb"] > 0
+
+    def test_failed_exit_code(self, tmp_path):
+        """execute_suite returns 'failed' for non-zero exit code and keeps stderr."""
+        from aec.lib.runner import execute_suite
 
-        result = execute_suite(Path("/tmp"), "lint", {"command": "false"})
+        result = execute_suite(
+            tmp_path, "lint", {"command": "echo error occurred 1>&2 && exit 1"}
+        )
         assert result["status"] == "failed"
         assert result["exit_code"] == 1
         assert "error occurred" in result["output"]
 
+    def test_extracts_failing_tests_of_a_failed_suite(self, tmp_path):
+        """Failing test names and errors are pulled from this suite's output only."""
+        from aec.lib.runner import execute_suite
+
+        output_path = tmp_path / "proj_test_output.txt"
+        output_path.write_text("=== older ===\n--- FAIL: TestOlder (0.00s)\n")
+        command = "printf -- '--- FAIL: TestAdd (0.01s)\\n    add_test.go:9: got 4\\n'; exit 1"
+
+        result = execute_suite(
+            tmp_path, "fw:go_test", {"command": command}, output_path=output_path,
+        )
+        assert result["failures"] == {
+            "framework": "go_test",
+            "failures": [{"test": "TestAdd", "error": "add_test.go:9: got 4"}],
+            "omitted": 0,
+        }
+        passed = execute_suite(tmp_path, "unit", {"command": "echo '--- FAIL: TestX'"})
+        assert "failures" not in passed
+
+    def test_streams_output_to_file(self, tmp_path):
+        """With output_path, suites append under a header and the path is recorded."""
+        from aec.lib.runner import execute_suite
+
+        out = tmp_path / "reports" / "proj_test_output.txt"
+        first = execute_suite(tmp_path, "unit", {"command": "echo one"}, out)
+        execute_suite(tmp_path, "lint", {"command": "echo two"}, out)
+
+        content = out.read_text()
+        assert content.index("=== unit ===") < content.index("one")
+        assert content.index("one") < content.index("=== lint ===") < content.index("two")
+        assert first["output_path"] == str(out)
+        assert first["output"].strip() == "one"
+
+    def test_output_tail_is_bounded(self, tmp_path, monkeypatch):
+        """Only the last OUTPUT_TAIL_BYTES stay in memory; the file keeps everything."""
+        import aec.lib.runner as runner
+
+        monkeypatch.setattr(runner, "OUTPUT_TAIL_BYTES", 64)
+        out = tmp_path / "proj_test_output.txt"
+        command = "python3 -c \"for i in range(200): print('line', i)\""
+        result = runner.execute_suite(tmp_path, "big", {"command": command}, out)
+
+        assert len(result["output"].encode()) <= 64
+        assert result["output"].startswith("line ")
+        assert result["output"].rstrip().endswith("line 199")
+        assert "line 0\n" in out.read_text()
+
     def test_measures_duration(self, monkeypatch):
         """execute_suite records duration_seconds."""
         from aec.lib.runner import execute_suite
@@ -58,10 +151,7 @@ class TestExecuteSuite:
 
         monkeypatch.setattr(time, "monotonic", fake_monotonic)
 
-        fake_result = subprocess.CompletedProcess(
-            args="sleep 0.5", returncode=0, stdout="", stderr=""
-        )
-        monkeypatch.setattr(subprocess, "run", lambda *a, **kw: fake_result)
+        _use_fake_popen(monkeypatch, _fake_popen(0))
 
         result = execute_suite(Path("/tmp"), "slow", {"command": "sleep 0.5"})
         assert result["duration_seconds"] == 0.5
@@ -70,15 +160,92 @@ class TestExecuteSuite:
         """execute_suite returns failed status on timeout."""
         from aec.lib.runner import execute_suite
 
-        def raise_timeout(*args, **kwargs):
-            raise subprocess.TimeoutExpired(cmd="hang", timeout=3600)
-
-        monkeypatch.setattr(subprocess, "run", raise_timeout)
+        _use_fake_popen(monkeypatch, _fake_popen(timeout=True))
 
         result = execute_suite(Path("/tmp"), "hang", {"command": "hang"})
         assert result["status"] == "failed"
         assert result["exit_code"] == -1
         assert "timed out" in result["output"]
+        assert "after 3600 seconds" in result["output"]
+        assert result["timed_out"] is True
+
+    def test_uses_suite_timeout_and_new_session(self, monkeypatch):
+        """timeout_seconds from the suite config bounds the wait."""
+        from aec.lib.runner import execute_suite
+
+        spawned = []
+
+        class RecordingPopen(_fake_popen(timeout=True)):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                spawned.append(self)
+
+        _use_fake_popen(monkeypatch, RecordingPopen)
+
+        result = execute_suite(
+            Path("/tmp"), "hang", {"command": "hang", "timeout_seconds": 30}
+        )
+        assert "timed out after 30 seconds" in result["output"]
+        assert result["limits"] == {"timeout_seconds": 30.0}
+        if sys.platform != "win32":
+            assert spawned[0].kwargs["start_new_session"] is True
+
+    @pytest.mark.parametrize("applied", [True, False])
+    def test_records_whether_the_cgroup_memory_cap_applied(self, monkeypatch, applied):
+        """max_memory_mb is best-effort in the cgroup; limits say whether it took."""
+        from aec.lib.runner import execute_suite
+
+        class FakeCgroup:
+            def attach(self, pid):
+                return True
+
+            def set_memory_max(self, megabytes):
+                return applied
+
+            def read(self):
+                return None
+
+            def remove(self):
+                return True
+
+        monkeypatch.setattr("aec.lib.suite_accounting.SuiteCgroup.create", lambda: FakeCgroup())
+        result = execute_suite(Path("/tmp"), "unit", {"command": "true", "max_memory_mb": 512})
+        assert result["limits"]["max_memory_mb"] == 512
+        assert result["limits"]["cgroup_memory_max"] is applied
+
+    @pytest.mark.skipif(not os.path.isdir("/proc/self"), reason="needs /proc")
+    def test_timeout_kills_grandchildren(self, tmp_path):
+        """A timed-out suite's background processes die with it."""
+        from aec.lib.runner import execute_suite
+
+        pid_file = tmp_path / "child.pid"
+        command = f"sleep 60 & echo $! > {pid_file}; wait"
+        result = execute_suite(
+            tmp_path, "hang", {"command": command, "timeout_seconds": 0.5}
+        )
+        assert result["timed_out"] is True
+        assert "survivors" not in result
+        child = pid_file.read_text().strip()
+        assert not os.path.exists(f"/proc/{child}") or "Z" in (
+            Path(f"/proc/{child}/stat").read_text().rsplit(")", 1)[1].split()[:1]
+        )
+
+    @pytest.mark.skipif(not os.path.isdir("/proc/self"), reason="needs /proc")
+    def test_reports_processes_left_behind(self, tmp_path):
+        """Processes a passing suite leaves in its session are listed."""
+        import signal
+
+        from aec.lib.runner import execute_suite
+
+        result = execute_suite(
+            tmp_path, "leaky", {"command": "sleep 30 > /dev/null 2>&1 &"}
+        )
+        try:
+            assert result["status"] == "passed"
+            assert [s["command"] for s in result["survivors"]] == ["sleep 30"]
+        finally:
+            for survivor in result.get("survivors", []):
+                os.kill(survivor["pid"], signal.SIGKILL)
 
     def test_no_command_returns_failed(self):
         """execute_suite returns failed when no command is specified."""
@@ -166,6 +333,26 @@ class TestCheckProjectPrerequisites:
         assert passed is False
         assert len(failures) == 1
 
+    def test_answers_from_oracle_when_given(self, monkeypatch):
+        """A run-scoped oracle replaces direct checks."""
+        from aec.lib.prerequisites import PrerequisiteOracle
+        from aec.lib.runner import check_project_prerequisites
+
+        monkeypatch.setattr(
+            "aec.lib.prerequisites.check_prerequisites",
+            lambda prereqs: pytest.fail("checked directly"),
+        )
+        monkeypatch.setattr(
+            "aec.lib.prerequisites.check_prerequisite",
+            lambda name: (False, "Docker not running"),
+        )
+        oracle = PrerequisiteOracle()
+        passed, failures = check_project_prerequisites(
+            {"test": {"prerequisites": ["docker"]}}, oracle,
+        )
+        assert not passed
+        assert failures == ["docker: Docker not running"]
+
     def test_passes_with_empty_prerequisites(self):
         """Returns (True, []) when there are no prerequisites."""
         from aec.lib.runner import check_project_prerequisites
@@ -323,22 +510,50 @@ class TestRunSingleProject:
         monkeypatch.setattr(
             "aec.lib.profiler.diff_snapshots",
             lambda before, after: {
-                "new_ports": [],
+                "ports_new": [],
                 "closed_ports": [],
                 "new_processes": [],
                 "ended_processes": [],
             },
         )
 
-        fake_result = subprocess.CompletedProcess(
-            args="pytest", returncode=0, stdout="all passed\n", stderr=""
-        )
-        monkeypatch.setattr(subprocess, "run", lambda *a, **kw: fake_result)
+        _use_fake_popen(monkeypatch, _fake_popen(0))
 
         result = run_single_project(Path("/tmp/test-proj"))
         assert result["status"] == "passed"
         assert result["suites"]["unit"]["status"] == "passed"
 
+    def test_summarizes_junit_written_by_the_suite(self, monkeypatch, tmp_path):
+        """A suite's fresh JUnit XML is summarized; stale files are ignored."""
+        from aec.lib.runner import run_single_project
+
+        (tmp_path / "old.xml").write_text('<testsuite><testcase name="stale"/></testsuite>')
+        os.utime(tmp_path / "old.xml", (0, 0))
+        xml = (
+            '<testsuite><testcase classname="t" name="ok"/>'
+            '<testcase classname="t" name="bad"><failure message="boom"/></testcase></testsuite>'
+        )
+        monkeypatch.setattr(
+            "aec.lib.aec_json.load_aec_json",
+            lambda path: {
+                "project": {"name": "test-proj"},
+                "test": {
+                    "suites": {"unit": {"command": f"echo '{xml}' > new.xml", "junit": "*.xml"}},
+                    "scheduled": ["unit"],
+                },
+            },
+        )
+        monkeypatch.setattr(
+            "aec.lib.ports.load_registry", lambda path: {"version": "1.0.0", "ports": {}},
+        )
+        monkeypatch.setattr("aec.lib.profiler.take_snapshot", lambda: {})
+        monkeypatch.setattr("aec.lib.profiler.diff_snapshots", lambda before, after: {})
+
+        junit = run_single_project(tmp_path)["suites"]["unit"]["junit"]
+        assert junit["files"] == 1
+        assert (junit["tests"], junit["passed"], junit["failures"]) == (2, 1, 1)
+        assert junit["failed"] == [{"test": "t::bad", "kind": "failure", "message": "boom"}]
+
     def test_skips_when_no_aec_json(self, monkeypatch):
         """Project is skipped when .aec.json does not exist."""
         from aec.lib.runner import run_single_project
@@ -383,17 +598,14 @@ class TestRunSingleProject:
         monkeypatch.setattr(
             "aec.lib.profiler.diff_snapshots",
             lambda before, after: {
-                "new_ports": [],
+                "ports_new": [],
                 "closed_ports": [],
                 "new_processes": [],
                 "ended_processes": [],
             },
         )
 
-        fake_result = subprocess.CompletedProcess(
-            args="test", returncode=0, stdout="ok\n", stderr=""
-        )
-        monkeypatch.setattr(subprocess, "run", lambda *a, **kw: fake_result)
+        _use_fake_popen(monkeypatch, _fake_popen(0))
 
         result = run_single_project(Path("/tmp/test-proj"), run_all=True)
         assert "unit" in result["suites"]
@@ -441,14 +653,21 @@ def _patch_run_all_dependencies(monkeypatch):
     monkeypatch.setattr(
         "aec.lib.profiler.diff_snapshots",
         lambda before, after: {
-            "new_ports": [],
+            "ports_new": [],
             "closed_ports": [],
             "new_processes": [],
             "ended_processes": [],
         },
     )
+    from aec.lib.history_store import connect
+
+    monkeypatch.setattr(
+        "aec.lib.history_store.connect",
+        lambda db_path, legacy_profiles_dir=None: connect(Path(":memory:")),
+    )
     monkeypatch.setattr(
-        "aec.lib.profiler.save_profile", lambda profiles_dir, project_name, timestamp, profile_data: None
+        "aec.lib.history_store.record_run",
+        lambda conn, project, timestamp, profiles, created_at=None: 1,
     )
     monkeypatch.setattr(
         "aec.lib.reports.create_report_dir",
@@ -460,16 +679,20 @@ def _patch_run_all_dependencies(monkeypatch):
     )
     monkeypatch.setattr(
         "aec.lib.reports.generate_summary",
-        lambda *args: Path("/tmp/reports/summary.json"),
+        lambda *args, **kwargs: Path("/tmp/reports/summary.txt"),
+    )
+    monkeypatch.setattr(
+        "aec.lib.reports.write_summary_json",
+        lambda *args, **kwargs: Path("/tmp/reports/summary.json"),
     )
     monkeypatch.setattr("aec.lib.reports.open_report", lambda path, viewer=None: None)
     monkeypatch.setattr("aec.lib.reports.count_report_days", lambda base: 0)
     monkeypatch.setattr("aec.lib.preferences.get_setting", lambda key: None)
 
-    fake_result = subprocess.CompletedProcess(
-        args="pytest", returncode=0, stdout="ok\n", stderr=""
-    )
-    monkeypatch.setattr(subprocess, "run", lambda *a, **kw: fake_result)
+    monkeypatch.setattr("aec.lib.config.AEC_HISTORY_DB", Path("/tmp/aec-history.db"))
+    monkeypatch.setattr("aec.lib.result_cache.repo_fingerprint", lambda project_dir: None)
+
+    _use_fake_popen(monkeypatch, _fake_popen(0))
 
 
 class TestRunAllProjects:
@@ -544,9 +767,10 @@ class TestAnalyzePortObservations:
 
     def test_detects_unregistered_ports(self):
         """Unregistered ports appear as observations."""
+        from aec.lib.profiler import diff_snapshots
         from aec.lib.runner import analyze_port_observations
 
-        diff = {"new_ports": [8080, 3000]}
+        diff = diff_snapshots({"ports": [22]}, {"ports": [22, 8080, 3000]})
         registry = {"version": "1.0.0", "ports": {"3000": {"port": 3000, "project": "web"}}}
 
         observations = analyze_port_observations("my-proj", diff, registry, True)
@@ -556,9 +780,10 @@ class TestAnalyzePortObservations:
 
     def test_no_observations_when_disabled(self):
         """No observations when port management is disabled."""
+        from aec.lib.profiler import diff_snapshots
         from aec.lib.runner import analyze_port_observations
 
-        diff = {"new_ports": [8080]}
+        diff = diff_snapshots({"ports": [22]}, {"ports": [22, 8080]})
         registry = {"version": "1.0.0", "ports": {}}
 
         observations = analyze_port_observations("my-proj", diff, registry, False)
@@ -566,14 +791,38 @@ class TestAnalyzePortObservations:
 
     def test_no_observations_when_all_registered(self):
         """No observations when all ports are registered."""
+        from aec.lib.profiler import diff_snapshots
         from aec.lib.runner import analyze_port_observations
 
-        diff = {"new_ports": [3000]}
+        diff = diff_snapshots({"ports": [22]}, {"ports": [22, 3000]})
         registry = {"version": "1.0.0", "ports": {"3000": {"port": 3000, "project": "web"}}}
 
         observations = analyze_port_observations("my-proj", diff, registry, True)
         assert observations == []
 
+    def test_offset_ports_count_as_registered(self):
+        """A lane's shifted copy of a registered port is not flagged."""
+        from aec.lib.profiler import diff_snapshots
+        from aec.lib.runner import analyze_port_observations
+
+        diff = diff_snapshots({"ports": [22]}, {"ports": [22, 3100, 3101]})
+        registry = {"version": "1.0.0", "ports": {"3000": {"port": 3000, "project": "web"}}}
+
+        observations = analyze_port_observations("my-proj", diff, registry, True, port_offset=100)
+        assert [o["port"] for o in observations] == [3101]
+
+
+    def test_other_lanes_ports_count_as_registered(self):
+        """A registered port shifted for any lane of the run is not flagged."""
+        from aec.lib.profiler import diff_snapshots
+        from aec.lib.runner import analyze_port_observations
+
+        diff = diff_snapshots({"ports": [22]}, {"ports": [22, 3000, 3200, 3300]})
+        registry = {"version": "1.0.0", "ports": {"3000": {"port": 3000, "project": "web"}}}
+
+        observations = analyze_port_observations("my-proj", diff, registry, True, lanes=3)
+        assert [o["port"] for o in observations] == [3300]
+
 
 class TestAnalyzeProcessObservations:
     """Tests for analyze_process_observations()."""
@@ -623,7 +872,10 @@ class TestApplyRetention:
             lambda base, keep: prune_profiles_calls.append((base, keep)) or 0,
         )
 
+        monkeypatch.setattr("aec.lib.report_index.compress_old_reports", lambda *args: 0)
+
         config = {"retention": {"report_mode": "auto", "report_days": 14, "profile_days": 60}}
+        monkeypatch.setattr("aec.lib.config.AEC_HISTORY_DB", Path("/nonexistent/history.db"))
         apply_retention(config)
 
         assert len(prune_reports_calls) == 1
@@ -631,6 +883,26 @@ class TestApplyRetention:
         assert len(prune_profiles_calls) == 1
         assert prune_profiles_calls[0][1] == 60
 
+    def test_compresses_old_reports_when_auto(self, monkeypatch):
+        """Reports past compress_after_days are compressed with the configured codec."""
+        from aec.lib.runner import apply_retention
+
+        compress_calls = []
+        monkeypatch.setattr("aec.lib.reports.prune_old_reports", lambda base, keep: 0)
+        monkeypatch.setattr("aec.lib.reports.prune_old_profiles", lambda base, keep: 0)
+        monkeypatch.setattr(
+            "aec.lib.report_index.compress_old_reports",
+            lambda base, days, codec: compress_calls.append((days, codec)) or 0,
+        )
+        monkeypatch.setattr("aec.lib.config.AEC_HISTORY_DB", Path("/nonexistent/history.db"))
+
+        apply_retention({"retention": {
+            "report_mode": "auto", "compress_after_days": 3, "compression": "gzip",
+        }})
+        apply_retention({"retention": {"report_mode": "auto", "compress_after_days": 0}})
+
+        assert compress_calls == [(3.0, "gzip")]
+
     def test_does_nothing_when_manual(self, monkeypatch):
         """Prune functions are NOT called when retention mode is 'manual'."""
         from aec.lib.runner import apply_retention
@@ -650,3 +922,763 @@ class TestApplyRetention:
         apply_retention(config)
 
         assert prune_calls == []
+
+    def test_prunes_run_history_with_profile_days(self, temp_dir, monkeypatch):
+        """Old runs are deleted from the history store in auto mode."""
+        import time
+
+        from aec.lib.history_store import connect, load_project_profiles, record_run
+        from aec.lib.runner import apply_retention
+
+        db = temp_dir / "history.db"
+        conn = connect(db)
+        record_run(conn, "web", "2026-01-01T02-00-00Z", {"unit": {}},
+                   created_at=time.time() - 100 * 86400)
+        record_run(conn, "web", "2026-04-01T02-00-00Z", {"unit": {}})
+        conn.close()
+        monkeypatch.setattr("aec.lib.config.AEC_HISTORY_DB", db)
+        monkeypatch.setattr("aec.lib.reports.prune_old_reports", lambda base, keep: 0)
+        monkeypatch.setattr("aec.lib.reports.prune_old_profiles", lambda base, keep: 0)
+        monkeypatch.setattr("aec.lib.report_index.compress_old_reports", lambda *args: 0)
+
+        apply_retention({"retention": {"report_mode": "auto", "profile_days": 90}})
+
+        conn = connect(db)
+        assert len(load_project_profiles(conn, "web")) == 1
+        conn.close()
+
+
+class TestRunAllProjectsParallel:
+    """Tests for the lane executor path of run_all_projects()."""
+
+    def _setup(self, monkeypatch, parallel_enabled, order_strategy="random", **execution):
+        from aec.lib.tracking import TrackedRepo
+
+        repos = [
+            TrackedRepo("2026-01-01T00:00:00Z", "2.0.0", Path(f"/tmp/{name}"), True)
+            for name in ("a", "b", "c")
+        ]
+        monkeypatch.setattr("aec.lib.tracking.list_repos", lambda: repos)
+        monkeypatch.setattr(
+            "aec.lib.aec_json.load_aec_json",
+            lambda path: {
+                "project": {"name": Path(path).name},
+                "test": {
+                    "prerequisites": [],
+                    "suites": {"unit": {"command": "pytest"}},
+                    "scheduled": ["unit"],
+                },
+                "ports": {},
+            },
+        )
+        _patch_run_all_dependencies(monkeypatch)
+        monkeypatch.setattr(
+            "aec.lib.scheduler_config.load_scheduler_config",
+            lambda path: {
+                "version": "1.0.0",
+                "last_run": None,
+                "retention": {"report_mode": "manual", "report_days": 30, "profile_days": 90},
+                "execution": {
+                    "parallel_enabled": parallel_enabled,
+                    "parallelization_plan": {"lanes": [["c", "a"], ["b"]]},
+                    "max_parallel_lanes": 2,
+                    "order_strategy": order_strategy,
+                    **execution,
+                },
+            },
+        )
+        summaries = []
+        monkeypatch.setattr(
+            "aec.lib.reports.generate_summary",
+            lambda *args, **kwargs: summaries.append((args, kwargs))
+            or Path("/tmp/reports/summary.txt"),
+        )
+        return summaries
+
+    def test_runs_planned_lanes_and_records_lane(self, monkeypatch):
+        """Each project result and flat suite result carries its lane number."""
+        from aec.lib.runner import run_all_projects
+
+        summaries = self._setup(monkeypatch, parallel_enabled=True)
+        result = run_all_projects()
+
+        assert result["execution_order"] == ["c", "a", "b"]
+        assert result["projects"]["/tmp/c"]["lane"] == 1
+        assert result["projects"]["/tmp/a"]["lane"] == 1
+        assert result["projects"]["/tmp/b"]["lane"] == 2
+        assert [lane["projects"] for lane in result["lanes"]] == [["c", "a"], ["b"]]
+
+        args, kwargs = summaries[-1]
+        flat = {r["project"]: r["lane"] for r in args[1]}
+        assert flat == {"c": 1, "a": 1, "b": 2}
+        assert len(kwargs["lanes"]) == 2
+
+    def test_exports_lane_isolation_to_suites(self, monkeypatch):
+        """Each lane's suites see their own lane, offset, Compose project and TMPDIR."""
+        from aec.lib.runner import run_all_projects
+
+        self._setup(monkeypatch, parallel_enabled=True)
+        monkeypatch.setattr(
+            "aec.lib.ports.load_registry",
+            lambda path: {"version": "1.0.0", "ports": {"3000": {"port": 3000}}},
+        )
+        envs = {}
+
+        class EnvPopen(_fake_popen(0)):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                envs[kwargs["cwd"]] = kwargs["env"]
+
+        _use_fake_popen(monkeypatch, EnvPopen)
+        result = run_all_projects()
+
+        assert {cwd: env["AEC_LANE"] for cwd, env in envs.items()} == {
+            "/tmp/c": "1", "/tmp/a": "1", "/tmp/b": "2",
+        }
+        assert envs["/tmp/a"]["AEC_PORT_OFFSET"] == "0"
+        assert envs["/tmp/b"]["AEC_PORT_OFFSET"] == "100"
+        assert envs["/tmp/a"]["COMPOSE_PROJECT_NAME"] != envs["/tmp/b"]["COMPOSE_PROJECT_NAME"]
+        assert envs["/tmp/a"]["TMPDIR"] != envs["/tmp/b"]["TMPDIR"]
+        assert not Path(envs["/tmp/b"]["TMPDIR"]).exists()
+        assert [lane["port_offset"] for lane in result["lanes"]] == [0, 100]
+
+    def test_lane_profiles_keep_only_their_own_changes(self, monkeypatch):
+        """With lanes, ports and containers another lane started stay out of profiles."""
+        from aec.lib.runner import run_all_projects
+
+        self._setup(monkeypatch, parallel_enabled=True)
+        monkeypatch.setattr(
+            "aec.lib.profiler.diff_snapshots",
+            lambda before, after: {
+                "ports_new": [3000],
+                "docker_started": ["someone-else-db-1"],
+                "docker_remaining": ["someone-else-db-1"],
+                "processes_leaked": 2,
+                "leaked_details": [{"pid": 1, "command": "jest"}],
+                "memory_delta_mb": 512.0,
+            },
+        )
+        result = run_all_projects()
+
+        profile = result["projects"]["/tmp/b"]["profiles"]["unit"]
+        assert profile["scope"] == "session"
+        assert profile["ports_new"] == []
+        assert profile["docker_started"] == []
+        assert profile["processes_leaked"] == 0
+        assert "memory_delta_mb" not in profile
+
+    def test_lane_profiles_store_unshifted_ports(self, monkeypatch):
+        """A later lane's shifted registered ports are profiled as lane 1 binds them."""
+        from aec.lib.runner import run_all_projects
+
+        self._setup(monkeypatch, parallel_enabled=True)
+        monkeypatch.setattr(
+            "aec.lib.ports.load_registry",
+            lambda path: {"version": "1.0.0", "ports": {"3000": {"port": 3000}}},
+        )
+        monkeypatch.setattr(
+            "aec.lib.profiler.scope_diff_to_session", lambda diff, *args: diff,
+        )
+        monkeypatch.setattr(
+            "aec.lib.profiler.diff_snapshots",
+            lambda before, after: {"ports_new": [3100, 8080]},
+        )
+        result = run_all_projects()
+
+        assert result["projects"]["/tmp/b"]["profiles"]["unit"]["ports_new"] == [3000, 8080]
+        assert result["projects"]["/tmp/a"]["profiles"]["unit"]["ports_new"] == [3100, 8080]
+
+    def test_lane_contexts_outlive_reruns(self, monkeypatch):
+        """Reruns get each project's lane context; it is released after them."""
+        from aec.lib.runner import run_all_projects
+
+        self._setup(monkeypatch, parallel_enabled=True, rerun_failed=True)
+        seen = {}
+
+        def fake_reruns(project_results, policy, flakiness, report_dir, **kwargs):
+            for path, context in kwargs["contexts"].items():
+                seen[path] = (context.lane, context.tmpdir, context.tmpdir.exists())
+            return 0
+
+        monkeypatch.setattr("aec.lib.runner.rerun_failed_suites", fake_reruns)
+        run_all_projects()
+
+        assert {path: lane for path, (lane, _, _) in seen.items()} == {
+            "/tmp/c": 1, "/tmp/a": 1, "/tmp/b": 2,
+        }
+        assert all(existed for _, _, existed in seen.values())
+        assert not any(tmpdir.exists() for _, tmpdir, _ in seen.values())
+
+    def test_governor_admits_every_suite_and_is_reported(self, monkeypatch):
+        """Parallel runs gate suites through the governor and report its decisions."""
+        from aec.lib.runner import run_all_projects
+
+        summaries = self._setup(monkeypatch, parallel_enabled=True)
+        monkeypatch.setattr("aec.lib.governor.load_per_cpu", lambda: 0.1)
+        result = run_all_projects()
+
+        governor = result["governor"]
+        assert governor["admitted"] == 3
+        assert governor["max_concurrency"] == 2
+        assert {(d["project"], d["suite"]) for d in governor["decisions"]} == {
+            ("a", "unit"), ("b", "unit"), ("c", "unit"),
+        }
+        assert summaries[-1][1]["governor"]["admitted"] == 3
+
+    def test_governor_off_for_sequential_runs_and_when_disabled(self, monkeypatch):
+        from aec.lib.runner import run_all_projects
+
+        self._setup(monkeypatch, parallel_enabled=False)
+        assert run_all_projects()["governor"] is None
+
+        self._setup(monkeypatch, parallel_enabled=True, adaptive_concurrency=False)
+        assert run_all_projects()["governor"] is None
+
+    def test_longest_first_reorders_lanes_from_history(self, monkeypatch):
+        """The heaviest lane starts first and lanes run longest project first."""
+        from aec.lib.runner import run_all_projects
+
+        summaries = self._setup(monkeypatch, parallel_enabled=True, order_strategy="longest-first")
+        monkeypatch.setattr(
+            "aec.lib.ordering.project_history_stats",
+            lambda conn, names: {
+                "a": {"runs": 3, "expected_seconds": 50.0, "fail_rate": 0.0},
+                "b": {"runs": 3, "expected_seconds": 300.0, "fail_rate": 0.0},
+                "c": {"runs": 3, "expected_seconds": 10.0, "fail_rate": 0.0},
+            },
+        )
+        result = run_all_projects()
+
+        assert result["order_strategy"] == "longest-first"
+        assert result["execution_order"] == ["b", "a", "c"]
+        assert [lane["projects"] for lane in result["lanes"]] == [["b"], ["a", "c"]]
+        assert summaries[-1][1]["order_strategy"] == "longest-first"
+
+    def test_reruns_failures_after_all_lanes(self, monkeypatch):
+        """With reruns on, failed suites are rerun once every lane has finished."""
+        from aec.lib.runner import run_all_projects
+
+        self._setup(
+            monkeypatch, parallel_enabled=True,
+            rerun_failed=True, max_reruns=1, rerun_flakiness_threshold=0,
+        )
+        _use_fake_popen(monkeypatch, _fake_popen(1))
+        result = run_all_projects()
+
+        assert result["reruns"] == 3
+        for project in result["projects"].values():
+            assert project["suites"]["unit"]["reruns"][0]["status"] == "failed"
+
+    def test_stays_sequential_when_disabled(self, monkeypatch):
+        """A stored plan is ignored until parallel_enabled is set."""
+        from aec.lib.runner import run_all_projects
+
+        self._setup(monkeypatch, parallel_enabled=False)
+        result = run_all_projects()
+
+        assert result["lanes"] == []
+        assert all("lane" not in r for r in result["projects"].values())
+
+
+class TestResumeRun:
+    """Tests for the run journal and --resume in run_all_projects()."""
+
+    def _setup(self, monkeypatch, temp_dir, parallel_enabled=False):
+        summaries = TestRunAllProjectsParallel._setup(self, monkeypatch, parallel_enabled)
+        monkeypatch.setattr("aec.lib.config.AEC_TESTS_DIR", temp_dir)
+        monkeypatch.setattr(
+            "aec.lib.reports.create_report_dir", lambda base, ts: base / ts,
+        )
+        cwds = []
+
+        class RecordingPopen(_fake_popen(0)):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                cwds.append(kwargs["cwd"])
+
+        _use_fake_popen(monkeypatch, RecordingPopen)
+        return summaries, cwds
+
+    def test_fresh_run_journals_every_suite(self, monkeypatch, temp_dir):
+        """Each suite is journaled, summary.txt is rewritten, and the run is closed."""
+        from aec.lib.run_journal import RunJournal, find_resumable
+        from aec.lib.runner import run_all_projects
+
+        summaries, cwds = self._setup(monkeypatch, temp_dir)
+        result = run_all_projects(resume=True)
+
+        assert result["resumed"] is False
+        journal_path = next(temp_dir.glob("*/journal.jsonl"))
+        journal = RunJournal.load(journal_path)
+        assert journal.complete
+        assert journal.seed == result["seed"]
+        assert journal.finished_count() == 3
+        assert find_resumable(temp_dir) is None
+
+        progress = [kwargs.get("progress") for _args, kwargs in summaries]
+        assert progress == [
+            "0 of 3 projects finished",
+            "1 of 3 projects finished",
+            "2 of 3 projects finished",
+            None,
+        ]
+
+    def test_resume_skips_finished_work_and_keeps_order(self, monkeypatch, temp_dir):
+        """Finished projects and suites are reused; new projects run last."""
+        from aec.lib.run_journal import JOURNAL_NAME, RunJournal
+        from aec.lib.runner import run_all_projects
+
+        summaries, cwds = self._setup(monkeypatch, temp_dir)
+        journal = RunJournal.create(
+            temp_dir / "2026-04-08T02-00-00Z" / JOURNAL_NAME,
+            "2026-04-08T02:00:00Z", 42, "random", order=["/tmp/b", "/tmp/a"],
+        )
+        journal.record_suite("/tmp/b", "b", "unit", {"status": "passed", "duration_seconds": 1.0})
+        journal.finish_project("/tmp/b", {"project": "b", "status": "passed"})
+
+        result = run_all_projects(resume=True)
+
+        assert result["resumed"] is True
+        assert result["seed"] == 42
+        assert result["execution_order"] == ["b", "a", "c"]
+        assert cwds == ["/tmp/a", "/tmp/c"]
+        assert result["projects"]["/tmp/b"]["suites"]["unit"]["duration_seconds"] == 1.0
+        assert result["passed"] == 3
+        assert RunJournal.load(journal.path).complete
+
+    def test_resume_reuses_journaled_lanes(self, monkeypatch, temp_dir):
+        """A parallel run resumes with its original lanes, not a new plan."""
+        from aec.lib.run_journal import JOURNAL_NAME, RunJournal
+        from aec.lib.runner import run_all_projects
+
+        self._setup(monkeypatch, temp_dir, parallel_enabled=True)
+        RunJournal.create(
+            temp_dir / "2026-04-08T02-00-00Z" / JOURNAL_NAME,
+            "2026-04-08T02:00:00Z", 42, "random",
+            order=["/tmp/a", "/tmp/b", "/tmp/c"],
+            lanes=[["/tmp/a", "/tmp/b"], ["/tmp/c"]],
+        )
+
+        result = run_all_projects(resume=True)
+
+        assert [lane["projects"] for lane in result["lanes"]] == [["a", "b"], ["c"]]
+
+
+class TestRunEventStream:
+    """Tests for the live event stream written by run_all_projects()."""
+
+    def test_emits_run_project_and_suite_events(self, monkeypatch, temp_dir):
+        from aec.lib.run_events import read_events
+        from aec.lib.runner import run_all_projects
+
+        TestResumeRun._setup(self, monkeypatch, temp_dir, parallel_enabled=True)
+        result = run_all_projects()
+
+        events, _offset = read_events(temp_dir / "events.jsonl")
+        kinds = [e["event"] for e in events]
+        assert kinds[0] == "run_started"
+        assert kinds[-1] == "run_finished"
+        assert events[0]["projects"] == ["c", "a", "b"]
+        assert events[0]["lanes"] == 2
+        assert events[0]["seed"] == result["seed"]
+        assert kinds.count("suite_started") == kinds.count("suite_finished") == 3
+        assert kinds.count("project_finished") == 3
+
+        finished = [e for e in events if e["event"] == "suite_finished"]
+        assert {(e["project"], e["lane"], e["status"]) for e in finished} == {
+            ("c", 1, "passed"), ("a", 1, "passed"), ("b", 2, "passed"),
+        }
+        started = next(e for e in events if e["event"] == "project_started")
+        assert started["suites"] == ["unit"]
+        assert events[-1]["passed"] == 3
+        assert events[-1]["status"] == "complete"
+
+    def test_failed_run_still_finishes_the_stream(self, monkeypatch, temp_dir):
+        from aec.lib.run_events import EventStream, read_events
+        from aec.lib.runner import run_all_projects
+
+        TestResumeRun._setup(self, monkeypatch, temp_dir, parallel_enabled=True)
+        streams = []
+
+        def tracked_stream(path):
+            streams.append(EventStream(path))
+            return streams[-1]
+
+        monkeypatch.setattr("aec.lib.runner.EventStream", tracked_stream)
+
+        def broken_reports(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("aec.lib.runner.write_reports", broken_reports)
+        with pytest.raises(OSError, match="disk full"):
+            run_all_projects()
+
+        events, _offset = read_events(temp_dir / "events.jsonl")
+        assert events[-1]["event"] == "run_finished"
+        assert events[-1]["status"] == "error"
+        assert streams[0]._fh.closed
+
+
+class TestRunWithinBudget:
+    """Tests for schedule.max_duration_minutes in run_all_projects()."""
+
+    def _setup(self, monkeypatch, parallel_enabled=False, deferred_last_run=()):
+        TestRunAllProjectsParallel._setup(self, monkeypatch, parallel_enabled)
+        saved = []
+        monkeypatch.setattr(
+            "aec.lib.scheduler_config.load_scheduler_config",
+            lambda path: {
+                "version": "1.0.0",
+                "schedule": {"max_duration_minutes": 10},
+                "last_run": {"deferred": [
+                    {"project": p, "suite": "unit"} for p in deferred_last_run
+                ]},
+                "retention": {"report_mode": "manual"},
+                "execution": {
+                    "parallel_enabled": parallel_enabled,
+                    "parallelization_plan": {"lanes": [["c", "a"], ["b"]]},
+                    "max_parallel_lanes": 2,
+                },
+            },
+        )
+        monkeypatch.setattr(
+            "aec.lib.scheduler_config.update_last_run",
+            lambda cfg, **kwargs: saved.append(kwargs) or cfg,
+        )
+        return saved
+
+    def test_defers_suites_over_budget_and_runs_carried_over_first(self, monkeypatch):
+        """Without history every suite is 5 minutes, so two of three fit 10 minutes."""
+        from aec.lib.runner import run_all_projects
+
+        saved = self._setup(monkeypatch, deferred_last_run=["b"])
+        result = run_all_projects()
+
+        assert len(result["deferred"]) == 1
+        deferred = result["deferred"][0]
+        assert deferred["project"] in ("a", "c")
+        assert deferred["expected_seconds"] == 300.0
+        assert result["execution_order"][0] == "b"
+        assert deferred["project"] not in result["execution_order"]
+        assert f"/tmp/{deferred['project']}" not in result["projects"]
+        assert saved[0]["deferred"] == [{"project": deferred["project"], "suite": "unit"}]
+
+    def test_each_lane_gets_the_whole_budget(self, monkeypatch):
+        """Lane 1 (c, a) needs 10 minutes and lane 2 (b) 5: all fit."""
+        from aec.lib.runner import run_all_projects
+
+        self._setup(monkeypatch, parallel_enabled=True)
+        result = run_all_projects()
+
+        assert result["deferred"] == []
+        assert result["execution_order"] == ["c", "a", "b"]
+
+
+class TestWriteReports:
+    """Tests for write_reports() output handling."""
+
+    def test_keeps_streamed_output_and_writes_unstreamed(self, tmp_path, monkeypatch):
+        """Streamed project logs are left as-is; in-memory outputs get written."""
+        from aec.lib.runner import write_reports
+
+        monkeypatch.setattr("aec.lib.config.AEC_TESTS_DIR", tmp_path / "tests")
+        monkeypatch.setattr("aec.lib.config.AEC_PROFILES_DIR", tmp_path / "profiles")
+        monkeypatch.setattr("aec.lib.preferences.get_setting", lambda key: None)
+
+        report_dir = tmp_path / "tests" / "2026-01-01T02-00-00Z"
+        report_dir.mkdir(parents=True)
+        streamed = report_dir / "streamed_test_output.txt"
+        streamed.write_text("=== unit ===\nfull log\n")
+
+        results = {
+            "/r/streamed": {
+                "project": "streamed",
+                "suites": {"unit": {
+                    "status": "passed", "output": "full log",
+                    "output_path": str(streamed),
+                }},
+            },
+            "/r/memory": {
+                "project": "memory",
+                "suites": {"unit": {"status": "passed", "output": "tail only"}},
+            },
+        }
+        write_reports(results, "2026-01-01T02:00:00Z", 1, ["streamed", "memory"])
+
+        assert streamed.read_text() == "=== unit ===\nfull log\n"
+        assert "tail only" in (report_dir / "memory_test_output.txt").read_text()
+
+
+class TestWritePartialSummary:
+    """Tests for write_partial_summary()."""
+
+    def test_lanes_can_write_at_once(self, tmp_path):
+        """Concurrent checkpoints from several lanes leave a whole summary."""
+        import json
+        import threading
+
+        from aec.lib.run_journal import JOURNAL_NAME, RunJournal
+        from aec.lib.runner import write_partial_summary
+
+        paths = [f"/repos/p{i}" for i in range(6)]
+        journal = RunJournal.create(
+            tmp_path / JOURNAL_NAME, "2026-01-01T02:00:00Z", 1, "random", order=paths,
+        )
+        errors = []
+
+        def lane(path):
+            try:
+                for n in range(15):
+                    journal.record_suite(path, Path(path).name, f"s{n}", {"status": "passed"})
+                    write_partial_summary(tmp_path, journal)
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=lane, args=(path,)) for path in paths]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        summary = json.loads((tmp_path / "summary.json").read_text())
+        assert summary["progress"] == "0 of 6 projects finished"
+        assert "s14" in (tmp_path / "summary.txt").read_text()
+        assert not list(tmp_path.glob("*.tmp"))
+
+
+class TestRunSingleProjectSampling:
+    """Resource sampling around each suite in run_single_project()."""
+
+    def test_attaches_sampler_and_stores_resources(self, monkeypatch):
+        """The sampler is started with the suite's PID and its summary is profiled."""
+        from aec.lib.runner import run_single_project
+
+        monkeypatch.setattr(
+            "aec.lib.aec_json.load_aec_json",
+            lambda path: {
+                "project": {"name": "test-proj"},
+                "test": {"suites": {"unit": {"command": "pytest"}}, "scheduled": ["unit"]},
+            },
+        )
+        monkeypatch.setattr(
+            "aec.lib.ports.load_registry", lambda path: {"version": "1.0.0", "ports": {}},
+        )
+        monkeypatch.setattr("aec.lib.profiler.take_snapshot", lambda: {})
+        monkeypatch.setattr("aec.lib.profiler.diff_snapshots", lambda before, after: {})
+        _use_fake_popen(monkeypatch, _fake_popen(0))
+
+        started = []
+
+        class FakeSampler:
+            def __init__(self, interval):
+                self.interval = interval
+
+            def start(self, pid):
+                started.append((self.interval, pid))
+
+            def stop(self):
+                pass
+
+            def summary(self):
+                return {"peak_rss_mb": 12.5}
+
+        monkeypatch.setattr("aec.lib.resource_sampler.ResourceSampler", FakeSampler)
+
+        result = run_single_project(Path("/tmp/test-proj"), sample_interval=0.5)
+        assert started == [(0.5, 424242)]
+        assert result["profiles"]["unit"]["resources"] == {"peak_rss_mb": 12.5}
+
+
+class TestRunSingleProjectCache:
+    """Skip-unchanged caching in run_single_project()."""
+
+    def _setup(self, tmp_path, monkeypatch, command):
+        if subprocess.run(["git", "--version"], capture_output=True).returncode != 0:
+            pytest.skip("git not installed")
+        repo = tmp_path / "proj"
+        repo.mkdir()
+        for args in (["init", "-q"], ["commit", "-q", "--allow-empty", "-m", "init"]):
+            subprocess.run(
+                ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+                cwd=repo, check=True, capture_output=True,
+            )
+        monkeypatch.setattr(
+            "aec.lib.aec_json.load_aec_json",
+            lambda path: {
+                "project": {"name": "proj"},
+                "test": {"suites": {"unit": {"command": command}}, "scheduled": ["unit"]},
+            },
+        )
+        monkeypatch.setattr(
+            "aec.lib.ports.load_registry", lambda path: {"version": "1.0.0", "ports": {}},
+        )
+        monkeypatch.setattr("aec.lib.profiler.take_snapshot", lambda: {})
+        monkeypatch.setattr("aec.lib.profiler.diff_snapshots", lambda before, after: {})
+        return repo
+
+    def test_second_unchanged_run_is_cached_pass(self, tmp_path, monkeypatch):
+        """A passing suite is skipped next time until the tree changes."""
+        from aec.lib.result_cache import ResultCache
+        from aec.lib.runner import run_single_project
+
+        repo = self._setup(tmp_path, monkeypatch, "exit 0")
+        cache = ResultCache(tmp_path / "history.db", ttl_seconds=3600)
+        first_report = tmp_path / "reports" / "first"
+
+        first = run_single_project(repo, report_dir=first_report, sample_interval=0, cache=cache)
+        assert first["suites"]["unit"]["status"] == "passed"
+
+        second = run_single_project(
+            repo, report_dir=tmp_path / "reports" / "second", sample_interval=0, cache=cache,
+        )
+        assert second["status"] == "passed"
+        assert second["suites"]["unit"]["status"] == "cached-pass"
+        assert second["suites"]["unit"]["cached_from"] == str(first_report)
+        assert "unit" not in second["profiles"]
+
+        (repo / "new_file.txt").write_text("change")
+        third = run_single_project(repo, sample_interval=0, cache=cache)
+        assert third["suites"]["unit"]["status"] == "passed"
+
+    def test_failures_are_never_cached(self, tmp_path, monkeypatch):
+        """A failing suite runs every time."""
+        from aec.lib.result_cache import ResultCache
+        from aec.lib.runner import run_single_project
+
+        repo = self._setup(tmp_path, monkeypatch, "exit 1")
+        cache = ResultCache(tmp_path / "history.db", ttl_seconds=3600)
+        for _ in range(2):
+            result = run_single_project(repo, sample_interval=0, cache=cache)
+            assert result["suites"]["unit"]["status"] == "failed"
+
+
+class TestCollectScheduledPrerequisites:
+    """Tests for collect_scheduled_prerequisites()."""
+
+    def test_project_and_scheduled_suite_prerequisites(self, monkeypatch):
+        """Unscheduled suites are ignored and names are de-duplicated."""
+        from aec.lib.runner import collect_scheduled_prerequisites
+
+        data = {
+            "a": {"test": {
+                "prerequisites": ["docker"],
+                "suites": {
+                    "unit": {"prerequisites": ["node"]},
+                    "e2e": {"prerequisites": ["playwright"]},
+                },
+                "scheduled": ["unit"],
+            }},
+            "b": {"test": {
+                "suites": {"unit": {"prerequisites": ["docker", "cargo"]}},
+                "scheduled": ["unit"],
+            }},
+        }
+        monkeypatch.setattr("aec.lib.aec_json.load_aec_json", lambda path: data.get(path.name))
+        names = collect_scheduled_prerequisites([Path("a"), Path("b"), Path("c")])
+        assert names == ["docker", "node", "cargo"]
+
+
+
+class TestRerunFailedSuites:
+    """Tests for rerun_failed_suites()."""
+
+    def _results(self, project_dir: Path):
+        return {
+            str(project_dir): {
+                "project": "web",
+                "status": "failed",
+                "suites": {
+                    "unit": {"status": "failed", "exit_code": 1},
+                    "lint": {"status": "failed", "exit_code": 1},
+                    "e2e": {"status": "passed", "exit_code": 0},
+                },
+                "profiles": {"unit": {"status": "failed"}, "lint": {"status": "failed"}},
+            }
+        }
+
+    def test_reruns_flaky_failures_until_they_pass(self, tmp_path, monkeypatch):
+        """Only suites over the threshold rerun; attempts are recorded separately."""
+        from aec.lib.runner import rerun_failed_suites
+
+        marker = tmp_path / "attempts"
+        # Fails on the first rerun, passes on the second.
+        flaky = f"echo x >> {marker}; test $(wc -l < {marker}) -ge 2"
+        monkeypatch.setattr(
+            "aec.lib.aec_json.load_aec_json",
+            lambda path: {"test": {"suites": {
+                "unit": {"command": flaky},
+                "lint": {"command": "exit 1"},
+                "e2e": {"command": "true"},
+            }}},
+        )
+        results = self._results(tmp_path)
+        report_dir = tmp_path / "report"
+        executed = rerun_failed_suites(
+            results,
+            {"max_reruns": 3, "flakiness_threshold": 0.2},
+            {("web", "unit"): {"score": 0.5, "runs": 6}, ("web", "lint"): {"score": 0.1, "runs": 6}},
+            report_dir,
+        )
+
+        project = results[str(tmp_path)]
+        unit = project["suites"]["unit"]
+        assert executed == 2
+        assert unit["status"] == "failed"
+        assert [r["status"] for r in unit["reruns"]] == ["failed", "passed"]
+        assert unit["flakiness"] == 0.5
+        profiled = project["profiles"]["unit"]["reruns"]
+        assert [{k: r[k] for k in unit["reruns"][0]} for r in profiled] == unit["reruns"]
+        assert "reruns" not in project["suites"]["lint"]
+        log = (report_dir / "web_test_output.txt").read_text()
+        assert "=== unit (rerun 1) ===" in log and "=== unit (rerun 2) ===" in log
+
+    def test_stops_at_max_reruns(self, tmp_path, monkeypatch):
+        """A suite that keeps failing is rerun at most max_reruns times."""
+        from aec.lib.runner import rerun_failed_suites
+
+        monkeypatch.setattr(
+            "aec.lib.aec_json.load_aec_json",
+            lambda path: {"test": {"suites": {"unit": {"command": "exit 1"}}}},
+        )
+        results = self._results(tmp_path)
+        executed = rerun_failed_suites(
+            results, {"max_reruns": 2, "flakiness_threshold": 0.0}, {},
+        )
+        assert executed == 2
+        assert [r["attempt"] for r in results[str(tmp_path)]["suites"]["unit"]["reruns"]] == [1, 2]
+
+    def test_reruns_use_the_lane_context_and_report_back(self, tmp_path, monkeypatch):
+        """Reruns and their cleanup see the lane's variables; the caller is told."""
+        from aec.lib.lane_isolation import LaneContext
+        from aec.lib.runner import rerun_failed_suites
+
+        seen = tmp_path / "seen"
+        monkeypatch.setattr(
+            "aec.lib.aec_json.load_aec_json",
+            lambda path: {"test": {"suites": {"unit": {
+                "command": f'echo "run $AEC_LANE $AEC_PORT_OFFSET $COMPOSE_PROJECT_NAME" >> {seen}',
+                "cleanup": f'echo "cleanup $AEC_LANE $COMPOSE_PROJECT_NAME" >> {seen}',
+            }}}},
+        )
+        (tmp_path / "lane-tmp").mkdir()
+        context = LaneContext(2, 100, "aec-run-lane2", tmp_path / "lane-tmp")
+        results = self._results(tmp_path)
+        finished = []
+        rerun_failed_suites(
+            results, {"max_reruns": 2, "flakiness_threshold": 0.0}, {},
+            contexts={str(tmp_path): context}, sample_interval=0,
+            on_suite=lambda *args: finished.append(args),
+        )
+
+        assert seen.read_text().splitlines() == [
+            "run 2 100 aec-run-lane2", "cleanup 2 aec-run-lane2",
+        ]
+        unit = results[str(tmp_path)]["suites"]["unit"]
+        assert finished == [
+            (str(tmp_path), "unit", unit, results[str(tmp_path)]["profiles"]["unit"]),
+        ]
+        # An interrupted run's reruns are not repeated
+        assert rerun_failed_suites(
+            results, {"max_reruns": 2, "flakiness_threshold": 0.0}, {},
+        ) == 0
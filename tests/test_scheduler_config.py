@@ -228,3 +228,201 @@ class TestGetExecutionConfig:
         assert execution["mode"] == "sequential"
         assert execution["randomize_order"] is True
         assert execution["parallel_enabled"] is False
+
+
+class TestGetParallelLanes:
+    """Tests for get_parallel_lanes and get_max_parallel_lanes."""
+
+    def test_none_when_parallel_disabled(self):
+        """A stored plan is not used while parallel_enabled is False."""
+        from aec.lib.scheduler_config import (
+            create_default_config,
+            get_parallel_lanes,
+            update_parallelization_plan,
+        )
+
+        config = update_parallelization_plan(create_default_config(), [["a"], ["b"]], 3)
+        assert get_parallel_lanes(config) is None
+
+    def test_returns_non_empty_lanes_when_enabled(self):
+        """Enabled config returns the plan's lanes without empty entries."""
+        from aec.lib.scheduler_config import (
+            create_default_config,
+            get_parallel_lanes,
+            update_parallelization_plan,
+        )
+
+        config = update_parallelization_plan(create_default_config(), [["a"], [], ["b"]], 3)
+        config["execution"]["parallel_enabled"] = True
+        assert get_parallel_lanes(config) == [["a"], ["b"]]
+
+    def test_none_when_enabled_without_plan(self):
+        """Enabled with no computed plan falls back to sequential."""
+        from aec.lib.scheduler_config import create_default_config, get_parallel_lanes
+
+        config = create_default_config()
+        config["execution"]["parallel_enabled"] = True
+        assert get_parallel_lanes(config) is None
+
+    def test_max_parallel_lanes_default_and_floor(self):
+        """Default bound is 4; invalid or non-positive values are clamped."""
+        from aec.lib.scheduler_config import create_default_config, get_max_parallel_lanes
+
+        config = create_default_config()
+        assert get_max_parallel_lanes(config) == 4
+        config["execution"]["max_parallel_lanes"] = 0
+        assert get_max_parallel_lanes(config) == 1
+        config["execution"]["max_parallel_lanes"] = "lots"
+        assert get_max_parallel_lanes(config) == 4
+
+
+class TestGetSampleInterval:
+    """Tests for get_sample_interval."""
+
+    def test_default_zero_and_invalid(self):
+        """Defaults to 1s; 0 disables; junk falls back to the default."""
+        from aec.lib.scheduler_config import create_default_config, get_sample_interval
+
+        config = create_default_config()
+        assert get_sample_interval(config) == 1.0
+        config["execution"]["resource_sample_interval_seconds"] = 0
+        assert get_sample_interval(config) == 0.0
+        config["execution"]["resource_sample_interval_seconds"] = -3
+        assert get_sample_interval(config) == 0.0
+        config["execution"]["resource_sample_interval_seconds"] = "often"
+        assert get_sample_interval(config) == 1.0
+
+
+class TestGetCacheTtlSeconds:
+    """Tests for get_cache_ttl_seconds."""
+
+    def test_default_disabled_and_zero(self):
+        """Off by default; one week once enabled; off again when the TTL is 0."""
+        from aec.lib.scheduler_config import create_default_config, get_cache_ttl_seconds
+
+        config = create_default_config()
+        assert get_cache_ttl_seconds(config) is None
+        assert get_cache_ttl_seconds({"execution": {}}) is None
+        config["execution"]["skip_unchanged"] = True
+        assert get_cache_ttl_seconds(config) == 168 * 3600
+        config["execution"]["cache_ttl_hours"] = 0
+        assert get_cache_ttl_seconds(config) is None
+        config["execution"]["cache_ttl_hours"] = 12
+        config["execution"]["skip_unchanged"] = False
+        assert get_cache_ttl_seconds(config) is None
+
+
+class TestGetPrerequisiteTtl:
+    """Tests for get_prerequisite_ttl."""
+
+    def test_default_probes_once_per_run(self):
+        """0 (default) or junk means once per run; positive values are a TTL."""
+        from aec.lib.scheduler_config import create_default_config, get_prerequisite_ttl
+
+        config = create_default_config()
+        assert get_prerequisite_ttl(config) is None
+        config["execution"]["prerequisite_ttl_seconds"] = 300
+        assert get_prerequisite_ttl(config) == 300.0
+        config["execution"]["prerequisite_ttl_seconds"] = "soon"
+        assert get_prerequisite_ttl(config) is None
+
+
+class TestGetOrderStrategy:
+    """Tests for get_order_strategy."""
+
+    def test_default_valid_and_unknown(self):
+        """Defaults to random; unknown values fall back to random."""
+        from aec.lib.scheduler_config import create_default_config, get_order_strategy
+
+        config = create_default_config()
+        assert get_order_strategy(config) == "random"
+        config["execution"]["order_strategy"] = "fail-first"
+        assert get_order_strategy(config) == "fail-first"
+        config["execution"]["order_strategy"] = "alphabetical"
+        assert get_order_strategy(config) == "random"
+
+
+
+class TestGetRerunPolicy:
+    """Tests for get_rerun_policy."""
+
+    def test_off_by_default_and_opt_in(self):
+        """Reruns are opt-in; max_reruns below 1 turns them off again."""
+        from aec.lib.scheduler_config import create_default_config, get_rerun_policy
+
+        config = create_default_config()
+        assert get_rerun_policy(config) is None
+        config["execution"]["rerun_failed"] = True
+        assert get_rerun_policy(config) == {"max_reruns": 2, "flakiness_threshold": 0.1}
+        config["execution"]["max_reruns"] = 0
+        assert get_rerun_policy(config) is None
+
+
+class TestGetGovernorSettings:
+    """Tests for get_governor_settings."""
+
+    def test_on_by_default_and_opt_out(self):
+        from aec.lib.scheduler_config import create_default_config, get_governor_settings
+
+        config = create_default_config()
+        assert get_governor_settings(config) == {
+            "max_load_per_cpu": 1.0, "memory_reserve_mb": 1024.0,
+        }
+        config["execution"]["adaptive_concurrency"] = False
+        assert get_governor_settings(config) is None
+
+    def test_invalid_values_fall_back(self):
+        from aec.lib.scheduler_config import get_governor_settings
+
+        config = {"execution": {"max_load_per_cpu": "busy", "memory_reserve_mb": -5}}
+        assert get_governor_settings(config) == {
+            "max_load_per_cpu": 1.0, "memory_reserve_mb": 0.0,
+        }
+
+
+class TestGetCompressionSettings:
+    """Tests for get_compression_settings."""
+
+    def test_xz_after_a_week_by_default(self):
+        from aec.lib.scheduler_config import create_default_config, get_compression_settings
+
+        config = create_default_config()
+        assert get_compression_settings(config) == (7.0, "xz")
+        config["retention"].update(compress_after_days=2, compression="gzip")
+        assert get_compression_settings(config) == (2.0, "gzip")
+
+    def test_disabled_or_invalid(self):
+        from aec.lib.scheduler_config import get_compression_settings
+
+        assert get_compression_settings({"retention": {"compress_after_days": None}}) is None
+        assert get_compression_settings({"retention": {"compress_after_days": 0}}) is None
+        assert get_compression_settings({"retention": {"compress_after_days": "soon"}}) is None
+        assert get_compression_settings(
+            {"retention": {"compress_after_days": 1, "compression": "zstd"}}
+        ) == (1.0, "xz")
+
+
+class TestGetMaxDurationSeconds:
+    """Tests for get_max_duration_seconds and get_carried_over."""
+
+    def test_unlimited_by_default(self):
+        from aec.lib.scheduler_config import create_default_config, get_max_duration_seconds
+
+        config = create_default_config()
+        assert get_max_duration_seconds(config) is None
+        config["schedule"]["max_duration_minutes"] = 240
+        assert get_max_duration_seconds(config) == 240 * 60
+        config["schedule"]["max_duration_minutes"] = 0
+        assert get_max_duration_seconds(config) is None
+        config["schedule"]["max_duration_minutes"] = "soon"
+        assert get_max_duration_seconds(config) is None
+
+    def test_carried_over_comes_from_last_run(self):
+        from aec.lib.scheduler_config import (
+            create_default_config, get_carried_over, update_last_run,
+        )
+
+        config = create_default_config()
+        assert get_carried_over(config) == set()
+        update_last_run(config, 3, 5, 0, 0, seed=1, deferred=[{"project": "web", "suite": "e2e"}])
+        assert get_carried_over(config) == {("web", "e2e")}
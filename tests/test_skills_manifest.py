@@ -132,6 +132,38 @@ class TestContentHashing:
         assert hash_before != hash_after
 
 
+class TestSkillTree:
+    """Tests for hash_skill_tree() and diff_skill_trees()."""
+
+    def test_root_matches_hash_skill_directory(self, temp_dir: Path):
+        from aec.lib.catalog_hashes import hash_single_file
+        from aec.lib.skills_manifest import hash_skill_directory, hash_skill_tree
+
+        skill_dir = temp_dir / "tree"
+        (skill_dir / "references").mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text("# Test")
+        (skill_dir / "references" / "guide.md").write_text("Guide")
+        (skill_dir / ".hidden").write_text("junk")
+
+        tree = hash_skill_tree(skill_dir)
+        assert tree.content_hash == hash_skill_directory(skill_dir)
+        assert tree.files == {
+            "SKILL.md": hash_single_file(skill_dir / "SKILL.md"),
+            "references/guide.md": hash_single_file(skill_dir / "references" / "guide.md"),
+        }
+
+    def test_diff_lists_added_removed_and_modified(self):
+        from aec.lib.skills_manifest import diff_skill_trees
+
+        old = {"SKILL.md": "sha256:a", "gone.md": "sha256:b", "same.md": "sha256:c"}
+        new = {"SKILL.md": "sha256:x", "new.md": "sha256:d", "same.md": "sha256:c"}
+        assert diff_skill_trees(old, new) == {
+            "added": ["new.md"],
+            "removed": ["gone.md"],
+            "modified": ["SKILL.md"],
+        }
+
+
 class TestManifestIO:
     """Test installed-skills.json read/write."""
 
@@ -0,0 +1,128 @@
+"""Tests for aec.lib.suite_accounting — wait4 rusage and per-suite cgroups."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+class TestWaitWithRusage:
+    """Tests for wait_with_rusage()."""
+
+    @pytest.mark.skipif(not hasattr(os, "wait4"), reason="wait4 is POSIX-only")
+    def test_reaps_child_and_returns_rusage(self):
+        """Exit status is propagated and the Popen object sees it too."""
+        from aec.lib.suite_accounting import wait_with_rusage
+
+        proc = subprocess.Popen([sys.executable, "-c", "raise SystemExit(3)"])
+        returncode, rusage = wait_with_rusage(proc, timeout=30)
+        assert returncode == 3
+        assert proc.returncode == 3
+        assert proc.wait() == 3
+        assert set(rusage) == {
+            "user_cpu_seconds", "system_cpu_seconds", "max_rss_mb",
+            "block_input_ops", "block_output_ops",
+        }
+        assert rusage["max_rss_mb"] > 0
+
+    @pytest.mark.skipif(not hasattr(os, "wait4"), reason="wait4 is POSIX-only")
+    def test_timeout_leaves_child_running(self):
+        """Like Popen.wait, a timeout raises and does not kill the child."""
+        from aec.lib.suite_accounting import wait_with_rusage
+
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        try:
+            with pytest.raises(subprocess.TimeoutExpired):
+                wait_with_rusage(proc, timeout=0.1)
+            assert proc.poll() is None
+        finally:
+            proc.kill()
+            _code, rusage = wait_with_rusage(proc, timeout=30)
+        assert rusage is not None
+
+
+class TestSuiteCgroup:
+    """Tests for SuiteCgroup against a fake cgroup v2 tree."""
+
+    def _fake_tree(self, temp_dir: Path):
+        proc_root = temp_dir / "proc"
+        (proc_root / "self").mkdir(parents=True)
+        (proc_root / "self" / "cgroup").write_text("0::/user.slice/session.scope\n")
+        cgroup_root = temp_dir / "cgroup"
+        (cgroup_root / "user.slice" / "session.scope").mkdir(parents=True)
+        (cgroup_root / "cgroup.controllers").write_text("cpu memory\n")
+        return cgroup_root, proc_root
+
+    def test_create_attach_read_remove(self, temp_dir):
+        """A child cgroup is created under the runner's own and read back."""
+        from aec.lib.suite_accounting import SuiteCgroup
+
+        cgroup_root, proc_root = self._fake_tree(temp_dir)
+        cgroup = SuiteCgroup.create(cgroup_root, proc_root)
+        assert cgroup is not None
+        assert cgroup.path.parent == cgroup_root / "user.slice" / "session.scope"
+
+        assert cgroup.attach(1234)
+        assert (cgroup.path / "cgroup.procs").read_text() == "1234\n"
+
+        (cgroup.path / "memory.peak").write_text(f"{512 * 1024 * 1024}\n")
+        (cgroup.path / "cpu.stat").write_text(
+            "usage_usec 3500000\nuser_usec 3000000\nsystem_usec 500000\nnr_periods 0\n"
+        )
+        assert cgroup.read() == {
+            "peak_memory_mb": 512.0,
+            "cpu_seconds": 3.5,
+            "user_cpu_seconds": 3.0,
+            "system_cpu_seconds": 0.5,
+        }
+
+        # A real cgroupfs drops these files itself; the fake needs help.
+        for name in ("memory.peak", "cpu.stat", "cgroup.procs"):
+            (cgroup.path / name).unlink()
+        assert cgroup.remove()
+        assert not cgroup.path.exists()
+
+    def test_remove_moves_leftover_processes_to_parent(self, temp_dir):
+        """Processes still in the suite cgroup go back to the runner's cgroup."""
+        from aec.lib.suite_accounting import SuiteCgroup
+
+        cgroup_root, proc_root = self._fake_tree(temp_dir)
+        cgroup = SuiteCgroup.create(cgroup_root, proc_root)
+        cgroup.attach(4321)
+        cgroup.remove()
+        assert (cgroup.path.parent / "cgroup.procs").read_text() == "4321\n"
+
+    def test_unavailable_without_cgroup_v2(self, temp_dir):
+        """cgroup v1 hosts (no cgroup.controllers) get no per-suite cgroup."""
+        from aec.lib.suite_accounting import SuiteCgroup
+
+        cgroup_root, proc_root = self._fake_tree(temp_dir)
+        (cgroup_root / "cgroup.controllers").unlink()
+        assert SuiteCgroup.create(cgroup_root, proc_root) is None
+
+    def test_read_returns_none_without_counters(self, temp_dir):
+        """A cgroup without memory or cpu counters yields no stats."""
+        from aec.lib.suite_accounting import SuiteCgroup
+
+        assert SuiteCgroup(temp_dir).read() is None
+
+    def test_memory_max_and_kill(self, temp_dir):
+        """Limits and kills are plain writes to the cgroup's control files."""
+        from aec.lib.suite_accounting import SuiteCgroup
+
+        cgroup_root, proc_root = self._fake_tree(temp_dir)
+        cgroup = SuiteCgroup.create(cgroup_root, proc_root)
+        assert cgroup.set_memory_max(256)
+        assert (cgroup.path / "memory.max").read_text() == f"{256 * 1024 * 1024}\n"
+        assert cgroup.kill()
+        assert (cgroup.path / "cgroup.kill").read_text() == "1\n"
+
+    def test_memory_max_and_kill_fail_without_cgroup(self, temp_dir):
+        """Missing control files are reported, not raised."""
+        from aec.lib.suite_accounting import SuiteCgroup
+
+        cgroup = SuiteCgroup(temp_dir / "gone")
+        assert not cgroup.set_memory_max(256)
+        assert not cgroup.kill()
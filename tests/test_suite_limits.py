@@ -0,0 +1,146 @@
+"""Tests for aec.lib.suite_limits — per-suite limits and process-group kills."""
+
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+posix_only = pytest.mark.skipif(sys.platform == "win32", reason="process groups are POSIX-only")
+procfs_only = pytest.mark.skipif(not os.path.isdir("/proc/self"), reason="needs /proc")
+
+
+def _alive(pid: int) -> bool:
+    try:
+        with open(f"/proc/{pid}/stat") as fh:
+            return fh.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except OSError:
+        return False
+
+
+class TestSuiteLimits:
+    """Tests for suite_limits()."""
+
+    def test_defaults(self):
+        from aec.lib.suite_limits import DEFAULT_TIMEOUT_SECONDS, suite_limits
+
+        limits = suite_limits({"command": "true"})
+        assert limits.timeout_seconds == DEFAULT_TIMEOUT_SECONDS
+        assert limits.max_memory_mb is None
+        assert limits.nice is None
+
+    def test_reads_configured_values(self):
+        from aec.lib.suite_limits import suite_limits
+
+        limits = suite_limits({"timeout_seconds": 90, "max_memory_mb": 2048, "nice": 10})
+        assert limits == (90.0, 2048, 10)
+
+    @pytest.mark.parametrize("config", [
+        {"timeout_seconds": 0},
+        {"timeout_seconds": "soon"},
+        {"timeout_seconds": True},
+        {"max_memory_mb": -1},
+        {"max_memory_mb": 1.5},
+        {"nice": -5},
+        {"nice": 40},
+    ])
+    def test_invalid_values_fall_back(self, config):
+        from aec.lib.suite_limits import DEFAULT_TIMEOUT_SECONDS, suite_limits
+
+        limits = suite_limits(config)
+        assert limits == (DEFAULT_TIMEOUT_SECONDS, None, None)
+
+
+class TestSuiteArgs:
+    """Tests for suite_args()."""
+
+    def test_plain_command_without_limits(self):
+        from aec.lib.suite_limits import SuiteLimits, suite_args
+
+        assert suite_args("npm test", SuiteLimits(60.0, None, None)) == "npm test"
+
+    @posix_only
+    def test_wraps_command_with_limits(self):
+        from aec.lib.suite_limits import SuiteLimits, suite_args
+
+        args = suite_args("npm test", SuiteLimits(60.0, 512, 5))
+        assert args[:2] == ["/bin/sh", "-c"]
+        assert "ulimit -d 524288" in args[2]
+        assert "exec nice -n 5" in args[2]
+        assert args[-1] == "npm test"
+
+    @posix_only
+    def test_wrapped_command_runs_with_limits(self, tmp_path):
+        """The command still sees its own quoting, under the requested niceness."""
+        from aec.lib.suite_limits import SuiteLimits, suite_args
+
+        args = suite_args("echo \"a  b\" $(nice)", SuiteLimits(60.0, 4096, 7))
+        out = subprocess.run(args, cwd=str(tmp_path), capture_output=True, text=True)
+        assert out.returncode == 0
+        assert out.stdout.split("\n")[0].startswith("a  b")
+        assert out.stdout.split()[-1] == str(min(19, os.nice(0) + 7))
+
+
+@posix_only
+class TestKillProcessGroup:
+    """Tests for kill_process_group() and session_members()."""
+
+    def _spawn_tree(self, tmp_path):
+        from aec.lib.suite_limits import popen_options
+
+        pid_file = tmp_path / "grandchild.pid"
+        # A shell with a background grandchild that ignores SIGTERM.
+        command = (
+            f"sh -c 'trap \"\" TERM; sleep 60' & echo $! > {pid_file}; wait"
+        )
+        proc = subprocess.Popen(command, shell=True, **popen_options())
+        deadline = time.monotonic() + 10
+        while not pid_file.exists() or not pid_file.read_text().strip():
+            assert time.monotonic() < deadline
+            time.sleep(0.02)
+        return proc, int(pid_file.read_text())
+
+    @procfs_only
+    def test_kills_whole_group(self, tmp_path):
+        from aec.lib.suite_limits import kill_process_group, session_members
+
+        proc, grandchild = self._spawn_tree(tmp_path)
+        assert grandchild in [m["pid"] for m in session_members(proc.pid)]
+
+        kill_process_group(proc, grace_seconds=0.2)
+        proc.wait(timeout=10)
+        deadline = time.monotonic() + 5
+        while _alive(grandchild) and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert not _alive(grandchild)
+        assert session_members(proc.pid) == []
+
+    def test_survives_already_exited_process(self):
+        from aec.lib.suite_limits import kill_process_group, popen_options
+
+        proc = subprocess.Popen(["true"], **popen_options())
+        proc.wait()
+        kill_process_group(proc, grace_seconds=0.1)
+
+    def test_falls_back_to_poll_without_waitid(self, monkeypatch):
+        """Without os.waitid (macOS) the leader's exit is seen through poll()."""
+        from aec.lib.suite_limits import kill_process_group, popen_options
+
+        monkeypatch.delattr(os, "waitid", raising=False)
+        monkeypatch.delattr(os, "P_PID", raising=False)
+        proc = subprocess.Popen(["sleep", "30"], **popen_options())
+        start = time.monotonic()
+        kill_process_group(proc, grace_seconds=10)
+        # SIGTERM ends sleep at once; the grace period must not be waited out
+        assert time.monotonic() - start < 5
+        assert proc.wait(timeout=5) != 0
+
+        done = subprocess.Popen(["true"], **popen_options())
+        done.wait()
+        kill_process_group(done, grace_seconds=0.1)
+
+    def test_session_members_empty_without_procfs(self, tmp_path):
+        from aec.lib.suite_limits import session_members
+
+        assert session_members(os.getpid(), proc_root=tmp_path / "missing") == []
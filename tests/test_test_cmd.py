@@ -345,3 +345,71 @@ class TestRunTestReport:
         run_test_report(global_flag=True)
 
         assert any("No test reports" in msg for msg in info_msgs)
+
+    def test_report_reads_compressed_summary(self, tmp_path, monkeypatch):
+        """A compressed summary.txt is decompressed transparently."""
+        from aec.commands.test_cmd import run_test_report
+        from aec.lib.report_index import compress_report_dir
+
+        report_dir = tmp_path / "tests" / "2026-04-08T02:00:00Z"
+        report_dir.mkdir(parents=True)
+        (report_dir / "summary.txt").write_text("All 3 suites passed\n")
+        compress_report_dir(report_dir, "gzip")
+        monkeypatch.setattr("aec.lib.config.AEC_HOME", tmp_path)
+
+        printed = []
+        monkeypatch.setattr("aec.lib.console.Console.subheader", staticmethod(lambda msg: None))
+        monkeypatch.setattr(
+            "aec.lib.console.Console.print", staticmethod(lambda msg: printed.append(msg)),
+        )
+
+        run_test_report(global_flag=True)
+
+        assert printed == ["All 3 suites passed\n"]
+
+
+class TestRunTestWatch:
+    """Tests for run_test_watch()."""
+
+    def test_no_run_yet(self, tmp_path, monkeypatch):
+        from aec.commands.test_cmd import run_test_watch
+
+        monkeypatch.setattr("aec.lib.config.AEC_TESTS_DIR", tmp_path)
+        info_msgs = []
+        monkeypatch.setattr(
+            "aec.lib.console.Console.info",
+            staticmethod(lambda msg: info_msgs.append(msg)),
+        )
+
+        assert run_test_watch(once=True) == 1
+        assert any("No scheduled run" in msg for msg in info_msgs)
+
+    def test_once_prints_progress_table(self, tmp_path, monkeypatch):
+        from aec.commands.test_cmd import run_test_watch
+        from aec.lib.run_events import EventStream
+
+        monkeypatch.setattr("aec.lib.config.AEC_TESTS_DIR", tmp_path)
+        monkeypatch.setattr("aec.lib.config.AEC_HISTORY_DB", tmp_path / "history.db")
+        stream = EventStream(tmp_path / "events.jsonl")
+        stream.emit("run_started", timestamp="2026-04-08T02:00:00Z", seed=42,
+                    projects=["web", "api"], lanes=1)
+        stream.emit("project_started", project="web", suites=["unit", "e2e"], lane=None)
+        stream.emit("suite_started", project="web", suite="unit", lane=None)
+        stream.emit("suite_finished", project="web", suite="unit", status="passed",
+                    duration_seconds=3.0)
+        stream.emit("suite_started", project="web", suite="e2e", lane=None)
+        stream.close()
+
+        printed = []
+        monkeypatch.setattr(
+            "aec.lib.console.Console.print",
+            staticmethod(lambda msg="", **kwargs: printed.append(msg)),
+        )
+
+        assert run_test_watch(once=True) == 0
+        assert printed[0].startswith("Run 2026-04-08T02:00:00Z  (seed 42, 1 lane)  0/2 projects")
+        assert "ETA ~0.0s (+2 without history)" in printed[0]
+        web = next(line for line in printed if line.strip().startswith("web"))
+        assert "1/2" in web and "running e2e" in web
+        api = next(line for line in printed if line.strip().startswith("api"))
+        assert api.endswith("queued")
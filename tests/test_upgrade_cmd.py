@@ -223,6 +223,33 @@ class TestUpgradeCommand:
         assert "manifest updated" in out.lower() or "matched source" in out.lower()
 
 
+    @patch("aec.commands.upgrade.is_stale", return_value=False)
+    @patch("aec.commands.upgrade.find_tracked_repo", return_value=None)
+    @patch("aec.commands.upgrade.get_all_tracked_repos", return_value=[])
+    @patch("aec.commands.upgrade.get_source_dirs")
+    @patch("aec.commands.upgrade.get_repo_root")
+    @patch("aec.commands.upgrade._manifest_path")
+    def test_overwrite_prompt_lists_differing_files(
+        self, mock_mp, mock_root, mock_sd, mock_all, mock_find, _stale,
+        upgrade_env, capsys, monkeypatch,
+    ):
+        """Local edits: the files that differ from the source are listed before asking."""
+        from aec.commands.upgrade import run_upgrade
+
+        mock_root.return_value = upgrade_env["repo"]
+        mock_mp.return_value = upgrade_env["manifest_path"]
+        mock_sd.return_value = _source_dirs(upgrade_env["repo"])
+        (upgrade_env["installed"] / "notes.md").write_text("local notes")
+        monkeypatch.setattr("builtins.input", lambda msg: "n")
+
+        run_upgrade(yes=False)
+
+        out = capsys.readouterr().out
+        assert "modified       SKILL.md" in out
+        assert "only installed notes.md" in out
+        assert "Skipped: test-skill" in out
+
+
 AGENT_V1 = "---\nname: test-agent\nversion: 1.0.0\ndescription: Old\nauthor: Test\n---\nOld"
 AGENT_V2 = "---\nname: test-agent\nversion: 2.0.0\ndescription: New\nauthor: Test\n---\nNew"
 
@@ -361,6 +388,32 @@ class TestUpgradeAgent:
         assert "2.0.0" in (agents_dir / "test-agent.md").read_text()
 
 
+class TestFindOutdatedRepos:
+    """Tests for _find_outdated_repos()."""
+
+    def test_counts_upgradable_items_and_discovers_catalog_once(self, upgrade_env, temp_dir):
+        from aec.commands.upgrade import _find_outdated_repos
+        from aec.lib import sources
+
+        repos = []
+        manifest = {"global": {}, "repos": {}}
+        for i, version in enumerate(["1.0.0", "2.0.0", "1.5.0"]):
+            repo_path = temp_dir / f"repo{i}"
+            repo_path.mkdir()
+            repos.append(repo_path)
+            manifest["repos"][str(repo_path.resolve())] = {
+                "skills": {"test-skill": {"version": version}},
+                "plugins": {"unlisted": {"version": "0.0.0"}},
+            }
+
+        with patch.object(sources, "discover_available", wraps=sources.discover_available) as spy:
+            result = _find_outdated_repos(manifest, repos, _source_dirs(upgrade_env["repo"]))
+
+        assert result == [(repos[0], 1), (repos[2], 1)]
+        # One discovery per item type, however many repos
+        assert spy.call_count == 3
+
+
 class TestRepairExtensionlessAgents:
     """Tests for _repair_extensionless_agents — runs independently of version upgrades."""
 